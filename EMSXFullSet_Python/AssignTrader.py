@@ -2,19 +2,17 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       ASSIGN_TRADER, EMSX_ASSIGNEE_TRADER_UUID, ERROR_CODE, ERROR_MESSAGE, EMSX_ALL_SUCCESS,
+                       EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS, EMSX_SEQUENCE, EMSX_ASSIGN_TRADER_FAILED_ORDERS)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-ASSIGN_TRADER           = blpapi.Name("AssignTrader")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +45,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -65,10 +64,10 @@ class SessionEventHandler():
     
                 request = service.createRequest("AssignTrader")
                 
-                request.append("EMSX_SEQUENCE", 5062768) #This is the EMSX_SEQUENCE or Order# from EMSX blotter
-                #request.append("EMSX_SEQUENCE", 5062767)
+                request.append(EMSX_SEQUENCE, 5062768) #This is the EMSX_SEQUENCE or Order# from EMSX blotter
+                #request.append(EMSX_SEQUENCE, 5062767)
 
-                request.set("EMSX_ASSIGNEE_TRADER_UUID", 7569479) #This is the new UUID
+                request.set(EMSX_ASSIGNEE_TRADER_UUID, 7569479) #This is the new UUID
             
                 print ("Request: %s" % request.toString())
                     
@@ -77,7 +76,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -92,45 +92,44 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == ASSIGN_TRADER:
-                    success = msg.getElementAsBool("EMSX_ALL_SUCCESS")
+                    success = msg.getElementAsBool(EMSX_ALL_SUCCESS)
                     if success:
                         print ("All orders successfully assigned")
-                        successful = msg.getElement("EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS") 
+                        successful = msg.getElement(EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS) 
                         
                         if successful.numValues() > 0: print ("Successful assignments:-")
 
                         for order in successful.values():
-                            seq = order.getElement("EMSX_SEQUENCE").getValue()
+                            seq = order.getElement(EMSX_SEQUENCE).getValue()
                             print (seq)
 
                     else:
                         print ("One or more failed assignments...\n")
                         
-                        if msg.hasElement("EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS"):
-                            successful = msg.getElement("EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS") 
+                        if msg.hasElement(EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS):
+                            successful = msg.getElement(EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS) 
                             
                             if successful.numValues() > 0: print ("Successful assignments:-")
 
                             for order in successful.values():
-                                seq = order.getElement("EMSX_SEQUENCE").getValue()
+                                seq = order.getElement(EMSX_SEQUENCE).getValue()
                                 print (seq)
                                 
                             
-                        if msg.hasElement("EMSX_ASSIGN_TRADER_FAILED_ORDERS"):
-                            failed = msg.getElement("EMSX_ASSIGN_TRADER_FAILED_ORDERS")
+                        if msg.hasElement(EMSX_ASSIGN_TRADER_FAILED_ORDERS):
+                            failed = msg.getElement(EMSX_ASSIGN_TRADER_FAILED_ORDERS)
 
                             if failed.numValues() > 0: print ("Failed assignments:-")
 
                             for order in failed.values():
-                                seq = order.getElement("EMSX_SEQUENCE").getValue()
+                                seq = order.getElement(EMSX_SEQUENCE).getValue()
                                 print (seq)
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -157,8 +156,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
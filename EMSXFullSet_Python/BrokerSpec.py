@@ -2,19 +2,19 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       ERROR_CODE, ERROR_MESSAGE, name)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-BROKER_SPEC             = blpapi.Name("BrokerSpec")
+
+# The brokerspec schema is not part of the generated names.
+BROKER_SPEC             = name("BrokerSpec")
 
 d_service="//blp/emsx.brokerspec" # The BrokerSpec service is only available in the production environment
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +47,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -74,7 +75,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -89,8 +91,8 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == BROKER_SPEC:
                     
@@ -192,8 +194,7 @@ class SessionEventHandler():
                             print ("\t\tName: %s\tFix Value: %s" % (instName, instFixValue))
 
                 if event.eventType() == blpapi.Event.RESPONSE :
-                    global bEnd
-                    bEnd = True
+                    d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -220,8 +221,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
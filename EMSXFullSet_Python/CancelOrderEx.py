@@ -2,20 +2,17 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       CANCEL_ORDER_EX, EMSX_SEQUENCE, ERROR_CODE, ERROR_MESSAGE, STATUS, MESSAGE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-CANCEL_ORDER            = blpapi.Name("CancelOrderEx")
 
 d_service="//blp/emapisvc_beta"
 #d_service="//blp/emapisvc"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -48,7 +45,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -69,7 +67,7 @@ class SessionEventHandler():
                 #request.set("EMSX_REQUEST_SEQ", 1)
                 #request.set("EMSX_TRADER_UUID", 1234567)        # UUID of trader who owns the order
 
-                request.getElement("EMSX_SEQUENCE").appendValue(4733955)
+                request.getElement(EMSX_SEQUENCE).appendValue(4733955)
                 #request.getElement("EMSX_SEQUENCE").appendValue(1234567)
 
                 print ("Request: %s" % request.toString())
@@ -79,7 +77,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -94,16 +93,15 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
-                elif msg.messageType() == CANCEL_ORDER:
-                    status = msg.getElementAsInteger("STATUS")
-                    message = msg.getElementAsString("MESSAGE")
+                elif msg.messageType() == CANCEL_ORDER_EX:
+                    status = msg.getElementAsInteger(STATUS)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("STATUS: %d\tMESSAGE: %s" % (status,message))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -130,8 +128,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
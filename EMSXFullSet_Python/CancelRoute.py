@@ -2,19 +2,16 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       CANCEL_ROUTE, ROUTES, EMSX_SEQUENCE, EMSX_ROUTE_ID, ERROR_CODE, ERROR_MESSAGE, STATUS, MESSAGE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-CANCEL_ROUTE            = blpapi.Name("CancelRoute")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +44,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -68,11 +66,11 @@ class SessionEventHandler():
                 #request.set("EMSX_REQUEST_SEQ", 1)
                 #request.set("EMSX_TRADER_UUID", 1234567)        # UUID of trader who owns the order
 
-                routes = request.getElement("ROUTES")
+                routes = request.getElement(ROUTES)
     
                 route = routes.appendElement()
-                route.getElement("EMSX_SEQUENCE").setValue(4113567)
-                route.getElement("EMSX_ROUTE_ID").setValue(1)
+                route.getElement(EMSX_SEQUENCE).setValue(4113567)
+                route.getElement(EMSX_ROUTE_ID).setValue(1)
             
                 print ("Request: %s" % request.toString())
                     
@@ -81,7 +79,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -96,16 +95,15 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == CANCEL_ROUTE:
-                    status = msg.getElementAsInteger("STATUS")
-                    message = msg.getElementAsString("MESSAGE")
+                    status = msg.getElementAsInteger(STATUS)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("STATUS: %d\tMESSAGE: %s" % (status,message))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -132,8 +130,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
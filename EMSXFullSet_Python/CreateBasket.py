@@ -1,20 +1,17 @@
 # CreateBasket.py
 
 import sys
+import threading
 import blpapi
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       CREATE_BASKET, EMSX_BASKET_NAME, ERROR_CODE, ERROR_MESSAGE, EMSX_SEQUENCE, MESSAGE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-CREATE_BASKET           = blpapi.Name("CreateBasket")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +44,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print(msg)
@@ -66,12 +64,12 @@ class SessionEventHandler():
                 request = service.createRequest("CreateBasket")
 
                 # define the basket name
-                request.set("EMSX_BASKET_NAME", "TestBasket")
+                request.set(EMSX_BASKET_NAME, "TestBasket")
 
                 # add any number of orders
-                request.append("EMSX_SEQUENCE", 4313227)
-                request.append("EMSX_SEQUENCE", 4313228)
-                #request.append("EMSX_SEQUENCE", 4313184)
+                request.append(EMSX_SEQUENCE, 4313227)
+                request.append(EMSX_SEQUENCE, 4313228)
+                #request.append(EMSX_SEQUENCE, 4313184)
 
                 print("Request: %s" % request.toString())
                     
@@ -80,7 +78,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                     
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print("Error: Service failed to open")
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                      
                 
     def processResponseEvent(self, event):
@@ -96,16 +95,15 @@ class SessionEventHandler():
                 print("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == CREATE_BASKET:
-                    emsx_sequence = msg.getElementAsInteger("EMSX_SEQUENCE")
-                    message = msg.getElementAsString("MESSAGE")
+                    emsx_sequence = msg.getElementAsInteger(EMSX_SEQUENCE)
+                    message = msg.getElementAsString(MESSAGE)
                     print("EMSX_SEQUENCE: %d\tMESSAGE: %s" % (emsx_sequence,message))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -132,8 +130,7 @@ def main():
         print("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
@@ -2,19 +2,17 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       CREATE_ORDER, EMSX_TICKER, EMSX_AMOUNT, EMSX_ORDER_TYPE, EMSX_TIF, EMSX_HAND_INSTRUCTION,
+                       EMSX_SIDE, ERROR_CODE, ERROR_MESSAGE, EMSX_SEQUENCE, MESSAGE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-CREATE_ORDER            = blpapi.Name("CreateOrder")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +45,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -66,12 +65,12 @@ class SessionEventHandler():
                 request = service.createRequest("CreateOrder")
 
                 # The fields below are mandatory
-                request.set("EMSX_TICKER", "IBM US Equity")
-                request.set("EMSX_AMOUNT", 1000)
-                request.set("EMSX_ORDER_TYPE", "MKT")
-                request.set("EMSX_TIF", "DAY")
-                request.set("EMSX_HAND_INSTRUCTION", "ANY")
-                request.set("EMSX_SIDE", "BUY")
+                request.set(EMSX_TICKER, "IBM US Equity")
+                request.set(EMSX_AMOUNT, 1000)
+                request.set(EMSX_ORDER_TYPE, "MKT")
+                request.set(EMSX_TIF, "DAY")
+                request.set(EMSX_HAND_INSTRUCTION, "ANY")
+                request.set(EMSX_SIDE, "BUY")
 
             
                 # The fields below are optional
@@ -114,7 +113,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -129,16 +129,15 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == CREATE_ORDER:
-                    emsx_sequence = msg.getElementAsInteger("EMSX_SEQUENCE")
-                    message = msg.getElementAsString("MESSAGE")
+                    emsx_sequence = msg.getElementAsInteger(EMSX_SEQUENCE)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("EMSX_SEQUENCE: %d\tMESSAGE: %s" % (emsx_sequence,message))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -165,8 +164,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
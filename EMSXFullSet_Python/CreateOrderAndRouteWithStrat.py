@@ -2,19 +2,19 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       CREATE_ORDER_AND_ROUTE_EX, EMSX_TICKER, EMSX_AMOUNT, EMSX_ORDER_TYPE, EMSX_TIF,
+                       EMSX_HAND_INSTRUCTION, EMSX_SIDE, EMSX_BROKER, EMSX_STRATEGY_PARAMS, EMSX_STRATEGY_NAME,
+                       EMSX_STRATEGY_FIELD_INDICATORS, EMSX_STRATEGY_FIELDS, EMSX_FIELD_DATA, EMSX_FIELD_INDICATOR,
+                       ERROR_CODE, ERROR_MESSAGE, EMSX_SEQUENCE, EMSX_ROUTE_ID, MESSAGE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-CREATE_ORDER_AND_ROUTE_WITH_STRAT  = blpapi.Name("CreateOrderAndRouteEx")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -46,7 +46,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -65,13 +66,13 @@ class SessionEventHandler():
                 request = service.createRequest("CreateOrderAndRouteEx")
 
                 # The fields below are mandatory
-                request.set("EMSX_TICKER", "IBM US Equity")
-                request.set("EMSX_AMOUNT", 1000)
-                request.set("EMSX_ORDER_TYPE", "MKT")
-                request.set("EMSX_TIF", "DAY")
-                request.set("EMSX_HAND_INSTRUCTION", "ANY")
-                request.set("EMSX_SIDE", "BUY")
-                request.set("EMSX_BROKER", "BMTB")
+                request.set(EMSX_TICKER, "IBM US Equity")
+                request.set(EMSX_AMOUNT, 1000)
+                request.set(EMSX_ORDER_TYPE, "MKT")
+                request.set(EMSX_TIF, "DAY")
+                request.set(EMSX_HAND_INSTRUCTION, "ANY")
+                request.set(EMSX_SIDE, "BUY")
+                request.set(EMSX_BROKER, "BMTB")
             
                 #The fields below are optional
                 #request.set("EMSX_ACCOUNT","TestAccount")
@@ -109,51 +110,51 @@ class SessionEventHandler():
                 
                 # Below we establish the strategy details
                 
-                strategy = request.getElement("EMSX_STRATEGY_PARAMS")
-                strategy.setElement("EMSX_STRATEGY_NAME", "VWAP")
+                strategy = request.getElement(EMSX_STRATEGY_PARAMS)
+                strategy.setElement(EMSX_STRATEGY_NAME, "VWAP")
                 
-                indicator = strategy.getElement("EMSX_STRATEGY_FIELD_INDICATORS")
-                data = strategy.getElement("EMSX_STRATEGY_FIELDS")
+                indicator = strategy.getElement(EMSX_STRATEGY_FIELD_INDICATORS)
+                data = strategy.getElement(EMSX_STRATEGY_FIELDS)
                 
                 # Strategy parameters must be appended in the correct order. See the output 
                 # of GetBrokerStrategyInfo request for the order. The indicator value is 0 for 
                 # a field that carries a value, and 1 where the field should be ignored
                 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "09:30:00") # StartTime
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 0)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "09:30:00") # StartTime
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 0)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "10:30:00") # EndTime
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 0)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "10:30:00") # EndTime
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 0)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # Max%Volume
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # Max%Volume
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # %AMSession
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # %AMSession
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # OPG
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # OPG
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # MOC
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # MOC
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # CompletePX
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # CompletePX
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
                    
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # TriggerPX
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # TriggerPX
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # DarkComplete
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # DarkComplete
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # DarkCompPX
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # DarkCompPX
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # RefIndex
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # RefIndex
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
     
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")         # Discretion
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")         # Discretion
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
                 print ("Request: %s" % request.toString())
                     
@@ -162,7 +163,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -177,17 +179,16 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
-                elif msg.messageType() == CREATE_ORDER_AND_ROUTE_WITH_STRAT:
-                    emsx_sequence = msg.getElementAsInteger("EMSX_SEQUENCE")
-                    emsx_route_id = msg.getElementAsInteger("EMSX_ROUTE_ID")
-                    message = msg.getElementAsString("MESSAGE")
+                elif msg.messageType() == CREATE_ORDER_AND_ROUTE_EX:
+                    emsx_sequence = msg.getElementAsInteger(EMSX_SEQUENCE)
+                    emsx_route_id = msg.getElementAsInteger(EMSX_ROUTE_ID)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("EMSX_SEQUENCE: %d\tEMSX_ROUTE_ID: %d\tMESSAGE: %s" % (emsx_sequence,emsx_route_id,message))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -214,8 +215,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
@@ -0,0 +1,79 @@
+# CreateOrderSync.py
+#
+# CreateOrder.py without the event handler: a ManagedSession opens the
+# service and its RequestRunner blocks until the response arrives.
+
+import sys
+
+from EMSXOperations import ErrorInfoResponse, REQUESTS
+from EMSXRequestRunner import RequestTimeout
+from EMSXSessionManager import ManagedSession, SessionError
+
+
+d_service="//blp/emapisvc_beta"
+d_host="localhost"
+d_port=8194
+d_timeout=30
+
+
+def main():
+    session = ManagedSession(d_host, d_port, services=[d_service])
+    try:
+        session.start()
+    except SessionError:
+        return
+
+    try:
+        request = REQUESTS["CreateOrder"](EMSX_TICKER="IBM US Equity",
+                                          EMSX_AMOUNT=1000,
+                                          EMSX_ORDER_TYPE="MKT",
+                                          EMSX_TIF="DAY",
+                                          EMSX_HAND_INSTRUCTION="ANY",
+                                          EMSX_SIDE="BUY").create(session.getService(d_service))
+
+        print ("Request: %s" % request.toString())
+
+        try:
+            pending = session.sendRequest(request, d_timeout)
+        except RequestTimeout:
+            print ("Error: %s" % sys.exc_info()[1], file=sys.stderr)
+            return
+
+        response = pending.decoded()
+        if pending.failure is not None:
+            print ("ERROR: %s %s" % pending.error())
+        elif isinstance(response, ErrorInfoResponse):
+            print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (response.ERROR_CODE, response.ERROR_MESSAGE))
+        else:
+            print ("EMSX_SEQUENCE: %d\tMESSAGE: %s" % (response.EMSX_SEQUENCE, response.MESSAGE))
+    finally:
+        session.stop()
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - CreateOrderSync")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,504 @@
+# EMSXBenchmark.py
+
+import EMSXEmulator
+
+import gc
+import io
+import json
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+
+d_sizes=[10000, 100000]         # orders (each with one route) in the initial paint
+d_updates=50000                 # messages in the steady-state scenario
+d_updateBlotterSize=10000       # blotter the updates and deletes are applied to
+d_allocationSample=10000        # messages traced for allocations per run
+d_batchSize=1000
+d_seed=1
+
+# Fields sent by the emulator itself, not copied from the blotter records.
+GENERATED_FIELDS = ("MSG_TYPE", "MSG_SUB_TYPE", "EVENT_STATUS", "API_SEQ_NUM")
+
+BLPAPI                  = "blpapi"
+EMULATOR_ONLY           = "emulator-only"
+
+
+def blpapiTest():
+    # The blpapi.test module of an installed blpapi, or None (the emulator
+    # has no blpapi.test).
+    try:
+        import blpapi.test
+    except ImportError:
+        return None
+    return blpapi.test
+
+
+def backend():
+    return BLPAPI if blpapiTest() is not None else EMULATOR_ONLY
+
+
+class BlpapiMessages(object):
+    """ Builds OrderRouteFields messages with blpapi.test.
+
+    The emapisvc service is deserialized from the schema file, so the
+    messages have the layout a live subscription delivers and the decoders
+    are timed against blpapi itself rather than the emulator.
+    """
+
+    def __init__(self):
+        import blpapi
+        from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, d_emapisvcSchema
+
+        self.blpapi = blpapi
+        self.test = blpapiTest()
+        with open(d_emapisvcSchema, encoding="utf-8-sig") as f:
+            service = self.test.deserializeService(f.read())
+        self.definition = service.getEventDefinition(ORDER_ROUTE_FIELDS_TYPE)
+
+    def message(self, correlationId, values):
+        event = self.test.createEvent(self.blpapi.Event.SUBSCRIPTION_DATA)
+        properties = self.test.MessageProperties()
+        properties.setCorrelationIds([correlationId])
+        self.test.appendMessage(event, self.definition, properties).formatMessageDict(values)
+        for msg in event:
+            return msg
+
+
+class LegacyDecoder(object):
+    """ Decodes a message the way the examples did before EMSXFieldDecoder:
+    a hasElement and a getElementAsX call by field name string for every
+    subscribed field, with the type default for absent fields. """
+
+    def __init__(self, schema=None):
+        import blpapi
+        from EMSXFieldDecoder import TYPE_DEFAULTS
+        from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, PRIMITIVE_ACCESSORS, emapisvcSchema
+
+        if schema is None:
+            schema = emapisvcSchema()
+
+        self.fields = []
+        for definition in schema.types[ORDER_ROUTE_FIELDS_TYPE].elements:
+            typeName = schema.primitiveType(definition.typeName)
+            getter = getattr(blpapi.Message, PRIMITIVE_ACCESSORS[typeName].replace("getValueAs", "getElementAs"))
+            self.fields.append((definition.name, getter, TYPE_DEFAULTS[typeName]))
+
+    def decode(self, msg):
+        record = {}
+        for name, getter, default in self.fields:
+            record[name] = getter(msg, name) if msg.hasElement(name) else default
+        return record
+
+
+def legacyMode():
+    decoder = LegacyDecoder()
+    return lambda kind, msg: decoder.decode(msg)
+
+
+def decoderMode():
+    from EMSXFieldDecoder import FieldDecoder
+    decoder = FieldDecoder()
+    return lambda kind, msg: decoder.decode(msg)
+
+
+def storeMode(store):
+    # Decode and apply to a blotter store, as SessionEventHandler does
+    # without the printing.
+    from EMSXEventQueue import INIT_PAINT_END
+    from EMSXFieldDecoder import FieldDecoder
+    from EMSXNames import EVENT_STATUS
+
+    decoder = FieldDecoder()
+
+    def consume(kind, msg):
+        eventStatus = msg.getElementAsInteger(EVENT_STATUS)
+        if eventStatus == INIT_PAINT_END:
+            return
+        record = decoder.decode(msg)
+        if kind == "order":
+            store.applyOrder(eventStatus, record)
+        else:
+            store.applyRoute(eventStatus, record)
+    return consume
+
+
+def blotterMode():
+    from EMSXBlotter import BlotterStore
+    return storeMode(BlotterStore())
+
+
+def columnarMode():
+    from EMSXColumnarBlotter import ColumnarBlotterStore, requireNumpy
+    requireNumpy()
+    return storeMode(ColumnarBlotterStore())
+
+
+def handlerMode():
+    # The full EMSXSubscriptions handler, including its printing (to a
+    # discarded buffer).
+    import blpapi
+    from EMSXEventQueue import MessageBatch
+    from EMSXSubscriptions import SessionEventHandler
+
+    handler = SessionEventHandler()
+    out = io.StringIO()
+
+    def consume(kind, msg):
+        with redirect_stdout(out):
+            handler.processSubscriptionDataEvent(MessageBatch(blpapi.Event.SUBSCRIPTION_DATA, [msg]))
+        out.seek(0)
+        out.truncate()
+    return consume
+
+
+MODES = {
+    "legacy":   legacyMode,
+    "decoder":  decoderMode,
+    "blotter":  blotterMode,
+    "columnar": columnarMode,
+    "handler":  handlerMode,
+}
+
+d_modes=["legacy", "decoder", "blotter", "columnar", "handler"]
+
+
+class SyntheticEvents(object):
+    """ OrderRouteFields messages for a blotter of emulated orders and routes.
+
+    Every OrderRouteFields element is populated, as on a subscription to
+    all fields. The emulator generates the blotter; the messages are built
+    with blpapi.test when blpapi is installed (see BlpapiMessages), and by
+    the emulator otherwise. Emulator child elements whose value repeats
+    between messages are shared, so generating 100k wide messages stays
+    cheap; the decoders see ordinary frozen messages either way.
+    """
+
+    def __init__(self, orders, seed=d_seed):
+        from EMSXSubscriptions import orderSubscriptionID, routeSubscriptionID
+
+        self.emulator = EMSXEmulator.Emulator()
+        self.emulator.loadBlotter(orders)
+        self.random = random.Random(seed)
+        self.cache = {}
+        self.builder = BlpapiMessages() if backend() == BLPAPI else None
+        self.fieldNames = set(definition.name for definition in self.emulator.orderRouteType.elements)
+
+        schema = self.emulator.emapisvc
+        self.template = {}
+        for definition in self.emulator.orderRouteType.elements:
+            if definition.name not in GENERATED_FIELDS and not definition.isArray():
+                self.template[definition.name] = self.emulator.synthesize(schema, definition.typeName, definition.name)
+
+        service = "//blp/emapisvc_beta"
+        self.subscriptions = {
+            "order": EMSXEmulator.Subscription(None, orderSubscriptionID, service + "/order", "order", None),
+            "route": EMSXEmulator.Subscription(None, routeSubscriptionID, service + "/route", "route", None),
+        }
+        self.records = {
+            "order": [self.fullRecord(order) for order in self.emulator.orders.values()],
+            "route": [self.fullRecord(route) for route in self.emulator.routes.values()],
+        }
+
+    def fullRecord(self, record):
+        full = dict(self.template)
+        full.update(record)
+        return full
+
+    def message(self, kind, eventStatus, record):
+        subscription = self.subscriptions[kind]
+        if self.builder is not None:
+            values = {"MSG_TYPE": "E", "MSG_SUB_TYPE": "O" if kind == "order" else "R", "EVENT_STATUS": eventStatus,
+                      "API_SEQ_NUM": next(self.emulator.apiSequence)}
+            for name, value in (record or {}).items():
+                if value is not None and name in self.fieldNames:
+                    values[name] = value
+            return kind, self.builder.message(subscription.correlationId, values)
+
+        if len(self.cache) > 100000:
+            self.cache.clear()
+        return kind, self.emulator.orderRouteMessage(subscription, eventStatus, record, self.cache)
+
+    def paint(self):
+        for kind in ("order", "route"):
+            for record in self.records[kind]:
+                yield self.message(kind, EMSXEmulator.INIT_PAINT, record)
+            yield self.message(kind, EMSXEmulator.INIT_PAINT_END, None)
+
+    def updates(self, count):
+        # A fill on a random route, followed by the update to its order.
+        routes = self.records["route"]
+        orders = dict((order["EMSX_SEQUENCE"], order) for order in self.records["order"])
+        for i in range(count // 2):
+            route = self.random.choice(routes)
+            order = orders[route["EMSX_SEQUENCE"]]
+            amount = self.random.randint(1, 10)
+            price = round(self.random.uniform(99.0, 101.0), 2)
+            for record in (route, order):
+                filled = record["EMSX_FILLED"]
+                record["EMSX_AVG_PRICE"] = (record["EMSX_AVG_PRICE"] * filled + price * amount) / (filled + amount)
+                record["EMSX_FILLED"] = filled + amount
+                record["EMSX_WORKING"] = max(0, record["EMSX_WORKING"] - amount)
+                record["EMSX_STATUS"] = "PARTFILLED"
+            route["EMSX_FILL_ID"] += 1
+            yield self.message("route", EMSXEmulator.UPDATE_ORDER_ROUTE, route)
+            yield self.message("order", EMSXEmulator.UPDATE_ORDER_ROUTE, order)
+
+    def deletes(self):
+        for kind in ("route", "order"):
+            for record in self.records[kind]:
+                yield self.message(kind, EMSXEmulator.DELETE_ORDER_ROUTE, record)
+
+
+def batches(messages, size=d_batchSize):
+    batch = []
+    for item in messages:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def capturedMessages(path):
+    # OrderRouteFields messages from a capture log, in the order received.
+    from EMSXCapture import CaptureReader, pacedEvents
+    from EMSXNames import ORDER_ROUTE_FIELDS, MSG_SUB_TYPE
+    from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE
+
+    if backend() == BLPAPI:
+        import blpapi
+        builder = BlpapiMessages()
+        for receiveTime, eventType, messages in CaptureReader(path):
+            for messageType, correlationIds, topic, eventStatus, data in messages:
+                if messageType == ORDER_ROUTE_FIELDS_TYPE and correlationIds:
+                    kind = "order" if data.get("MSG_SUB_TYPE") == "O" else "route"
+                    yield kind, builder.message(blpapi.CorrelationId(correlationIds[0][1]), data)
+        return
+
+    for event in pacedEvents(path):
+        for msg in event:
+            if msg.messageType() == ORDER_ROUTE_FIELDS:
+                yield ("order" if msg.getElementAsString(MSG_SUB_TYPE) == "O" else "route"), msg
+
+
+class Scenario(object):
+
+    def __init__(self, name, build):
+        self.name = name
+        self.build = build          # () -> (setup messages or None, timed messages)
+
+
+def paintScenario(orders):
+    def build():
+        events = SyntheticEvents(orders)
+        return None, events.paint()
+    return Scenario("paint %d" % orders, build)
+
+
+def updateScenario(orders, updates):
+    def build():
+        events = SyntheticEvents(orders)
+        return events.paint(), events.updates(updates)
+    return Scenario("update", build)
+
+
+def deleteScenario(orders):
+    def build():
+        events = SyntheticEvents(orders)
+        return events.paint(), events.deletes()
+    return Scenario("delete", build)
+
+
+def captureScenario(path):
+    return Scenario("capture", lambda: (None, capturedMessages(path)))
+
+
+def prepare(scenario, modeFactory):
+    setup, timed = scenario.build()
+    consume = modeFactory()
+    if setup is not None:
+        for kind, msg in setup:
+            consume(kind, msg)
+    return consume, timed
+
+
+def timeRun(scenario, modeFactory):
+    consume, timed = prepare(scenario, modeFactory)
+
+    # Messages are generated a batch at a time outside the timed region.
+    clock = time.perf_counter_ns
+    samples = []
+    gc.collect()
+    for batch in batches(timed):
+        for kind, msg in batch:
+            start = clock()
+            consume(kind, msg)
+            samples.append(clock() - start)
+    return samples
+
+
+def allocationRun(scenario, modeFactory, sample=d_allocationSample):
+    # Returns (bytes retained per message, peak transient bytes of a batch)
+    # for the first sample timed messages.
+    consume, timed = prepare(scenario, modeFactory)
+
+    retained = 0
+    peak = 0
+    count = 0
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for batch in batches(timed):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            for kind, msg in batch:
+                consume(kind, msg)
+            current, batchPeak = tracemalloc.get_traced_memory()
+            retained += current - before
+            peak = max(peak, batchPeak - before)
+            count += len(batch)
+            if count >= sample:
+                break
+    finally:
+        tracemalloc.stop()
+    return (retained / count if count else 0), peak
+
+
+def runBenchmark(scenario, mode, allocations=True):
+    samples = timeRun(scenario, MODES[mode])
+    total = sum(samples)
+    samples.sort()
+
+    result = {
+        "scenario":         scenario.name,
+        "mode":             mode,
+        "messages":         len(samples),
+        "seconds":          total / 1e9,
+        "messagesPerSec":   len(samples) / (total / 1e9) if total else 0,
+        "p50Micros":        percentile(samples, 0.50) / 1e3,
+        "p99Micros":        percentile(samples, 0.99) / 1e3,
+        "maxMicros":        samples[-1] / 1e3 if samples else 0,
+        "backend":          backend(),
+    }
+    if allocations:
+        result["retainedBytesPerMessage"], result["peakBatchBytes"] = allocationRun(scenario, MODES[mode])
+    return result
+
+
+def availableModes(modes):
+    available = []
+    for mode in modes:
+        if mode == "columnar":
+            from EMSXColumnarBlotter import np
+            if np is None:
+                print ("Skipping columnar mode: numpy is not installed")
+                continue
+        available.append(mode)
+    return available
+
+
+def printResult(result):
+    line = "%-12s %-9s %9d %12.0f %9.2f %9.2f" % (result["scenario"], result["mode"], result["messages"],
+                                                  result["messagesPerSec"], result["p50Micros"], result["p99Micros"])
+    if "retainedBytesPerMessage" in result:
+        line += " %14.0f %10.0f" % (result["retainedBytesPerMessage"], result["peakBatchBytes"] / 1024.0)
+    line += " %s" % result["backend"]
+    print (line)
+
+
+def main():
+    # EMSXBenchmark.py [size,...] [--modes=legacy,decoder,...] [--updates=N] [--capture=capture.bin] [--no-alloc] [--json=results.json]
+    sizes = d_sizes
+    modes = d_modes
+    updates = d_updates
+    allocations = True
+    output = None
+    captures = []
+
+    for arg in sys.argv[1:]:
+        if arg.startswith("--modes="):
+            modes = arg[len("--modes="):].split(",")
+        elif arg.startswith("--updates="):
+            updates = int(arg[len("--updates="):])
+        elif arg.startswith("--capture="):
+            captures.append(arg[len("--capture="):])
+        elif arg == "--no-alloc":
+            allocations = False
+        elif arg.startswith("--json="):
+            output = arg[len("--json="):]
+        else:
+            sizes = [int(size) for size in arg.split(",")]
+
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        print ("Unknown modes: %s (choose from %s)" % (", ".join(unknown), ", ".join(sorted(MODES))))
+        return
+
+    modes = availableModes(modes)
+    blotterSize = min(d_updateBlotterSize, min(sizes))
+    scenarios = [paintScenario(size) for size in sizes]
+    scenarios.append(updateScenario(blotterSize, updates))
+    scenarios.append(deleteScenario(blotterSize))
+    scenarios.extend(captureScenario(path) for path in captures)
+
+    if backend() != BLPAPI:
+        print ("blpapi is not installed: messages are built and decoded by the emulator, so these results only")
+        print ("compare the modes with each other and say nothing about throughput against blpapi.")
+    print ("%-12s %-9s %9s %12s %9s %9s %14s %10s %s" % ("scenario", "mode", "messages", "msgs/sec", "p50(us)", "p99(us)", "retained B/msg", "peak KiB", "backend"))
+
+    results = []
+    for scenario in scenarios:
+        for mode in modes:
+            result = runBenchmark(scenario, mode, allocations)
+            printResult(result)
+            results.append(result)
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        print ("Results written to %s" % output)
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXBenchmark")
+
+    # Without blpapi the emulator stands in for it for the whole run, and
+    # every result is labelled emulator-only.
+    if blpapiTest() is None:
+        EMSXEmulator.install()
+
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
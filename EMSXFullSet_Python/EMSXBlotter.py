@@ -0,0 +1,232 @@
+# EMSXBlotter.py
+
+import threading
+
+
+# EVENT_STATUS values carried by OrderRouteFields messages
+HEARTBEAT               = 1
+INIT_PAINT              = 4
+NEW_ORDER_ROUTE         = 6
+UPDATE_ORDER_ROUTE      = 7
+DELETE_ORDER_ROUTE      = 8
+INIT_PAINT_END          = 11
+
+ORDER_KEY_FIELDS = ("EMSX_SEQUENCE",)
+ROUTE_KEY_FIELDS = ("EMSX_SEQUENCE", "EMSX_ROUTE_ID")
+
+d_indexFields=["EMSX_TICKER", "EMSX_STATUS", "EMSX_BASKET_NAME", "EMSX_TRADER", "EMSX_BROKER"]
+
+
+class BlotterTable(object):
+    """ Rows keyed by their key fields, with equality indexes on selected fields.
+
+    Each index maps a field value to the set of row keys holding that value,
+    so lookups and equality filters do not scan the table.
+    """
+
+    def __init__(self, keyFields, indexFields=d_indexFields):
+        self.keyFields = tuple(keyFields)
+        self.indexFields = list(indexFields)
+        self.rows = {}
+        self.indexes = dict((field, {}) for field in self.indexFields)
+        self.lock = threading.RLock()
+
+    def key(self, record):
+        if len(self.keyFields) == 1:
+            return record[self.keyFields[0]]
+        return tuple(record[field] for field in self.keyFields)
+
+    def addIndex(self, field):
+        with self.lock:
+            if field in self.indexes:
+                return
+            index = {}
+            for key, row in self.rows.items():
+                if field in row:
+                    index.setdefault(row[field], set()).add(key)
+            self.indexFields.append(field)
+            self.indexes[field] = index
+
+    def unindex(self, key, row, fields):
+        for field in fields:
+            if field in row:
+                keys = self.indexes[field].get(row[field])
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self.indexes[field][row[field]]
+
+    def reindex(self, key, row, fields):
+        for field in fields:
+            if field in row:
+                self.indexes[field].setdefault(row[field], set()).add(key)
+
+    def upsert(self, record):
+        # Merges the record into the stored row and returns the row.
+        key = self.key(record)
+        with self.lock:
+            row = self.rows.get(key)
+            if row is None:
+                row = dict(record)
+                self.rows[key] = row
+                self.reindex(key, row, self.indexFields)
+                return row
+
+            changed = [f for f in self.indexFields if f in record and row.get(f) != record[f]]
+            self.unindex(key, row, changed)
+            row.update(record)
+            self.reindex(key, row, changed)
+            return row
+
+    def replace(self, record):
+        # Makes the record the whole stored row, dropping fields it does not
+        # have, and returns the row.
+        key = self.key(record)
+        with self.lock:
+            row = self.rows.get(key)
+            if row is None:
+                return self.upsert(record)
+
+            changed = [f for f in self.indexFields if (f in row) != (f in record) or row.get(f) != record.get(f)]
+            self.unindex(key, row, changed)
+            row.clear()
+            row.update(record)
+            self.reindex(key, row, changed)
+            return row
+
+    def load(self, records):
+        # Bulk upsert for an initial paint, under a single lock.
+        with self.lock:
+            rows = self.rows
+            for record in records:
+                key = self.key(record)
+                if key in rows:
+                    self.upsert(record)
+                else:
+                    row = rows[key] = dict(record)
+                    self.reindex(key, row, self.indexFields)
+
+    def delete(self, key):
+        with self.lock:
+            row = self.rows.pop(key, None)
+            if row is not None:
+                self.unindex(key, row, self.indexFields)
+            return row
+
+    def clear(self):
+        with self.lock:
+            self.rows.clear()
+            for index in self.indexes.values():
+                index.clear()
+
+    def get(self, key):
+        with self.lock:
+            row = self.rows.get(key)
+            return dict(row) if row is not None else None
+
+    def allKeys(self):
+        with self.lock:
+            return list(self.rows.keys())
+
+    def keys(self, field, value):
+        with self.lock:
+            return set(self.indexes[field].get(value, ()))
+
+    def lookup(self, field, value):
+        with self.lock:
+            return [dict(self.rows[key]) for key in self.indexes[field].get(value, ())]
+
+    def values(self, field):
+        # Distinct values of an indexed field
+        with self.lock:
+            return list(self.indexes[field].keys())
+
+    def select(self, predicate=None, **equals):
+        # Rows matching all field=value filters and the optional predicate.
+        # Indexed filters are intersected first, starting with the smallest.
+        with self.lock:
+            indexed = [(f, v) for f, v in equals.items() if f in self.indexes]
+            others = [(f, v) for f, v in equals.items() if f not in self.indexes]
+
+            if indexed:
+                candidates = sorted((self.indexes[f].get(v, set()) for f, v in indexed), key=len)
+                keys = set(candidates[0])
+                for other in candidates[1:]:
+                    keys &= other
+                rows = [self.rows[key] for key in keys]
+            else:
+                rows = self.rows.values()
+
+            result = []
+            for row in rows:
+                if all(row.get(f) == v for f, v in others) and (predicate is None or predicate(row)):
+                    result.append(dict(row))
+            return result
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+
+class BlotterStore(object):
+    """ Live order and route blotter maintained from subscription records. """
+
+    def __init__(self, indexFields=d_indexFields):
+        self.orders = BlotterTable(ORDER_KEY_FIELDS, indexFields)
+        self.routes = BlotterTable(ROUTE_KEY_FIELDS, list(indexFields) + ["EMSX_SEQUENCE"])
+
+    def apply(self, table, eventStatus, record):
+        if eventStatus == INIT_PAINT or eventStatus == NEW_ORDER_ROUTE or eventStatus == UPDATE_ORDER_ROUTE:
+            return table.upsert(record)
+        elif eventStatus == DELETE_ORDER_ROUTE:
+            return table.delete(table.key(record))
+        return None
+
+    def applyOrder(self, eventStatus, record):
+        return self.apply(self.orders, eventStatus, record)
+
+    def applyRoute(self, eventStatus, record):
+        return self.apply(self.routes, eventStatus, record)
+
+    def loadOrders(self, records):
+        self.orders.load(records)
+
+    def loadRoutes(self, records):
+        self.routes.load(records)
+
+    def order(self, sequence):
+        return self.orders.get(sequence)
+
+    def route(self, sequence, routeId):
+        return self.routes.get((sequence, routeId))
+
+    def routesForOrder(self, sequence):
+        return self.routes.lookup("EMSX_SEQUENCE", sequence)
+
+    def clear(self):
+        self.orders.clear()
+        self.routes.clear()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
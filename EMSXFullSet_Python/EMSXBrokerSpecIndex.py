@@ -0,0 +1,305 @@
+# EMSXBrokerSpecIndex.py
+
+import sys
+import time
+
+from EMSXNames import (EMSX_STRATEGY_PARAMS, EMSX_STRATEGY_NAME, EMSX_STRATEGY_FIELDS, EMSX_STRATEGY_FIELD_INDICATORS,
+                       EMSX_FIELD_DATA, EMSX_FIELD_INDICATOR)
+from EMSXRefDataCache import RefDataError
+from EMSXRequestRunner import elementToPython
+
+
+d_service="//blp/emsx.brokerspec"   # only available in the production environment
+d_uuid=6767714
+d_requestTimeout=60
+
+ENUMERATION             = "enumeration"
+RANGE                   = "range"
+STRING                  = "string"
+
+
+class StrategyValidationError(ValueError):
+
+    def __init__(self, errors):
+        ValueError.__init__(self, "; ".join(errors))
+        self.errors = errors
+
+
+class StrategyParameter(object):
+
+    __slots__ = ("name", "position", "fixTag", "isRequired", "isReplaceable", "kind",
+                 "enumerators", "minimum", "maximum", "step", "possibleValues")
+
+    def __init__(self, position, spec):
+        self.name = spec["name"]
+        self.position = position
+        self.fixTag = spec.get("fixTag")
+        self.isRequired = bool(spec.get("isRequired"))
+        self.isReplaceable = bool(spec.get("isReplaceable"))
+        self.enumerators = None
+        self.minimum = self.maximum = self.step = None
+        self.possibleValues = None
+
+        # type is a choice: {"enumeration": {...}}, {"range": {...}} or {"string": {...}}
+        kind, details = next(iter((spec.get("type") or {STRING: {}}).items()))
+        self.kind = kind
+        if kind == ENUMERATION:
+            # Either the enumerator name or its FIX value is accepted.
+            self.enumerators = {}
+            for enumerator in details.get("enumerators", ()):
+                self.enumerators[enumerator["name"]] = enumerator["fixValue"]
+                self.enumerators[enumerator["fixValue"]] = enumerator["fixValue"]
+        elif kind == RANGE:
+            self.minimum = details.get("min")
+            self.maximum = details.get("max")
+            self.step = details.get("step")
+        elif kind == STRING:
+            values = details.get("possibleValues") or ()
+            self.possibleValues = frozenset(values) if values else None
+
+    def check(self, value):
+        # None if value is acceptable, otherwise the reason it is not.
+        if self.kind == ENUMERATION:
+            if value not in self.enumerators:
+                return "%s must be one of %s" % (self.name, ", ".join(sorted(self.enumerators)))
+        elif self.kind == RANGE:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                return "%s must be a number" % self.name
+            if self.minimum is not None and number < self.minimum:
+                return "%s must be at least %s" % (self.name, self.minimum)
+            if self.maximum is not None and number > self.maximum:
+                return "%s must be at most %s" % (self.name, self.maximum)
+            if self.step and self.minimum is not None:
+                steps = (number - self.minimum) / self.step
+                if abs(steps - round(steps)) > 1e-9:
+                    return "%s must be in steps of %s from %s" % (self.name, self.step, self.minimum)
+        elif self.possibleValues is not None and value not in self.possibleValues:
+            return "%s must be one of %s" % (self.name, ", ".join(sorted(self.possibleValues)))
+        return None
+
+    def wireValue(self, value):
+        # The EMSX_FIELD_DATA string for value; enumerations are always sent
+        # as the FIX value, whichever form was given.
+        if self.kind == ENUMERATION:
+            value = self.enumerators.get(value, value)
+        return str(value)
+
+
+class StrategySpec(object):
+    """ The parameters of one strategy of one broker and asset class, in order. """
+
+    def __init__(self, broker, assetClass, strategyFixTag, spec):
+        self.broker = broker
+        self.assetClass = assetClass
+        self.strategyFixTag = strategyFixTag
+        self.name = spec["name"]
+        self.fixValue = spec.get("fixValue")
+        self.parameters = [StrategyParameter(i, p) for i, p in enumerate(spec.get("parameters") or ())]
+        self.byName = dict((p.name, p) for p in self.parameters)
+        self.required = [p for p in self.parameters if p.isRequired]
+
+    def errors(self, values, replace=False):
+        # values maps parameter names to values; replace checks a
+        # ModifyRouteEx, where only replaceable parameters may be given.
+        errors = []
+        byName = self.byName
+        for name, value in values.items():
+            parameter = byName.get(name)
+            if parameter is None:
+                errors.append("%s is not a parameter of %s %s" % (name, self.broker, self.name))
+                continue
+            if replace and not parameter.isReplaceable:
+                errors.append("%s cannot be replaced" % name)
+            error = parameter.check(value)
+            if error is not None:
+                errors.append(error)
+        if not replace:
+            for parameter in self.required:
+                if parameter.name not in values:
+                    errors.append("%s is required" % parameter.name)
+        return errors
+
+    def validate(self, values, replace=False):
+        errors = self.errors(values, replace)
+        if errors:
+            raise StrategyValidationError(errors)
+
+    def fields(self, values):
+        # (EMSX_FIELD_DATA, EMSX_FIELD_INDICATOR) pairs in parameter order;
+        # parameters without a value are sent empty with indicator 1.
+        fields = []
+        for parameter in self.parameters:
+            value = values.get(parameter.name)
+            if value is None:
+                fields.append(("", 1))
+            else:
+                fields.append((parameter.wireValue(value), 0))
+        return fields
+
+    def applyTo(self, request, values, validate=True):
+        # Fills EMSX_STRATEGY_PARAMS of a RouteEx, ModifyRouteEx or
+        # CreateOrderAndRouteEx request.
+        if validate:
+            self.validate(values)
+        strategy = request.getElement(EMSX_STRATEGY_PARAMS)
+        strategy.setElement(EMSX_STRATEGY_NAME, self.name)
+        indicators = strategy.getElement(EMSX_STRATEGY_FIELD_INDICATORS)
+        data = strategy.getElement(EMSX_STRATEGY_FIELDS)
+        for value, indicator in self.fields(values):
+            data.appendElement().setElement(EMSX_FIELD_DATA, value)
+            indicators.appendElement().setElement(EMSX_FIELD_INDICATOR, indicator)
+
+    def __repr__(self):
+        return "%s %s %s (%d parameters)" % (self.broker, self.assetClass, self.name, len(self.parameters))
+
+
+class BrokerInfo(object):
+
+    def __init__(self, spec):
+        self.code = spec["code"]
+        self.assetClass = spec["assetClass"]
+        self.strategyFixTag = spec.get("strategyFixTag")
+        self.timesInForce = dict((t["name"], t["fixValue"]) for t in spec.get("timesInForce") or ())
+        self.orderTypes = dict((t["name"], t["fixValue"]) for t in spec.get("orderTypes") or ())
+        self.handlingInstructions = dict((h["name"], h["fixValue"]) for h in spec.get("handlingInstructions") or ())
+
+
+class BrokerSpecIndex(object):
+    """ A GetBrokerSpecForUuid response compiled for lookups.
+
+    Strategies are indexed by (broker code, asset class, strategy name) and
+    brokers by (broker code, asset class), so validating the strategy
+    parameters of a route is a few dict lookups instead of a request. The
+    index is built from the plain Python form of the response (see
+    fromMessage), which is also what toPython() returns.
+    """
+
+    def __init__(self, brokers=()):
+        self.source = list(brokers)
+        self.brokers = {}
+        self.strategies = {}
+        for spec in self.source:
+            broker = BrokerInfo(spec)
+            self.brokers[(broker.code, broker.assetClass)] = broker
+            for strategy in spec.get("strategies") or ():
+                compiled = StrategySpec(broker.code, broker.assetClass, broker.strategyFixTag, strategy)
+                self.strategies[(broker.code, broker.assetClass, compiled.name)] = compiled
+
+    @staticmethod
+    def fromMessage(msg):
+        return BrokerSpecIndex(elementToPython(msg.asElement()).get("brokers") or ())
+
+    @staticmethod
+    def fetch(session, uuid=d_uuid, service=d_service, timeout=d_requestTimeout):
+        # session is a ManagedSession with the brokerspec service open.
+        request = session.createRequest(service, "GetBrokerSpecForUuid")
+        request.set("uuid", uuid)
+        pending = session.sendRequest(request, timeout)
+        if pending.isError():
+            raise RefDataError("GetBrokerSpecForUuid failed: (%s) %s" % pending.error())
+        return BrokerSpecIndex(pending.response().get("brokers") or ())
+
+    def toPython(self):
+        return self.source
+
+    def strategy(self, broker, assetClass, name):
+        return self.strategies.get((broker, assetClass, name))
+
+    def broker(self, broker, assetClass):
+        return self.brokers.get((broker, assetClass))
+
+    def strategyNames(self, broker, assetClass):
+        return [key[2] for key in self.strategies if key[0] == broker and key[1] == assetClass]
+
+    def errors(self, broker, assetClass, strategy, values, replace=False):
+        spec = self.strategies.get((broker, assetClass, strategy))
+        if spec is None:
+            if (broker, assetClass) not in self.brokers:
+                return ["Unknown broker %s for %s" % (broker, assetClass)]
+            return ["%s has no strategy %s for %s" % (broker, strategy, assetClass)]
+        return spec.errors(values, replace)
+
+    def validate(self, broker, assetClass, strategy, values, replace=False):
+        # Raises StrategyValidationError with every problem found.
+        errors = self.errors(broker, assetClass, strategy, values, replace)
+        if errors:
+            raise StrategyValidationError(errors)
+        return self.strategies[(broker, assetClass, strategy)]
+
+    def routeErrors(self, broker, assetClass, tif=None, orderType=None, handInstruction=None):
+        # Checks the route fields the broker spec also restricts.
+        info = self.brokers.get((broker, assetClass))
+        if info is None:
+            return ["Unknown broker %s for %s" % (broker, assetClass)]
+        errors = []
+        if tif is not None and info.timesInForce and tif not in info.timesInForce:
+            errors.append("%s does not accept EMSX_TIF %s" % (broker, tif))
+        if orderType is not None and info.orderTypes and orderType not in info.orderTypes:
+            errors.append("%s does not accept EMSX_ORDER_TYPE %s" % (broker, orderType))
+        if handInstruction is not None and info.handlingInstructions and handInstruction not in info.handlingInstructions:
+            errors.append("%s does not accept EMSX_HAND_INSTRUCTION %s" % (broker, handInstruction))
+        return errors
+
+    def __len__(self):
+        return len(self.strategies)
+
+
+def main():
+    from EMSXSessionManager import ManagedSession
+
+    uuid = int(sys.argv[1]) if len(sys.argv) > 1 else d_uuid
+
+    session = ManagedSession(services=[d_service])
+    session.start()
+    try:
+        start = time.time()
+        index = BrokerSpecIndex.fetch(session, uuid)
+        print ("Compiled %d strategies of %d brokers in %0.3f seconds" % (len(index), len(index.brokers), time.time() - start))
+    finally:
+        session.stop()
+
+    for key in sorted(index.strategies):
+        spec = index.strategies[key]
+        print ("%s %s %s: %s" % (key[0], key[1], key[2], ", ".join(p.name + ("*" if p.isRequired else "") for p in spec.parameters)))
+
+    if index.strategies:
+        broker, assetClass, name = sorted(index.strategies)[0]
+        spec = index.strategy(broker, assetClass, name)
+        values = dict((p.name, p.minimum if p.kind == RANGE else next(iter(p.enumerators)) if p.kind == ENUMERATION else "")
+                      for p in spec.required)
+        count = 10000
+        start = time.time()
+        for i in range(count):
+            index.errors(broker, assetClass, name, values)
+        print ("Validated %s %s %s in %0.2f microseconds" % (broker, assetClass, name, (time.time() - start) / count * 1e6))
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXBrokerSpecIndex")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,249 @@
+# EMSXBrokerSpecStore.py
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+from EMSXBrokerSpecIndex import BrokerSpecIndex, d_service, d_uuid, d_requestTimeout
+from EMSXRefDataCache import RefDataError
+
+
+d_snapshotPath="brokerspec.json"
+d_refreshInterval=3600      # seconds between background refreshes; None to refresh only once
+d_indexTimeout=60           # seconds index() waits for the first fetch when there is no snapshot
+
+
+def specDigest(brokers):
+    # Identifies a spec independently of how it was serialised.
+    return hashlib.sha1(json.dumps(brokers, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+class BrokerSpecStore(object):
+    """ A BrokerSpecIndex persisted on disk and refreshed in the background.
+
+    index() loads and compiles the snapshot file the first time it is
+    called, so a process with a snapshot starts routing without waiting on
+    the brokerspec service; only a process without one blocks until the
+    first fetch completes or fails. start() runs a thread that fetches the spec
+    straight away and then every refreshInterval seconds. A fetched spec
+    that differs from the current one (by digest) is compiled, swapped in
+    as a single reference assignment, and written to the snapshot through
+    a temporary file and a rename, so neither readers of index() nor other
+    processes reading the file ever see a partial spec. An unchanged spec
+    is neither recompiled nor rewritten.
+    """
+
+    def __init__(self, path=d_snapshotPath, uuid=d_uuid, sessionManager=None, refreshInterval=d_refreshInterval,
+                 service=d_service, timeout=d_requestTimeout, fetch=None):
+        self.path = path
+        self.uuid = uuid
+        self.sessionManager = sessionManager
+        self.refreshInterval = refreshInterval
+        self.service = service
+        self.timeout = timeout
+        if fetch is not None:
+            self.fetch = fetch
+
+        self.current = None
+        self.digest = None
+        self.updated = None
+        self.loadLock = threading.Lock()
+        self.refreshLock = threading.Lock()
+        self.firstAttempt = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+
+        self.loads = 0
+        self.refreshes = 0
+        self.swaps = 0
+        self.errors = 0
+
+    def fetch(self):
+        # Returns the brokers array of a GetBrokerSpecForUuid response.
+        if self.sessionManager is None:
+            from EMSXSessionManager import defaultSessionManager
+            self.sessionManager = defaultSessionManager()
+
+        with self.sessionManager.borrow() as session:
+            request = session.createRequest(self.service, "GetBrokerSpecForUuid")
+            request.set("uuid", self.uuid)
+            pending = session.sendRequest(request, self.timeout)
+
+        if pending.isError():
+            raise RefDataError("GetBrokerSpecForUuid failed: (%s) %s" % pending.error())
+        return pending.response().get("brokers") or []
+
+    def index(self, timeout=d_indexTimeout):
+        # The current index; loads the snapshot on first use, and waits for
+        # the first fetch if there is none. Returns None if that fetch
+        # failed or timed out (timeout=None waits for it however long).
+        current = self.current
+        if current is not None:
+            return current
+
+        with self.loadLock:
+            if self.current is None and self.path is not None:
+                self.load()
+        if self.current is None:
+            if self.thread is None:
+                self.refresh()
+            else:
+                self.firstAttempt.wait(timeout)
+        return self.current
+
+    def load(self):
+        # Loads the snapshot file, if there is one for this uuid.
+        try:
+            with open(self.path) as f:
+                snapshot = json.load(f)
+            if not isinstance(snapshot, dict) or snapshot.get("uuid") != self.uuid:
+                return False
+            index = BrokerSpecIndex(snapshot["brokers"])
+            digest, saved = snapshot["digest"], snapshot["saved"]
+        except (IOError, OSError, ValueError, KeyError, TypeError, AttributeError):
+            print ("Error: Ignoring unreadable snapshot %s: %s" % (self.path, sys.exc_info()[1]), file=sys.stderr)
+            return False
+
+        self.swap(index, digest, saved)
+        self.loads += 1
+        return True
+
+    def save(self, brokers, digest):
+        temp = "%s.%d.tmp" % (self.path, os.getpid())
+        with open(temp, "w") as f:
+            json.dump({"uuid": self.uuid, "saved": time.time(), "digest": digest, "brokers": brokers}, f, separators=(",", ":"))
+        os.replace(temp, self.path)
+
+    def swap(self, index, digest, updated):
+        self.current = index
+        self.digest = digest
+        self.updated = updated
+
+    def refresh(self):
+        # Fetches the spec and swaps it in if it changed; returns True if it
+        # did. Waiters in index() are woken whether or not the fetch worked.
+        try:
+            return self.update()
+        finally:
+            self.firstAttempt.set()
+
+    def update(self):
+        with self.refreshLock:
+            try:
+                brokers = self.fetch()
+            except:
+                self.errors += 1
+                print ("Exception:  %s" % sys.exc_info()[0])
+                return False
+
+            self.refreshes += 1
+            digest = specDigest(brokers)
+            if digest == self.digest:
+                self.updated = time.time()
+                return False
+
+            self.swap(BrokerSpecIndex(brokers), digest, time.time())
+            self.swaps += 1
+            if self.path is not None:
+                try:
+                    self.save(brokers, digest)
+                except (IOError, OSError):
+                    print ("Exception:  %s" % sys.exc_info()[0])
+            return True
+
+    def run(self):
+        with self.loadLock:
+            if self.current is None and self.path is not None:
+                self.load()
+        self.refresh()
+        while self.refreshInterval is not None and not self.stopped.wait(self.refreshInterval):
+            self.refresh()
+
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="EMSXBrokerSpecStore")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def stats(self):
+        return {"strategies": len(self.current) if self.current is not None else 0, "digest": self.digest,
+                "updated": self.updated, "loads": self.loads, "refreshes": self.refreshes,
+                "swaps": self.swaps, "errors": self.errors}
+
+
+_defaultStore = None
+_defaultStoreLock = threading.Lock()
+
+
+def defaultBrokerSpecStore():
+    # Process-wide store, refreshing in the background from first use.
+    global _defaultStore
+    with _defaultStoreLock:
+        if _defaultStore is None:
+            _defaultStore = BrokerSpecStore()
+            _defaultStore.start()
+        return _defaultStore
+
+
+def main():
+    # EMSXBrokerSpecStore.py [--snapshot=brokerspec.json] [UUID]
+    global d_snapshotPath, d_uuid
+
+    for arg in sys.argv[1:]:
+        if arg.startswith("--snapshot="):
+            d_snapshotPath = arg[len("--snapshot="):]
+        else:
+            d_uuid = int(arg)
+
+    start = time.time()
+    store = BrokerSpecStore(d_snapshotPath, d_uuid, refreshInterval=None)
+    store.start()
+    index = store.index()
+    if index is None:
+        print ("No broker spec available after %0.3f seconds" % (time.time() - start))
+    else:
+        print ("%d strategies available after %0.3f seconds" % (len(index), time.time() - start))
+
+    store.stop()
+    print ("Store: %s" % store.stats())
+
+    if store.sessionManager is not None:
+        store.sessionManager.stop()
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXBrokerSpecStore")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,291 @@
+# EMSXBulkOrders.py
+
+import csv
+import queue
+import sys
+import time
+import uuid
+
+from EMSXNames import ERROR_INFO
+from EMSXOperations import REQUESTS, decodeResponse
+from EMSXSchema import emapisvcSchema
+
+
+d_service="//blp/emapisvc"
+d_operation="CreateOrder"
+d_window=50
+d_requestTimeout=30
+d_refIdField="EMSX_ORDER_REF_ID"
+d_blotterRefIdField="EMSX_ORD_REF_ID"     # the same value as published on OrderRouteFields
+
+# OrderResult states
+CREATED = "CREATED"
+FAILED  = "FAILED"
+UNKNOWN = "UNKNOWN"         # sent, but no response before the timeout; the order may exist
+
+CONVERTERS = {
+    "Int32":    int,
+    "Int64":    int,
+    "Float32":  float,
+    "Float64":  float,
+}
+
+
+def coerceSpec(spec, operation=d_operation, schema=None):
+    # Converts CSV/DataFrame values to the request field types and drops
+    # empty values so the service applies its defaults.
+    if schema is None:
+        schema = emapisvcSchema()
+    requestType = schema.requestType(operation)
+
+    coerced = {}
+    for name, value in spec.items():
+        if value is None or value == "" or value != value:    # value != value catches NaN
+            continue
+        element = requestType.element(name)
+        if element is None:
+            raise ValueError("%s is not a %s field" % (name, operation))
+        converter = CONVERTERS.get(schema.primitiveType(element.typeName))
+        if converter is not None:
+            value = converter(float(value)) if converter is int else converter(value)
+        coerced[name] = value
+    return coerced
+
+
+def specsFromCsv(path, operation=d_operation):
+    # One order per row, columns named after the request fields (EMSX_TICKER, ...).
+    with open(path) as f:
+        return [coerceSpec(row, operation) for row in csv.DictReader(f)]
+
+
+def specsFromDataFrame(frame, operation=d_operation):
+    return [coerceSpec(row, operation) for row in frame.to_dict("records")]
+
+
+class OrderResult(object):
+
+    def __init__(self, index, spec, refId=None):
+        self.index = index
+        self.spec = spec
+        self.refId = refId
+        self.reset()
+
+    def reset(self):
+        self.state = None
+        self.sequence = None
+        self.routeId = None
+        self.message = None
+        self.errorCode = None
+        self.errorMessage = None
+        self.latency = None
+
+    def isError(self):
+        return self.state == FAILED
+
+    def isUnknown(self):
+        return self.state == UNKNOWN
+
+    def __repr__(self):
+        if self.isUnknown():
+            return "Row %d: UNKNOWN %s (%s %s)" % (self.index, self.errorMessage, d_refIdField, self.refId)
+        if self.isError():
+            return "Row %d: ERROR %s %s" % (self.index, self.errorCode, self.errorMessage)
+        return "Row %d: EMSX_SEQUENCE %d %s" % (self.index, self.sequence, self.message)
+
+
+class BulkOrderCreator(object):
+    """ Pipelines CreateOrder (or CreateOrderAndRouteEx) requests.
+
+    Up to window requests are outstanding at once on the session; results
+    are matched back to their input rows through the request correlation
+    IDs and returned in input order. When the session has a rate limiter,
+    window is only an upper bound and the limiter's adaptive window decides
+    how many requests are actually in flight.
+
+    Every row is sent with an EMSX_ORDER_REF_ID (its own, or one generated
+    here). A request that gets no response before requestTimeout is
+    cancelled and reported as UNKNOWN rather than failed, since the order
+    may have been created anyway; reconcile() resolves those rows against
+    a blotter by the reference ID, and retry() does so before resending.
+    """
+
+    def __init__(self, session, service=d_service, operation=d_operation, window=d_window, requestTimeout=d_requestTimeout,
+                 refIdPrefix=None):
+        self.session = session
+        self.service = service
+        self.operation = operation
+        self.window = window
+        self.requestTimeout = requestTimeout
+        self.refIdPrefix = refIdPrefix if refIdPrefix is not None else uuid.uuid4().hex[:12]
+
+    def withRefId(self, index, spec):
+        if spec.get(d_refIdField):
+            return spec
+        spec = dict(spec)
+        spec[d_refIdField] = "%s-%d" % (self.refIdPrefix, index)
+        return spec
+
+    def buildRequest(self, service, spec):
+        # The generated request class checks the row before it is sent; a
+        # RequestValidationError fails the row without a request.
+        return REQUESTS[self.operation](**spec).create(service)
+
+    def sendOne(self, service, result, completed):
+        request = self.buildRequest(service, result.spec)
+        pending = self.session.sendRequestAsync(request)
+        pending.addCallback(lambda pending, result=result: completed.put((result, pending)))
+        return pending
+
+    def readResult(self, result, pending):
+        result.latency = pending.latency()
+
+        if pending.failure is not None:
+            # Cancelled, timed out or the session went away after the
+            # request was sent: whether the order exists is not known.
+            result.state = UNKNOWN
+            result.errorMessage = str(pending.failure)
+            return
+
+        msg = pending.messages[-1]
+        response = decodeResponse(msg)
+        if msg.messageType() == ERROR_INFO:
+            result.state = FAILED
+            result.errorCode = response.ERROR_CODE
+            result.errorMessage = response.ERROR_MESSAGE
+        else:
+            result.state = CREATED
+            result.sequence = response.EMSX_SEQUENCE
+            result.routeId = getattr(response, "EMSX_ROUTE_ID", None)
+            result.message = response.MESSAGE
+
+    def createOrders(self, specs, onResult=None):
+        # onResult(result) is called as each order completes.
+        results = []
+        for i, spec in enumerate(specs):
+            spec = self.withRefId(i, spec)
+            results.append(OrderResult(i, spec, spec[d_refIdField]))
+        return self.send(results, onResult)
+
+    def send(self, results, onResult=None):
+        service = self.session.getService(self.service)
+        completed = queue.Queue()
+        todo = list(reversed(results))
+        inFlight = {}
+
+        while todo or inFlight:
+
+            while todo and len(inFlight) < self.window:
+                result = todo.pop()
+                try:
+                    inFlight[result.index] = self.sendOne(service, result, completed)
+                except Exception as e:
+                    # Never sent, so definitely not created.
+                    result.state = FAILED
+                    result.errorMessage = "%s: %s" % (type(e).__name__, e)
+                    if onResult is not None:
+                        onResult(result)
+
+            if not inFlight:
+                continue
+
+            try:
+                result, pending = completed.get(timeout=1)
+            except queue.Empty:
+                now = time.time()
+                for pending in list(inFlight.values()):
+                    if now - pending.sentTime > self.requestTimeout:
+                        self.session.runner.cancel(pending)
+                continue
+
+            del inFlight[result.index]
+            self.readResult(result, pending)
+            if onResult is not None:
+                onResult(result)
+
+        return results
+
+    def reconcile(self, results, blotter):
+        # Resolves UNKNOWN results against a BlotterStore whose order
+        # subscription started before the orders were sent: a row whose
+        # reference ID is on the blotter was created. Returns the results
+        # that are still unknown.
+        unknown = []
+        for result in results:
+            if not result.isUnknown():
+                continue
+            rows = blotter.orders.select(**{d_blotterRefIdField: result.refId})
+            if rows:
+                result.state = CREATED
+                result.sequence = rows[0]["EMSX_SEQUENCE"]
+                result.errorMessage = None
+            else:
+                unknown.append(result)
+        return unknown
+
+    def retry(self, results, blotter, onResult=None):
+        # Resends the rows that were not created, with their original
+        # reference IDs, after reconciling so none is created twice.
+        self.reconcile(results, blotter)
+        todo = [result for result in results if result.state != CREATED]
+        for result in todo:
+            result.reset()
+        self.send(todo, onResult)
+        return results
+
+
+def main():
+    from EMSXRateLimiter import RateLimiter
+    from EMSXSessionManager import ManagedSession
+
+    if len(sys.argv) < 2:
+        print ("Usage: EMSXBulkOrders.py orders.csv")
+        return
+
+    specs = specsFromCsv(sys.argv[1])
+
+    limiter = RateLimiter()
+    session = ManagedSession(services=[d_service], limiter=limiter)
+    session.start()
+
+    try:
+        start = time.time()
+        results = BulkOrderCreator(session).createOrders(specs, onResult=print)
+        elapsed = time.time() - start
+
+        failed = len([r for r in results if r.isError()])
+        unknown = len([r for r in results if r.isUnknown()])
+        print ("Created %d orders (%d failed, %d unknown) in %0.2f seconds" % (len(results) - failed - unknown, failed, unknown, elapsed))
+        if unknown:
+            print ("Check the blotter for the unknown orders' %s before resending them" % d_refIdField)
+        print ("Rate limiter: %s" % limiter.stats())
+    finally:
+        session.stop()
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXBulkOrders")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
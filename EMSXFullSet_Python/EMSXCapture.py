@@ -0,0 +1,596 @@
+# EMSXCapture.py
+
+import runpy
+import struct
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, time as dtime
+
+from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, emapisvcSchema
+
+# blpapi is only needed to record and the emulator only to replay, so both
+# are imported where they are used: replaying or summarising a capture works
+# without blpapi, and recording never loads the emulator.
+
+
+MAGIC = b"EMSXCAP\x01"
+
+# Value tags. Element names and other short strings (message types,
+# statuses, tickers...) are written once and then referred to by their
+# index in the file's string table, which keeps wide OrderRouteFields
+# messages small.
+TAG_NONE        = 0
+TAG_FALSE       = 1
+TAG_TRUE        = 2
+TAG_INT         = 3
+TAG_FLOAT       = 4
+TAG_STRING      = 5
+TAG_NEW_NAME    = 6
+TAG_NAME        = 7
+TAG_LIST        = 8
+TAG_DICT        = 9
+TAG_DATETIME    = 10
+TAG_DATE        = 11
+TAG_TIME        = 12
+
+d_flushEvery=100
+d_maxNameLength=32
+d_maxNames=65536
+
+FLOAT = struct.Struct("<d")
+
+
+def writeVarint(out, value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def readVarint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class Encoder(object):
+
+    def __init__(self):
+        self.names = {}
+
+    def name(self, out, value):
+        index = self.names.get(value)
+        if index is not None:
+            out.append(TAG_NAME)
+            writeVarint(out, index)
+            return
+
+        raw = value.encode("utf-8")
+        if len(self.names) < d_maxNames:
+            self.names[value] = len(self.names)
+            out.append(TAG_NEW_NAME)
+        else:
+            out.append(TAG_STRING)
+        writeVarint(out, len(raw))
+        out += raw
+
+    def value(self, out, value):
+        if value is None:
+            out.append(TAG_NONE)
+        elif value is True:
+            out.append(TAG_TRUE)
+        elif value is False:
+            out.append(TAG_FALSE)
+        elif isinstance(value, int):
+            out.append(TAG_INT)
+            writeVarint(out, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            out.append(TAG_FLOAT)
+            out += FLOAT.pack(value)
+        elif isinstance(value, str):
+            if len(value) <= d_maxNameLength:
+                self.name(out, value)
+                return
+            raw = value.encode("utf-8")
+            out.append(TAG_STRING)
+            writeVarint(out, len(raw))
+            out += raw
+        elif isinstance(value, (list, tuple)):
+            out.append(TAG_LIST)
+            writeVarint(out, len(value))
+            for item in value:
+                self.value(out, item)
+        elif isinstance(value, dict):
+            out.append(TAG_DICT)
+            writeVarint(out, len(value))
+            for key, item in value.items():
+                self.name(out, str(key))
+                self.value(out, item)
+        elif isinstance(value, (datetime, date, dtime)):
+            raw = value.isoformat().encode("ascii")
+            out.append(TAG_DATETIME if isinstance(value, datetime) else TAG_DATE if isinstance(value, date) else TAG_TIME)
+            writeVarint(out, len(raw))
+            out += raw
+        else:
+            self.value(out, str(value))
+
+    def event(self, receiveTime, eventType, messages):
+        # Message types and topics always go through the string table.
+        out = bytearray()
+        out += FLOAT.pack(receiveTime)
+        self.value(out, eventType)
+        writeVarint(out, len(messages))
+        for messageType, correlationIds, topic, eventStatus, data in messages:
+            self.name(out, messageType)
+            self.value(out, correlationIds)
+            self.name(out, topic)
+            self.value(out, eventStatus)
+            self.value(out, data)
+        return out
+
+
+class Decoder(object):
+
+    def __init__(self):
+        self.names = []
+
+    def value(self, data, offset):
+        tag = data[offset]
+        offset += 1
+
+        if tag == TAG_NAME:
+            index, offset = readVarint(data, offset)
+            return self.names[index], offset
+        if tag == TAG_INT:
+            raw, offset = readVarint(data, offset)
+            return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1), offset
+        if tag == TAG_STRING or tag == TAG_NEW_NAME or tag >= TAG_DATETIME:
+            length, offset = readVarint(data, offset)
+            text = bytes(data[offset:offset + length]).decode("utf-8")
+            offset += length
+            if tag == TAG_NEW_NAME:
+                self.names.append(text)
+            elif tag == TAG_DATETIME:
+                return datetime.fromisoformat(text), offset
+            elif tag == TAG_DATE:
+                return date.fromisoformat(text), offset
+            elif tag == TAG_TIME:
+                return dtime.fromisoformat(text), offset
+            return text, offset
+        if tag == TAG_FLOAT:
+            return FLOAT.unpack_from(data, offset)[0], offset + FLOAT.size
+        if tag == TAG_LIST:
+            count, offset = readVarint(data, offset)
+            items = []
+            for i in range(count):
+                item, offset = self.value(data, offset)
+                items.append(item)
+            return items, offset
+        if tag == TAG_DICT:
+            count, offset = readVarint(data, offset)
+            fields = {}
+            for i in range(count):
+                key, offset = self.value(data, offset)
+                fields[key], offset = self.value(data, offset)
+            return fields, offset
+        if tag == TAG_NONE:
+            return None, offset
+        if tag == TAG_TRUE:
+            return True, offset
+        if tag == TAG_FALSE:
+            return False, offset
+        raise ValueError("Corrupt capture: unknown tag %d" % tag)
+
+    def event(self, data):
+        # Returns [receiveTime, eventType, messages] as written by Encoder.event.
+        receiveTime = FLOAT.unpack_from(data, 0)[0]
+        eventType, offset = self.value(data, FLOAT.size)
+        count, offset = readVarint(data, offset)
+        messages = []
+        for i in range(count):
+            messageType, offset = self.value(data, offset)
+            correlationIds, offset = self.value(data, offset)
+            topic, offset = self.value(data, offset)
+            eventStatus, offset = self.value(data, offset)
+            fields, offset = self.value(data, offset)
+            messages.append([messageType, correlationIds, topic, eventStatus, fields])
+        return [receiveTime, eventType, messages]
+
+
+def correlationIdRecord(correlationId):
+    value = correlationId.value()
+    return [correlationId.type(), value if isinstance(value, int) else None, correlationId.classId()]
+
+
+def messageRecord(msg):
+    from EMSXRequestRunner import elementToPython
+    data = elementToPython(msg.asElement())
+    eventStatus = data.get("EVENT_STATUS") if isinstance(data, dict) else None
+    try:
+        topic = msg.topicName()
+    except Exception:
+        topic = ""
+    return [str(msg.messageType()), [correlationIdRecord(c) for c in msg.correlationIds()], topic, eventStatus, data]
+
+
+class CaptureWriter(object):
+    """ Appends received events to a binary capture log.
+
+    Each event is stored with its receive time, type and messages; a message
+    keeps its type, correlation IDs, topic, EVENT_STATUS and every non-null
+    element. Writes may come from the event thread and from threads calling
+    nextEvent, so they are serialised.
+    """
+
+    def __init__(self, path, flushEvery=d_flushEvery):
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.encoder = Encoder()
+        self.flushEvery = flushEvery
+        self.events = 0
+        self.messages = 0
+        self.lock = threading.Lock()
+
+    def writeEvent(self, event, receiveTime=None):
+        if receiveTime is None:
+            receiveTime = time.time()
+        messages = [messageRecord(msg) for msg in event]
+
+        with self.lock:
+            if self.file is None:
+                return
+            payload = self.encoder.event(receiveTime, event.eventType(), messages)
+            header = bytearray()
+            writeVarint(header, len(payload))
+            self.file.write(header)
+            self.file.write(payload)
+
+            self.events += 1
+            self.messages += len(messages)
+            if self.events % self.flushEvery == 0:
+                self.file.flush()
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def captureHandler(handler, writer):
+    # Wraps a session event handler so every event is logged before it is handled.
+    def processEvent(event, session):
+        writer.writeEvent(event)
+        return handler(event, session)
+    return processEvent
+
+
+def capturingSessionClass(base, writer):
+    # A Session class that logs every event delivered to its handler or
+    # returned by nextEvent.
+    import blpapi
+
+    class CapturingSession(base):
+
+        def __init__(self, options=None, eventHandler=None, *args, **kwargs):
+            if eventHandler is not None:
+                eventHandler = captureHandler(eventHandler, writer)
+            base.__init__(self, options, eventHandler, *args, **kwargs)
+
+        def nextEvent(self, timeout=0):
+            event = base.nextEvent(self, timeout)
+            if event.eventType() != blpapi.Event.TIMEOUT:
+                writer.writeEvent(event)
+            return event
+
+        def tryNextEvent(self):
+            event = base.tryNextEvent(self)
+            if event is not None:
+                writer.writeEvent(event)
+            return event
+
+    return CapturingSession
+
+
+class CaptureReader(object):
+    """ Reads a capture log back as (receiveTime, eventType, messages) records. """
+
+    def __init__(self, path):
+        self.path = path
+
+    def readLength(self, f):
+        length = 0
+        shift = 0
+        while True:
+            byte = f.read(1)
+            if not byte:
+                return None
+            length |= (byte[0] & 0x7f) << shift
+            if byte[0] < 0x80:
+                return length
+            shift += 7
+
+    def records(self):
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError("%s is not an EMSX capture" % self.path)
+
+            decoder = Decoder()
+            while True:
+                length = self.readLength(f)
+                if length is None:
+                    return
+                payload = f.read(length)
+                if len(payload) < length:
+                    return      # truncated by a recorder that did not close the log
+                yield decoder.event(payload)
+
+    def __iter__(self):
+        return self.records()
+
+
+class MessageBuilder(object):
+    """ Rebuilds captured messages as emulator Events and Messages.
+
+    OrderRouteFields messages get the schema's element layout, so decoders
+    that rely on element positions see what a live subscription delivers;
+    other messages are rebuilt from their values.
+    """
+
+    def __init__(self, schema=None):
+        import EMSXEmulator
+        self.emulator = EMSXEmulator
+        self.schema = schema if schema is not None else emapisvcSchema()
+
+    def element(self, messageType, data):
+        emulator = self.emulator
+        if messageType == ORDER_ROUTE_FIELDS_TYPE:
+            element = emulator.Element(ORDER_ROUTE_FIELDS_TYPE, self.schema, ORDER_ROUTE_FIELDS_TYPE)
+            try:
+                return emulator.populate(element, data)
+            except emulator.BlpapiException:
+                pass        # fields or enumerators the local schema does not know
+        return emulator.Element.fromPython(messageType, data if data is not None else {})
+
+    def message(self, record):
+        messageType, correlationIds, topic, eventStatus, data = record
+        correlationIds = [self.emulator.CorrelationId.restore(valueType, value, classId) for valueType, value, classId in correlationIds]
+        return self.emulator.Message(self.element(messageType, data), correlationIds, topic)
+
+    def event(self, record):
+        receiveTime, eventType, messages = record
+        return self.emulator.Event(eventType, [self.message(m) for m in messages])
+
+
+def pacedEvents(path, speed=None, stopped=None):
+    # Yields captured events, spaced out as they were received divided by
+    # speed; speed None (or 0) replays as fast as possible.
+    builder = MessageBuilder()
+    start = None
+    first = None
+
+    for record in CaptureReader(path):
+        if speed:
+            if start is None:
+                start, first = time.time(), record[0]
+            wait = start + (record[0] - first) / speed - time.time()
+            if wait > 0:
+                if stopped is not None:
+                    if stopped.wait(wait):
+                        return
+                else:
+                    time.sleep(wait)
+        if stopped is not None and stopped.is_set():
+            return
+        yield builder.event(record)
+
+
+def replay(path, handler, speed=None, session=None):
+    # Calls handler(event, session) for every captured event; returns the number of events.
+    count = 0
+    for event in pacedEvents(path, speed):
+        handler(event, session)
+        count += 1
+    return count
+
+
+def replaySessionClass(path, speed=None):
+    # A blpapi Session class replaying the capture at path; the emulator is
+    # only loaded here, when a capture is replayed.
+    import EMSXEmulator
+
+    class ReplaySession(EMSXEmulator.Session):
+        """ A Session that delivers a capture log instead of connecting.
+
+        Events go to the event handler, or to nextEvent() without one, exactly
+        as a live session would deliver them. Requests and subscriptions made by
+        the handler are accepted and ignored, since their responses are already
+        in the log.
+        """
+
+        capturePath = None
+        speed = None
+
+        def __init__(self, options=None, eventHandler=None, eventDispatcher=None, path=None, speed=None):
+            EMSXEmulator.Session.__init__(self, options, eventHandler, eventDispatcher)
+            if path is not None:
+                self.capturePath = path
+            if speed is not None:
+                self.speed = speed
+            self.stopped = threading.Event()
+            self.finished = threading.Event()
+            self.delivered = 0
+
+        def replay(self):
+            try:
+                for event in pacedEvents(self.capturePath, self.speed, self.stopped):
+                    self.deliver(event)
+                    self.delivered += 1
+            finally:
+                self.finished.set()
+
+        def startAsync(self):
+            if self.running:
+                return False
+            self.running = True
+            self.thread = threading.Thread(target=self.replay, name="EMSXReplaySession")
+            self.thread.daemon = True
+            self.thread.start()
+            return True
+
+        def stop(self):
+            self.running = False
+            self.stopped.set()
+            if self.thread is not None and self.thread is not threading.current_thread():
+                self.thread.join()
+
+        def stopAsync(self):
+            self.running = False
+            self.stopped.set()
+
+        def openService(self, name):
+            service = self.emulator.openService(name)
+            if service is not None:
+                self.services[name] = service
+            return True
+
+        def openServiceAsync(self, name, correlationId=None):
+            self.openService(name)
+            return correlationId if correlationId is not None else EMSXEmulator.CorrelationId().assign()
+
+        def sendRequest(self, request, identity=None, correlationId=None, eventQueue=None, requestLabel=None):
+            return correlationId if correlationId is not None else EMSXEmulator.CorrelationId().assign()
+
+        def subscribe(self, subscriptionList, identity=None, requestLabel=None):
+            pass
+
+        def unsubscribe(self, subscriptionList):
+            pass
+
+        def cancel(self, correlationId):
+            pass
+
+    return type("ReplaySession", (ReplaySession,), {"capturePath": path, "speed": speed})
+
+
+def summary(path):
+    events = Counter()
+    statuses = Counter()
+    messageTypes = Counter()
+    first = last = None
+
+    for receiveTime, eventType, messages in CaptureReader(path):
+        first = receiveTime if first is None else first
+        last = receiveTime
+        events[eventType] += 1
+        for messageType, correlationIds, topic, eventStatus, data in messages:
+            messageTypes[messageType] += 1
+            if eventStatus is not None:
+                statuses[eventStatus] += 1
+
+    from EMSXEmulator import Event
+    eventNames = dict((value, name) for name, value in vars(Event).items() if name.isupper())
+    print ("%d events over %0.3f seconds" % (sum(events.values()), (last - first) if first is not None else 0))
+    for eventType, count in sorted(events.items()):
+        print ("  %-20s %d" % (eventNames.get(eventType, eventType), count))
+    print ("Messages:")
+    for messageType, count in messageTypes.most_common():
+        print ("  %-30s %d" % (messageType, count))
+    if statuses:
+        print ("EVENT_STATUS:")
+        for eventStatus, count in sorted(statuses.items()):
+            print ("  %-4d %d" % (eventStatus, count))
+
+
+def runScript(script, args):
+    sys.argv = [script] + args
+    runpy.run_path(script, run_name="__main__")
+
+
+def main():
+    usage = ("Usage: EMSXCapture.py record capture.bin Script.py [args...]\n"
+             "       EMSXCapture.py replay capture.bin Script.py [--speed=N|max] [args...]\n"
+             "       EMSXCapture.py summary capture.bin")
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ("record", "replay", "summary"):
+        print (usage)
+        return
+
+    command, path, args = sys.argv[1], sys.argv[2], sys.argv[3:]
+
+    if command == "summary":
+        summary(path)
+        return
+
+    if not args:
+        print (usage)
+        return
+
+    if command == "record":
+        import blpapi
+        writer = CaptureWriter(path)
+        blpapi.Session = capturingSessionClass(blpapi.Session, writer)
+        try:
+            runScript(args[0], args[1:])
+        finally:
+            writer.close()
+            print ("Captured %d events (%d messages) to %s" % (writer.events, writer.messages, path))
+        return
+
+    speed = 1.0
+    for arg in list(args):
+        if arg.startswith("--speed="):
+            value = arg[len("--speed="):]
+            speed = None if value == "max" else float(value)
+            args.remove(arg)
+
+    # Replayed messages are emulator objects, so a replayed script runs
+    # against the emulator's blpapi with its sessions replaced by the log;
+    # this is the only place the emulator is installed.
+    import EMSXEmulator
+    EMSXEmulator.install()
+    sys.modules["blpapi"].Session = replaySessionClass(path, speed)
+    runScript(args[0], args[1:])
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXCapture")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
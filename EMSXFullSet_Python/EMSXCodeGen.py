@@ -0,0 +1,495 @@
+# EMSXCodeGen.py
+
+import os
+import re
+import sys
+
+from EMSXSchema import ServiceSchema, PRIMITIVE_ACCESSORS, d_emapisvcSchema, d_historySchema
+
+
+d_outputDir=os.path.dirname(os.path.abspath(__file__))
+d_operationsOutput=os.path.join(d_outputDir, "EMSXOperations.py")
+d_namesOutput=os.path.join(d_outputDir, "EMSXNames.py")
+
+# Schemas whose names go into EMSXNames, with the prefix given to a name
+# whose constant is already taken by a different name of an earlier schema
+# (history's ErrorCode becomes HISTORY_ERROR_CODE next to emapisvc's
+# ERROR_CODE).
+d_nameSchemas = [(d_emapisvcSchema, ""), (d_historySchema, "HISTORY_")]
+
+# Session, service and subscription status messages and their elements,
+# which are not in either schema.
+SYSTEM_NAMES = {
+    "SESSION_STARTED":                  "SessionStarted",
+    "SESSION_STARTUP_FAILURE":          "SessionStartupFailure",
+    "SESSION_TERMINATED":               "SessionTerminated",
+    "SESSION_CONNECTION_UP":            "SessionConnectionUp",
+    "SESSION_CONNECTION_DOWN":          "SessionConnectionDown",
+    "SERVICE_OPENED":                   "ServiceOpened",
+    "SERVICE_OPEN_FAILURE":             "ServiceOpenFailure",
+    "SUBSCRIPTION_STARTED":             "SubscriptionStarted",
+    "SUBSCRIPTION_FAILURE":             "SubscriptionFailure",
+    "SUBSCRIPTION_TERMINATED":          "SubscriptionTerminated",
+    "SLOW_CONSUMER_WARNING":            "SlowConsumerWarning",
+    "SLOW_CONSUMER_WARNING_CLEARED":    "SlowConsumerWarningCleared",
+    "REQUEST_FAILURE":                  "RequestFailure",
+    "REASON":                           "reason",
+    "REASON_ERROR_CODE":                "errorCode",
+    "DESCRIPTION":                      "description",
+    "CATEGORY":                         "category",
+    "SUBCATEGORY":                      "subcategory",
+    "SOURCE":                           "source",
+    "EXCEPTIONS":                       "exceptions",
+    "FIELD_ID":                         "fieldId",
+}
+
+INDENT = "    "
+
+HEADER = '''# EMSXOperations.py
+#
+# Generated by EMSXCodeGen.py from %(schema)s (version %(version)s).
+# Do not edit; change the generator and run it again.
+
+'''
+
+HELPERS = '''
+
+class RequestValidationError(ValueError):
+
+    def __init__(self, errors):
+        ValueError.__init__(self, "; ".join(errors))
+        self.errors = errors
+
+
+def fillElement(element, value):
+    # Sets value, in the form elementToPython() returns, on element: dicts
+    # for sequences and choices, lists for arrays, scalars otherwise.
+    if isinstance(value, dict):
+        if element.isChoice():
+            for name, item in value.items():
+                fillElement(element.setChoice(name), item)
+        else:
+            for name, item in value.items():
+                fillElement(element.getElement(name), item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, dict):
+                fillElement(element.appendElement(), item)
+            else:
+                element.appendValue(item)
+    else:
+        element.setValue(value)
+'''
+
+FOOTER = '''
+
+def decodeResponse(msg):
+    # The decoded response or ErrorInfo of a request, or None for other
+    # message types.
+    decoder = DECODERS.get(msg.messageType())
+    if decoder is None:
+        return None
+    return decoder(msg)
+'''
+
+NAMES_HEADER = '''# EMSXNames.py
+#
+# Generated by EMSXCodeGen.py from %(schemas)s.
+# Do not edit; change the generator and run it again.
+
+import blpapi
+
+
+# Constant -> element, message or operation name, for every name in the
+# schemas and the session status messages. Each blpapi.Name is created the
+# first time it is imported or read from this module and is then a module
+# global, so later uses are plain attribute reads:
+#
+#     from EMSXNames import EMSX_SEQUENCE, ERROR_INFO
+#
+'''
+
+NAMES_FOOTER = '''
+_interned = {}
+
+
+def name(value):
+    # The shared blpapi.Name for a name only known at run time.
+    result = _interned.get(value)
+    if result is None:
+        result = _interned[value] = blpapi.Name(value)
+    return result
+
+
+def __getattr__(attr):
+    # Only called for constants that have not been created yet.
+    value = NAMES.get(attr)
+    if value is None:
+        raise AttributeError("module %s has no attribute %s" % (__name__, attr))
+    result = globals()[attr] = name(value)
+    return result
+
+
+def __dir__():
+    return sorted(set(globals()) | set(NAMES))
+'''
+
+COPYRIGHT = '''
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
+'''
+
+
+def constantName(name):
+    # OrderRouteFields -> ORDER_ROUTE_FIELDS; EMSX_TIF stays as it is.
+    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name).upper()
+
+
+def schemaNames(schema):
+    # Element, operation, response message and event names of a schema.
+    names = set()
+    for typeDef in schema.types.values():
+        for element in typeDef.elements:
+            names.add(element.name)
+    for operation in schema.operations.values():
+        names.add(operation.name)
+        names.update(operation.responseSelections)
+    names.update(schema.events)
+    return names
+
+
+def buildNames(schemas):
+    # {constant: name} for the (schema, prefix) pairs and SYSTEM_NAMES.
+    constants = {}
+    taken = {}
+    for schema, prefix in schemas:
+        for name in sorted(schemaNames(schema)):
+            if name in taken:
+                continue
+            constant = constantName(name)
+            if constant in constants:
+                constant = prefix + constant
+            if constant in constants:
+                raise ValueError("%s and %s map to the same constant %s" % (constants[constant], name, constant))
+            constants[constant] = name
+            taken[name] = constant
+    for constant, name in SYSTEM_NAMES.items():
+        if constants.setdefault(constant, name) != name:
+            raise ValueError("%s and %s map to the same constant %s" % (constants[constant], name, constant))
+    return constants
+
+
+def generateNames(schemas):
+    constants = buildNames(schemas)
+    lines = ["NAMES = {"]
+    for constant in sorted(constants):
+        lines.append('%s"%s":%s"%s",' % (INDENT, constant, " " * max(1, 40 - len(constant)), constants[constant]))
+    lines.append("}")
+    header = NAMES_HEADER % {"schemas": " and ".join(os.path.basename(schema.path) for schema, prefix in schemas)}
+    return header + "\n".join(lines) + "\n\n" + NAMES_FOOTER + COPYRIGHT
+
+
+class Generator(object):
+    """ Writes typed request builders and response decoders for a service.
+
+    For every operation the output has a <Operation>Request class whose
+    FIELDS lists (name, type, required, array) for each field, whose
+    __slots__ are the request's fields and whose fill(), errors() and
+    __init__() are unrolled per field, using module level blpapi.Name
+    constants and frozensets of the schema's enumerators; for every response
+    type a class of the same name whose fromMessage() reads each field with
+    the getter for its schema type. Nothing is looked up by string or
+    through an instance dict when a request is built or a response decoded.
+    """
+
+    def __init__(self, schema, names):
+        self.schema = schema
+        self.registry = names
+        self.names = set()
+        self.enums = {}
+        self.lines = []
+
+    def emit(self, line="", level=0):
+        self.lines.append(INDENT * level + line if line else "")
+
+    def emitTuple(self, prefix, items, level, suffix=""):
+        # One item per line, so long field lists stay readable and diff well.
+        if len(items) < 2:
+            self.emit("%s(%s)%s" % (prefix, "".join("%s," % item for item in items), suffix), level)
+            return
+        self.emit("%s(" % prefix, level)
+        for item in items:
+            self.emit("%s," % item, level + 1)
+        self.emit(")%s" % suffix, level)
+
+    def name(self, name):
+        # The EMSXNames constant for name.
+        constant = constantName(name)
+        if self.registry.get(constant) != name:
+            raise ValueError("%s is not in EMSXNames as %s" % (name, constant))
+        self.names.add(constant)
+        return constant
+
+    def enum(self, typeName):
+        constant = constantName(typeName)
+        self.enums[constant] = self.schema.types[typeName]
+        return constant
+
+    def fieldKind(self, element):
+        # "scalar", "enum" or "complex" (sequences, choices and arrays).
+        if element.isArray():
+            return "complex"
+        if self.schema.isPrimitive(element.typeName):
+            return "scalar"
+        typeDef = self.schema.types.get(element.typeName)
+        if typeDef is not None and typeDef.kind == "enumeration":
+            return "enum"
+        return "complex"
+
+    def getter(self, element):
+        primitive = self.schema.primitiveType(element.typeName)
+        return PRIMITIVE_ACCESSORS[primitive].replace("getValueAs", "getElementAs")
+
+    def responseTypes(self):
+        # {response type name: (TypeDef, [message type names])}, in schema order.
+        types = {}
+        for operation in self.schema.operations.values():
+            for selection in operation.responseSelections:
+                typeDef = self.schema.selectionType(operation.response, selection)
+                entry = types.setdefault(typeDef.name, (typeDef, []))
+                if selection not in entry[1]:
+                    entry[1].append(selection)
+        return types
+
+    def generateRequest(self, operation):
+        typeDef = self.schema.requestType(operation.name)
+        elements = typeDef.elements
+        className = "%sRequest" % operation.name
+
+        self.emit()
+        self.emit()
+        self.emit("class %s(object):" % className)
+        self.emit('""" %s request (%s). """' % (operation.name, typeDef.name), 1)
+        self.emit()
+        self.emit('OPERATION = "%s"' % operation.name, 1)
+        self.emit("FIELDS = (", 1)
+        for element in elements:
+            self.emit('("%s", "%s", %s, %s),' % (element.name, element.typeName, element.isRequired(), element.isArray()), 2)
+        self.emit(")", 1)
+        self.emit()
+        self.emitTuple("__slots__ = ", ['"%s"' % e.name for e in elements], 1)
+        self.emit()
+
+        if elements:
+            self.emit("def __init__(self,", 1)
+            for i, element in enumerate(elements):
+                self.emit(" " * 17 + "%s=None%s" % (element.name, "):" if i == len(elements) - 1 else ","))
+            for element in elements:
+                self.emit("self.%s = %s" % (element.name, element.name), 2)
+            self.emit()
+
+        self.emit("def errors(self):", 1)
+        self.emit("errors = []", 2)
+        for element in elements:
+            if element.isRequired():
+                self.emit("if self.%s is None:" % element.name, 2)
+                self.emit('errors.append("%s is required")' % element.name, 3)
+            if element.isArray():
+                # fillElement would pass anything else to setValue() on the array.
+                self.emit("if self.%s is not None and not isinstance(self.%s, (list, tuple)):" % (element.name, element.name), 2)
+                self.emit('errors.append("%s must be a list")' % element.name, 3)
+            elif self.fieldKind(element) == "enum":
+                enum = self.enum(element.typeName)
+                self.emit("if self.%s is not None and self.%s not in %s:" % (element.name, element.name, enum), 2)
+                self.emit('errors.append("%%s is not a valid %s" %% (self.%s,))' % (element.name, element.name), 3)
+        self.emit("return errors", 2)
+        self.emit()
+
+        self.emit("def validate(self):", 1)
+        self.emit("errors = self.errors()", 2)
+        self.emit("if errors:", 2)
+        self.emit("raise RequestValidationError(errors)", 3)
+        self.emit()
+
+        self.emit("def fill(self, request):", 1)
+        if not elements:
+            self.emit("pass", 2)
+        for element in elements:
+            constant = self.name(element.name)
+            self.emit("if self.%s is not None:" % element.name, 2)
+            if self.fieldKind(element) == "complex":
+                self.emit("fillElement(request.getElement(%s), self.%s)" % (constant, element.name), 3)
+            else:
+                self.emit("request.set(%s, self.%s)" % (constant, element.name), 3)
+        self.emit()
+
+        self.emit("def create(self, service, validate=True):", 1)
+        self.emit("# service is the blpapi.Service the request is created on.", 2)
+        self.emit("if validate:", 2)
+        self.emit("self.validate()", 3)
+        self.emit("request = service.createRequest(self.OPERATION)", 2)
+        self.emit("self.fill(request)", 2)
+        self.emit("return request", 2)
+        return className
+
+    def generateResponse(self, typeDef, messageTypes):
+        elements = typeDef.elements
+
+        self.emit()
+        self.emit()
+        self.emit("class %s(object):" % typeDef.name)
+        self.emit('""" Decoded %s response. """' % ", ".join(messageTypes), 1)
+        self.emit()
+        self.emitTuple("__slots__ = ", ['"%s"' % e.name for e in elements], 1)
+        self.emit()
+
+        self.emit("def __init__(self):", 1)
+        if not elements:
+            self.emit("pass", 2)
+        for element in elements:
+            self.emit("self.%s = None" % element.name, 2)
+        self.emit()
+
+        self.emit("@staticmethod", 1)
+        self.emit("def fromMessage(msg):", 1)
+        self.emit("response = %s()" % typeDef.name, 2)
+        for element in elements:
+            constant = self.name(element.name)
+            self.emit("if msg.hasElement(%s, True):" % constant, 2)
+            if self.fieldKind(element) == "complex":
+                self.emit("response.%s = elementToPython(msg.getElement(%s))" % (element.name, constant), 3)
+            else:
+                self.emit("response.%s = msg.%s(%s)" % (element.name, self.getter(element), constant), 3)
+        self.emit("return response", 2)
+        self.emit()
+
+        self.emit("def __repr__(self):", 1)
+        self.emit('return "%s(%%s)" %% ", ".join("%%s=%%r" %% (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)' % typeDef.name, 2)
+
+    def generate(self):
+        requests = []
+        for operation in self.schema.operations.values():
+            requests.append((operation.name, self.generateRequest(operation)))
+
+        decoders = []
+        for typeDef, messageTypes in self.responseTypes().values():
+            self.generateResponse(typeDef, messageTypes)
+            for messageType in messageTypes:
+                decoders.append((self.name(messageType), typeDef.name))
+
+        self.emit()
+        self.emit()
+        self.emit("REQUESTS = {")
+        for operation, className in requests:
+            self.emit('"%s": %s,' % (operation, className), 1)
+        self.emit("}")
+        self.emit()
+        self.emit("# Keyed by message type, as returned by Message.messageType().")
+        self.emit("DECODERS = {")
+        for constant, className in decoders:
+            self.emit("%s: %s.fromMessage," % (constant, className), 1)
+        self.emit("}")
+
+        for constant in self.enums:
+            if constant in self.names:
+                raise ValueError("Enumeration %s and name %s map to the same constant %s" % (self.enums[constant].name, self.registry[constant], constant))
+
+        body = self.lines
+        self.lines = []
+        self.emitTuple("from EMSXNames import ", sorted(self.names), 0)
+        self.emit("from EMSXRequestRunner import elementToPython")
+        self.emit()
+        self.emit()
+        self.emit('d_service="%s"' % self.schema.serviceName)
+        for constant in sorted(self.enums):
+            typeDef = self.enums[constant]
+            self.emit()
+            self.emitTuple("%s = frozenset(" % constant, ['"%s"' % e for e in typeDef.enumerators], 0, ")")
+
+        header = HEADER % {"schema": os.path.basename(self.schema.path), "version": self.schema.version}
+        return header + "\n".join(self.lines) + "\n" + HELPERS + "\n".join(body) + "\n" + FOOTER + COPYRIGHT
+
+
+def generate():
+    # {output path: source} of every generated module.
+    schemas = [(ServiceSchema(path), prefix) for path, prefix in d_nameSchemas]
+    names = buildNames(schemas)
+    return {d_namesOutput: generateNames(schemas),
+            d_operationsOutput: Generator(schemas[0][0], names).generate()}
+
+
+def main():
+    # EMSXCodeGen.py [--check]
+    # --check exits with status 1 if a generated module is not up to date.
+    check = "--check" in sys.argv[1:]
+    outdated = 0
+
+    for output, source in sorted(generate().items()):
+        if check:
+            try:
+                with open(output, newline="") as f:
+                    current = f.read().replace("\r\n", "\n")
+            except (IOError, OSError):
+                current = None
+            if current != source:
+                print ("%s is out of date, run EMSXCodeGen.py" % output)
+                outdated += 1
+            else:
+                print ("%s is up to date" % output)
+            continue
+
+        # Generated modules use CRLF like the rest of the examples.
+        with open(output, "w", newline="\r\n") as f:
+            f.write(source)
+        print ("Wrote %s (%d lines)" % (output, source.count("\n")))
+
+    if outdated:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXCodeGen")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,376 @@
+# EMSXColumnarBlotter.py
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import threading
+
+from EMSXBlotter import INIT_PAINT, NEW_ORDER_ROUTE, UPDATE_ORDER_ROUTE, DELETE_ORDER_ROUTE, ORDER_KEY_FIELDS, ROUTE_KEY_FIELDS
+from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, emapisvcSchema
+
+
+d_initialCapacity=1024
+
+
+def requireNumpy():
+    if np is None:
+        raise ImportError("The columnar blotter requires numpy (pip install numpy)")
+
+
+class StringDictionary(object):
+    """ Dictionary encoding for a string column; code 0 is the empty string. """
+
+    def __init__(self):
+        self.values = [""]
+        self.codes = {"": 0}
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def decode(self, code):
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ColumnarTable(object):
+    """ One typed numpy array per OrderRouteFields element.
+
+    String fields are stored as int32 dictionary codes. Rows are addressed
+    through a key -> row map and updated in place; deleted rows are marked
+    dead and reused by later inserts. Aggregations run over the live rows
+    with vectorised numpy operations.
+    """
+
+    def __init__(self, keyFields, fields=None, schema=None, capacity=d_initialCapacity):
+        requireNumpy()
+
+        if schema is None:
+            schema = emapisvcSchema()
+
+        definitions = schema.types[ORDER_ROUTE_FIELDS_TYPE].elements
+        if fields is not None:
+            definitions = [d for d in definitions if d.name in fields or d.name in keyFields]
+
+        dtypes = {"String": np.int32, "Int32": np.int32, "Int64": np.int64, "Float64": np.float64}
+
+        self.keyFields = tuple(keyFields)
+        self.capacity = capacity
+        self.columns = {}
+        self.dictionaries = {}
+
+        for definition in definitions:
+            typeName = schema.primitiveType(definition.typeName)
+            self.columns[definition.name] = np.zeros(capacity, dtype=dtypes[typeName])
+            if typeName == "String":
+                self.dictionaries[definition.name] = StringDictionary()
+
+        self.live = np.zeros(capacity, dtype=bool)
+        self.rowIndex = {}
+        self.freeRows = []
+        self.used = 0
+        self.lock = threading.RLock()
+
+    def key(self, record):
+        if len(self.keyFields) == 1:
+            return record[self.keyFields[0]]
+        return tuple(record[field] for field in self.keyFields)
+
+    def grow(self):
+        capacity = self.capacity * 2
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.capacity] = column
+            self.columns[name] = grown
+        live = np.zeros(capacity, dtype=bool)
+        live[:self.capacity] = self.live
+        self.live = live
+        self.capacity = capacity
+
+    def allocate(self):
+        if self.freeRows:
+            return self.freeRows.pop()
+        if self.used == self.capacity:
+            self.grow()
+        row = self.used
+        self.used += 1
+        return row
+
+    def upsert(self, record):
+        key = self.key(record)
+        with self.lock:
+            row = self.rowIndex.get(key)
+            if row is None:
+                row = self.allocate()
+                for column in self.columns.values():
+                    column[row] = 0
+                self.rowIndex[key] = row
+                self.live[row] = True
+
+            for name, value in record.items():
+                column = self.columns.get(name)
+                if column is None:
+                    continue
+                dictionary = self.dictionaries.get(name)
+                column[row] = dictionary.encode(value) if dictionary is not None else value
+            return row
+
+    def replace(self, record):
+        # Like upsert, but fields the record does not have are reset to
+        # 0 (or the empty string).
+        with self.lock:
+            row = self.rowIndex.get(self.key(record))
+            if row is not None:
+                for column in self.columns.values():
+                    column[row] = 0
+            return self.upsert(record)
+
+    def load(self, records):
+        # Bulk upsert for an initial paint: the values are gathered per
+        # column first, then each column is written with one vectorised
+        # assignment.
+        with self.lock:
+            gathered = {}
+            added = []
+            for record in records:
+                key = self.key(record)
+                row = self.rowIndex.get(key)
+                if row is None:
+                    row = self.rowIndex[key] = self.allocate()
+                    added.append(row)
+
+                for name, value in record.items():
+                    entry = gathered.get(name)
+                    if entry is None:
+                        entry = gathered[name] = ([], [])
+                    entry[0].append(row)
+                    entry[1].append(value)
+
+            self.live[added] = True
+            for column in self.columns.values():
+                column[added] = 0
+
+            for name, (rows, values) in gathered.items():
+                column = self.columns.get(name)
+                if column is None:
+                    continue
+                dictionary = self.dictionaries.get(name)
+                if dictionary is not None:
+                    values = [dictionary.encode(value) for value in values]
+                column[rows] = values
+
+    def delete(self, key):
+        with self.lock:
+            row = self.rowIndex.pop(key, None)
+            if row is not None:
+                self.live[row] = False
+                self.freeRows.append(row)
+            return row
+
+    def clear(self):
+        with self.lock:
+            self.rowIndex.clear()
+            self.freeRows = []
+            self.used = 0
+            self.live[:] = False
+
+    def get(self, key):
+        with self.lock:
+            row = self.rowIndex.get(key)
+            if row is None:
+                return None
+            return self.rowAsDict(row)
+
+    def allKeys(self):
+        with self.lock:
+            return list(self.rowIndex.keys())
+
+    def rowKey(self, row):
+        if len(self.keyFields) == 1:
+            return self.columns[self.keyFields[0]][row].item()
+        return tuple(self.columns[field][row].item() for field in self.keyFields)
+
+    def addIndex(self, field):
+        # Every column can be filtered without an index; kept so code
+        # written against BlotterTable runs unchanged.
+        pass
+
+    def keys(self, field, value):
+        with self.lock:
+            return set(self.rowKey(row) for row in np.nonzero(self.mask(**{field: value}))[0])
+
+    def lookup(self, field, value):
+        return self.select(**{field: value})
+
+    def values(self, field):
+        # Distinct values of a column over the live rows
+        with self.lock:
+            codes = np.unique(self.columns[field][:self.used][self.live[:self.used]])
+            dictionary = self.dictionaries.get(field)
+            if dictionary is not None:
+                return [dictionary.decode(code) for code in codes]
+            return codes.tolist()
+
+    def select(self, predicate=None, **equals):
+        # Rows matching all field=value filters and the optional predicate.
+        # Filters on stored columns are applied to the arrays first; any
+        # other field is never set on a row here, so it cannot match.
+        with self.lock:
+            if any(name not in self.columns for name in equals):
+                return []
+            result = []
+            for row in np.nonzero(self.mask(**equals))[0]:
+                record = self.rowAsDict(row)
+                if predicate is None or predicate(record):
+                    result.append(record)
+            return result
+
+    def rowAsDict(self, row):
+        record = {}
+        for name, column in self.columns.items():
+            dictionary = self.dictionaries.get(name)
+            value = column[row]
+            record[name] = dictionary.decode(value) if dictionary is not None else value.item()
+        return record
+
+    def mask(self, **equals):
+        # Boolean mask over the allocated rows: live and matching every filter.
+        with self.lock:
+            mask = self.live[:self.used].copy()
+            for name, value in equals.items():
+                dictionary = self.dictionaries.get(name)
+                if dictionary is not None:
+                    code = dictionary.codes.get(value)
+                    if code is None:
+                        mask[:] = False
+                        break
+                    value = code
+                mask &= self.columns[name][:self.used] == value
+            return mask
+
+    def column(self, name, mask=None):
+        # Values of the live rows (decoded for string columns).
+        with self.lock:
+            if mask is None:
+                mask = self.live[:self.used]
+            values = self.columns[name][:self.used][mask]
+            dictionary = self.dictionaries.get(name)
+            if dictionary is not None:
+                return np.array(dictionary.values, dtype=object)[values]
+            return values
+
+    def groupBySum(self, keyField, values, mask=None):
+        """ Sums values per distinct keyField value over the live rows.
+
+        values is a column name or an array aligned with the table rows, so
+        derived measures such as EMSX_AMOUNT * EMSX_AVG_PRICE can be passed
+        in directly.
+        """
+        with self.lock:
+            if mask is None:
+                mask = self.live[:self.used]
+
+            if isinstance(values, str):
+                values = self.columns[values][:self.used]
+            values = np.asarray(values[:self.used], dtype=np.float64)[mask]
+            keys = self.columns[keyField][:self.used][mask]
+
+            dictionary = self.dictionaries.get(keyField)
+            if dictionary is not None:
+                sums = np.bincount(keys, weights=values, minlength=len(dictionary))
+                counts = np.bincount(keys, minlength=len(dictionary))
+                return dict((dictionary.decode(code), float(sums[code])) for code in np.nonzero(counts)[0])
+
+            distinct, inverse = np.unique(keys, return_inverse=True)
+            sums = np.bincount(inverse, weights=values, minlength=len(distinct))
+            return dict(zip(distinct.tolist(), sums.tolist()))
+
+    def groupByRatio(self, keyField, numerator, denominator, mask=None):
+        # e.g. fill % by broker: groupByRatio("EMSX_BROKER", "EMSX_FILLED", "EMSX_AMOUNT")
+        top = self.groupBySum(keyField, numerator, mask)
+        bottom = self.groupBySum(keyField, denominator, mask)
+        return dict((key, top[key] / bottom[key] if bottom[key] else 0.0) for key in top)
+
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values()) + self.live.nbytes
+
+    def __len__(self):
+        return len(self.rowIndex)
+
+    def __contains__(self, key):
+        return key in self.rowIndex
+
+
+class ColumnarBlotterStore(object):
+    """ Drop-in alternative to EMSXBlotter.BlotterStore backed by ColumnarTable.
+
+    The tables answer the same get/lookup/select/keys/values calls as
+    BlotterTable. Rows always hold every stored column, so a field that was
+    never published reads as "" or 0 rather than being absent.
+    """
+
+    def __init__(self, fields=None, capacity=d_initialCapacity):
+        self.orders = ColumnarTable(ORDER_KEY_FIELDS, fields, capacity=capacity)
+        self.routes = ColumnarTable(ROUTE_KEY_FIELDS, fields, capacity=capacity)
+
+    def apply(self, table, eventStatus, record):
+        if eventStatus == INIT_PAINT or eventStatus == NEW_ORDER_ROUTE or eventStatus == UPDATE_ORDER_ROUTE:
+            return table.upsert(record)
+        elif eventStatus == DELETE_ORDER_ROUTE:
+            return table.delete(table.key(record))
+        return None
+
+    def applyOrder(self, eventStatus, record):
+        return self.apply(self.orders, eventStatus, record)
+
+    def applyRoute(self, eventStatus, record):
+        return self.apply(self.routes, eventStatus, record)
+
+    def loadOrders(self, records):
+        self.orders.load(records)
+
+    def loadRoutes(self, records):
+        self.routes.load(records)
+
+    def order(self, sequence):
+        return self.orders.get(sequence)
+
+    def route(self, sequence, routeId):
+        return self.routes.get((sequence, routeId))
+
+    def routesForOrder(self, sequence):
+        return self.routes.lookup("EMSX_SEQUENCE", sequence)
+
+    def clear(self):
+        self.orders.clear()
+        self.routes.clear()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,190 @@
+# EMSXConflator.py
+
+import sys
+import threading
+import time
+
+from EMSXBlotter import INIT_PAINT, NEW_ORDER_ROUTE, UPDATE_ORDER_ROUTE, DELETE_ORDER_ROUTE
+from EMSXTopics import ORDER, ROUTE
+
+
+KEY_FIELDS              = ("EMSX_SEQUENCE", "EMSX_ROUTE_ID")
+
+d_interval=0.1              # seconds between published ticks
+
+
+class PendingUpdate(object):
+
+    __slots__ = ("kind", "eventStatus", "record", "count")
+
+    def __init__(self, kind, eventStatus, record):
+        self.kind = kind
+        self.eventStatus = eventStatus
+        self.record = dict(record)
+        self.count = 1
+
+
+class Conflator(object):
+    """ Merges subscription records per order/route and publishes once per tick.
+
+    submit() is called with every decoded OrderRouteFields record. Records
+    are keyed by (kind, EMSX_SEQUENCE, EMSX_ROUTE_ID); within a tick, updates
+    to the same key are merged into one pending record, so a route that
+    ticks fifty times in 100ms is published once. Each tick calls
+    publish(kind, eventStatus, delta) for every pending key, in the order
+    the keys first changed, where delta holds the key fields plus the fields
+    that differ from what was last published for that key. Updates that end
+    up changing nothing are not published.
+
+    A new (or initial paint) record followed by updates is published as a
+    single new record; a new record deleted within the same tick is not
+    published at all; a delete replaces any pending update, later updates
+    in the tick are ignored, and once published it drops the state kept
+    for its key.
+    """
+
+    def __init__(self, publish, interval=d_interval):
+        self.publish = publish
+        self.interval = interval
+        self.pending = {}
+        self.published = {}
+        self.lock = threading.Lock()
+        self.flushLock = threading.RLock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+        self.received = 0
+        self.merged = 0
+        self.sent = 0
+        self.suppressed = 0
+        self.ticks = 0
+
+    def key(self, kind, record):
+        return (kind, record.get("EMSX_SEQUENCE"), record.get("EMSX_ROUTE_ID"))
+
+    def submit(self, kind, eventStatus, record):
+        key = self.key(kind, record)
+        with self.lock:
+            self.received += 1
+            pending = self.pending.get(key)
+            if pending is None:
+                self.pending[key] = PendingUpdate(kind, eventStatus, record)
+                return
+
+            self.merged += 1
+            pending.count += 1
+            if eventStatus == UPDATE_ORDER_ROUTE:
+                # An update after a delete is stale; the delete still goes out.
+                if pending.eventStatus != DELETE_ORDER_ROUTE:
+                    pending.record.update(record)
+            elif eventStatus == DELETE_ORDER_ROUTE and pending.eventStatus in (NEW_ORDER_ROUTE, INIT_PAINT) and key not in self.published:
+                # Created and deleted within the tick; nobody has seen it.
+                del self.pending[key]
+            else:
+                pending.eventStatus = eventStatus
+                pending.record = dict(record)
+
+    def delta(self, key, pending):
+        # The record to publish for a pending update, or None if nothing changed.
+        if pending.eventStatus != UPDATE_ORDER_ROUTE:
+            if pending.eventStatus == DELETE_ORDER_ROUTE:
+                self.forget(key=key)
+            else:
+                self.published[key] = dict(pending.record)
+            return pending.record
+
+        last = self.published.get(key)
+        if last is None:
+            self.published[key] = dict(pending.record)
+            return pending.record
+
+        changed = dict((name, value) for name, value in pending.record.items() if last.get(name) != value)
+        if not changed:
+            return None
+        last.update(changed)
+        for name in KEY_FIELDS:
+            if name in pending.record:
+                changed[name] = pending.record[name]
+        return changed
+
+    def flush(self):
+        # Publishes everything pending; called every interval by the tick
+        # thread, and may be called directly when running without one.
+        with self.flushLock:
+            with self.lock:
+                pending, self.pending = self.pending, {}
+                self.ticks += 1
+
+            for key, update in pending.items():
+                record = self.delta(key, update)
+                if record is None:
+                    with self.lock:
+                        self.suppressed += 1
+                    continue
+                try:
+                    self.publish(update.kind, update.eventStatus, record)
+                except:
+                    print ("Exception:  %s" % sys.exc_info()[0])
+                with self.lock:
+                    self.sent += 1
+
+    def run(self):
+        due = time.time() + self.interval
+        while not self.stopped.wait(max(0, due - time.time())):
+            self.flush()
+            due = max(due + self.interval, time.time())
+
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="EMSXConflator")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        # Stops the tick thread and publishes what is still pending.
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
+
+    def forget(self, kind=None, key=None):
+        # Drops the last published state of one key, of a kind, or of
+        # everything: on delete, and before a resync's fresh initial paint,
+        # so later updates are not diffed against rows that may be stale.
+        with self.flushLock:
+            if key is not None:
+                self.published.pop(key, None)
+            elif kind is None:
+                self.published.clear()
+            else:
+                for key in [k for k in self.published if k[0] == kind]:
+                    del self.published[key]
+
+    def stats(self):
+        with self.lock:
+            return {"received": self.received, "merged": self.merged, "published": self.sent,
+                    "suppressed": self.suppressed, "pending": len(self.pending), "ticks": self.ticks,
+                    "ratio": float(self.received) / self.sent if self.sent else 0.0}
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,1707 @@
+# EMSXEmulator.py
+
+import heapq
+import itertools
+import queue
+import random
+import re
+import runpy
+import sys
+import threading
+import time
+import types
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+
+from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, emapisvcSchema, historySchema
+
+
+d_latency=0.002             # seconds from sendRequest to the response
+d_jitter=0.0                # extra random latency, 0..jitter seconds
+d_errorRate=0.0             # fraction of requests answered with ErrorInfo/ErrorResponse
+d_failureRate=0.0           # fraction of requests answered with a RequestFailure
+d_throttleRate=None         # requests per second before "Request throttled" errors
+d_messagesPerEvent=100      # subscription messages per SUBSCRIPTION_DATA event
+d_partialSize=100           # fills per GetFills PARTIAL_RESPONSE
+d_fillInterval=timedelta(minutes=5)
+d_correctionEvery=50        # every Nth emulated fill corrects the previous one
+d_arrayLength=2             # items in synthesized arrays
+d_firstSequence=1000001
+d_reconnectDelay=0.5
+d_maxEventQueueSize=10000   # events a session without a handler holds for nextEvent()
+
+d_tickers=["IBM US Equity", "AAPL US Equity", "MSFT US Equity", "VOD LN Equity", "7203 JT Equity"]
+d_brokers=["BMTB", "EFIX", "BB"]
+d_strategies=["VWAP", "TWAP", "DMA"]
+d_teams=["TEAM1", "TEAM2"]
+d_traderUuids=[1234, 5678]
+d_tradeDesks=["DESK1", "DESK2"]
+
+# Sample values for the arrays that the reference data operations return.
+SAMPLE_ARRAYS = {
+    "EMSX_BROKERS":         d_brokers,
+    "EMSX_STRATEGIES":      d_strategies,
+    "TEAMS":                d_teams,
+    "EMSX_TRADER_UUID":     d_traderUuids,
+    "EMSX_TRADE_DESK":      d_tradeDesks,
+}
+
+ERROR_INJECTED          = 9000
+ERROR_THROTTLED         = 9001
+ERROR_INVALID_REQUEST   = 9002
+ERROR_UNKNOWN_ORDER     = 9003
+
+HEARTBEAT               = 1
+INIT_PAINT              = 4
+NEW_ORDER_ROUTE         = 6
+UPDATE_ORDER_ROUTE      = 7
+DELETE_ORDER_ROUTE      = 8
+INIT_PAINT_END          = 11
+
+CREATE_ORDER_OPERATIONS = ("CreateOrder",)
+CREATE_AND_ROUTE_OPERATIONS = ("CreateOrderAndRoute", "CreateOrderAndRouteManually", "CreateOrderAndRouteWithStrat", "CreateOrderAndRouteEx")
+ROUTE_OPERATIONS = ("Route", "RouteManually", "RouteWithStrat", "RouteEx", "RouteManuallyEx")
+MODIFY_ORDER_OPERATIONS = ("ModifyOrder", "ModifyOrderEx")
+MODIFY_ROUTE_OPERATIONS = ("ModifyRoute", "ModifyRouteWithStrat", "ModifyRouteEx")
+GROUP_ROUTE_OPERATIONS = ("GroupRouteEx", "GroupRouteWithStrat")
+
+TOPIC_PATTERN = re.compile(r"^(//blp/[^/]+)/(order|route)(;[^?]*)?(?:\?fields=(.*))?$")
+
+DATETIME_FORMATS = ["%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"]
+FILL_EPOCH = datetime(2017, 1, 1)
+
+
+class BlpapiException(Exception):
+    pass
+
+
+class NotFoundException(BlpapiException):
+    pass
+
+
+class InvalidArgumentException(BlpapiException):
+    pass
+
+
+class InvalidConversionException(BlpapiException):
+    pass
+
+
+class InvalidStateException(BlpapiException):
+    pass
+
+
+class EmulatorError(Exception):
+    """ Rejects a request with an ErrorInfo/ErrorResponse. """
+
+    def __init__(self, errorCode, message):
+        Exception.__init__(self, message)
+        self.errorCode = errorCode
+
+
+class Name(str):
+    """ Element and message names; compares equal to the plain string. """
+
+    __slots__ = ()
+
+
+_names = {}
+
+
+def _name(value):
+    name = _names.get(value)
+    if name is None:
+        name = _names[value] = Name(value)
+    return name
+
+
+_autogenCorrelationIds = itertools.count(1)
+
+
+class CorrelationId(object):
+
+    UNSET_TYPE = 0
+    INT_TYPE = 1
+    POINTER_TYPE = 2
+    AUTOGEN_TYPE = 3
+
+    def __init__(self, value=None, classId=0):
+        if value is None:
+            # Like blpapi, a bare CorrelationId stays unset until the session
+            # it is passed to assigns it an automatic value.
+            self._type = CorrelationId.UNSET_TYPE
+            self._value = 0
+        elif isinstance(value, int):
+            self._type = CorrelationId.INT_TYPE
+            self._value = value
+        else:
+            self._type = CorrelationId.POINTER_TYPE
+            self._value = value
+        self._classId = classId
+
+    @staticmethod
+    def restore(valueType, value, classId=0):
+        # Rebuilds a correlation ID of any type, e.g. an AUTOGEN one read
+        # back from a capture.
+        correlationId = CorrelationId(0, classId)
+        correlationId._type = valueType
+        correlationId._value = value
+        return correlationId
+
+    def assign(self):
+        # Gives an unset correlation ID its automatic value, in place.
+        if self._type == CorrelationId.UNSET_TYPE:
+            self._type = CorrelationId.AUTOGEN_TYPE
+            self._value = next(_autogenCorrelationIds)
+        return self
+
+    def value(self):
+        return self._value
+
+    def type(self):
+        return self._type
+
+    def classId(self):
+        return self._classId
+
+    def __eq__(self, other):
+        return isinstance(other, CorrelationId) and self._type == other._type and self._value == other._value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self._type, self._value))
+
+    def __str__(self):
+        valueTypes = {0: "UNSET", 1: "INT", 2: "POINTER", 3: "AUTOGEN"}
+        return "[ valueType=%s classId=%d value=%s ]" % (valueTypes[self._type], self._classId, self._value)
+
+    __repr__ = __str__
+
+
+def parseDatetime(value):
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    for pattern in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, pattern)
+        except (TypeError, ValueError):
+            pass
+    raise InvalidConversionException("Cannot convert %r to a Datetime" % (value,))
+
+
+def coerce(element, value):
+    # Converts value to the element's primitive type the way blpapi's setters do.
+    primitive = element._primitive
+    try:
+        if primitive == "Int32" or primitive == "Int64":
+            value = int(value)
+        elif primitive == "Float64" or primitive == "Float32":
+            value = float(value)
+        elif primitive == "Boolean":
+            value = value.lower() == "true" if isinstance(value, str) else bool(value)
+        elif primitive == "Datetime":
+            value = parseDatetime(value)
+        elif primitive == "Date":
+            value = value if isinstance(value, date) and not isinstance(value, datetime) else parseDatetime(value).date()
+        else:
+            value = str(value)
+    except (TypeError, ValueError):
+        raise InvalidConversionException("Cannot set %s (%s) to %r" % (element._name, primitive, value))
+
+    typeDef = element._type
+    if typeDef is not None and typeDef.kind == "enumeration" and typeDef.valueType == "String" and value not in typeDef.enumerators:
+        raise InvalidArgumentException("%r is not a valid %s" % (value, typeDef.name))
+    return value
+
+
+def inferPrimitive(value):
+    if isinstance(value, bool):
+        return "Boolean"
+    if isinstance(value, int):
+        return "Int64"
+    if isinstance(value, float):
+        return "Float64"
+    if isinstance(value, datetime):
+        return "Datetime"
+    if isinstance(value, date):
+        return "Date"
+    return "String"
+
+
+_elementIndexes = {}
+
+
+def elementIndex(typeDef):
+    # name -> ElementDef for a sequence/choice type, built once per type.
+    index = _elementIndexes.get(typeDef)
+    if index is None:
+        index = _elementIndexes[typeDef] = dict((d.name, d) for d in typeDef.elements)
+    return index
+
+
+_nullElements = {}
+
+
+class Element(object):
+    """ A node of a request or message.
+
+    Elements of a schema type know their definition and validate what is
+    set on them; elements without a schema (status messages, BrokerSpec)
+    are built from plain Python values. Message elements are frozen: an
+    absent child is returned as a shared null element instead of being
+    created, so decoding a wide message does not allocate one element per
+    field.
+    """
+
+    __slots__ = ("_name", "_schema", "_type", "_primitive", "_isArray", "_value", "_children", "_choice", "_frozen")
+
+    def __init__(self, name, schema=None, typeName=None, isArray=False, primitive=None):
+        self._name = _name(name)
+        self._schema = schema
+        self._type = None
+        self._primitive = primitive
+        if schema is not None and typeName is not None:
+            self._type = schema.types.get(typeName)
+            self._primitive = schema.primitiveType(typeName)
+        self._isArray = isArray
+        self._value = [] if isArray else None
+        self._children = None
+        self._choice = None
+        self._frozen = False
+
+    @staticmethod
+    def fromDefinition(schema, definition):
+        return Element(definition.name, schema, definition.typeName, definition.isArray())
+
+    @staticmethod
+    def fromPython(name, value):
+        # Schema-less element holding value (dicts become sequences, lists arrays).
+        if isinstance(value, (list, tuple)):
+            primitive = None
+            if value and not isinstance(value[0], dict):
+                primitive = inferPrimitive(value[0])
+            element = Element(name, isArray=True, primitive=primitive)
+        elif isinstance(value, dict):
+            element = Element(name)
+        else:
+            element = Element(name, primitive=inferPrimitive(value))
+        populate(element, value)
+        return element
+
+    def name(self):
+        return self._name
+
+    def isArray(self):
+        return self._isArray
+
+    def isComplexType(self):
+        return self._primitive is None
+
+    def isChoice(self):
+        return self._type is not None and self._type.kind == "choice"
+
+    def isNull(self):
+        if self._isArray:
+            return not self._value
+        if self._primitive is not None:
+            return self._value is None
+        if self.isChoice():
+            return self._choice is None
+        return not self._children
+
+    def numValues(self):
+        if self._isArray:
+            return len(self._value)
+        if self._primitive is not None:
+            return 0 if self._value is None else 1
+        return 1
+
+    def numElements(self):
+        if self._isArray or self._primitive is not None:
+            return 0
+        if self.isChoice():
+            return 0 if self._choice is None else 1
+        if self._type is not None:
+            return len(self._type.elements)
+        return len(self._children or ())
+
+    def definition(self, name):
+        definition = elementIndex(self._type).get(name)
+        if definition is None:
+            raise NotFoundException("%s has no element %s" % (self._name, name))
+        return definition
+
+    def child(self, definition):
+        children = self._children
+        if children is not None:
+            element = children.get(definition.name)
+            if element is not None:
+                return element
+        if self._frozen:
+            element = _nullElements.get(definition)
+            if element is None:
+                element = _nullElements[definition] = Element.fromDefinition(self._schema, definition)
+                element._frozen = True
+            return element
+        if children is None:
+            children = self._children = {}
+        element = children[definition.name] = Element.fromDefinition(self._schema, definition)
+        return element
+
+    def elements(self):
+        if self._isArray or self._primitive is not None:
+            return []
+        if self.isChoice():
+            return [] if self._choice is None else [self._children[self._choice]]
+        if self._type is not None:
+            return [self.child(d) for d in self._type.elements]
+        return list((self._children or {}).values())
+
+    def getElement(self, name):
+        if isinstance(name, int):
+            if self._type is not None and not self.isChoice() and not self._isArray:
+                definitions = self._type.elements
+                if name >= len(definitions):
+                    raise NotFoundException("%s has no element at position %d" % (self._name, name))
+                return self.child(definitions[name])
+            elements = self.elements()
+            if name >= len(elements):
+                raise NotFoundException("%s has no element at position %d" % (self._name, name))
+            return elements[name]
+
+        if self._primitive is not None or self._isArray:
+            raise InvalidStateException("%s is not a sequence or choice" % self._name)
+
+        if self._type is None:
+            element = (self._children or {}).get(name)
+            if element is None:
+                raise NotFoundException("%s has no element %s" % (self._name, name))
+            return element
+
+        if self.isChoice():
+            if self._choice == name:
+                return self._children[name]
+            if self._frozen:
+                raise NotFoundException("%s is not the selected choice of %s" % (name, self._name))
+            return self.setChoice(name)
+
+        return self.child(self.definition(name))
+
+    def hasElement(self, name, excludeNullElements=False):
+        if self._primitive is not None or self._isArray:
+            return False
+        if self._type is None or self.isChoice():
+            element = (self._children or {}).get(name)
+            if element is None or (self.isChoice() and self._choice != name):
+                return False
+            return not (excludeNullElements and element.isNull())
+        if name not in elementIndex(self._type):
+            return False
+        if not excludeNullElements and not self._frozen:
+            return True
+        element = (self._children or {}).get(name)
+        return element is not None and not element.isNull()
+
+    def setChoice(self, name):
+        if not self.isChoice():
+            raise InvalidStateException("%s is not a choice" % self._name)
+        definition = self.definition(name)
+        self._children = {name: Element.fromDefinition(self._schema, definition)}
+        self._choice = name
+        return self._children[name]
+
+    def getChoice(self):
+        if self._choice is None:
+            raise InvalidStateException("No choice selected in %s" % self._name)
+        return self._children[self._choice]
+
+    def getValue(self, index=0):
+        if self._isArray:
+            if index >= len(self._value):
+                raise NotFoundException("%s has %d values" % (self._name, len(self._value)))
+            return self._value[index]
+        if self._primitive is None:
+            raise InvalidStateException("%s has no value" % self._name)
+        if self._value is None:
+            raise NotFoundException("%s is null" % self._name)
+        return self._value
+
+    def getValueAsString(self, index=0):
+        value = self.getValue(index)
+        if isinstance(value, datetime):
+            return value.isoformat(timespec="milliseconds")
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    def getValueAsInteger(self, index=0):
+        try:
+            return int(self.getValue(index))
+        except ValueError:
+            raise InvalidConversionException("%s is not an integer" % self._name)
+
+    def getValueAsFloat(self, index=0):
+        try:
+            return float(self.getValue(index))
+        except ValueError:
+            raise InvalidConversionException("%s is not a number" % self._name)
+
+    def getValueAsBool(self, index=0):
+        value = self.getValue(index)
+        if isinstance(value, str):
+            return value.lower() == "true"
+        return bool(value)
+
+    def getValueAsDatetime(self, index=0):
+        return parseDatetime(self.getValue(index))
+
+    def getValueAsElement(self, index=0):
+        value = self.getValue(index)
+        if not isinstance(value, Element):
+            raise InvalidConversionException("%s does not hold elements" % self._name)
+        return value
+
+    def getValueAsName(self, index=0):
+        return _name(self.getValueAsString(index))
+
+    def getElementValue(self, name):
+        return self.getElement(name).getValue()
+
+    def getElementAsString(self, name):
+        return self.getElement(name).getValueAsString()
+
+    def getElementAsInteger(self, name):
+        return self.getElement(name).getValueAsInteger()
+
+    def getElementAsFloat(self, name):
+        return self.getElement(name).getValueAsFloat()
+
+    def getElementAsBool(self, name):
+        return self.getElement(name).getValueAsBool()
+
+    def getElementAsDatetime(self, name):
+        return self.getElement(name).getValueAsDatetime()
+
+    def getElementAsName(self, name):
+        return self.getElement(name).getValueAsName()
+
+    def values(self):
+        if self._isArray:
+            return list(self._value)
+        if self._primitive is not None:
+            return [] if self._value is None else [self._value]
+        return [self]
+
+    def checkWritable(self):
+        if self._frozen:
+            raise InvalidStateException("%s belongs to a received message and cannot be modified" % self._name)
+
+    def setValue(self, value, index=0):
+        self.checkWritable()
+        if self._primitive is None:
+            raise InvalidStateException("%s is not a simple element" % self._name)
+        value = coerce(self, value)
+        if self._isArray:
+            if index == len(self._value):
+                self._value.append(value)
+            else:
+                self._value[index] = value
+        else:
+            self._value = value
+
+    def appendValue(self, value):
+        self.checkWritable()
+        if not self._isArray or self._primitive is None:
+            raise InvalidStateException("%s is not an array of values" % self._name)
+        self._value.append(coerce(self, value))
+
+    def appendElement(self):
+        self.checkWritable()
+        if not self._isArray or self._primitive is not None:
+            raise InvalidStateException("%s is not an array of elements" % self._name)
+        element = Element(self._name, self._schema, self._type.name if self._type is not None else None)
+        self._value.append(element)
+        return element
+
+    def setElement(self, name, value):
+        self.checkWritable()
+        if self._type is None and self._primitive is None and not self._isArray:
+            # Schema-less requests (e.g. BrokerSpec) take whatever is set on them.
+            if self._children is None:
+                self._children = {}
+            element = Element(name, primitive=inferPrimitive(value))
+            element.setValue(value)
+            self._children[name] = element
+            return
+        element = self.getElement(name)
+        if element._isArray:
+            raise InvalidArgumentException("%s is an array, use appendValue" % name)
+        element.setValue(value)
+
+    def freeze(self):
+        if self._frozen:
+            return self
+        self._frozen = True
+        if self._isArray:
+            for value in self._value:
+                if isinstance(value, Element):
+                    value.freeze()
+        elif self._children:
+            for child in self._children.values():
+                child.freeze()
+        return self
+
+    def formatValue(self, value):
+        if isinstance(value, Element):
+            return None
+        if isinstance(value, str):
+            return '"%s"' % value
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, datetime):
+            return value.isoformat(timespec="milliseconds")
+        if isinstance(value, date):
+            return value.isoformat()
+        return str(value)
+
+    def toString(self, level=0, spacesPerLevel=4):
+        indent = " " * (level * spacesPerLevel)
+        if self._isArray:
+            lines = ["%s%s[] = {" % (indent, self._name)]
+            for value in self._value:
+                if isinstance(value, Element):
+                    lines.append(value.toString(level + 1, spacesPerLevel).rstrip("\n"))
+                else:
+                    lines.append("%s%s" % (" " * ((level + 1) * spacesPerLevel), self.formatValue(value)))
+            lines.append("%s}" % indent)
+            return "\n".join(lines) + "\n"
+        if self._primitive is not None:
+            return "%s%s = %s\n" % (indent, self._name, self.formatValue(self._value))
+        lines = ["%s%s = {\n" % (indent, self._name)]
+        for child in (self._children or {}).values():
+            if not child.isNull():
+                lines.append(child.toString(level + 1, spacesPerLevel))
+        lines.append("%s}\n" % indent)
+        return "".join(lines)
+
+    def __str__(self):
+        return self.toString()
+
+
+def populate(element, value):
+    # Sets a plain Python value (scalars, lists, dicts) on element.
+    if element._isArray:
+        for item in value:
+            if isinstance(item, dict):
+                populate(element.appendElement(), item)
+            else:
+                if element._primitive is None:
+                    element._primitive = inferPrimitive(item)
+                element.appendValue(item)
+    elif element._primitive is not None:
+        element.setValue(value)
+    elif element.isChoice():
+        (choice, item), = value.items()
+        populate(element.setChoice(choice), item)
+    elif element._type is None:
+        if element._children is None:
+            element._children = {}
+        for name, item in value.items():
+            if item is not None:
+                element._children[name] = Element.fromPython(name, item)
+    else:
+        for name, item in value.items():
+            if item is not None:
+                populate(element.getElement(name), item)
+    return element
+
+
+class Message(object):
+
+    __slots__ = ("_type", "_element", "_correlationIds", "_topicName")
+
+    def __init__(self, element, correlationIds=(), topicName=""):
+        self._type = element.name()
+        self._element = element.freeze()
+        self._correlationIds = list(correlationIds)
+        self._topicName = topicName
+
+    def messageType(self):
+        return self._type
+
+    def correlationIds(self):
+        return self._correlationIds
+
+    def correlationId(self, index=0):
+        return self._correlationIds[index]
+
+    def numCorrelationIds(self):
+        return len(self._correlationIds)
+
+    def topicName(self):
+        return self._topicName
+
+    def asElement(self):
+        return self._element
+
+    def numElements(self):
+        return self._element.numElements()
+
+    def elements(self):
+        return self._element.elements()
+
+    def hasElement(self, name, excludeNullElements=False):
+        return self._element.hasElement(name, excludeNullElements)
+
+    def getElement(self, name):
+        return self._element.getElement(name)
+
+    def getElementValue(self, name):
+        return self._element.getElementValue(name)
+
+    def getElementAsString(self, name):
+        return self._element.getElementAsString(name)
+
+    def getElementAsInteger(self, name):
+        return self._element.getElementAsInteger(name)
+
+    def getElementAsFloat(self, name):
+        return self._element.getElementAsFloat(name)
+
+    def getElementAsBool(self, name):
+        return self._element.getElementAsBool(name)
+
+    def getElementAsDatetime(self, name):
+        return self._element.getElementAsDatetime(name)
+
+    def toString(self, level=0, spacesPerLevel=4):
+        return self._element.toString(level, spacesPerLevel)
+
+    def __str__(self):
+        return self.toString()
+
+
+class Event(object):
+
+    UNKNOWN = -1
+    ADMIN = 1
+    SESSION_STATUS = 2
+    SUBSCRIPTION_STATUS = 3
+    REQUEST_STATUS = 4
+    RESPONSE = 5
+    PARTIAL_RESPONSE = 6
+    SUBSCRIPTION_DATA = 8
+    SERVICE_STATUS = 9
+    TIMEOUT = 10
+    AUTHORIZATION_STATUS = 11
+    RESOLUTION_STATUS = 12
+    TOPIC_STATUS = 13
+    TOKEN_STATUS = 14
+    REQUEST = 15
+
+    def __init__(self, eventType, messages=()):
+        self._eventType = eventType
+        self._messages = list(messages)
+
+    def eventType(self):
+        return self._eventType
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __len__(self):
+        return len(self._messages)
+
+
+class SessionOptions(object):
+
+    def __init__(self):
+        self._host = "localhost"
+        self._port = 8194
+        self._maxEventQueueSize = d_maxEventQueueSize
+        self._settings = {}
+
+    def setServerHost(self, host):
+        self._host = host
+
+    def setServerPort(self, port):
+        self._port = port
+
+    def setServerAddress(self, host, port, index=0):
+        self._host = host
+        self._port = port
+
+    def serverHost(self):
+        return self._host
+
+    def serverPort(self):
+        return self._port
+
+    def setMaxEventQueueSize(self, size):
+        self._maxEventQueueSize = size
+
+    def maxEventQueueSize(self):
+        return self._maxEventQueueSize
+
+    def __getattr__(self, name):
+        # Other setters (setAutoRestartOnDisconnection, ...) are accepted and
+        # have no effect on the emulator.
+        if name.startswith("set"):
+            return lambda *args, **kwargs: self._settings.__setitem__(name[3:], args)
+        raise AttributeError(name)
+
+
+class SubscriptionList(object):
+
+    def __init__(self):
+        self._entries = []
+
+    def add(self, topic, fields=None, options=None, correlationId=None):
+        if fields:
+            if isinstance(fields, (list, tuple)):
+                fields = ",".join(fields)
+            topic = topic + ("&" if "?" in topic else "?") + "fields=" + fields
+        if correlationId is None:
+            correlationId = CorrelationId()
+        self._entries.append((topic, correlationId))
+
+    def size(self):
+        return len(self._entries)
+
+    def topicStringAt(self, index):
+        return self._entries[index][0]
+
+    def correlationIdAt(self, index):
+        return self._entries[index][1]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+
+class Request(object):
+
+    def __init__(self, service, operation, element):
+        self._service = service
+        self._operation = operation
+        self._element = element
+
+    def asElement(self):
+        return self._element
+
+    def getElement(self, name):
+        return self._element.getElement(name)
+
+    def set(self, name, value):
+        self._element.setElement(name, value)
+
+    def append(self, name, value):
+        return self._element.getElement(name).appendValue(value)
+
+    def operation(self):
+        return self._operation
+
+    def service(self):
+        return self._service
+
+    def toString(self, level=0, spacesPerLevel=4):
+        return self._element.toString(level, spacesPerLevel)
+
+    def __str__(self):
+        return self.toString()
+
+
+class Service(object):
+
+    def __init__(self, name, schema=None, operations=()):
+        self._name = name
+        self.schema = schema
+        self.operations = list(operations) if schema is None else list(schema.operations)
+
+    def name(self):
+        return self._name
+
+    def numOperations(self):
+        return len(self.operations)
+
+    def hasOperation(self, name):
+        return name in self.operations
+
+    def createRequest(self, operation):
+        if operation not in self.operations:
+            raise NotFoundException("%s has no operation %s" % (self._name, operation))
+        if self.schema is None:
+            return Request(self, operation, Element(operation))
+        op = self.schema.operations[operation]
+        requestType = self.schema.requestType(operation)
+        return Request(self, operation, Element(op.requestSelection, self.schema, requestType.name))
+
+    def __str__(self):
+        return self._name
+
+
+class Subscription(object):
+
+    def __init__(self, session, correlationId, topic, kind, fields):
+        self.session = session
+        self.correlationId = correlationId
+        self.topic = topic
+        self.kind = kind                    # "order" or "route"
+        self.fields = fields
+        self.active = True
+
+
+class Session(object):
+    """ Emulated blpapi.Session.
+
+    Events are scheduled with the emulator's latency and delivered in due
+    time order by one event thread per session, either to the event handler
+    or, without one, to the queue read by nextEvent().
+    """
+
+    def __init__(self, options=None, eventHandler=None, eventDispatcher=None, emulator=None):
+        self.options = options if options is not None else SessionOptions()
+        self.eventHandler = eventHandler
+        self.emulator = emulator if emulator is not None else defaultEmulator()
+
+        self.scheduled = []
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.events = queue.Queue()
+        self.space = threading.Condition()
+        self.slowConsumer = False
+        self.thread = None
+        self.running = False
+
+        self.services = {}
+        self.cancelled = set()
+        self.subscriptions = {}
+
+    def schedule(self, event, delay=0):
+        with self.condition:
+            heapq.heappush(self.scheduled, (time.time() + delay, next(self.sequence), event))
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while True:
+                    if self.scheduled:
+                        wait = self.scheduled[0][0] - time.time()
+                        if wait <= 0:
+                            break
+                        self.condition.wait(wait)
+                    else:
+                        self.condition.wait()
+                due, sequence, event = heapq.heappop(self.scheduled)
+
+            if event is None:
+                return
+            self.deliver(event)
+
+    def deliver(self, event):
+        if self.cancelled and event.eventType() in (Event.RESPONSE, Event.PARTIAL_RESPONSE, Event.REQUEST_STATUS, Event.SUBSCRIPTION_DATA):
+            messages = [m for m in event if not any(cid in self.cancelled for cid in m.correlationIds())]
+            if not messages:
+                return
+            event = Event(event.eventType(), messages)
+
+        if self.eventHandler is None:
+            self.enqueue(event)
+            return
+        try:
+            self.eventHandler(event, self)
+        except:
+            print ("Exception:  %s" % sys.exc_info()[0])
+
+    def enqueue(self, event):
+        # The queue read by nextEvent() holds at most maxEventQueueSize
+        # events. While it is full, delivery stops, as blpapi stops reading
+        # from the connection, and a SlowConsumerWarning is queued.
+        limit = self.options.maxEventQueueSize()
+        with self.space:
+            if self.events.qsize() >= limit:
+                self.slowConsumer = True
+                self.events.put(self.statusEvent(Event.ADMIN, "SlowConsumerWarning"))
+                while self.running and self.events.qsize() >= limit:
+                    self.space.wait(0.1)
+            if self.slowConsumer and self.events.qsize() < limit:
+                self.slowConsumer = False
+                self.events.put(self.statusEvent(Event.ADMIN, "SlowConsumerWarningCleared"))
+            self.events.put(event)
+
+    def taken(self, event):
+        with self.space:
+            self.space.notify()
+        return event
+
+    def statusEvent(self, eventType, messageType, correlationId=None, **fields):
+        element = Element.fromPython(messageType, fields)
+        return Event(eventType, [Message(element, [correlationId] if correlationId is not None else [])])
+
+    def startAsync(self):
+        if self.running:
+            return False
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="EMSXEmulatorSession")
+        self.thread.daemon = True
+        self.thread.start()
+        self.emulator.addSession(self)
+
+        self.schedule(self.statusEvent(Event.SESSION_STATUS, "SessionConnectionUp", server="%s:%d" % (self.options.serverHost(), self.options.serverPort())))
+        self.schedule(self.statusEvent(Event.SESSION_STATUS, "SessionStarted"))
+        return True
+
+    def start(self):
+        return self.startAsync()
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        self.emulator.removeSession(self)
+        self.schedule(self.statusEvent(Event.SESSION_STATUS, "SessionTerminated"))
+        self.schedule(None)
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def stopAsync(self):
+        self.running = False
+        self.emulator.removeSession(self)
+        self.schedule(self.statusEvent(Event.SESSION_STATUS, "SessionTerminated"))
+        self.schedule(None)
+
+    def nextEvent(self, timeout=0):
+        try:
+            return self.taken(self.events.get(timeout=timeout / 1000.0 if timeout else None))
+        except queue.Empty:
+            return Event(Event.TIMEOUT)
+
+    def tryNextEvent(self):
+        try:
+            return self.taken(self.events.get_nowait())
+        except queue.Empty:
+            return None
+
+    def openService(self, name):
+        service = self.emulator.openService(name)
+        if service is not None:
+            self.services[name] = service
+        return service is not None
+
+    def openServiceAsync(self, name, correlationId=None):
+        if correlationId is None:
+            correlationId = CorrelationId()
+        correlationId.assign()
+        service = self.emulator.openService(name)
+        if service is not None:
+            self.services[name] = service
+            event = self.statusEvent(Event.SERVICE_STATUS, "ServiceOpened", correlationId, serviceName=name)
+        else:
+            event = self.statusEvent(Event.SERVICE_STATUS, "ServiceOpenFailure", correlationId, serviceName=name,
+                                     reason={"source": "EMSXEmulator", "errorCode": -1, "category": "NOT_FOUND", "description": "Service not found"})
+        self.schedule(event, self.emulator.delay())
+        return correlationId
+
+    def getService(self, name):
+        service = self.services.get(name)
+        if service is None:
+            raise NotFoundException("Service %s has not been opened" % name)
+        return service
+
+    def sendRequest(self, request, identity=None, correlationId=None, eventQueue=None, requestLabel=None):
+        if not self.running:
+            raise InvalidStateException("Session is not started")
+        if request.service().name() not in self.services:
+            raise InvalidStateException("Service %s has not been opened" % request.service().name())
+        if correlationId is None:
+            correlationId = CorrelationId()
+        correlationId.assign()
+        self.cancelled.discard(correlationId)
+        self.emulator.handleRequest(self, request, correlationId)
+        return correlationId
+
+    def subscribe(self, subscriptionList, identity=None, requestLabel=None):
+        for topic, correlationId in subscriptionList:
+            correlationId.assign()
+            self.cancelled.discard(correlationId)
+            self.emulator.subscribe(self, topic, correlationId)
+
+    def unsubscribe(self, subscriptionList):
+        for topic, correlationId in subscriptionList:
+            self.cancel(correlationId)
+
+    def cancel(self, correlationId):
+        correlationIds = correlationId if isinstance(correlationId, (list, tuple)) else [correlationId]
+        for correlationId in correlationIds:
+            self.cancelled.add(correlationId)
+            self.emulator.unsubscribe(self, correlationId)
+
+
+class Emulator(object):
+    """ Order book and responders shared by every emulated session.
+
+    Request responses are generated from the emapisvc and emsx.history
+    schemas: the order and route operations act on an in-memory book and
+    publish OrderRouteFields updates to the subscriptions, GetFills returns
+    a deterministic stream of fills, and every other operation gets a
+    synthesized response with each element of its response type filled in.
+    """
+
+    def __init__(self, latency=d_latency, jitter=d_jitter, errorRate=d_errorRate, failureRate=d_failureRate,
+                 throttleRate=d_throttleRate, messagesPerEvent=d_messagesPerEvent, partialSize=d_partialSize,
+                 fillInterval=d_fillInterval, heartbeatInterval=None, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.errorRate = errorRate
+        self.failureRate = failureRate
+        self.operationErrorRates = {}
+        self.throttleRate = throttleRate
+        self.messagesPerEvent = messagesPerEvent
+        self.partialSize = partialSize
+        self.fillInterval = fillInterval
+        self.random = random.Random(seed)
+
+        self.emapisvc = emapisvcSchema()
+        self.history = historySchema()
+        self.orderRouteType = self.emapisvc.types[ORDER_ROUTE_FIELDS_TYPE]
+        self.orderRouteFields = set(elementIndex(self.orderRouteType))
+
+        self.lock = threading.RLock()
+        self.sessions = []
+        self.subscriptions = []
+        self.orders = {}
+        self.routes = {}
+        self.lastRouteIds = {}
+        self.sequences = itertools.count(d_firstSequence)
+        self.apiSequence = itertools.count(1)
+        self.requestTimes = deque()
+
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.published = 0
+
+        if heartbeatInterval:
+            thread = threading.Thread(target=self.runHeartbeats, args=(heartbeatInterval,), name="EMSXEmulatorHeartbeat")
+            thread.daemon = True
+            thread.start()
+
+    # Sessions and services
+
+    def addSession(self, session):
+        with self.lock:
+            self.sessions.append(session)
+
+    def removeSession(self, session):
+        with self.lock:
+            if session in self.sessions:
+                self.sessions.remove(session)
+            self.subscriptions = [s for s in self.subscriptions if s.session is not session]
+
+    def openService(self, name):
+        if name.startswith("//blp/emapisvc"):
+            return Service(name, self.emapisvc)
+        if name.startswith("//blp/emsx.history"):
+            return Service(name, self.history)
+        if name.startswith("//blp/emsx.brokerspec"):
+            return Service(name, operations=["GetBrokerSpecForUuid"])
+        return None
+
+    def delay(self):
+        if self.jitter:
+            return self.latency + self.random.uniform(0, self.jitter)
+        return self.latency
+
+    def setErrorRate(self, rate, operation=None):
+        if operation is None:
+            self.errorRate = rate
+        else:
+            self.operationErrorRates[operation] = rate
+
+    def stats(self):
+        with self.lock:
+            return {"requests": self.requests, "errors": self.errors, "throttled": self.throttled, "published": self.published,
+                    "orders": len(self.orders), "routes": len(self.routes)}
+
+    # Messages
+
+    def message(self, schema, typeName, name, data, correlationId):
+        element = Element(name, schema, typeName)
+        populate(element, data)
+        return Message(element, [correlationId])
+
+    def errorMessage(self, service, operation, correlationId, errorCode, errorMessage):
+        if service.schema is self.history:
+            data = {"ErrorCode": "ERROR_INTERNAL" if errorCode != ERROR_INVALID_REQUEST else "ERROR_INVALID_INPUT", "ErrorMsg": errorMessage}
+            return self.message(self.history, "ErrorResponse", "ErrorResponse", data, correlationId)
+        if service.schema is None:
+            return Message(Element.fromPython("ErrorInfo", {"ERROR_CODE": errorCode, "ERROR_MESSAGE": errorMessage}), [correlationId])
+        return self.message(self.emapisvc, "ErrorInfoResponse", "ErrorInfo", {"ERROR_CODE": errorCode, "ERROR_MESSAGE": errorMessage}, correlationId)
+
+    def responseMessage(self, operation, correlationId, data):
+        for selection, responseType in self.emapisvc.responseTypes(operation).items():
+            if selection != "ErrorInfo":
+                return self.message(self.emapisvc, responseType.name, selection, data, correlationId)
+
+    def synthesize(self, schema, typeName, name, depth=0):
+        # A schema-valid sample value for an element of typeName.
+        primitive = schema.primitiveType(typeName)
+        typeDef = schema.types.get(typeName)
+
+        if typeDef is not None and typeDef.kind == "enumeration":
+            return typeDef.enumerators[0] if typeDef.valueType == "String" else 0
+        if primitive == "String":
+            return name.lower()
+        if primitive == "Int32" or primitive == "Int64":
+            return 1
+        if primitive == "Float64" or primitive == "Float32":
+            return 1.0
+        if primitive == "Boolean":
+            return True
+        if primitive == "Datetime":
+            return datetime.utcnow().replace(microsecond=0)
+        if primitive == "Date":
+            return date.today()
+
+        if depth > 8:
+            return {}
+        if typeDef.kind == "choice":
+            first = typeDef.elements[0]
+            return {first.name: self.synthesizeElement(schema, first, depth + 1)}
+        return dict((e.name, self.synthesizeElement(schema, e, depth + 1)) for e in typeDef.elements)
+
+    def synthesizeElement(self, schema, definition, depth=0):
+        if definition.isArray():
+            sample = SAMPLE_ARRAYS.get(definition.name)
+            if sample is not None and schema.primitiveType(definition.typeName) is not None:
+                return list(sample)
+            return [self.synthesize(schema, definition.typeName, definition.name, depth) for i in range(d_arrayLength)]
+        return self.synthesize(schema, definition.typeName, definition.name, depth)
+
+    # Requests
+
+    def injectedError(self, operation):
+        # Returns (errorCode, errorMessage) when this request should fail.
+        now = time.time()
+        with self.lock:
+            self.requests += 1
+            if self.throttleRate is not None:
+                self.requestTimes.append(now)
+                while self.requestTimes and self.requestTimes[0] < now - 1:
+                    self.requestTimes.popleft()
+                if len(self.requestTimes) > self.throttleRate:
+                    self.throttled += 1
+                    return ERROR_THROTTLED, "Request throttled: too many requests"
+
+            rate = self.operationErrorRates.get(operation, self.errorRate)
+            if rate and self.random.random() < rate:
+                self.errors += 1
+                return ERROR_INJECTED, "Injected error"
+        return None
+
+    def handleRequest(self, session, request, correlationId):
+        service = request.service()
+        operation = request.operation()
+        delay = self.delay()
+
+        if self.failureRate and self.random.random() < self.failureRate:
+            reason = {"source": "EMSXEmulator", "errorCode": -1, "category": "TIMEOUT", "description": "Injected request failure"}
+            session.schedule(session.statusEvent(Event.REQUEST_STATUS, "RequestFailure", correlationId, reason=reason), delay)
+            return
+
+        error = self.injectedError(operation)
+        if error is not None:
+            session.schedule(Event(Event.RESPONSE, [self.errorMessage(service, operation, correlationId, error[0], error[1])]), delay)
+            return
+
+        try:
+            if service.schema is self.history:
+                responses = self.getFills(request, correlationId)
+            elif service.schema is None:
+                responses = [self.brokerSpec(request, correlationId)]
+            else:
+                self.checkRequired(request)
+                with self.lock:
+                    responses = [self.handleEmapisvc(operation, request.asElement(), correlationId, delay)]
+        except EmulatorError as e:
+            responses = [self.errorMessage(service, operation, correlationId, e.errorCode, str(e))]
+
+        # Every message but the last is a PARTIAL_RESPONSE; they share one
+        # due time and are delivered in order.
+        for msg in responses[:-1]:
+            session.schedule(Event(Event.PARTIAL_RESPONSE, [msg]), delay)
+        session.schedule(Event(Event.RESPONSE, [responses[-1]]), delay)
+
+    def checkRequired(self, request):
+        element = request.asElement()
+        for definition in element._type.elements:
+            if definition.isRequired() and not element.hasElement(definition.name, True):
+                raise EmulatorError(ERROR_INVALID_REQUEST, "Missing required field %s" % definition.name)
+
+    def handleEmapisvc(self, operation, element, correlationId, delay):
+        if operation in CREATE_ORDER_OPERATIONS:
+            order = self.createOrder(element, delay)
+            return self.responseMessage(operation, correlationId, {"EMSX_SEQUENCE": order["EMSX_SEQUENCE"], "MESSAGE": "Order created"})
+
+        if operation in CREATE_AND_ROUTE_OPERATIONS:
+            order = self.createOrder(element, delay)
+            route = self.createRoute(order, element, delay)
+            return self.responseMessage(operation, correlationId, {"EMSX_SEQUENCE": route["EMSX_SEQUENCE"], "EMSX_ROUTE_ID": route["EMSX_ROUTE_ID"], "MESSAGE": "Order created and routed"})
+
+        if operation in ROUTE_OPERATIONS:
+            route = self.createRoute(self.order(element.getElementAsInteger("EMSX_SEQUENCE")), element, delay)
+            return self.responseMessage(operation, correlationId, {"EMSX_SEQUENCE": route["EMSX_SEQUENCE"], "EMSX_ROUTE_ID": route["EMSX_ROUTE_ID"], "MESSAGE": "Order routed"})
+
+        if operation in GROUP_ROUTE_OPERATIONS:
+            routed, failed = [], []
+            for sequence in element.getElement("EMSX_SEQUENCE").values():
+                try:
+                    route = self.createRoute(self.order(sequence), element, delay)
+                    routed.append({"EMSX_SEQUENCE": sequence, "EMSX_ROUTE_ID": route["EMSX_ROUTE_ID"]})
+                except EmulatorError as e:
+                    failed.append({"EMSX_SEQUENCE": sequence, "ERROR_CODE": e.errorCode, "ERROR_MESSAGE": str(e)})
+            return self.responseMessage(operation, correlationId, {"EMSX_SUCCESS_ROUTES": routed, "EMSX_FAILED_ROUTES": failed, "MESSAGE": "Group route processed", "EMSX_ML_ID": ""})
+
+        if operation in MODIFY_ORDER_OPERATIONS:
+            order = self.order(element.getElementAsInteger("EMSX_SEQUENCE"))
+            order.update(self.requestFields(element))
+            self.publish("order", UPDATE_ORDER_ROUTE, order, delay)
+            return self.responseMessage(operation, correlationId, {"EMSX_SEQUENCE": order["EMSX_SEQUENCE"], "MESSAGE": "Order modified"})
+
+        if operation in MODIFY_ROUTE_OPERATIONS:
+            route = self.route(element.getElementAsInteger("EMSX_SEQUENCE"), element.getElementAsInteger("EMSX_ROUTE_ID"))
+            route.update(self.requestFields(element))
+            self.publish("route", UPDATE_ORDER_ROUTE, route, delay)
+            return self.responseMessage(operation, correlationId, {"EMSX_SEQUENCE": route["EMSX_SEQUENCE"], "EMSX_ROUTE_ID": route["EMSX_ROUTE_ID"], "MESSAGE": "Route modified"})
+
+        if operation == "DeleteOrder":
+            for sequence in element.getElement("EMSX_SEQUENCE").values():
+                self.deleteOrder(sequence, delay)
+            return self.responseMessage(operation, correlationId, {"STATUS": 0, "MESSAGE": "Order deleted"})
+
+        if operation == "CancelOrderEx":
+            for sequence in element.getElement("EMSX_SEQUENCE").values():
+                for route in self.routesForOrder(sequence):
+                    self.cancelRoute(route, delay)
+            return self.responseMessage(operation, correlationId, {"STATUS": 0, "MESSAGE": "Order cancelled"})
+
+        if operation == "CancelRoute":
+            for item in element.getElement("ROUTES").values():
+                self.cancelRoute(self.route(item.getElementAsInteger("EMSX_SEQUENCE"), item.getElementAsInteger("EMSX_ROUTE_ID")), delay)
+            return self.responseMessage(operation, correlationId, {"STATUS": 0, "MESSAGE": "Route cancelled"})
+
+        if operation == "CancelRouteEx":
+            idType = element.getElement("ID_TYPE")
+            if idType.hasElement("OrderRoute", True):
+                for item in idType.getElement("OrderRoute").values():
+                    self.cancelRoute(self.route(item.getElementAsInteger("EMSX_SEQUENCE"), item.getElementAsInteger("EMSX_ROUTE_ID")), delay)
+            return self.responseMessage(operation, correlationId, {"STATUS": 0, "MESSAGE": "Route cancelled"})
+
+        if operation == "ManualFill":
+            target = element.getElement("ROUTE_TO_FILL")
+            route = self.route(target.getElementAsInteger("EMSX_SEQUENCE"), target.getElementAsInteger("EMSX_ROUTE_ID"))
+            fillIds = []
+            for fill in element.getElement("FILLS").values():
+                fillIds.append(self.applyFill(route, fill.getElementAsInteger("EMSX_FILL_AMOUNT") if fill.hasElement("EMSX_FILL_AMOUNT", True) else route["EMSX_WORKING"],
+                                              fill.getElementAsFloat("EMSX_FILL_PRICE") if fill.hasElement("EMSX_FILL_PRICE", True) else 100.0, delay))
+            return self.responseMessage(operation, correlationId, {"MESSAGE": "Fills applied", "EMSX_FILL_ID": fillIds})
+
+        for selection, responseType in self.emapisvc.responseTypes(operation).items():
+            if selection != "ErrorInfo":
+                return self.responseMessage(operation, correlationId, self.synthesize(self.emapisvc, responseType.name, selection))
+
+    # Order book
+
+    def requestFields(self, element):
+        # Scalar request fields that are also OrderRouteFields.
+        fields = {}
+        for child in element.elements():
+            name = str(child.name())
+            if name in self.orderRouteFields and not child.isArray() and not child.isComplexType() and not child.isNull():
+                fields[name] = child.getValue()
+        return fields
+
+    def order(self, sequence):
+        order = self.orders.get(sequence)
+        if order is None:
+            raise EmulatorError(ERROR_UNKNOWN_ORDER, "Order %d not found" % sequence)
+        return order
+
+    def route(self, sequence, routeId):
+        route = self.routes.get((sequence, routeId))
+        if route is None:
+            raise EmulatorError(ERROR_UNKNOWN_ORDER, "Route %d/%d not found" % (sequence, routeId))
+        return route
+
+    def routesForOrder(self, sequence):
+        return [route for key, route in self.routes.items() if key[0] == sequence]
+
+    def createOrder(self, element=None, delay=0, fields=None, publish=True):
+        today = date.today()
+        order = {
+            "EMSX_SEQUENCE":    next(self.sequences),
+            "EMSX_STATUS":      "NEW",
+            "EMSX_FILLED":      0,
+            "EMSX_WORKING":     0,
+            "EMSX_AVG_PRICE":   0.0,
+            "EMSX_DATE":        today.year * 10000 + today.month * 100 + today.day,
+            "EMSX_TRADER":      "EMULATOR",
+        }
+        if element is not None:
+            order.update(self.requestFields(element))
+            if element.hasElement("EMSX_ORDER_REF_ID", True):
+                # Published on OrderRouteFields as EMSX_ORD_REF_ID
+                order["EMSX_ORD_REF_ID"] = element.getElementAsString("EMSX_ORDER_REF_ID")
+        if fields is not None:
+            order.update(fields)
+        order["EMSX_IDLE_AMOUNT"] = order.get("EMSX_AMOUNT", 0)
+        self.orders[order["EMSX_SEQUENCE"]] = order
+        if publish:
+            self.publish("order", NEW_ORDER_ROUTE, order, delay)
+        return order
+
+    def createRoute(self, order, element=None, delay=0, fields=None, publish=True):
+        routeId = self.lastRouteIds[order["EMSX_SEQUENCE"]] = self.lastRouteIds.get(order["EMSX_SEQUENCE"], 0) + 1
+        route = dict(order)
+        route.update({"EMSX_ROUTE_ID": routeId, "EMSX_STATUS": "WORKING", "EMSX_FILLED": 0, "EMSX_AVG_PRICE": 0.0})
+        if element is not None:
+            route.update(self.requestFields(element))
+        if fields is not None:
+            route.update(fields)
+        route["EMSX_SEQUENCE"] = order["EMSX_SEQUENCE"]
+        route["EMSX_WORKING"] = route.get("EMSX_AMOUNT", 0)
+        self.routes[(order["EMSX_SEQUENCE"], routeId)] = route
+
+        order["EMSX_STATUS"] = "WORKING"
+        order["EMSX_WORKING"] = order.get("EMSX_WORKING", 0) + route["EMSX_WORKING"]
+        order["EMSX_IDLE_AMOUNT"] = max(0, order.get("EMSX_IDLE_AMOUNT", 0) - route["EMSX_WORKING"])
+        if publish:
+            self.publish("route", NEW_ORDER_ROUTE, route, delay)
+            self.publish("order", UPDATE_ORDER_ROUTE, order, delay)
+        return route
+
+    def applyFill(self, route, amount, price, delay=0):
+        order = self.orders[route["EMSX_SEQUENCE"]]
+        for record in (route, order):
+            filled = record.get("EMSX_FILLED", 0)
+            record["EMSX_AVG_PRICE"] = (record.get("EMSX_AVG_PRICE", 0.0) * filled + price * amount) / (filled + amount) if filled + amount else 0.0
+            record["EMSX_FILLED"] = filled + amount
+            record["EMSX_WORKING"] = max(0, record.get("EMSX_WORKING", 0) - amount)
+            record["EMSX_STATUS"] = "FILLED" if record["EMSX_FILLED"] >= record.get("EMSX_AMOUNT", 0) else "PARTFILLED"
+        route["EMSX_FILL_ID"] = route.get("EMSX_FILL_ID", 0) + 1
+        self.publish("route", UPDATE_ORDER_ROUTE, route, delay)
+        self.publish("order", UPDATE_ORDER_ROUTE, order, delay)
+        return route["EMSX_FILL_ID"]
+
+    def cancelRoute(self, route, delay=0):
+        route["EMSX_STATUS"] = "CANCEL"
+        route["EMSX_WORKING"] = 0
+        self.publish("route", UPDATE_ORDER_ROUTE, route, delay)
+
+    def deleteOrder(self, sequence, delay=0):
+        order = self.orders.pop(sequence, None)
+        if order is None:
+            raise EmulatorError(ERROR_UNKNOWN_ORDER, "Order %d not found" % sequence)
+        for route in self.routesForOrder(sequence):
+            del self.routes[(sequence, route["EMSX_ROUTE_ID"])]
+            self.publish("route", DELETE_ORDER_ROUTE, route, delay)
+        self.publish("order", DELETE_ORDER_ROUTE, order, delay)
+
+    def loadBlotter(self, orders, routesPerOrder=1):
+        """ Adds orders (and routes) to the book without publishing them, e.g.
+        to give a later subscription a large initial paint. """
+        with self.lock:
+            for i in range(orders):
+                fields = {
+                    "EMSX_TICKER":      d_tickers[i % len(d_tickers)],
+                    "EMSX_SIDE":        "BUY" if i % 2 == 0 else "SELL",
+                    "EMSX_AMOUNT":      100 * (1 + i % 50),
+                    "EMSX_ORDER_TYPE":  "MKT",
+                    "EMSX_TIF":         "DAY",
+                    "EMSX_BROKER":      d_brokers[i % len(d_brokers)],
+                    "EMSX_BASKET_NAME": "BASKET%d" % (i % 10),
+                }
+                order = self.createOrder(fields=fields, publish=False)
+                for r in range(routesPerOrder):
+                    self.createRoute(order, publish=False)
+
+    def fill(self, sequence, routeId, amount, price):
+        with self.lock:
+            return self.applyFill(self.route(sequence, routeId), amount, price, self.latency)
+
+    # Subscriptions
+
+    def subscribe(self, session, topic, correlationId):
+        match = TOPIC_PATTERN.match(topic)
+        fields = None
+        error = None
+        if match is None:
+            error = "Invalid topic %s" % topic
+        else:
+            if match.group(4):
+                fields = [f for f in match.group(4).split(",") if f]
+                unknown = [f for f in fields if f not in self.orderRouteFields]
+                if unknown:
+                    error = "Unknown fields: %s" % ",".join(unknown)
+
+        if error is not None:
+            reason = {"source": "EMSXEmulator", "errorCode": ERROR_INVALID_REQUEST, "category": "BAD_FIELD", "description": error}
+            session.schedule(session.statusEvent(Event.SUBSCRIPTION_STATUS, "SubscriptionFailure", correlationId, reason=reason), self.latency)
+            return
+
+        subscription = Subscription(session, correlationId, topic, match.group(2), fields)
+        with self.lock:
+            self.subscriptions.append(subscription)
+            records = list(self.orders.values()) if subscription.kind == "order" else list(self.routes.values())
+
+            session.schedule(session.statusEvent(Event.SUBSCRIPTION_STATUS, "SubscriptionStarted", correlationId), self.latency)
+
+            messages = [self.orderRouteMessage(subscription, INIT_PAINT, record) for record in records]
+            messages.append(self.orderRouteMessage(subscription, INIT_PAINT_END, None))
+            for i in range(0, len(messages), self.messagesPerEvent):
+                session.schedule(Event(Event.SUBSCRIPTION_DATA, messages[i:i + self.messagesPerEvent]), self.latency)
+            self.published += len(messages)
+
+    def unsubscribe(self, session, correlationId):
+        with self.lock:
+            self.subscriptions = [s for s in self.subscriptions if not (s.session is session and s.correlationId == correlationId)]
+
+    def orderRouteMessage(self, subscription, eventStatus, record, cache=None):
+        # cache, if given, maps (field, value) to a frozen child element that
+        # is shared between messages instead of built again for each one.
+        element = Element(ORDER_ROUTE_FIELDS_TYPE, self.emapisvc, ORDER_ROUTE_FIELDS_TYPE)
+        children = element._children = {}
+        index = elementIndex(self.orderRouteType)
+
+        values = {"MSG_TYPE": "E", "MSG_SUB_TYPE": "O" if subscription.kind == "order" else "R", "EVENT_STATUS": eventStatus, "API_SEQ_NUM": next(self.apiSequence)}
+        if record is not None:
+            fields = subscription.fields if subscription.fields is not None else record
+            for name in fields:
+                value = record.get(name)
+                if value is not None:
+                    values[name] = value
+
+        for name, value in values.items():
+            child = cache.get((name, value)) if cache is not None else None
+            if child is None:
+                child = Element.fromDefinition(self.emapisvc, index[name])
+                try:
+                    child.setValue(value)
+                except BlpapiException:
+                    continue
+                if cache is not None:
+                    cache[(name, value)] = child.freeze()
+            children[name] = child
+
+        return Message(element, [subscription.correlationId], subscription.topic)
+
+    def publish(self, kind, eventStatus, record, delay=0):
+        for subscription in self.subscriptions:
+            if subscription.kind == kind:
+                msg = self.orderRouteMessage(subscription, eventStatus, record)
+                subscription.session.schedule(Event(Event.SUBSCRIPTION_DATA, [msg]), delay)
+                self.published += 1
+
+    def heartbeat(self):
+        with self.lock:
+            for subscription in self.subscriptions:
+                msg = self.orderRouteMessage(subscription, HEARTBEAT, None)
+                subscription.session.schedule(Event(Event.SUBSCRIPTION_DATA, [msg]))
+
+    def runHeartbeats(self, interval):
+        while True:
+            time.sleep(interval)
+            self.heartbeat()
+
+    def dropConnection(self, session=None, reconnectDelay=d_reconnectDelay):
+        """ Simulates a lost connection: SessionConnectionDown, then
+        SubscriptionTerminated for each subscription of the session, then
+        SessionConnectionUp after reconnectDelay. """
+        with self.lock:
+            sessions = [session] if session is not None else list(self.sessions)
+            for session in sessions:
+                dropped = [s for s in self.subscriptions if s.session is session]
+                self.subscriptions = [s for s in self.subscriptions if s.session is not session]
+
+                session.schedule(session.statusEvent(Event.SESSION_STATUS, "SessionConnectionDown"))
+                for subscription in dropped:
+                    reason = {"source": "EMSXEmulator", "errorCode": -1, "category": "CANCELED", "description": "Connection lost"}
+                    session.schedule(session.statusEvent(Event.SUBSCRIPTION_STATUS, "SubscriptionTerminated", subscription.correlationId, reason=reason))
+                session.schedule(session.statusEvent(Event.SESSION_STATUS, "SessionConnectionUp"), reconnectDelay)
+
+    # emsx.history
+
+    def getFills(self, request, correlationId):
+        """ Fills occur every fillInterval from FILL_EPOCH, so a given time
+        window always returns the same fills with the same FillIds. Fill N
+        belongs to trader d_traderUuids[N % len]; every d_correctionEvery-th
+        fill corrects the one before it. """
+        element = request.asElement()
+        if not element.hasElement("FromDateTime", True) or not element.hasElement("ToDateTime", True) or not element.hasElement("Scope", True):
+            raise EmulatorError(ERROR_INVALID_REQUEST, "FromDateTime, ToDateTime and Scope are required")
+
+        fromDateTime = self.naiveUtc(element.getElementAsDatetime("FromDateTime"))
+        toDateTime = self.naiveUtc(element.getElementAsDatetime("ToDateTime"))
+        if toDateTime < fromDateTime:
+            raise EmulatorError(ERROR_INVALID_REQUEST, "ToDateTime is before FromDateTime")
+
+        scope = element.getElement("Scope")
+        uuids = None
+        if scope.hasElement("Uuids", True):
+            uuids = set(scope.getElement("Uuids").values())
+
+        interval = self.fillInterval.total_seconds()
+        first = int(max(0, (fromDateTime - FILL_EPOCH).total_seconds()) // interval)
+        last = int((toDateTime - FILL_EPOCH).total_seconds() // interval)
+
+        fills = []
+        for n in range(first, last + 1):
+            fill = self.fillItem(n)
+            if fromDateTime <= fill["DateTimeOfFill"] <= toDateTime and (uuids is None or fill["TraderUuid"] in uuids):
+                fills.append(fill)
+
+        chunks = [fills[i:i + self.partialSize] for i in range(0, len(fills), self.partialSize)] or [[]]
+        responses = []
+        for chunk in chunks:
+            msg = Element("GetFillsResponse", self.history, "GetFillsResponse")
+            fillsElement = msg.getElement("Fills")
+            for fill in chunk:
+                populate(fillsElement.appendElement(), fill)
+            responses.append(Message(msg, [correlationId]))
+        return responses
+
+    def naiveUtc(self, value):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def fillItem(self, n):
+        generator = random.Random(n)
+        fill = self.synthesize(self.history, "FillItem", "FillItem")
+        side = "BUY" if n % 2 == 0 else "SELL"
+        fill.update({
+            "Ticker":           d_tickers[n % len(d_tickers)],
+            "Side":             side,
+            "OrderId":          d_firstSequence + n // 4,
+            "RouteId":          1,
+            "FillId":           n + 1,
+            "CorrectedFillId":  n if d_correctionEvery and n % d_correctionEvery == 0 and n > 0 else 0,
+            "FillPrice":        round(generator.uniform(10, 500), 4),
+            "FillShares":       float(100 * generator.randint(1, 20)),
+            "TraderUuid":       d_traderUuids[n % len(d_traderUuids)],
+            "ExecutingBroker":  d_brokers[n % len(d_brokers)],
+            "Broker":           d_brokers[n % len(d_brokers)],
+            "DateTimeOfFill":   FILL_EPOCH + timedelta(seconds=n * self.fillInterval.total_seconds()),
+            "IsLeg":            False,
+            "IsCfd":            False,
+        })
+        return fill
+
+    # emsx.brokerspec
+
+    def brokerSpec(self, request, correlationId):
+        brokers = []
+        for code in d_brokers:
+            parameters = [
+                {"name": "StartTime", "fixTag": 168, "isRequired": False, "isReplaceable": True, "type": {"string": {"possibleValues": []}}},
+                {"name": "EndTime", "fixTag": 126, "isRequired": False, "isReplaceable": True, "type": {"string": {"possibleValues": []}}},
+                {"name": "MaxPctVolume", "fixTag": 5012, "isRequired": False, "isReplaceable": True, "type": {"range": {"min": 1, "max": 50, "step": 1}}},
+                {"name": "Urgency", "fixTag": 5013, "isRequired": True, "isReplaceable": False,
+                 "type": {"enumeration": {"enumerators": [{"name": "Low", "fixValue": "1"}, {"name": "Medium", "fixValue": "2"}, {"name": "High", "fixValue": "3"}]}}},
+            ]
+            strategies = [{"name": name, "fixValue": str(i + 1), "parameters": parameters} for i, name in enumerate(d_strategies)]
+            brokers.append({
+                "code": code,
+                "assetClass": "EQTY",
+                "strategyFixTag": 847,
+                "strategies": strategies,
+                "timesInForce": [{"name": "DAY", "fixValue": "0"}, {"name": "GTC", "fixValue": "1"}],
+                "orderTypes": [{"name": "MKT", "fixValue": "1"}, {"name": "LMT", "fixValue": "2"}],
+                "handlingInstructions": [{"name": "ANY", "fixValue": "1"}, {"name": "DMA", "fixValue": "2"}],
+            })
+        return Message(Element.fromPython("BrokerSpec", {"brokers": brokers}), [correlationId])
+
+
+_defaultEmulator = None
+
+
+def defaultEmulator():
+    global _defaultEmulator
+    if _defaultEmulator is None:
+        _defaultEmulator = Emulator()
+    return _defaultEmulator
+
+
+EXPORTS = ["Name", "CorrelationId", "SessionOptions", "Session", "Event", "Message", "Element", "Service", "Request",
+           "SubscriptionList", "NotFoundException", "InvalidArgumentException", "InvalidConversionException", "InvalidStateException"]
+
+
+def install(emulator=None, **options):
+    """ Makes "import blpapi" return the emulator for the rest of the process.
+
+    Must be called before the example modules are imported, since they
+    create their blpapi.Name constants at import time. Keyword options are
+    passed to Emulator(); the emulator is returned so tests can drive it.
+    """
+    global _defaultEmulator
+    if emulator is None:
+        emulator = Emulator(**options)
+    _defaultEmulator = emulator
+
+    module = types.ModuleType("blpapi")
+    for name in EXPORTS:
+        setattr(module, name, globals()[name])
+    module.Exception = BlpapiException
+    module.emulator = emulator
+    sys.modules["blpapi"] = module
+    return emulator
+
+
+def main():
+    # Runs one of the example scripts against the emulator.
+    if len(sys.argv) < 2:
+        print ("Usage: EMSXEmulator.py Script.py [args...]")
+        return
+
+    install()
+    script = sys.argv[1]
+    sys.argv = sys.argv[1:]
+    runpy.run_path(script, run_name="__main__")
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXEmulator")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
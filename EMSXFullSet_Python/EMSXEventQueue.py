@@ -0,0 +1,406 @@
+# EMSXEventQueue.py
+
+import sys
+import threading
+import time
+
+from EMSXNames import ORDER_ROUTE_FIELDS, EVENT_STATUS, EMSX_SEQUENCE, EMSX_ROUTE_ID
+
+
+UPDATE_ORDER_ROUTE      = 7
+INIT_PAINT_END          = 11
+
+BLOCK                   = "block"
+DROP                    = "drop"
+COALESCE                = "coalesce"
+POLICIES                = (BLOCK, DROP, COALESCE)
+
+d_capacity=10000
+d_policy=BLOCK
+d_workers=1
+d_blockTimeout=None         # seconds a full queue may block the event thread; None waits
+
+
+class RingBuffer(object):
+    """ Bounded FIFO between one producer and its consumer threads.
+
+    When the buffer is full, put() blocks (BLOCK) or discards the new item
+    (DROP); a forced item always waits for room. With COALESCE, an item put
+    with coalesce=True is merged into the queued coalescable item with the
+    same key, whether or not the buffer is full, and the result keeps the
+    queued item's place; a non-coalescable item with that key in between
+    stops this, so per-key order is unchanged.
+    """
+
+    def __init__(self, capacity=d_capacity, policy=d_policy, blockTimeout=d_blockTimeout, merge=None):
+        if policy not in POLICIES:
+            raise ValueError("Unknown queue policy %s (choose from %s)" % (policy, ", ".join(POLICIES)))
+        self.capacity = capacity
+        self.policy = policy
+        self.blockTimeout = blockTimeout
+        self.merge = merge
+
+        self.slots = [None] * capacity
+        self.slotKeys = [None] * capacity
+        self.keys = {}
+        self.head = 0
+        self.size = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+        self.enqueued = 0
+        self.dequeued = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.maxDepth = 0
+        self.blockedTime = 0.0
+
+    def put(self, item, key=None, coalesce=False, force=False):
+        # Returns False if the item was dropped. A forced item is waited for
+        # even under the DROP policy or past blockTimeout. A coalesced item
+        # replaces the queued one, or is merged into it by merge(queued, item).
+        coalesce = coalesce and key is not None and self.policy == COALESCE
+        with self.condition:
+            if coalesce:
+                index = self.keys.get(key)
+                if index is not None:
+                    self.slots[index] = item if self.merge is None else self.merge(self.slots[index], item)
+                    self.coalesced += 1
+                    return True
+
+            if self.size == self.capacity:
+                if self.policy == DROP and not force:
+                    self.dropped += 1
+                    return False
+                start = time.time()
+                deadline = None if self.blockTimeout is None or force else start + self.blockTimeout
+                while self.size == self.capacity and not self.closed:
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                self.blockedTime += time.time() - start
+                if self.size == self.capacity:
+                    self.dropped += 1
+                    return False
+
+            if self.closed:
+                return False
+
+            index = (self.head + self.size) % self.capacity
+            self.slots[index] = item
+            self.slotKeys[index] = key
+            if coalesce:
+                self.keys[key] = index
+            elif key is not None:
+                self.keys.pop(key, None)
+            self.size += 1
+            self.enqueued += 1
+            self.maxDepth = max(self.maxDepth, self.size)
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout=None):
+        # Returns the oldest item, or None once the buffer is closed and empty
+        # (or after timeout seconds).
+        with self.condition:
+            while self.size == 0:
+                if self.closed or not self.condition.wait(timeout):
+                    return None
+
+            index = self.head
+            item = self.slots[index]
+            key = self.slotKeys[index]
+            self.slots[index] = None
+            self.slotKeys[index] = None
+            if key is not None and self.keys.get(key) == index:
+                del self.keys[key]
+            self.head = (self.head + 1) % self.capacity
+            self.size -= 1
+            self.dequeued += 1
+            self.condition.notify_all()
+            return item
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def depth(self):
+        with self.condition:
+            return self.size
+
+    def stats(self):
+        with self.condition:
+            return {"depth": self.size, "maxDepth": self.maxDepth, "enqueued": self.enqueued, "dequeued": self.dequeued,
+                    "dropped": self.dropped, "coalesced": self.coalesced, "blockedTime": self.blockedTime}
+
+
+class MessageBatch(object):
+    """ Some of the messages of an event, handled as if they were the event. """
+
+    def __init__(self, eventType, messages):
+        self._eventType = eventType
+        self._messages = messages
+
+    def eventType(self):
+        return self._eventType
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __len__(self):
+        return len(self._messages)
+
+
+class CoalescedElement(object):
+    """ The elements of several messages of one type, read as one element.
+
+    Each child is taken from the newest element in which it is not null, so
+    a field left out of a later update keeps the value an earlier one gave
+    it. Children are read by position or by name, as FieldDecoder does.
+    """
+
+    def __init__(self, elements):
+        self._elements = elements   # oldest first
+
+    def name(self):
+        return self._elements[-1].name()
+
+    def isNull(self):
+        return all(element.isNull() for element in self._elements)
+
+    def numElements(self):
+        return self._elements[-1].numElements()
+
+    def elements(self):
+        return [self.getElement(i) for i in range(self.numElements())]
+
+    def hasElement(self, name, excludeNullElements=False):
+        return any(element.hasElement(name, excludeNullElements) for element in self._elements)
+
+    def getElement(self, name):
+        for element in reversed(self._elements):
+            if isinstance(name, int) or element.hasElement(name, True):
+                child = element.getElement(name)
+                if not child.isNull():
+                    return child
+        return self._elements[-1].getElement(name)
+
+    def __getattr__(self, attribute):
+        # getElementAsString(name) etc. read the merged child.
+        if not attribute.startswith("getElementAs"):
+            raise AttributeError(attribute)
+        getter = "getValueAs" + attribute[len("getElementAs"):]
+        return lambda name: getattr(self.getElement(name), getter)()
+
+
+class CoalescedMessage(object):
+    """ UPDATE messages for one order or route merged field by field.
+
+    Updates only carry the fields that changed, so a newer update cannot
+    simply replace a queued one; this stands in for the newest message,
+    with every field that any of the merged messages set.
+    """
+
+    def __init__(self, older, newer):
+        messages = older.messages if isinstance(older, CoalescedMessage) else [older]
+        self.messages = messages + [newer]
+        self.element = CoalescedElement([msg.asElement() for msg in self.messages])
+
+    def messageType(self):
+        return self.messages[-1].messageType()
+
+    def correlationIds(self):
+        return self.messages[-1].correlationIds()
+
+    def asElement(self):
+        return self.element
+
+    def numElements(self):
+        return self.element.numElements()
+
+    def elements(self):
+        return self.element.elements()
+
+    def hasElement(self, name, excludeNullElements=False):
+        return self.element.hasElement(name, excludeNullElements)
+
+    def getElement(self, name):
+        return self.element.getElement(name)
+
+    def __getattr__(self, attribute):
+        if not attribute.startswith("getElementAs"):
+            raise AttributeError(attribute)
+        return getattr(self.element, attribute)
+
+    def __str__(self):
+        return "\n".join(str(msg) for msg in self.messages)
+
+
+def mergeBatches(queued, batch):
+    # RingBuffer merge for coalesced single message batches.
+    (older,), (newer,) = queued, batch
+    return MessageBatch(batch.eventType(), [CoalescedMessage(older, newer)])
+
+
+class Fence(object):
+    """ An event that every worker has to reach before one of them handles it. """
+
+    def __init__(self, workers, event):
+        self.event = event
+        self.waiting = workers
+        self.done = False
+        self.condition = threading.Condition()
+
+    def arrive(self):
+        # True for the last worker to arrive, which handles the event; the
+        # others wait until it has.
+        with self.condition:
+            self.waiting -= 1
+            if self.waiting == 0:
+                return True
+            while not self.done:
+                self.condition.wait()
+            return False
+
+    def release(self):
+        with self.condition:
+            self.done = True
+            self.condition.notify_all()
+
+
+class EventQueue(object):
+    """ Moves subscription event processing off the blpapi event thread.
+
+    submit() is called from the event handler and only queues the event;
+    worker threads take it from a bounded ring buffer and call
+    handler(event). With one worker and the BLOCK or DROP policy whole
+    events are queued as they are, which is all the event thread has to do.
+
+    With several workers, or with DROP or COALESCE, events are split into
+    their messages, which are routed to a worker by EMSX_SEQUENCE so the
+    messages of an order and of its routes are handled in order by the same
+    worker. Only UPDATE messages (EVENT_STATUS 7) are ever dropped or
+    coalesced; paint, new, delete and end of paint messages wait for room
+    in the queue whatever the policy. COALESCE merges a newer UPDATE of an
+    order or route into its queued UPDATE field by field (see
+    CoalescedMessage), since an update only carries the fields that
+    changed. The end of an initial paint (EVENT_STATUS 11) is a fence: it
+    is handled only after every worker has handled the messages queued
+    before it.
+    """
+
+    def __init__(self, handler, workers=d_workers, capacity=d_capacity, policy=d_policy, blockTimeout=d_blockTimeout):
+        self.handler = handler
+        self.policy = policy
+        self.splitEvents = workers > 1 or policy != BLOCK
+        self.buffers = [RingBuffer(capacity, policy, blockTimeout, mergeBatches) for i in range(workers)]
+        self.processed = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+        self.threads = []
+        for i, buffer in enumerate(self.buffers):
+            thread = threading.Thread(target=self.work, args=(buffer,), name="EMSXEventQueueWorker-%d" % i)
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+    def messageKeys(self, msg):
+        # (partition key, record key or None, is an UPDATE) for one message.
+        # Orders and their routes share EMSX_SEQUENCE, so they share a worker.
+        correlationIds = msg.correlationIds()
+        cid = correlationIds[0].value() if correlationIds else None
+        if msg.messageType() != ORDER_ROUTE_FIELDS or not msg.hasElement(EMSX_SEQUENCE, True):
+            return cid, None, False
+
+        sequence = msg.getElementAsInteger(EMSX_SEQUENCE)
+        routeId = msg.getElementAsInteger(EMSX_ROUTE_ID) if msg.hasElement(EMSX_ROUTE_ID, True) else None
+        return sequence, (cid, sequence, routeId), msg.getElementAsInteger(EVENT_STATUS) == UPDATE_ORDER_ROUTE
+
+    def isFence(self, msg):
+        return (len(self.buffers) > 1 and msg.messageType() == ORDER_ROUTE_FIELDS
+                and msg.getElementAsInteger(EVENT_STATUS) == INIT_PAINT_END)
+
+    def submit(self, event):
+        if not self.splitEvents:
+            self.buffers[0].put(event)
+            return
+
+        eventType = event.eventType()
+        for msg in event:
+            if self.isFence(msg):
+                fence = Fence(len(self.buffers), MessageBatch(eventType, [msg]))
+                for buffer in self.buffers:
+                    buffer.put(fence, force=True)
+                continue
+
+            partition, key, update = self.messageKeys(msg)
+            buffer = self.buffers[hash(partition) % len(self.buffers)]
+            buffer.put(MessageBatch(eventType, [msg]), key, coalesce=update, force=not update)
+
+    def work(self, buffer):
+        while True:
+            event = buffer.get()
+            if event is None:
+                return
+            fence = None
+            if isinstance(event, Fence):
+                if not event.arrive():
+                    continue
+                fence, event = event, event.event
+            try:
+                self.handler(event)
+            except:
+                with self.lock:
+                    self.errors += 1
+                print ("Exception:  %s" % sys.exc_info()[0])
+            if fence is not None:
+                fence.release()
+            with self.lock:
+                self.processed += 1
+
+    def stop(self, timeout=None):
+        # Lets the workers finish what is queued, then stops them.
+        for buffer in self.buffers:
+            buffer.close()
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def depth(self):
+        return sum(buffer.depth() for buffer in self.buffers)
+
+    def stats(self):
+        totals = {"depth": 0, "maxDepth": 0, "enqueued": 0, "dequeued": 0, "dropped": 0, "coalesced": 0, "blockedTime": 0.0}
+        for buffer in self.buffers:
+            for name, value in buffer.stats().items():
+                totals[name] += value
+        with self.lock:
+            totals["processed"] = self.processed
+            totals["errors"] = self.errors
+        totals["workers"] = len(self.buffers)
+        totals["policy"] = self.policy
+        return totals
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
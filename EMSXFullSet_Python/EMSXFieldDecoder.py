@@ -0,0 +1,175 @@
+# EMSXFieldDecoder.py
+
+import blpapi
+
+import EMSXNames
+from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, PRIMITIVE_ACCESSORS, emapisvcSchema
+
+
+# Values reported for fields that are absent from a message, matching the
+# defaults used by the sample scripts.
+TYPE_DEFAULTS = {
+    "String":   "",
+    "Int32":    0,
+    "Int64":    0,
+    "Float32":  0.0,
+    "Float64":  0.0,
+    "Boolean":  False,
+    "Datetime": "",
+    "Date":     "",
+}
+
+# A decoder whose fields are at most this fraction of the message elements
+# reads its fields by position instead of walking every element.
+d_sparseRatio=0.25
+
+
+class FieldSpec(object):
+
+    __slots__ = ("name", "blpName", "typeName", "accessor", "default")
+
+    def __init__(self, name, typeName):
+        self.name = name
+        self.blpName = EMSXNames.name(name)
+        self.typeName = typeName
+        self.accessor = getattr(blpapi.Element, PRIMITIVE_ACCESSORS[typeName])
+        self.default = TYPE_DEFAULTS[typeName]
+
+
+class FieldDecoder(object):
+    """ Decodes OrderRouteFields messages into dicts keyed by field name.
+
+    The field table is compiled once from the OrderRouteFields sequence in the
+    emapisvc schema. On the first message the table is also laid out by
+    element position, so later messages are decoded in a single pass over
+    the message elements without any name lookups. When the decoder only
+    wants a few of the fields (a projected subscription), it fetches just
+    those elements by position instead. The layout is reused while a message
+    has the same number of elements and the same first and last element
+    names, and each wanted element's name is checked as it is read, so a
+    message whose elements come in another order gets a new layout. Only
+    elements that are present (not null) in the message end up in the
+    record. Values are read with the accessors of the class of the message's
+    elements, so messages rebuilt by the emulator (a replayed capture) are
+    decoded even in a process where the real blpapi is installed.
+    """
+
+    def __init__(self, fields=None, schema=None):
+        if schema is None:
+            schema = emapisvcSchema()
+
+        definitions = schema.types[ORDER_ROUTE_FIELDS_TYPE].elements
+
+        if fields is None:
+            fields = [d.name for d in definitions]
+
+        byName = dict((d.name, d) for d in definitions)
+        unknown = [f for f in fields if f not in byName]
+        if unknown:
+            raise ValueError("Unknown %s fields: %s" % (ORDER_ROUTE_FIELDS_TYPE, ", ".join(unknown)))
+
+        self.specs = [FieldSpec(f, schema.primitiveType(byName[f].typeName)) for f in fields]
+        self.specsByName = dict((spec.blpName, spec) for spec in self.specs)
+        self.positions = None
+        self.selected = None
+        self.firstName = None
+        self.lastName = None
+        self.elementClass = blpapi.Element
+
+    def fieldNames(self):
+        return [spec.name for spec in self.specs]
+
+    def defaults(self):
+        return dict((spec.name, spec.default) for spec in self.specs)
+
+    def compilePositions(self, element):
+        # Maps each element position of the message type to its FieldSpec (or
+        # None for fields this decoder does not care about). If only a few
+        # positions are wanted, they are also kept as (position, FieldSpec)
+        # pairs in self.selected.
+        positions = []
+        for child in element.elements():
+            positions.append(self.specsByName.get(child.name()))
+        selected = [(i, spec) for i, spec in enumerate(positions) if spec is not None]
+        self.selected = selected if len(selected) <= d_sparseRatio * len(positions) else None
+        self.positions = positions
+        if positions:
+            first = element.getElement(0)
+            self.firstName = first.name()
+            self.lastName = element.getElement(len(positions) - 1).name()
+            if type(first) is not self.elementClass:
+                self.elementClass = type(first)
+                for spec in self.specs:
+                    spec.accessor = getattr(self.elementClass, PRIMITIVE_ACCESSORS[spec.typeName])
+        return positions
+
+    def layoutMatches(self, element):
+        count = element.numElements()
+        if self.positions is None or len(self.positions) != count:
+            return False
+        if count == 0:
+            return True
+        first = element.getElement(0)
+        return (type(first) is self.elementClass and first.name() == self.firstName
+                and element.getElement(count - 1).name() == self.lastName)
+
+    def decode(self, msg):
+        element = msg.asElement()
+
+        if not self.layoutMatches(element):
+            self.compilePositions(element)
+
+        record = self.decodeByPosition(element)
+        if record is None:
+            # A wanted element was not where the layout put it.
+            self.compilePositions(element)
+            record = self.decodeByPosition(element)
+        return record
+
+    def decodeByPosition(self, element):
+        # The record, or None if an element is not the field the layout
+        # expects at its position.
+        record = {}
+        if self.selected is not None:
+            for i, spec in self.selected:
+                child = element.getElement(i)
+                if child.name() != spec.blpName:
+                    return None
+                if not child.isNull():
+                    record[spec.name] = spec.accessor(child)
+            return record
+
+        for child, spec in zip(element.elements(), self.positions):
+            if spec is not None:
+                if child.name() != spec.blpName:
+                    return None
+                if not child.isNull():
+                    record[spec.name] = spec.accessor(child)
+        return record
+
+    def decodeWithDefaults(self, msg):
+        record = self.defaults()
+        record.update(self.decode(msg))
+        return record
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
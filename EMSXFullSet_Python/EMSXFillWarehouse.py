@@ -0,0 +1,228 @@
+# EMSXFillWarehouse.py
+
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta, timezone
+
+from EMSXHistoryFetcher import splitScopes
+from EMSXSchema import historySchema
+
+
+FILL_ITEM_TYPE = "FillItem"
+
+d_database="emsx_fills.db"
+d_overlap=timedelta(hours=1)
+d_initialHistory=timedelta(days=30)
+
+SQL_TYPES = {
+    "String":   "TEXT",
+    "Int32":    "INTEGER",
+    "Int64":    "INTEGER",
+    "Float32":  "REAL",
+    "Float64":  "REAL",
+    "Boolean":  "INTEGER",
+    "Datetime": "TEXT",
+    "Date":     "TEXT",
+}
+
+
+def scopeKeys(scope):
+    # The sync_state keys of a scope: one per UUID, so a UUID keeps its mark
+    # whichever request it is batched into.
+    choice, value = scope
+    if choice == "Uuids":
+        return ["Uuid:%d" % uuid for uuid in value]
+    return ["%s:%s" % (choice, value)]
+
+
+def sqlValue(value):
+    # Datetimes are stored as naive UTC, so the text sorts in time order
+    # whatever offset each fill came with.
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+class FillWarehouse(object):
+    """ Local SQLite store of GetFills results with incremental sync.
+
+    Every FillItem field from the emsx.history schema is a column, plus
+    TradeDate (the date part of DateTimeOfFill, in UTC) which is indexed so
+    reads by trade date only touch that day's rows. A high-water mark, the
+    end of the last window synced without errors, is kept per UUID (or
+    team) and each sync only requests fills from the mark less a small
+    overlap, so late fills and corrections are not missed.
+    """
+
+    def __init__(self, path=d_database, schema=None):
+        if schema is None:
+            schema = historySchema()
+
+        self.fields = [(e.name, schema.primitiveType(e.typeName) or "String") for e in schema.types[FILL_ITEM_TYPE].elements]
+        self.fieldNames = [name for name, typeName in self.fields]
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.createTables()
+
+    def createTables(self):
+        columns = ", ".join('"%s" %s' % (name, SQL_TYPES[typeName]) for name, typeName in self.fields if name != "FillId")
+
+        with self.lock, self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS fills ("FillId" INTEGER PRIMARY KEY, "TradeDate" TEXT, %s)' % columns)
+            self.connection.execute('CREATE INDEX IF NOT EXISTS fills_trade_date ON fills ("TradeDate")')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS sync_state (scope TEXT PRIMARY KEY, high_water TEXT)')
+
+            # Columns added to FillItem by a newer schema are appended to an existing table.
+            existing = set(row[1] for row in self.connection.execute('PRAGMA table_info(fills)'))
+            for name, typeName in self.fields:
+                if name not in existing:
+                    self.connection.execute('ALTER TABLE fills ADD COLUMN "%s" %s' % (name, SQL_TYPES[typeName]))
+            self.connection.execute('CREATE INDEX IF NOT EXISTS fills_corrected_fill_id ON fills ("CorrectedFillId")')
+
+            # Rows written before datetimes were normalised may still carry an offset.
+            rows = self.connection.execute('SELECT "FillId", "DateTimeOfFill" FROM fills WHERE "DateTimeOfFill" GLOB \'*[+-][0-9][0-9]:[0-9][0-9]\'').fetchall()
+            for fillId, dateTimeOfFill in rows:
+                dateTimeOfFill = sqlValue(datetime.fromisoformat(dateTimeOfFill))
+                self.connection.execute('UPDATE fills SET "DateTimeOfFill" = ?, "TradeDate" = ? WHERE "FillId" = ?', (dateTimeOfFill, dateTimeOfFill[:10], fillId))
+
+    def close(self):
+        self.connection.close()
+
+    def highWater(self, key):
+        with self.lock:
+            row = self.connection.execute('SELECT high_water FROM sync_state WHERE scope = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        return datetime.strptime(row[0], "%Y-%m-%dT%H:%M:%S")
+
+    def setHighWater(self, key, value):
+        with self.lock, self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO sync_state (scope, high_water) VALUES (?, ?)', (key, value.strftime("%Y-%m-%dT%H:%M:%S")))
+
+    def scopes(self, uuids, teams, tradingSystem, uuidsPerRequest):
+        # (high-water mark, scope) pairs to sync. UUIDs are batched with
+        # others that have the same mark, so each request has one start.
+        scopes = []
+        byMark = {}
+        for uuid in sorted(set(uuids or [])):
+            byMark.setdefault(self.highWater(scopeKeys(("Uuids", [uuid]))[0]), []).append(uuid)
+        for mark, group in byMark.items():
+            scopes.extend((mark, scope) for scope in splitScopes(group, uuidsPerRequest=uuidsPerRequest))
+        for scope in splitScopes(None, teams, tradingSystem):
+            scopes.append((self.highWater(scopeKeys(scope)[0]), scope))
+        return scopes
+
+    def store(self, fills):
+        names = ["FillId", "TradeDate"] + [n for n in self.fieldNames if n != "FillId"]
+        statement = 'INSERT OR REPLACE INTO fills (%s) VALUES (%s)' % (", ".join('"%s"' % n for n in names), ", ".join("?" * len(names)))
+
+        rows = []
+        fillIds = []
+        correctedIds = []
+        for fill in fills:
+            dateTimeOfFill = sqlValue(fill.get("DateTimeOfFill"))
+            tradeDate = dateTimeOfFill[:10] if dateTimeOfFill else None
+            rows.append([fill.get("FillId"), tradeDate] + [sqlValue(fill.get(n)) for n in names[2:]])
+            fillIds.append((fill.get("FillId"), fill.get("FillId")))
+            if fill.get("CorrectedFillId"):
+                correctedIds.append((fill.get("CorrectedFillId"),))
+
+        # Originals superseded by a correction in this batch are removed, as
+        # are originals in it (re-read in the overlap) whose correction was
+        # already stored. Both only touch the batch's own FillIds.
+        with self.lock, self.connection:
+            self.connection.executemany(statement, rows)
+            self.connection.executemany('DELETE FROM fills WHERE "FillId" = ?', correctedIds)
+            self.connection.executemany('DELETE FROM fills WHERE "FillId" = ? AND EXISTS (SELECT 1 FROM fills WHERE "CorrectedFillId" = ?)', fillIds)
+
+        return len(rows)
+
+    def sync(self, fetcher, uuids=None, teams=None, tradingSystem=False, toDateTime=None, overlap=d_overlap, initialHistory=d_initialHistory):
+        # Brings every scope up to toDateTime; returns the number of fills received.
+        if toDateTime is None:
+            toDateTime = datetime.utcnow().replace(microsecond=0)
+        elif toDateTime.tzinfo is not None:
+            toDateTime = toDateTime.astimezone(timezone.utc).replace(tzinfo=None)
+
+        received = 0
+        for highWater, scope in self.scopes(uuids, teams, tradingSystem, fetcher.uuidsPerRequest):
+            fromDateTime = highWater - overlap if highWater is not None else toDateTime - initialHistory
+
+            choice, value = scope
+            fills, errors = fetcher.fetch(fromDateTime, toDateTime,
+                                          uuids=value if choice == "Uuids" else None,
+                                          teams=[value] if choice == "Team" else None,
+                                          tradingSystem=choice == "TradingSystem")
+            received += self.store(fills)
+
+            # The mark only moves when every chunk of the scope succeeded; it
+            # then moves to the end of the window, fills or not, so a UUID
+            # without fills is not fetched from initialHistory every time.
+            if errors:
+                print ("Error: %d chunks failed for %s, high-water mark not advanced" % (len(errors), ", ".join(scopeKeys(scope))))
+            elif highWater is None or toDateTime > highWater:
+                for key in scopeKeys(scope):
+                    self.setHighWater(key, toDateTime)
+
+        return received
+
+    def query(self, fromDate=None, toDate=None, **equals):
+        # Fills with fromDate <= TradeDate <= toDate (YYYY-MM-DD strings) and field=value filters.
+        clauses = []
+        params = []
+        if fromDate is not None:
+            clauses.append('"TradeDate" >= ?')
+            params.append(fromDate)
+        if toDate is not None:
+            clauses.append('"TradeDate" <= ?')
+            params.append(toDate)
+        for name, value in equals.items():
+            if name not in self.fieldNames:
+                raise ValueError("Unknown fill field %s" % name)
+            clauses.append('"%s" = ?' % name)
+            params.append(sqlValue(value))
+
+        statement = 'SELECT * FROM fills'
+        if clauses:
+            statement += ' WHERE ' + ' AND '.join(clauses)
+        statement += ' ORDER BY "DateTimeOfFill", "FillId"'
+
+        with self.lock:
+            cursor = self.connection.execute(statement, params)
+            names = [d[0] for d in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def tradeDates(self):
+        with self.lock:
+            return [row[0] for row in self.connection.execute('SELECT DISTINCT "TradeDate" FROM fills ORDER BY "TradeDate"')]
+
+    def purge(self, beforeDate):
+        with self.lock, self.connection:
+            return self.connection.execute('DELETE FROM fills WHERE "TradeDate" < ?', (beforeDate,)).rowcount
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
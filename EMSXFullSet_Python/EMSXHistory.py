@@ -2,19 +2,17 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       GET_FILLS_RESPONSE, FROM_DATE_TIME, TO_DATE_TIME, SCOPE, UUIDS, HISTORY_ERROR_CODE, ERROR_MSG,
+                       HISTORY_FILLS, DATE_TIME_OF_FILL, FILL_ID, FILL_PRICE, FILL_SHARES, ORDER_ID)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-GET_FILLS_RESPONSE      = blpapi.Name("GetFillsResponse")
 
 d_service="//blp/emsx.history.uat"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +45,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -65,19 +64,19 @@ class SessionEventHandler():
     
                 request = service.createRequest("GetFills")
 
-                request.set("FromDateTime", "2017-11-03T00:00:00.000+00:00")
-                request.set("ToDateTime", "2017-11-03T23:59:00.000+00:00")
+                request.set(FROM_DATE_TIME, "2017-11-03T00:00:00.000+00:00")
+                request.set(TO_DATE_TIME, "2017-11-03T23:59:00.000+00:00")
 
-                scope = request.getElement("Scope")
+                scope = request.getElement(SCOPE)
                 
                 #scope.setChoice("Team") # Team Name
                 #scope.setChoice("TradingSystem") # AIM Px#
-                scope.setChoice("Uuids") # UUID 
+                scope.setChoice(UUIDS) # UUID 
                 
                 #scope.setElement("Team", "MyTeamName")
                 #scope.setElement("TradingSystem", True) # no need to specify px# this will be picked up based on the login.
                 
-                scope.getElement("Uuids").appendValue(1234) # User's UUID
+                scope.getElement(UUIDS).appendValue(1234) # User's UUID
 
                 #scope.getElement("Uuids").appendValue(12345);
                 #scope.getElement("Uuids").appendValue(123456);
@@ -103,7 +102,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -114,12 +114,12 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ErrorCode")
-                    errorMessage = msg.getElementAsString("ErrorMsg")
+                    errorCode = msg.getElementAsInteger(HISTORY_ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MSG)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == GET_FILLS_RESPONSE:
 
-                    fills = msg.getElement("Fills")
+                    fills = msg.getElement(HISTORY_FILLS)
                     
                     for fill in fills.values():
 
@@ -136,14 +136,14 @@ class SessionEventHandler():
                         #correctedFillId = fill.getElement("CorrectedFillId").getValueAsInteger()
                         #currency = fill.getElement("Currency").getValueAsString()
                         #cusip = fill.getElement("Cusip").getValueAsString()
-                        dateTimeOfFill = fill.getElement("DateTimeOfFill").getValueAsString()
+                        dateTimeOfFill = fill.getElement(DATE_TIME_OF_FILL).getValueAsString()
                         #exchange = fill.getElement("Exchange").getValueAsString()
                         #execPrevSeqNo = fill.getElement("ExecPrevSeqNo").getValueAsInteger()
                         #execType = fill.getElement("ExecType").getValueAsString()
                         #executingBroker = fill.getElement("ExecutingBroker").getValueAsString()
-                        fillId = fill.getElement("FillId").getValueAsInteger()
-                        fillPrice = fill.getElement("FillPrice").getValueAsFloat()
-                        fillShares = fill.getElement("FillShares").getValueAsFloat()
+                        fillId = fill.getElement(FILL_ID).getValueAsInteger()
+                        fillPrice = fill.getElement(FILL_PRICE).getValueAsFloat()
+                        fillShares = fill.getElement(FILL_SHARES).getValueAsFloat()
                         #investorId = fill.getElement("InvestorID").getValueAsString()
                         #isCFD = fill.getElement("IsCfd").getValueAsBool()
                         #isin = fill.getElement("Isin").getValueAsString()
@@ -160,7 +160,7 @@ class SessionEventHandler():
                         #occSymbol = fill.getElement("OCCSymbol").getValueAsString()
                         #orderExecutionInstruction = fill.getElement("OrderExecutionInstruction").getValueAsString()
                         #orderHandlingInstruction = fill.getElement("OrderHandlingInstruction").getValueAsString()
-                        orderId = fill.getElement("OrderId").getValueAsInteger()
+                        orderId = fill.getElement(ORDER_ID).getValueAsInteger()
                         #orderInstruction = fill.getElement("OrderInstruction").getValueAsString()
                         #orderOrigin = fill.getElement("OrderOrigin").getValueAsString()
                         #orderReferenceId = fill.getElement("OrderReferenceId").getValueAsString()
@@ -194,8 +194,7 @@ class SessionEventHandler():
                         print ("OrderId: %d\tFill ID: %d\tDate/Time: %s\tShares: %f\tPrice: %f" % (orderId,fillId, dateTimeOfFill, fillShares, fillPrice))
                             
                 if event.eventType() == blpapi.Event.RESPONSE:
-                    global bEnd
-                    bEnd = True
+                    d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -222,8 +221,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
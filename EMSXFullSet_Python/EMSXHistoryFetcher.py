@@ -0,0 +1,470 @@
+# EMSXHistoryFetcher.py
+
+import asyncio
+import blpapi
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+from EMSXNames import (GET_FILLS_RESPONSE, ERROR_RESPONSE, HISTORY_FILLS, HISTORY_ERROR_CODE, ERROR_MSG,
+                       FROM_DATE_TIME, TO_DATE_TIME, SCOPE, UUIDS, FILTER_BY, REASON, CATEGORY,
+                       SESSION_TERMINATED, SLOW_CONSUMER_WARNING)
+from EMSXRequestRunner import TERMINATED, RequestRunner, RequestTimeout, elementToPython, messageError
+
+
+d_service="//blp/emsx.history"
+d_window=timedelta(days=1)
+d_minWindow=timedelta(minutes=15)
+d_uuidsPerRequest=10
+d_maxInFlight=4
+d_requestTimeout=60
+d_maxBufferedEvents=8
+d_overflowPolicy="block"    # or "fail": what a FillStream does when its consumer falls behind
+d_retryKeywords=["timeout", "timed out", "too large", "too big"]
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.000+00:00"
+
+BLOCK                   = "block"
+FAIL                    = "fail"
+OVERFLOW_POLICIES       = (BLOCK, FAIL)
+
+
+def formatDateTime(value):
+    return value.strftime(DATETIME_FORMAT)
+
+
+def splitWindows(fromDateTime, toDateTime, window=d_window):
+    windows = []
+    start = fromDateTime
+    while start < toDateTime:
+        end = min(start + window, toDateTime)
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+def splitScopes(uuids=None, teams=None, tradingSystem=False, uuidsPerRequest=d_uuidsPerRequest):
+    # Each scope is a ("Uuids", [..]), ("Team", name) or ("TradingSystem", True) choice.
+    scopes = []
+    if uuids:
+        uuids = list(uuids)
+        for i in range(0, len(uuids), uuidsPerRequest):
+            scopes.append(("Uuids", uuids[i:i + uuidsPerRequest]))
+    for team in teams or []:
+        scopes.append(("Team", team))
+    if tradingSystem:
+        scopes.append(("TradingSystem", True))
+    return scopes
+
+
+class FillsChunk(object):
+    """ One GetFills request: a scope over a date/time window. """
+
+    def __init__(self, scope, fromDateTime, toDateTime, attempt=0):
+        self.scope = scope
+        self.fromDateTime = fromDateTime
+        self.toDateTime = toDateTime
+        self.attempt = attempt
+        self.pending = None
+        self.timedOut = False
+
+    def split(self):
+        middle = self.fromDateTime + (self.toDateTime - self.fromDateTime) // 2
+        return [FillsChunk(self.scope, self.fromDateTime, middle, self.attempt + 1),
+                FillsChunk(self.scope, middle, self.toDateTime, self.attempt + 1)]
+
+    def __repr__(self):
+        return "%s %s -> %s" % (self.scope[0], formatDateTime(self.fromDateTime), formatDateTime(self.toDateTime))
+
+
+def buildFillsRequest(service, chunk, filterBy=None):
+    request = service.createRequest("GetFills")
+
+    request.set(FROM_DATE_TIME, formatDateTime(chunk.fromDateTime))
+    request.set(TO_DATE_TIME, formatDateTime(chunk.toDateTime))
+
+    scope = request.getElement(SCOPE)
+    choice, value = chunk.scope
+    scope.setChoice(choice)
+    if choice == "Uuids":
+        uuids = scope.getElement(UUIDS)
+        for uuid in value:
+            uuids.appendValue(uuid)
+    else:
+        scope.setElement(choice, value)
+
+    if filterBy is not None:
+        choice, values = filterBy
+        element = request.getElement(FILTER_BY)
+        element.setChoice(choice)
+        for value in values:
+            element.getElement(choice).appendValue(value)
+
+    return request
+
+
+def decodeFills(msg):
+    fills = []
+    for fill in msg.getElement(HISTORY_FILLS).values():
+        fills.append(elementToPython(fill))
+    return fills
+
+
+class HistoryError(Exception):
+    pass
+
+
+class StreamSession(object):
+    """ A session whose events are pulled by the thread that consumes them.
+
+    It has no event handler, so events wait in the session's own queue,
+    which holds at most maxBuffered events; while that queue is full blpapi
+    stops reading from the connection and queues a SlowConsumerWarning.
+    Requests go through a RequestRunner, and pump() hands it the responses.
+    """
+
+    def __init__(self, host, port, service=d_service, maxBuffered=d_maxBufferedEvents, limiter=None, metrics=None):
+        self.service = service
+        self.maxBuffered = maxBuffered
+        self.slowConsumerWarnings = 0
+
+        sessionOptions = blpapi.SessionOptions()
+        sessionOptions.setServerHost(host)
+        sessionOptions.setServerPort(port)
+        sessionOptions.setMaxEventQueueSize(maxBuffered)
+
+        self.session = blpapi.Session(sessionOptions)
+        self.runner = RequestRunner(self.session, limiter, metrics=metrics)
+
+        if not self.session.start():
+            raise HistoryError("Failed to start the stream session")
+        if not self.session.openService(service):
+            self.stop()
+            raise HistoryError("Failed to open %s" % service)
+
+    def stop(self):
+        try:
+            self.session.stop()
+        except:
+            print ("Exception:  %s" % sys.exc_info()[0])
+        self.runner.failAll(TERMINATED)
+
+    def getService(self):
+        return self.session.getService(self.service)
+
+    def pump(self, timeout):
+        # Handles the next event; False if none arrived within timeout seconds.
+        event = self.session.nextEvent(int(timeout * 1000))
+        eventType = event.eventType()
+
+        if eventType == blpapi.Event.TIMEOUT:
+            return False
+
+        if eventType == blpapi.Event.RESPONSE or eventType == blpapi.Event.PARTIAL_RESPONSE or eventType == blpapi.Event.REQUEST_STATUS:
+            self.runner.processResponseEvent(event)
+
+        elif eventType == blpapi.Event.ADMIN:
+            for msg in event:
+                if msg.messageType() == SLOW_CONSUMER_WARNING:
+                    self.slowConsumerWarnings += 1
+
+        elif eventType == blpapi.Event.SESSION_STATUS:
+            for msg in event:
+                if msg.messageType() == SESSION_TERMINATED:
+                    self.runner.failAll(TERMINATED)
+
+        return True
+
+
+class FillStream(object):
+    """ Iterates the fills of one GetFills request as its PARTIAL_RESPONSE
+    events arrive.
+
+    The request is sent on a StreamSession and its events are pulled and
+    decoded on the consuming thread, so at most maxBuffered events are ever
+    waiting. With BLOCK a consumer that falls behind holds up the response
+    until it catches up; with FAIL the first SlowConsumerWarning cancels the
+    request, and the consumer gets a HistoryError instead of the rest of the
+    fills. Supports both "for fill in stream" and "async for fill in stream".
+    """
+
+    _END = object()
+
+    def __init__(self, session, request, timeout=d_requestTimeout, overflowPolicy=d_overflowPolicy):
+        if overflowPolicy not in OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy %s (choose from %s)" % (overflowPolicy, ", ".join(OVERFLOW_POLICIES)))
+        self.session = session
+        self.timeout = timeout
+        self.overflowPolicy = overflowPolicy
+        self.slowConsumerWarnings = session.slowConsumerWarnings
+        self.closed = False
+        self.messages = deque()
+        self.iterator = None
+
+        self.pending = session.runner.sendRequestAsync(request, onMessage=self.messages.append)
+
+    def close(self):
+        # Abandons the request; messages already pulled are discarded.
+        if not self.closed:
+            self.closed = True
+            if not self.pending.isComplete():
+                self.session.runner.cancel(self.pending)
+            self.messages.clear()
+
+    def fills(self):
+        try:
+            while True:
+                if not self.messages:
+                    if self.pending.isComplete():
+                        break
+                    if self.overflowPolicy == FAIL and self.session.slowConsumerWarnings > self.slowConsumerWarnings:
+                        raise HistoryError("GetFills stream cancelled: the consumer fell %d events behind" % self.session.maxBuffered)
+                    if not self.session.pump(self.timeout):
+                        raise RequestTimeout("GetFills stream received nothing for %d seconds" % self.timeout)
+                    continue
+
+                msg = self.messages.popleft()
+
+                if msg.messageType() == ERROR_RESPONSE:
+                    raise HistoryError("%s %s" % (msg.getElementAsString(HISTORY_ERROR_CODE), msg.getElementAsString(ERROR_MSG)))
+
+                if msg.messageType() == GET_FILLS_RESPONSE:
+                    for fill in msg.getElement(HISTORY_FILLS).values():
+                        yield elementToPython(fill)
+
+            if self.pending.failure is not None:
+                raise HistoryError("%s %s" % self.pending.error())
+        finally:
+            self.close()
+
+    def __iter__(self):
+        return self.fills()
+
+    def __aiter__(self):
+        self.iterator = self.fills()
+        return self
+
+    async def __anext__(self):
+        loop = asyncio.get_running_loop()
+        fill = await loop.run_in_executor(None, next, self.iterator, FillStream._END)
+        if fill is FillStream._END:
+            raise StopAsyncIteration
+        return fill
+
+
+class FillSet(object):
+    """ Fills merged across chunks, de-duplicated by FillId.
+
+    A fill carrying a CorrectedFillId supersedes the fill it corrects, so
+    the corrected original is dropped from the result whichever order the
+    two arrive in.
+    """
+
+    def __init__(self):
+        self.fills = {}
+        self.corrected = set()
+        self.lock = threading.Lock()
+
+    def add(self, fill):
+        fillId = fill.get("FillId")
+        with self.lock:
+            correctedId = fill.get("CorrectedFillId")
+            if correctedId:
+                self.corrected.add(correctedId)
+                self.fills.pop(correctedId, None)
+            if fillId in self.corrected:
+                return
+            self.fills[fillId] = fill
+
+    def addAll(self, fills):
+        for fill in fills:
+            self.add(fill)
+
+    def values(self):
+        with self.lock:
+            return sorted(self.fills.values(), key=lambda f: (str(f.get("DateTimeOfFill", "")), f.get("FillId", 0)))
+
+    def __len__(self):
+        return len(self.fills)
+
+
+class HistoryFetcher(object):
+    """ Fetches GetFills over a long range as many small concurrent requests.
+
+    The range is cut into windows and the scope into chunks (UUID lists or
+    teams). Up to maxInFlight requests are kept outstanding on one session.
+    A chunk that times out, or whose response is too large, is split in
+    half and retried until it reaches minWindow; any other error (or a
+    request that cannot be sent) fails the chunk straight away.
+    """
+
+    def __init__(self, session, service=d_service, window=d_window, minWindow=d_minWindow,
+                 uuidsPerRequest=d_uuidsPerRequest, maxInFlight=d_maxInFlight, requestTimeout=d_requestTimeout,
+                 retryKeywords=d_retryKeywords):
+        self.session = session
+        self.service = service
+        self.window = window
+        self.minWindow = minWindow
+        self.uuidsPerRequest = uuidsPerRequest
+        self.maxInFlight = maxInFlight
+        self.requestTimeout = requestTimeout
+        self.retryKeywords = [k.lower() for k in retryKeywords]
+
+    def chunks(self, fromDateTime, toDateTime, uuids=None, teams=None, tradingSystem=False):
+        scopes = splitScopes(uuids, teams, tradingSystem, self.uuidsPerRequest)
+        return [FillsChunk(scope, start, end) for scope in scopes for start, end in splitWindows(fromDateTime, toDateTime, self.window)]
+
+    def fetch(self, fromDateTime, toDateTime, uuids=None, teams=None, tradingSystem=False, filterBy=None, onFills=None):
+        # onFills(chunk, fills) is called for every decoded chunk as it completes.
+        todo = self.chunks(fromDateTime, toDateTime, uuids, teams, tradingSystem)
+        todo.reverse()
+
+        service = self.session.getService(self.service)
+        completed = queue.Queue()
+        inFlight = []
+        result = FillSet()
+        errors = []
+
+        while todo or inFlight:
+
+            while todo and len(inFlight) < self.maxInFlight:
+                chunk = todo.pop()
+                try:
+                    chunk.pending = self.session.sendRequestAsync(buildFillsRequest(service, chunk, filterBy))
+                except Exception as e:
+                    print ("Error: %s could not be sent: %s" % (chunk, e), file=sys.stderr)
+                    errors.append((chunk, "%s: %s" % (type(e).__name__, e)))
+                    continue
+                chunk.pending.addCallback(lambda pending, chunk=chunk: completed.put(chunk))
+                inFlight.append(chunk)
+
+            if not inFlight:
+                continue
+
+            try:
+                chunk = completed.get(timeout=1)
+            except queue.Empty:
+                now = time.time()
+                for chunk in inFlight:
+                    if now - chunk.pending.sentTime > self.requestTimeout:
+                        chunk.timedOut = True
+                        self.session.runner.cancel(chunk.pending)
+                continue
+
+            inFlight.remove(chunk)
+            error = self.chunkError(chunk)
+
+            if error is None:
+                fills = []
+                for msg in chunk.pending.messages:
+                    if msg.messageType() == GET_FILLS_RESPONSE:
+                        fills.extend(decodeFills(msg))
+                result.addAll(fills)
+                if onFills is not None:
+                    onFills(chunk, fills)
+
+            elif error[1] and chunk.toDateTime - chunk.fromDateTime > self.minWindow:
+                print ("Retrying %s in two halves: %s" % (chunk, error[0]))
+                todo.extend(chunk.split())
+
+            else:
+                print ("Error: %s failed: %s" % (chunk, error[0]), file=sys.stderr)
+                errors.append((chunk, error[0]))
+
+        return result.values(), errors
+
+    def stream(self, fromDateTime, toDateTime, uuids=None, teams=None, tradingSystem=False, filterBy=None,
+               maxBuffered=d_maxBufferedEvents, overflowPolicy=d_overflowPolicy):
+        # Yields fills chunk by chunk with one request in flight, holding at
+        # most maxBuffered events however slowly the fills are consumed. The
+        # requests go to their own StreamSession, sharing the rate limiter of
+        # this fetcher's session. Unlike fetch() there is no cross-chunk
+        # de-duplication.
+        runner = self.session.runner
+        session = StreamSession(self.session.host, self.session.port, self.service, maxBuffered, runner.limiter, runner.metrics)
+        try:
+            for chunk in self.chunks(fromDateTime, toDateTime, uuids, teams, tradingSystem):
+                stream = FillStream(session, buildFillsRequest(session.getService(), chunk, filterBy), self.requestTimeout, overflowPolicy)
+                for fill in stream:
+                    yield fill
+        finally:
+            session.stop()
+
+    def chunkError(self, chunk):
+        # (error, retryable) if the chunk failed, otherwise None.
+        pending = chunk.pending
+        if chunk.timedOut:
+            return "timed out after %d seconds" % self.requestTimeout, True
+
+        failure = pending.failure
+        if failure is not None:
+            if isinstance(failure, str):
+                return failure, False
+            error = "%s %s" % messageError(failure)
+            category = ""
+            if failure.hasElement(REASON, True) and failure.getElement(REASON).hasElement(CATEGORY, True):
+                category = failure.getElement(REASON).getElementAsString(CATEGORY)
+            return error, category == "TIMEOUT" or self.isRetryable(error)
+
+        for msg in pending.messages:
+            if msg.messageType() == ERROR_RESPONSE:
+                error = "%s %s" % messageError(msg)
+                return error, self.isRetryable(error)
+        return None
+
+    def isRetryable(self, error):
+        error = error.lower()
+        return any(keyword in error for keyword in self.retryKeywords)
+
+
+def main():
+    from EMSXSessionManager import ManagedSession
+
+    session = ManagedSession(services=[d_service])
+    session.start()
+
+    try:
+        fetcher = HistoryFetcher(session)
+        toDateTime = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        fromDateTime = toDateTime - timedelta(days=30)
+
+        fills, errors = fetcher.fetch(fromDateTime, toDateTime, uuids=[1234])
+
+        for fill in fills:
+            print ("OrderId: %d\tFill ID: %d\tDate/Time: %s\tShares: %f\tPrice: %f" % (fill["OrderId"], fill["FillId"], fill["DateTimeOfFill"], fill["FillShares"], fill["FillPrice"]))
+
+        print ("%d fills, %d failed chunks" % (len(fills), len(errors)))
+    finally:
+        session.stop()
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXHistoryFetcher")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,481 @@
+# EMSXMetrics.py
+
+import blpapi
+import json
+import runpy
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from EMSXRequestRunner import messageError
+
+
+d_subBucketBits=8           # 256 sub-buckets per power of two: values within 0.4%
+d_maxLatency=3600.0         # seconds; longer latencies are recorded as this
+d_quantiles=[0.5, 0.9, 0.99, 0.999]
+d_prometheusBuckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+d_prefix="emsx"
+d_port=9108
+
+
+class LatencyHistogram(object):
+    """ HDR-style histogram of latencies in microseconds.
+
+    Values below 2**subBucketBits are counted exactly; above that, each
+    power of two is split into 2**(subBucketBits - 1) equal buckets, so
+    every recorded value is known to within the same relative precision
+    whatever its magnitude. Only buckets that have been hit are stored.
+    """
+
+    def __init__(self, subBucketBits=d_subBucketBits, maxLatency=d_maxLatency):
+        self.subBucketBits = subBucketBits
+        self.subBucketCount = 1 << subBucketBits
+        self.halfCount = self.subBucketCount >> 1
+        self.maxValue = int(maxLatency * 1e6)
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.minValue = None
+        self.maxRecorded = 0
+
+    def index(self, value):
+        if value < self.subBucketCount:
+            return value
+        shift = value.bit_length() - self.subBucketBits
+        return self.subBucketCount + (shift - 1) * self.halfCount + (value >> shift) - self.halfCount
+
+    def highestEquivalentValue(self, index):
+        if index < self.subBucketCount:
+            return index
+        shift = (index - self.subBucketCount) // self.halfCount + 1
+        subBucket = (index - self.subBucketCount) % self.halfCount + self.halfCount
+        return ((subBucket + 1) << shift) - 1
+
+    def record(self, seconds):
+        value = min(self.maxValue, max(0, int(seconds * 1e6)))
+        index = self.index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.minValue is None or value < self.minValue:
+            self.minValue = value
+        if value > self.maxRecorded:
+            self.maxRecorded = value
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.minValue is not None and (self.minValue is None or other.minValue < self.minValue):
+            self.minValue = other.minValue
+        self.maxRecorded = max(self.maxRecorded, other.maxRecorded)
+
+    def percentile(self, fraction):
+        # Latency in seconds at or below which fraction of the values fall.
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(fraction * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.highestEquivalentValue(index), self.maxRecorded) / 1e6
+        return self.maxRecorded / 1e6
+
+    def countAtOrBelow(self, seconds):
+        limit = seconds * 1e6
+        return sum(count for index, count in self.counts.items() if self.highestEquivalentValue(index) <= limit)
+
+    def mean(self):
+        return self.total / 1e6 / self.count if self.count else 0.0
+
+
+class OperationMetrics(object):
+
+    def __init__(self, operation):
+        self.operation = operation
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.completed = 0
+        self.inFlight = 0
+        self.maxInFlight = 0
+        self.errors = Counter()
+
+    def snapshot(self, quantiles=d_quantiles):
+        histogram = self.histogram
+        return {
+            "requests":         self.requests,
+            "completed":        self.completed,
+            "inFlight":         self.inFlight,
+            "maxInFlight":      self.maxInFlight,
+            "errors":           dict(self.errors),
+            "latency": {
+                "count":        histogram.count,
+                "mean":         histogram.mean(),
+                "min":          (histogram.minValue or 0) / 1e6,
+                "max":          histogram.maxRecorded / 1e6,
+                "quantiles":    dict((str(q), histogram.percentile(q)) for q in quantiles),
+            },
+        }
+
+
+def labels(**values):
+    escaped = []
+    for name, value in values.items():
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        escaped.append('%s="%s"' % (name, value))
+    return "{" + ",".join(escaped) + "}"
+
+
+class RequestMetrics(object):
+    """ Latency histograms, in-flight gauges and error counters per operation.
+
+    requestStarted() is called when a request is sent and requestCompleted()
+    when its final RESPONSE or REQUEST_STATUS message arrives, from whatever
+    threads those happen on.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations = {}
+        self.startTime = time.time()
+
+    def metrics(self, operation):
+        metrics = self.operations.get(operation)
+        if metrics is None:
+            metrics = self.operations[operation] = OperationMetrics(operation)
+        return metrics
+
+    def requestStarted(self, operation):
+        with self.lock:
+            metrics = self.metrics(operation)
+            metrics.requests += 1
+            metrics.inFlight += 1
+            metrics.maxInFlight = max(metrics.maxInFlight, metrics.inFlight)
+
+    def requestCompleted(self, operation, latency, errorCode=None):
+        with self.lock:
+            metrics = self.metrics(operation)
+            metrics.completed += 1
+            metrics.inFlight = max(0, metrics.inFlight - 1)
+            if latency is not None:
+                metrics.histogram.record(latency)
+            if errorCode is not None:
+                metrics.errors[str(errorCode)] += 1
+
+    def reset(self):
+        with self.lock:
+            self.operations = {}
+            self.startTime = time.time()
+
+    def snapshot(self, quantiles=d_quantiles):
+        with self.lock:
+            return {
+                "startTime":    self.startTime,
+                "time":         time.time(),
+                "operations":   dict((op, m.snapshot(quantiles)) for op, m in sorted(self.operations.items())),
+            }
+
+    def toJson(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def toPrometheus(self, prefix=d_prefix, buckets=d_prometheusBuckets, quantiles=d_quantiles):
+        lines = []
+
+        def header(name, kind, text):
+            lines.append("# HELP %s_%s %s" % (prefix, name, text))
+            lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+
+        with self.lock:
+            operations = sorted(self.operations.items())
+
+            header("requests_total", "counter", "Requests sent, by operation.")
+            for op, m in operations:
+                lines.append("%s_requests_total%s %d" % (prefix, labels(operation=op), m.requests))
+
+            header("request_errors_total", "counter", "Requests answered with an error, by operation and error code.")
+            for op, m in operations:
+                for code, count in sorted(m.errors.items()):
+                    lines.append("%s_request_errors_total%s %d" % (prefix, labels(operation=op, code=code), count))
+
+            header("requests_in_flight", "gauge", "Requests sent and not yet answered.")
+            for op, m in operations:
+                lines.append("%s_requests_in_flight%s %d" % (prefix, labels(operation=op), m.inFlight))
+
+            header("request_latency_seconds", "histogram", "Time from sending a request to its final response.")
+            for op, m in operations:
+                histogram = m.histogram
+                for bound in buckets:
+                    lines.append("%s_request_latency_seconds_bucket%s %d" % (prefix, labels(operation=op, le=bound), histogram.countAtOrBelow(bound)))
+                lines.append("%s_request_latency_seconds_bucket%s %d" % (prefix, labels(operation=op, le="+Inf"), histogram.count))
+                lines.append("%s_request_latency_seconds_sum%s %.6f" % (prefix, labels(operation=op), histogram.total / 1e6))
+                lines.append("%s_request_latency_seconds_count%s %d" % (prefix, labels(operation=op), histogram.count))
+
+            header("request_latency_quantile_seconds", "summary", "Latency quantiles from the full-resolution histogram.")
+            for op, m in operations:
+                histogram = m.histogram
+                for q in quantiles:
+                    lines.append("%s_request_latency_quantile_seconds%s %.6f" % (prefix, labels(operation=op, quantile=q), histogram.percentile(q)))
+                lines.append("%s_request_latency_quantile_seconds_sum%s %.6f" % (prefix, labels(operation=op), histogram.total / 1e6))
+                lines.append("%s_request_latency_quantile_seconds_count%s %d" % (prefix, labels(operation=op), histogram.count))
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        # Prometheus text for *.prom files, a JSON snapshot otherwise.
+        with open(path, "w") as f:
+            f.write(self.toPrometheus() if path.endswith(".prom") else self.toJson())
+
+    def report(self, out=None):
+        out = out if out is not None else sys.stdout
+        print ("%-32s %8s %7s %9s %9s %9s %9s %9s" % ("operation", "requests", "errors", "inflight", "p50(ms)", "p99(ms)", "p99.9(ms)", "max(ms)"), file=out)
+        with self.lock:
+            for op, m in sorted(self.operations.items()):
+                histogram = m.histogram
+                print ("%-32s %8d %7d %9d %9.2f %9.2f %9.2f %9.2f" % (op, m.requests, sum(m.errors.values()), m.inFlight,
+                       histogram.percentile(0.5) * 1e3, histogram.percentile(0.99) * 1e3, histogram.percentile(0.999) * 1e3,
+                       histogram.maxRecorded / 1e3), file=out)
+
+
+class RequestTracker(object):
+    """ Times requests sent directly on a session (as the example scripts
+    do) by matching each sendRequest to its final response event.
+
+    An unset correlation ID is only assigned by sendRequest, so a request is
+    recorded after it has been sent. Final responses that arrive while a
+    send is still in progress are kept until sent() claims them.
+    """
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.sending = 0
+        self.early = {}
+
+    def sendStarted(self):
+        # Called before sendRequest; returns the send time to pass to sent().
+        with self.lock:
+            self.sending += 1
+        return time.time()
+
+    def sendFailed(self):
+        with self.lock:
+            self.sending -= 1
+            if self.sending == 0:
+                self.early.clear()
+
+    def sent(self, correlationId, operation, sentTime):
+        # Called with the correlation ID returned by sendRequest.
+        self.metrics.requestStarted(operation)
+        with self.lock:
+            self.sending -= 1
+            early = self.early.pop(correlationId.value(), None)
+            if early is None:
+                self.pending[correlationId.value()] = (operation, sentTime)
+            if self.sending == 0:
+                self.early.clear()
+        if early is not None:
+            completedTime, errorCode = early
+            self.metrics.requestCompleted(operation, max(0.0, completedTime - sentTime), errorCode)
+
+    def cancelled(self, correlationId):
+        with self.lock:
+            entry = self.pending.pop(correlationId.value(), None)
+        if entry is not None:
+            self.metrics.requestCompleted(entry[0], None, "Cancelled")
+
+    def observe(self, event):
+        eventType = event.eventType()
+        if eventType != blpapi.Event.RESPONSE and eventType != blpapi.Event.REQUEST_STATUS:
+            return
+        now = time.time()
+        for msg in event:
+            for cid in msg.correlationIds():
+                error = messageError(msg)
+                errorCode = error[0] if error is not None else None
+                with self.lock:
+                    entry = self.pending.pop(cid.value(), None)
+                    if entry is None and self.sending:
+                        self.early[cid.value()] = (now, errorCode)
+                if entry is not None:
+                    operation, sentTime = entry
+                    self.metrics.requestCompleted(operation, now - sentTime, errorCode)
+
+
+def instrumentedSessionClass(base, metrics):
+    # A Session class that records metrics for every request sent on it.
+    tracker = RequestTracker(metrics)
+
+    class InstrumentedSession(base):
+
+        def __init__(self, options=None, eventHandler=None, *args, **kwargs):
+            if eventHandler is not None:
+                handler = eventHandler
+
+                def eventHandler(event, session):
+                    tracker.observe(event)
+                    return handler(event, session)
+            base.__init__(self, options, eventHandler, *args, **kwargs)
+
+        def sendRequest(self, request, identity=None, correlationId=None, eventQueue=None, requestLabel=None):
+            # The request is keyed on the correlation ID sendRequest returns,
+            # as an unset one is only assigned during the send.
+            kwargs = {}
+            if correlationId is not None:
+                kwargs["correlationId"] = correlationId
+            if identity is not None:
+                kwargs["identity"] = identity
+            if eventQueue is not None:
+                kwargs["eventQueue"] = eventQueue
+            if requestLabel is not None:
+                kwargs["requestLabel"] = requestLabel
+            sentTime = tracker.sendStarted()
+            try:
+                correlationId = base.sendRequest(self, request, **kwargs)
+            except:
+                tracker.sendFailed()
+                raise
+            tracker.sent(correlationId, str(request.asElement().name()), sentTime)
+            return correlationId
+
+        def cancel(self, correlationId):
+            base.cancel(self, correlationId)
+            for cid in (correlationId if isinstance(correlationId, (list, tuple)) else [correlationId]):
+                tracker.cancelled(cid)
+
+        def nextEvent(self, timeout=0):
+            event = base.nextEvent(self, timeout)
+            tracker.observe(event)
+            return event
+
+        def tryNextEvent(self):
+            event = base.tryNextEvent(self)
+            if event is not None:
+                tracker.observe(event)
+            return event
+
+    return InstrumentedSession
+
+
+class MetricsServer(object):
+    """ Serves /metrics (Prometheus text) and /metrics.json from a daemon thread. """
+
+    def __init__(self, metrics, port=d_port, host=""):
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.startswith("/metrics.json"):
+                    body, contentType = metrics.toJson(), "application/json"
+                elif self.path.startswith("/metrics"):
+                    body, contentType = metrics.toPrometheus(), "text/plain; version=0.0.4"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", contentType)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, name="EMSXMetricsServer")
+        self.thread.daemon = True
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+_defaultMetrics = None
+_defaultMetricsLock = threading.Lock()
+
+
+def defaultMetrics():
+    global _defaultMetrics
+    with _defaultMetricsLock:
+        if _defaultMetrics is None:
+            _defaultMetrics = RequestMetrics()
+        return _defaultMetrics
+
+
+def main():
+    # Runs one of the example scripts with every request it sends timed.
+    usage = "Usage: EMSXMetrics.py [--json=out.json] [--prom=out.prom] [--port=N] Script.py [args...]"
+
+    outputs = []
+    port = None
+    args = sys.argv[1:]
+    while args and args[0].startswith("--"):
+        arg = args.pop(0)
+        if arg.startswith("--json=") or arg.startswith("--prom="):
+            outputs.append(arg.split("=", 1)[1])
+        elif arg.startswith("--port="):
+            port = int(arg[len("--port="):])
+        else:
+            print (usage)
+            return
+
+    if not args:
+        print (usage)
+        return
+
+    metrics = defaultMetrics()
+    blpapi.Session = instrumentedSessionClass(blpapi.Session, metrics)
+
+    server = None
+    if port is not None:
+        server = MetricsServer(metrics, port).start()
+        print ("Serving metrics on port %d" % port)
+
+    sys.argv = args
+    try:
+        runpy.run_path(args[0], run_name="__main__")
+    finally:
+        print ("")
+        metrics.report()
+        for path in outputs:
+            metrics.write(path)
+            print ("Metrics written to %s" % path)
+        if server is not None:
+            server.stop()
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXMetrics")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
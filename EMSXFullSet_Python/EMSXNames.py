@@ -0,0 +1,463 @@
+# EMSXNames.py
+#
+# Generated by EMSXCodeGen.py from emapisvc_3.33.1.4.xml and emsx.history_1.4.0.0.xml.
+# Do not edit; change the generator and run it again.
+
+import blpapi
+
+
+# Constant -> element, message or operation name, for every name in the
+# schemas and the session status messages. Each blpapi.Name is created the
+# first time it is imported or read from this module and is then a module
+# global, so later uses are plain attribute reads:
+#
+#     from EMSXNames import EMSX_SEQUENCE, ERROR_INFO
+#
+NAMES = {
+    "ACCOUNT":                                 "Account",
+    "AMOUNT":                                  "Amount",
+    "API_SEQ_NUM":                             "API_SEQ_NUM",
+    "ASSET_CLASS":                             "AssetClass",
+    "ASSIGN_TRADER":                           "AssignTrader",
+    "BASKET":                                  "Basket",
+    "BASKET_ID":                               "BasketId",
+    "BASKET_NAME":                             "BasketName",
+    "BBGID":                                   "BBGID",
+    "BLOCK_ID":                                "BlockId",
+    "BROKER":                                  "Broker",
+    "BROKER_EXEC_ID":                          "BrokerExecId",
+    "BROKER_ORDER_ID":                         "BrokerOrderId",
+    "CANCEL_ORDER_EX":                         "CancelOrderEx",
+    "CANCEL_ROUTE":                            "CancelRoute",
+    "CANCEL_ROUTE_EX":                         "CancelRouteEx",
+    "CATEGORY":                                "category",
+    "CLEARING_ACCOUNT":                        "ClearingAccount",
+    "CLEARING_FIRM":                           "ClearingFirm",
+    "CONTRACT_EXP_DATE":                       "ContractExpDate",
+    "CORRECTED_FILL_ID":                       "CorrectedFillId",
+    "CREATE_BASKET":                           "CreateBasket",
+    "CREATE_ORDER":                            "CreateOrder",
+    "CREATE_ORDER_AND_ROUTE":                  "CreateOrderAndRoute",
+    "CREATE_ORDER_AND_ROUTE_EX":               "CreateOrderAndRouteEx",
+    "CREATE_ORDER_AND_ROUTE_MANUALLY":         "CreateOrderAndRouteManually",
+    "CREATE_ORDER_AND_ROUTE_WITH_STRAT":       "CreateOrderAndRouteWithStrat",
+    "CURRENCY":                                "Currency",
+    "CUSIP":                                   "Cusip",
+    "DATE_TIME_OF_FILL":                       "DateTimeOfFill",
+    "DELETE_ORDER":                            "DeleteOrder",
+    "DESCRIPTION":                             "description",
+    "DISABLE":                                 "Disable",
+    "EMSX_ACCOUNT":                            "EMSX_ACCOUNT",
+    "EMSX_ALL_SUCCESS":                        "EMSX_ALL_SUCCESS",
+    "EMSX_AMOUNT":                             "EMSX_AMOUNT",
+    "EMSX_AMOUNT_PERCENT":                     "EMSX_AMOUNT_PERCENT",
+    "EMSX_APA_MIC":                            "EMSX_APA_MIC",
+    "EMSX_ARRIVAL_PRICE":                      "EMSX_ARRIVAL_PRICE",
+    "EMSX_ASSET_CLASS":                        "EMSX_ASSET_CLASS",
+    "EMSX_ASSIGNED_TRADER":                    "EMSX_ASSIGNED_TRADER",
+    "EMSX_ASSIGNEE_TRADER_UUID":               "EMSX_ASSIGNEE_TRADER_UUID",
+    "EMSX_ASSIGN_TRADER_FAILED_ORDERS":        "EMSX_ASSIGN_TRADER_FAILED_ORDERS",
+    "EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS":    "EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS",
+    "EMSX_AS_OF_DATE":                         "EMSX_AS_OF_DATE",
+    "EMSX_AS_OF_TIME_MICROSEC":                "EMSX_AS_OF_TIME_MICROSEC",
+    "EMSX_AVG_PRICE":                          "EMSX_AVG_PRICE",
+    "EMSX_BASKET_NAME":                        "EMSX_BASKET_NAME",
+    "EMSX_BASKET_NUM":                         "EMSX_BASKET_NUM",
+    "EMSX_BLOCK_ID":                           "EMSX_BLOCK_ID",
+    "EMSX_BLOT_DATE":                          "EMSX_BLOT_DATE",
+    "EMSX_BLOT_SEQ_NUM":                       "EMSX_BLOT_SEQ_NUM",
+    "EMSX_BOOKNAME":                           "EMSX_BOOKNAME",
+    "EMSX_BROKER":                             "EMSX_BROKER",
+    "EMSX_BROKERS":                            "EMSX_BROKERS",
+    "EMSX_BROKER_COMM":                        "EMSX_BROKER_COMM",
+    "EMSX_BROKER_LEI":                         "EMSX_BROKER_LEI",
+    "EMSX_BROKER_SI":                          "EMSX_BROKER_SI",
+    "EMSX_BROKER_STATUS":                      "EMSX_BROKER_STATUS",
+    "EMSX_BSE_AVG_PRICE":                      "EMSX_BSE_AVG_PRICE",
+    "EMSX_BSE_FILLED":                         "EMSX_BSE_FILLED",
+    "EMSX_BUYSIDE_LEI":                        "EMSX_BUYSIDE_LEI",
+    "EMSX_CFD_FLAG":                           "EMSX_CFD_FLAG",
+    "EMSX_CLEARING_ACCOUNT":                   "EMSX_CLEARING_ACCOUNT",
+    "EMSX_CLEARING_FIRM":                      "EMSX_CLEARING_FIRM",
+    "EMSX_CLIENT_IDENTIFICATION":              "EMSX_CLIENT_IDENTIFICATION",
+    "EMSX_COMM_DIFF_FLAG":                     "EMSX_COMM_DIFF_FLAG",
+    "EMSX_COMM_RATE":                          "EMSX_COMM_RATE",
+    "EMSX_COMM_TYPE":                          "EMSX_COMM_TYPE",
+    "EMSX_CURRENCY_PAIR":                      "EMSX_CURRENCY_PAIR",
+    "EMSX_CUSTOM_ACCOUNT":                     "EMSX_CUSTOM_ACCOUNT",
+    "EMSX_CUSTOM_NOTE1":                       "EMSX_CUSTOM_NOTE1",
+    "EMSX_CUSTOM_NOTE2":                       "EMSX_CUSTOM_NOTE2",
+    "EMSX_CUSTOM_NOTE3":                       "EMSX_CUSTOM_NOTE3",
+    "EMSX_CUSTOM_NOTE4":                       "EMSX_CUSTOM_NOTE4",
+    "EMSX_CUSTOM_NOTE5":                       "EMSX_CUSTOM_NOTE5",
+    "EMSX_DATE":                               "EMSX_DATE",
+    "EMSX_DAY_AVG_PRICE":                      "EMSX_DAY_AVG_PRICE",
+    "EMSX_DAY_FILL":                           "EMSX_DAY_FILL",
+    "EMSX_DIR_BROKER_FLAG":                    "EMSX_DIR_BROKER_FLAG",
+    "EMSX_DISP_NAME":                          "EMSX_DISP_NAME",
+    "EMSX_EXCHANGE":                           "EMSX_EXCHANGE",
+    "EMSX_EXCHANGE_DESTINATION":               "EMSX_EXCHANGE_DESTINATION",
+    "EMSX_EXECUTE_BROKER":                     "EMSX_EXECUTE_BROKER",
+    "EMSX_EXEC_INSTRUCTION":                   "EMSX_EXEC_INSTRUCTION",
+    "EMSX_FAILED_ROUTES":                      "EMSX_FAILED_ROUTES",
+    "EMSX_FIELD_DATA":                         "EMSX_FIELD_DATA",
+    "EMSX_FIELD_INDICATOR":                    "EMSX_FIELD_INDICATOR",
+    "EMSX_FIELD_NAME":                         "EMSX_FIELD_NAME",
+    "EMSX_FIELD_NAMES":                        "EMSX_FIELD_NAMES",
+    "EMSX_FILLED":                             "EMSX_FILLED",
+    "EMSX_FILL_AMOUNT":                        "EMSX_FILL_AMOUNT",
+    "EMSX_FILL_DATE":                          "EMSX_FILL_DATE",
+    "EMSX_FILL_DATE_TIME":                     "EMSX_FILL_DATE_TIME",
+    "EMSX_FILL_ID":                            "EMSX_FILL_ID",
+    "EMSX_FILL_PRICE":                         "EMSX_FILL_PRICE",
+    "EMSX_FILL_TIME":                          "EMSX_FILL_TIME",
+    "EMSX_FILL_TIME_FORMAT":                   "EMSX_FILL_TIME_FORMAT",
+    "EMSX_FILL_TIME_MICROSEC":                 "EMSX_FILL_TIME_MICROSEC",
+    "EMSX_FLAG":                               "EMSX_FLAG",
+    "EMSX_GET_WARNINGS":                       "EMSX_GET_WARNINGS",
+    "EMSX_GPI":                                "EMSX_GPI",
+    "EMSX_GTD_DATE":                           "EMSX_GTD_DATE",
+    "EMSX_HAND_INSTRUCTION":                   "EMSX_HAND_INSTRUCTION",
+    "EMSX_IDLE_AMOUNT":                        "EMSX_IDLE_AMOUNT",
+    "EMSX_INDIA_EXCHANGE":                     "EMSX_INDIA_EXCHANGE",
+    "EMSX_INVESTOR_ID":                        "EMSX_INVESTOR_ID",
+    "EMSX_ISIN":                               "EMSX_ISIN",
+    "EMSX_IS_AGGREGATED":                      "EMSX_IS_AGGREGATED",
+    "EMSX_IS_MANUAL_ROUTE":                    "EMSX_IS_MANUAL_ROUTE",
+    "EMSX_LAST_CAPACITY":                      "EMSX_LAST_CAPACITY",
+    "EMSX_LAST_FILL_DATE":                     "EMSX_LAST_FILL_DATE",
+    "EMSX_LAST_FILL_TIME":                     "EMSX_LAST_FILL_TIME",
+    "EMSX_LAST_FILL_TIME_MICROSEC":            "EMSX_LAST_FILL_TIME_MICROSEC",
+    "EMSX_LAST_MARKET":                        "EMSX_LAST_MARKET",
+    "EMSX_LAST_PRICE":                         "EMSX_LAST_PRICE",
+    "EMSX_LAST_SHARES":                        "EMSX_LAST_SHARES",
+    "EMSX_LEG_FILL_DATE_ADDED":                "EMSX_LEG_FILL_DATE_ADDED",
+    "EMSX_LEG_FILL_PRICE":                     "EMSX_LEG_FILL_PRICE",
+    "EMSX_LEG_FILL_SEQ_NO":                    "EMSX_LEG_FILL_SEQ_NO",
+    "EMSX_LEG_FILL_SHARES":                    "EMSX_LEG_FILL_SHARES",
+    "EMSX_LEG_FILL_SIDE":                      "EMSX_LEG_FILL_SIDE",
+    "EMSX_LEG_FILL_TICKER":                    "EMSX_LEG_FILL_TICKER",
+    "EMSX_LEG_FILL_TIME_ADDED":                "EMSX_LEG_FILL_TIME_ADDED",
+    "EMSX_LEN":                                "EMSX_LEN",
+    "EMSX_LEVEL":                              "EMSX_LEVEL",
+    "EMSX_LIMIT_PRICE":                        "EMSX_LIMIT_PRICE",
+    "EMSX_LOCATE_BROKER":                      "EMSX_LOCATE_BROKER",
+    "EMSX_LOCATE_ID":                          "EMSX_LOCATE_ID",
+    "EMSX_LOCATE_REQ":                         "EMSX_LOCATE_REQ",
+    "EMSX_LOC_BROKER":                         "EMSX_LOC_BROKER",
+    "EMSX_LOC_ID":                             "EMSX_LOC_ID",
+    "EMSX_LOC_REQ":                            "EMSX_LOC_REQ",
+    "EMSX_LSTTR2_ID0":                         "EMSX_LSTTR2ID0",
+    "EMSX_LSTTR2_ID1":                         "EMSX_LSTTR2ID1",
+    "EMSX_MIFID_II_INSTRUCTION":               "EMSX_MIFID_II_INSTRUCTION",
+    "EMSX_MISC_FEES":                          "EMSX_MISC_FEES",
+    "EMSX_ML_ID":                              "EMSX_ML_ID",
+    "EMSX_ML_LEG_QUANTITY":                    "EMSX_ML_LEG_QUANTITY",
+    "EMSX_ML_NUM_LEGS":                        "EMSX_ML_NUM_LEGS",
+    "EMSX_ML_PERCENT_FILLED":                  "EMSX_ML_PERCENT_FILLED",
+    "EMSX_ML_RATIO":                           "EMSX_ML_RATIO",
+    "EMSX_ML_REMAIN_BALANCE":                  "EMSX_ML_REMAIN_BALANCE",
+    "EMSX_ML_STRATEGY":                        "EMSX_ML_STRATEGY",
+    "EMSX_ML_TOTAL_QUANTITY":                  "EMSX_ML_TOTAL_QUANTITY",
+    "EMSX_MOD_PEND_STATUS":                    "EMSX_MOD_PEND_STATUS",
+    "EMSX_NOTES":                              "EMSX_NOTES",
+    "EMSX_NSE_AVG_PRICE":                      "EMSX_NSE_AVG_PRICE",
+    "EMSX_NSE_FILLED":                         "EMSX_NSE_FILLED",
+    "EMSX_ODD_LOT":                            "EMSX_ODD_LOT",
+    "EMSX_ORDER_AS_OF_DATE":                   "EMSX_ORDER_AS_OF_DATE",
+    "EMSX_ORDER_AS_OF_TIME_MICROSEC":          "EMSX_ORDER_AS_OF_TIME_MICROSEC",
+    "EMSX_ORDER_CREATE_DATE":                  "EMSX_ORDER_CREATE_DATE",
+    "EMSX_ORDER_CREATE_TIME":                  "EMSX_ORDER_CREATE_TIME",
+    "EMSX_ORDER_ORIGIN":                       "EMSX_ORDER_ORIGIN",
+    "EMSX_ORDER_REF_ID":                       "EMSX_ORDER_REF_ID",
+    "EMSX_ORDER_TYPE":                         "EMSX_ORDER_TYPE",
+    "EMSX_ORD_REF_ID":                         "EMSX_ORD_REF_ID",
+    "EMSX_ORIGINATE_TRADER":                   "EMSX_ORIGINATE_TRADER",
+    "EMSX_ORIGINATE_TRADER_FIRM":              "EMSX_ORIGINATE_TRADER_FIRM",
+    "EMSX_OTC_FLAG":                           "EMSX_OTC_FLAG",
+    "EMSX_PERCENT_REMAIN":                     "EMSX_PERCENT_REMAIN",
+    "EMSX_PM_UUID":                            "EMSX_PM_UUID",
+    "EMSX_PORT_MGR":                           "EMSX_PORT_MGR",
+    "EMSX_PORT_NAME":                          "EMSX_PORT_NAME",
+    "EMSX_PORT_NUM":                           "EMSX_PORT_NUM",
+    "EMSX_POSITION":                           "EMSX_POSITION",
+    "EMSX_PRINCIPAL":                          "EMSX_PRINCIPAL",
+    "EMSX_PRODUCT":                            "EMSX_PRODUCT",
+    "EMSX_P_A":                                "EMSX_P_A",
+    "EMSX_QUEUED_DATE":                        "EMSX_QUEUED_DATE",
+    "EMSX_QUEUED_TIME":                        "EMSX_QUEUED_TIME",
+    "EMSX_QUEUED_TIME_MICROSEC":               "EMSX_QUEUED_TIME_MICROSEC",
+    "EMSX_REASON_CODE":                        "EMSX_REASON_CODE",
+    "EMSX_REASON_DESC":                        "EMSX_REASON_DESC",
+    "EMSX_RELEASE_TIME":                       "EMSX_RELEASE_TIME",
+    "EMSX_REMAIN_BALANCE":                     "EMSX_REMAIN_BALANCE",
+    "EMSX_REQUEST_SEQ":                        "EMSX_REQUEST_SEQ",
+    "EMSX_REQUEST_TYPE":                       "EMSX_REQUEST_TYPE",
+    "EMSX_RESERVED_FIELD1":                    "EMSX_RESERVED_FIELD1",
+    "EMSX_RESERVED_FIELD2":                    "EMSX_RESERVED_FIELD2",
+    "EMSX_ROUTE_AS_OF_DATE":                   "EMSX_ROUTE_AS_OF_DATE",
+    "EMSX_ROUTE_AS_OF_TIME_MICROSEC":          "EMSX_ROUTE_AS_OF_TIME_MICROSEC",
+    "EMSX_ROUTE_CREATE_DATE":                  "EMSX_ROUTE_CREATE_DATE",
+    "EMSX_ROUTE_CREATE_TIME":                  "EMSX_ROUTE_CREATE_TIME",
+    "EMSX_ROUTE_CREATE_TIME_MICROSEC":         "EMSX_ROUTE_CREATE_TIME_MICROSEC",
+    "EMSX_ROUTE_ID":                           "EMSX_ROUTE_ID",
+    "EMSX_ROUTE_LAST_UPDATE_DATE":             "EMSX_ROUTE_LAST_UPDATE_DATE",
+    "EMSX_ROUTE_LAST_UPDATE_TIME":             "EMSX_ROUTE_LAST_UPDATE_TIME",
+    "EMSX_ROUTE_LAST_UPDATE_TIME_MICROSEC":    "EMSX_ROUTE_LAST_UPDATE_TIME_MICROSEC",
+    "EMSX_ROUTE_PRICE":                        "EMSX_ROUTE_PRICE",
+    "EMSX_ROUTE_REF_ID":                       "EMSX_ROUTE_REF_ID",
+    "EMSX_ROUTE_REF_ID_PAIRS":                 "EMSX_ROUTE_REF_ID_PAIRS",
+    "EMSX_SEC_NAME":                           "EMSX_SEC_NAME",
+    "EMSX_SEDOL":                              "EMSX_SEDOL",
+    "EMSX_SEQUENCE":                           "EMSX_SEQUENCE",
+    "EMSX_SETTLE_AMOUNT":                      "EMSX_SETTLE_AMOUNT",
+    "EMSX_SETTLE_CURRENCY":                    "EMSX_SETTLE_CURRENCY",
+    "EMSX_SETTLE_DATE":                        "EMSX_SETTLE_DATE",
+    "EMSX_SETTLE_TYPE":                        "EMSX_SETTLE_TYPE",
+    "EMSX_SI":                                 "EMSX_SI",
+    "EMSX_SIDE":                               "EMSX_SIDE",
+    "EMSX_START_AMOUNT":                       "EMSX_START_AMOUNT",
+    "EMSX_STATUS":                             "EMSX_STATUS",
+    "EMSX_STATUS_ID":                          "EMSX_STATUS_ID",
+    "EMSX_STEP_OUT_BROKER":                    "EMSX_STEP_OUT_BROKER",
+    "EMSX_STOP_PRICE":                         "EMSX_STOP_PRICE",
+    "EMSX_STRATEGIES":                         "EMSX_STRATEGIES",
+    "EMSX_STRATEGY":                           "EMSX_STRATEGY",
+    "EMSX_STRATEGY_END_TIME":                  "EMSX_STRATEGY_END_TIME",
+    "EMSX_STRATEGY_FIELDS":                    "EMSX_STRATEGY_FIELDS",
+    "EMSX_STRATEGY_FIELD_INDICATORS":          "EMSX_STRATEGY_FIELD_INDICATORS",
+    "EMSX_STRATEGY_FIELD_NAMES":               "EMSX_STRATEGY_FIELD_NAMES",
+    "EMSX_STRATEGY_INFO":                      "EMSX_STRATEGY_INFO",
+    "EMSX_STRATEGY_NAME":                      "EMSX_STRATEGY_NAME",
+    "EMSX_STRATEGY_PARAMS":                    "EMSX_STRATEGY_PARAMS",
+    "EMSX_STRATEGY_PART_RATE1":                "EMSX_STRATEGY_PART_RATE1",
+    "EMSX_STRATEGY_PART_RATE2":                "EMSX_STRATEGY_PART_RATE2",
+    "EMSX_STRATEGY_START_TIME":                "EMSX_STRATEGY_START_TIME",
+    "EMSX_STRATEGY_STYLE":                     "EMSX_STRATEGY_STYLE",
+    "EMSX_STRATEGY_TYPE":                      "EMSX_STRATEGY_TYPE",
+    "EMSX_SUB_FLAG":                           "EMSX_SUB_FLAG",
+    "EMSX_SUCCESS_ROUTES":                     "EMSX_SUCCESS_ROUTES",
+    "EMSX_TICKER":                             "EMSX_TICKER",
+    "EMSX_TIF":                                "EMSX_TIF",
+    "EMSX_TIME_STAMP":                         "EMSX_TIME_STAMP",
+    "EMSX_TIME_STAMP_MICROSEC":                "EMSX_TIME_STAMP_MICROSEC",
+    "EMSX_TOMS_PXNUM":                         "EMSX_TOMS_PXNUM",
+    "EMSX_TRADER":                             "EMSX_TRADER",
+    "EMSX_TRADER_NOTES":                       "EMSX_TRADER_NOTES",
+    "EMSX_TRADER_UUID":                        "EMSX_TRADER_UUID",
+    "EMSX_TRADE_DESK":                         "EMSX_TRADE_DESK",
+    "EMSX_TRADE_REPORTING_INDICATOR":          "EMSX_TRADE_REPORTING_INDICATOR",
+    "EMSX_TRAD_UUID":                          "EMSX_TRAD_UUID",
+    "EMSX_TRANSACTION_REPORTING_MIC":          "EMSX_TRANSACTION_REPORTING_MIC",
+    "EMSX_TS_ORDNUM":                          "EMSX_TS_ORDNUM",
+    "EMSX_TYPE":                               "EMSX_TYPE",
+    "EMSX_UNDERLYING_TICKER":                  "EMSX_UNDERLYING_TICKER",
+    "EMSX_URGENCY_LEVEL":                      "EMSX_URGENCY_LEVEL",
+    "EMSX_USER_COMM_AMOUNT":                   "EMSX_USER_COMM_AMOUNT",
+    "EMSX_USER_COMM_RATE":                     "EMSX_USER_COMM_RATE",
+    "EMSX_USER_FEES":                          "EMSX_USER_FEES",
+    "EMSX_USER_NET_MONEY":                     "EMSX_USER_NET_MONEY",
+    "EMSX_WAIVER_FLAG":                        "EMSX_WAIVER_FLAG",
+    "EMSX_WORKING":                            "EMSX_WORKING",
+    "EMSX_WORK_PRICE":                         "EMSX_WORK_PRICE",
+    "EMSX_YELLOW_KEY":                         "EMSX_YELLOW_KEY",
+    "EMSX_YIELD":                              "EMSX_YIELD",
+    "ERROR_CODE":                              "ERROR_CODE",
+    "ERROR_INFO":                              "ErrorInfo",
+    "ERROR_MESSAGE":                           "ERROR_MESSAGE",
+    "ERROR_MSG":                               "ErrorMsg",
+    "ERROR_RESPONSE":                          "ErrorResponse",
+    "EVENT_STATUS":                            "EVENT_STATUS",
+    "EXCEPTIONS":                              "exceptions",
+    "EXCHANGE":                                "Exchange",
+    "EXECUTING_BROKER":                        "ExecutingBroker",
+    "EXEC_PREV_SEQ_NO":                        "ExecPrevSeqNo",
+    "EXEC_TYPE":                               "ExecType",
+    "FIELD_ID":                                "fieldId",
+    "FIELD_NAME":                              "FieldName",
+    "FILLS":                                   "FILLS",
+    "FILL_ID":                                 "FillId",
+    "FILL_PRICE":                              "FillPrice",
+    "FILL_SHARES":                             "FillShares",
+    "FILTER_BY":                               "FilterBy",
+    "FROM_DATE_TIME":                          "FromDateTime",
+    "GET_ALL_FIELD_META_DATA":                 "GetAllFieldMetaData",
+    "GET_ASSET_CLASS":                         "GetAssetClass",
+    "GET_BROKERS":                             "GetBrokers",
+    "GET_BROKERS_WITH_ASSET_CLASS":            "GetBrokersWithAssetClass",
+    "GET_BROKER_STRATEGIES":                   "GetBrokerStrategies",
+    "GET_BROKER_STRATEGIES_WITH_ASSET_CLASS":  "GetBrokerStrategiesWithAssetClass",
+    "GET_BROKER_STRATEGY_INFO":                "GetBrokerStrategyInfo",
+    "GET_BROKER_STRATEGY_INFO_WITH_ASSET_CLASS": "GetBrokerStrategyInfoWithAssetClass",
+    "GET_FIELD_META_DATA":                     "GetFieldMetaData",
+    "GET_FILLS":                               "GetFills",
+    "GET_FILLS_RESPONSE":                      "GetFillsResponse",
+    "GET_TEAMS":                               "GetTeams",
+    "GET_TRADERS":                             "GetTraders",
+    "GET_TRADE_DESKS":                         "GetTradeDesks",
+    "GROUP_ROUTE_EX":                          "GroupRouteEx",
+    "GROUP_ROUTE_WITH_STRAT":                  "GroupRouteWithStrat",
+    "HISTORY_ERROR_CODE":                      "ErrorCode",
+    "HISTORY_FILLS":                           "Fills",
+    "ID_TYPE":                                 "ID_TYPE",
+    "INVESTOR_ID":                             "InvestorID",
+    "ISIN":                                    "Isin",
+    "IS_CFD":                                  "IsCfd",
+    "IS_LEG":                                  "IsLeg",
+    "LAST_CAPACITY":                           "LastCapacity",
+    "LAST_MARKET":                             "LastMarket",
+    "LEGACY":                                  "Legacy",
+    "LIMIT_PRICE":                             "LimitPrice",
+    "LIQUIDITY":                               "Liquidity",
+    "LOCAL_EXCHANGE_SYMBOL":                   "LocalExchangeSymbol",
+    "LOCATE_BROKER":                           "LocateBroker",
+    "LOCATE_ID":                               "LocateId",
+    "LOCATE_REQUIRED":                         "LocateRequired",
+    "MANUAL_FILL":                             "ManualFill",
+    "MESSAGE":                                 "MESSAGE",
+    "META_DATA":                               "MetaData",
+    "MIFID_AGGR_FLAG":                         "MifidAggrFlag",
+    "MIFID_BUYSIDE_LEI":                       "MifidBuysideLei",
+    "MIFID_GPI":                               "MifidGpi",
+    "MIFID_IS_SI":                             "MifidIsSi",
+    "MIFID_SELLSIDE_APA_MIC":                  "MifidSellsideApaMic",
+    "MIFID_SELLSIDE_LEI":                      "MifidSellsideLei",
+    "MIFID_SELLSIDE_OTC_FLAG":                 "MifidSellsideOtcFlag",
+    "MIFID_SELLSIDE_SI_MIC":                   "MifidSellsideSiMic",
+    "MIFID_SELLSIDE_TRI":                      "MifidSellsideTri",
+    "MIFID_SELLSIDE_TR_MIC":                   "MifidSellsideTrMic",
+    "MIFID_SELLSIDE_WAIVER_FLAG":              "MifidSellsideWaiverFlag",
+    "MIFID_TRADE_INSTR":                       "MifidTradeInstr",
+    "MODIFY_ORDER":                            "ModifyOrder",
+    "MODIFY_ORDER_EX":                         "ModifyOrderEx",
+    "MODIFY_ROUTE":                            "ModifyRoute",
+    "MODIFY_ROUTE_EX":                         "ModifyRouteEx",
+    "MODIFY_ROUTE_WITH_STRAT":                 "ModifyRouteWithStrat",
+    "MPID":                                    "Mpid",
+    "MSG_SUB_TYPE":                            "MSG_SUB_TYPE",
+    "MSG_TYPE":                                "MSG_TYPE",
+    "MULTILEG":                                "Multileg",
+    "MULTILEG_ID":                             "MultilegId",
+    "NY_ORDER_CREATE_AS_OF_DATE_TIME":         "NyOrderCreateAsOfDateTime",
+    "NY_TRAN_CREATE_AS_OF_DATE_TIME":          "NyTranCreateAsOfDateTime",
+    "OCCSYMBOL":                               "OCCSymbol",
+    "ORDERS_AND_ROUTES":                       "OrdersAndRoutes",
+    "ORDER_EXECUTION_INSTRUCTION":             "OrderExecutionInstruction",
+    "ORDER_HANDLING_INSTRUCTION":              "OrderHandlingInstruction",
+    "ORDER_ID":                                "OrderId",
+    "ORDER_INFO":                              "OrderInfo",
+    "ORDER_INSTRUCTION":                       "OrderInstruction",
+    "ORDER_ORIGIN":                            "OrderOrigin",
+    "ORDER_REFERENCE_ID":                      "OrderReferenceId",
+    "ORDER_ROUTE":                             "OrderRoute",
+    "ORDER_ROUTE_FIELDS":                      "OrderRouteFields",
+    "ORIGINATING_TRADER_UUID":                 "OriginatingTraderUuid",
+    "REASON":                                  "reason",
+    "REASON_ERROR_CODE":                       "errorCode",
+    "REQUEST_EXT":                             "REQUEST_EXT",
+    "REQUEST_FAILURE":                         "RequestFailure",
+    "REROUTED_BROKER":                         "ReroutedBroker",
+    "ROUTE":                                   "Route",
+    "ROUTES":                                  "ROUTES",
+    "ROUTE_COMMISSION_AMOUNT":                 "RouteCommissionAmount",
+    "ROUTE_COMMISSION_RATE":                   "RouteCommissionRate",
+    "ROUTE_EX":                                "RouteEx",
+    "ROUTE_EXECUTION_INSTRUCTION":             "RouteExecutionInstruction",
+    "ROUTE_HANDLING_INSTRUCTION":              "RouteHandlingInstruction",
+    "ROUTE_ID":                                "RouteId",
+    "ROUTE_INFO":                              "RouteInfo",
+    "ROUTE_MANUALLY":                          "RouteManually",
+    "ROUTE_MANUALLY_EX":                       "RouteManuallyEx",
+    "ROUTE_NET_MONEY":                         "RouteNetMoney",
+    "ROUTE_NOTES":                             "RouteNotes",
+    "ROUTE_SHARES":                            "RouteShares",
+    "ROUTE_TO_FILL":                           "ROUTE_TO_FILL",
+    "ROUTE_WITH_STRAT":                        "RouteWithStrat",
+    "SCOPE":                                   "Scope",
+    "SECURITY_NAME":                           "SecurityName",
+    "SEDOL":                                   "Sedol",
+    "SELL_SIDE_ACK":                           "SellSideAck",
+    "SELL_SIDE_REJECT":                        "SellSideReject",
+    "SERVICE_OPENED":                          "ServiceOpened",
+    "SERVICE_OPEN_FAILURE":                    "ServiceOpenFailure",
+    "SESSION_CONNECTION_DOWN":                 "SessionConnectionDown",
+    "SESSION_CONNECTION_UP":                   "SessionConnectionUp",
+    "SESSION_STARTED":                         "SessionStarted",
+    "SESSION_STARTUP_FAILURE":                 "SessionStartupFailure",
+    "SESSION_TERMINATED":                      "SessionTerminated",
+    "SETTLEMENT_DATE":                         "SettlementDate",
+    "SIDE":                                    "Side",
+    "SLOW_CONSUMER_WARNING":                   "SlowConsumerWarning",
+    "SLOW_CONSUMER_WARNING_CLEARED":           "SlowConsumerWarningCleared",
+    "SOURCE":                                  "source",
+    "SPREAD":                                  "Spread",
+    "STATUS":                                  "STATUS",
+    "STOP_PRICE":                              "StopPrice",
+    "STRATEGY_TYPE":                           "StrategyType",
+    "STRING_VALUE":                            "StringValue",
+    "SUBCATEGORY":                             "subcategory",
+    "SUBSCRIPTION_FAILURE":                    "SubscriptionFailure",
+    "SUBSCRIPTION_STARTED":                    "SubscriptionStarted",
+    "SUBSCRIPTION_TERMINATED":                 "SubscriptionTerminated",
+    "TEAM":                                    "Team",
+    "TEAMS":                                   "TEAMS",
+    "TICKER":                                  "Ticker",
+    "TIF":                                     "TIF",
+    "TO_DATE_TIME":                            "ToDateTime",
+    "TRADER_NAME":                             "TraderName",
+    "TRADER_UUID":                             "TraderUuid",
+    "TRADING_SYSTEM":                          "TradingSystem",
+    "TYPE":                                    "Type",
+    "USER_COMMISSION_AMOUNT":                  "UserCommissionAmount",
+    "USER_COMMISSION_RATE":                    "UserCommissionRate",
+    "USER_FEES":                               "UserFees",
+    "USER_NET_MONEY":                          "UserNetMoney",
+    "UUIDS":                                   "Uuids",
+    "YELLOW_KEY":                              "YellowKey",
+}
+
+
+_interned = {}
+
+
+def name(value):
+    # The shared blpapi.Name for a name only known at run time.
+    result = _interned.get(value)
+    if result is None:
+        result = _interned[value] = blpapi.Name(value)
+    return result
+
+
+def __getattr__(attr):
+    # Only called for constants that have not been created yet.
+    value = NAMES.get(attr)
+    if value is None:
+        raise AttributeError("module %s has no attribute %s" % (__name__, attr))
+    result = globals()[attr] = name(value)
+    return result
+
+
+def __dir__():
+    return sorted(set(globals()) | set(NAMES))
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
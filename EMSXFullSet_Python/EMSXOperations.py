@@ -0,0 +1,6535 @@
+# EMSXOperations.py
+#
+# Generated by EMSXCodeGen.py from emapisvc_3.33.1.4.xml (version 3.33.1.4).
+# Do not edit; change the generator and run it again.
+
+from EMSXNames import (
+    ASSIGN_TRADER,
+    CANCEL_ORDER_EX,
+    CANCEL_ROUTE,
+    CANCEL_ROUTE_EX,
+    CREATE_BASKET,
+    CREATE_ORDER,
+    CREATE_ORDER_AND_ROUTE,
+    CREATE_ORDER_AND_ROUTE_EX,
+    CREATE_ORDER_AND_ROUTE_MANUALLY,
+    CREATE_ORDER_AND_ROUTE_WITH_STRAT,
+    DELETE_ORDER,
+    EMSX_ACCOUNT,
+    EMSX_ALL_SUCCESS,
+    EMSX_AMOUNT,
+    EMSX_AMOUNT_PERCENT,
+    EMSX_ASSET_CLASS,
+    EMSX_ASSIGNEE_TRADER_UUID,
+    EMSX_ASSIGN_TRADER_FAILED_ORDERS,
+    EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS,
+    EMSX_AS_OF_DATE,
+    EMSX_AS_OF_TIME_MICROSEC,
+    EMSX_AVG_PRICE,
+    EMSX_BASKET_NAME,
+    EMSX_BLOT_DATE,
+    EMSX_BLOT_SEQ_NUM,
+    EMSX_BOOKNAME,
+    EMSX_BROKER,
+    EMSX_BROKERS,
+    EMSX_BUYSIDE_LEI,
+    EMSX_CFD_FLAG,
+    EMSX_CLEARING_ACCOUNT,
+    EMSX_CLEARING_FIRM,
+    EMSX_CLIENT_IDENTIFICATION,
+    EMSX_COMM_RATE,
+    EMSX_COMM_TYPE,
+    EMSX_CUSTOM_NOTE1,
+    EMSX_CUSTOM_NOTE2,
+    EMSX_CUSTOM_NOTE3,
+    EMSX_CUSTOM_NOTE4,
+    EMSX_CUSTOM_NOTE5,
+    EMSX_EXCHANGE,
+    EMSX_EXCHANGE_DESTINATION,
+    EMSX_EXEC_INSTRUCTION,
+    EMSX_FAILED_ROUTES,
+    EMSX_FIELD_NAMES,
+    EMSX_FILLED,
+    EMSX_FILL_ID,
+    EMSX_FLAG,
+    EMSX_GET_WARNINGS,
+    EMSX_GPI,
+    EMSX_GTD_DATE,
+    EMSX_HAND_INSTRUCTION,
+    EMSX_IDLE_AMOUNT,
+    EMSX_INVESTOR_ID,
+    EMSX_IS_AGGREGATED,
+    EMSX_IS_MANUAL_ROUTE,
+    EMSX_LIMIT_PRICE,
+    EMSX_LOCATE_BROKER,
+    EMSX_LOCATE_ID,
+    EMSX_LOCATE_REQ,
+    EMSX_LOC_BROKER,
+    EMSX_LOC_ID,
+    EMSX_LOC_REQ,
+    EMSX_LSTTR2_ID0,
+    EMSX_LSTTR2_ID1,
+    EMSX_MIFID_II_INSTRUCTION,
+    EMSX_ML_ID,
+    EMSX_NOTES,
+    EMSX_ODD_LOT,
+    EMSX_ORDER_CREATE_DATE,
+    EMSX_ORDER_CREATE_TIME,
+    EMSX_ORDER_ORIGIN,
+    EMSX_ORDER_REF_ID,
+    EMSX_ORDER_TYPE,
+    EMSX_PORT_MGR,
+    EMSX_POSITION,
+    EMSX_P_A,
+    EMSX_RELEASE_TIME,
+    EMSX_REQUEST_SEQ,
+    EMSX_REQUEST_TYPE,
+    EMSX_RESERVED_FIELD1,
+    EMSX_RESERVED_FIELD2,
+    EMSX_ROUTE_CREATE_DATE,
+    EMSX_ROUTE_CREATE_TIME,
+    EMSX_ROUTE_ID,
+    EMSX_ROUTE_LAST_UPDATE_DATE,
+    EMSX_ROUTE_LAST_UPDATE_TIME,
+    EMSX_ROUTE_REF_ID,
+    EMSX_ROUTE_REF_ID_PAIRS,
+    EMSX_SEQUENCE,
+    EMSX_SETTLE_CURRENCY,
+    EMSX_SETTLE_DATE,
+    EMSX_SETTLE_TYPE,
+    EMSX_SI,
+    EMSX_SIDE,
+    EMSX_STATUS,
+    EMSX_STATUS_ID,
+    EMSX_STEP_OUT_BROKER,
+    EMSX_STOP_PRICE,
+    EMSX_STRATEGIES,
+    EMSX_STRATEGY,
+    EMSX_STRATEGY_FIELD_NAMES,
+    EMSX_STRATEGY_INFO,
+    EMSX_STRATEGY_PARAMS,
+    EMSX_SUB_FLAG,
+    EMSX_SUCCESS_ROUTES,
+    EMSX_TICKER,
+    EMSX_TIF,
+    EMSX_TOMS_PXNUM,
+    EMSX_TRADER,
+    EMSX_TRADER_NOTES,
+    EMSX_TRADER_UUID,
+    EMSX_TRADE_DESK,
+    EMSX_TS_ORDNUM,
+    EMSX_USER_COMM_AMOUNT,
+    EMSX_USER_COMM_RATE,
+    EMSX_USER_FEES,
+    EMSX_WORKING,
+    EMSX_YELLOW_KEY,
+    EMSX_YIELD,
+    ERROR_CODE,
+    ERROR_INFO,
+    ERROR_MESSAGE,
+    FILLS,
+    GET_ALL_FIELD_META_DATA,
+    GET_ASSET_CLASS,
+    GET_BROKERS,
+    GET_BROKERS_WITH_ASSET_CLASS,
+    GET_BROKER_STRATEGIES,
+    GET_BROKER_STRATEGIES_WITH_ASSET_CLASS,
+    GET_BROKER_STRATEGY_INFO,
+    GET_BROKER_STRATEGY_INFO_WITH_ASSET_CLASS,
+    GET_FIELD_META_DATA,
+    GET_TEAMS,
+    GET_TRADERS,
+    GET_TRADE_DESKS,
+    GROUP_ROUTE_EX,
+    GROUP_ROUTE_WITH_STRAT,
+    ID_TYPE,
+    MANUAL_FILL,
+    MESSAGE,
+    META_DATA,
+    MODIFY_ORDER,
+    MODIFY_ORDER_EX,
+    MODIFY_ROUTE,
+    MODIFY_ROUTE_EX,
+    MODIFY_ROUTE_WITH_STRAT,
+    ORDER_INFO,
+    REQUEST_EXT,
+    ROUTE,
+    ROUTES,
+    ROUTE_INFO,
+    ROUTE_MANUALLY,
+    ROUTE_TO_FILL,
+    ROUTE_WITH_STRAT,
+    SCOPE,
+    SELL_SIDE_ACK,
+    SELL_SIDE_REJECT,
+    STATUS,
+    TEAMS,
+)
+from EMSXRequestRunner import elementToPython
+
+
+d_service="//blp/emapisvc"
+
+ASSET_CLASS_ENUM = frozenset((
+    "EQTY",
+    "OPT",
+    "FUT",
+    "MULTILEG_OPT",
+))
+
+MIFID_CLIENT_IDENTIFICATION = frozenset((
+    "AGGR",
+    "PNAL",
+))
+
+MIFID_IS_SI = frozenset((
+    "Y",
+    "N",
+))
+
+MIFID_TRADING_INSRUCTION_ENUM = frozenset((
+    "NO_RESTRICTION",
+    "VENUE",
+    "SI",
+    "SI_OR_VENUE",
+))
+
+ORDER_TYPE_ENUM = frozenset((
+    "CD",
+    "FUN",
+    "LMT",
+    "LOC",
+    "MKT",
+    "MOC",
+    "OC",
+    "SL",
+    "ST",
+    "PEG",
+    "MKTL",
+))
+
+SETTLE_TYPE_ENUM = frozenset((
+    "Regular",
+    "Cash",
+    "Next Day",
+    "T+2",
+    "T+3",
+    "T+4",
+    "Future",
+    "When Issued",
+    "T+5",
+))
+
+SIDE_ENUM = frozenset((
+    "BUY",
+    "BUYM",
+    "COVR",
+    "SELL",
+    "SHRT",
+    "SHRX",
+    "SLPL",
+    "B/O",
+    "B/C",
+    "S/C",
+    "S/O",
+    "UNDI",
+))
+
+TIF_ENUM = frozenset((
+    "DAY",
+    "FOK",
+    "GTC",
+    "GTD",
+    "GTX",
+    "IOC",
+    "OPG",
+    "CLO",
+    "AUC",
+    "DAY+",
+))
+
+
+class RequestValidationError(ValueError):
+
+    def __init__(self, errors):
+        ValueError.__init__(self, "; ".join(errors))
+        self.errors = errors
+
+
+def fillElement(element, value):
+    # Sets value, in the form elementToPython() returns, on element: dicts
+    # for sequences and choices, lists for arrays, scalars otherwise.
+    if isinstance(value, dict):
+        if element.isChoice():
+            for name, item in value.items():
+                fillElement(element.setChoice(name), item)
+        else:
+            for name, item in value.items():
+                fillElement(element.getElement(name), item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, dict):
+                fillElement(element.appendElement(), item)
+            else:
+                element.appendValue(item)
+    else:
+        element.setValue(value)
+
+
+class CreateOrderRequest(object):
+    """ CreateOrder request (CreateOrderRequest). """
+
+    OPERATION = "CreateOrder"
+    FIELDS = (
+        ("EMSX_SIDE", "SideEnum", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_BROKER", "String", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_SETTLE_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_ORDER_ORIGIN", "String", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_RESERVED_FIELD1", "String", False, False),
+        ("EMSX_BASKET_NAME", "String", False, False),
+        ("EMSX_ORDER_REF_ID", "String", False, False),
+        ("EMSX_INVESTOR_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_CUSTOM_NOTE1", "String", False, False),
+        ("EMSX_CUSTOM_NOTE2", "String", False, False),
+        ("EMSX_CUSTOM_NOTE3", "String", False, False),
+        ("EMSX_CUSTOM_NOTE4", "String", False, False),
+        ("EMSX_CUSTOM_NOTE5", "String", False, False),
+        ("EMSX_SETTLE_TYPE", "SettleTypeEnum", False, False),
+        ("EMSX_SETTLE_CURRENCY", "String", False, False),
+        ("EMSX_BUYSIDE_LEI", "String", False, False),
+        ("EMSX_CLIENT_IDENTIFICATION", "MifidClientIdentification", False, False),
+        ("EMSX_SI", "MifidIsSi", False, False),
+        ("EMSX_MIFID_II_INSTRUCTION", "MifidTradingInsructionEnum", False, False),
+        ("EMSX_GPI", "String", False, False),
+        ("EMSX_AS_OF_DATE", "Int32", False, False),
+        ("EMSX_AS_OF_TIME_MICROSEC", "Float64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SIDE",
+        "EMSX_AMOUNT",
+        "EMSX_TICKER",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_BROKER",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_GTD_DATE",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_SETTLE_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_P_A",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_ORDER_ORIGIN",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_RESERVED_FIELD1",
+        "EMSX_BASKET_NAME",
+        "EMSX_ORDER_REF_ID",
+        "EMSX_INVESTOR_ID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_CUSTOM_NOTE1",
+        "EMSX_CUSTOM_NOTE2",
+        "EMSX_CUSTOM_NOTE3",
+        "EMSX_CUSTOM_NOTE4",
+        "EMSX_CUSTOM_NOTE5",
+        "EMSX_SETTLE_TYPE",
+        "EMSX_SETTLE_CURRENCY",
+        "EMSX_BUYSIDE_LEI",
+        "EMSX_CLIENT_IDENTIFICATION",
+        "EMSX_SI",
+        "EMSX_MIFID_II_INSTRUCTION",
+        "EMSX_GPI",
+        "EMSX_AS_OF_DATE",
+        "EMSX_AS_OF_TIME_MICROSEC",
+    )
+
+    def __init__(self,
+                 EMSX_SIDE=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_TICKER=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_BROKER=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_SETTLE_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_P_A=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_ORDER_ORIGIN=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_RESERVED_FIELD1=None,
+                 EMSX_BASKET_NAME=None,
+                 EMSX_ORDER_REF_ID=None,
+                 EMSX_INVESTOR_ID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_CUSTOM_NOTE1=None,
+                 EMSX_CUSTOM_NOTE2=None,
+                 EMSX_CUSTOM_NOTE3=None,
+                 EMSX_CUSTOM_NOTE4=None,
+                 EMSX_CUSTOM_NOTE5=None,
+                 EMSX_SETTLE_TYPE=None,
+                 EMSX_SETTLE_CURRENCY=None,
+                 EMSX_BUYSIDE_LEI=None,
+                 EMSX_CLIENT_IDENTIFICATION=None,
+                 EMSX_SI=None,
+                 EMSX_MIFID_II_INSTRUCTION=None,
+                 EMSX_GPI=None,
+                 EMSX_AS_OF_DATE=None,
+                 EMSX_AS_OF_TIME_MICROSEC=None):
+        self.EMSX_SIDE = EMSX_SIDE
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_SETTLE_DATE = EMSX_SETTLE_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_ORDER_ORIGIN = EMSX_ORDER_ORIGIN
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_RESERVED_FIELD1 = EMSX_RESERVED_FIELD1
+        self.EMSX_BASKET_NAME = EMSX_BASKET_NAME
+        self.EMSX_ORDER_REF_ID = EMSX_ORDER_REF_ID
+        self.EMSX_INVESTOR_ID = EMSX_INVESTOR_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_CUSTOM_NOTE1 = EMSX_CUSTOM_NOTE1
+        self.EMSX_CUSTOM_NOTE2 = EMSX_CUSTOM_NOTE2
+        self.EMSX_CUSTOM_NOTE3 = EMSX_CUSTOM_NOTE3
+        self.EMSX_CUSTOM_NOTE4 = EMSX_CUSTOM_NOTE4
+        self.EMSX_CUSTOM_NOTE5 = EMSX_CUSTOM_NOTE5
+        self.EMSX_SETTLE_TYPE = EMSX_SETTLE_TYPE
+        self.EMSX_SETTLE_CURRENCY = EMSX_SETTLE_CURRENCY
+        self.EMSX_BUYSIDE_LEI = EMSX_BUYSIDE_LEI
+        self.EMSX_CLIENT_IDENTIFICATION = EMSX_CLIENT_IDENTIFICATION
+        self.EMSX_SI = EMSX_SI
+        self.EMSX_MIFID_II_INSTRUCTION = EMSX_MIFID_II_INSTRUCTION
+        self.EMSX_GPI = EMSX_GPI
+        self.EMSX_AS_OF_DATE = EMSX_AS_OF_DATE
+        self.EMSX_AS_OF_TIME_MICROSEC = EMSX_AS_OF_TIME_MICROSEC
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SIDE is None:
+            errors.append("EMSX_SIDE is required")
+        if self.EMSX_SIDE is not None and self.EMSX_SIDE not in SIDE_ENUM:
+            errors.append("%s is not a valid EMSX_SIDE" % (self.EMSX_SIDE,))
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        if self.EMSX_SETTLE_TYPE is not None and self.EMSX_SETTLE_TYPE not in SETTLE_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_SETTLE_TYPE" % (self.EMSX_SETTLE_TYPE,))
+        if self.EMSX_CLIENT_IDENTIFICATION is not None and self.EMSX_CLIENT_IDENTIFICATION not in MIFID_CLIENT_IDENTIFICATION:
+            errors.append("%s is not a valid EMSX_CLIENT_IDENTIFICATION" % (self.EMSX_CLIENT_IDENTIFICATION,))
+        if self.EMSX_SI is not None and self.EMSX_SI not in MIFID_IS_SI:
+            errors.append("%s is not a valid EMSX_SI" % (self.EMSX_SI,))
+        if self.EMSX_MIFID_II_INSTRUCTION is not None and self.EMSX_MIFID_II_INSTRUCTION not in MIFID_TRADING_INSRUCTION_ENUM:
+            errors.append("%s is not a valid EMSX_MIFID_II_INSTRUCTION" % (self.EMSX_MIFID_II_INSTRUCTION,))
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SIDE is not None:
+            request.set(EMSX_SIDE, self.EMSX_SIDE)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_SETTLE_DATE is not None:
+            request.set(EMSX_SETTLE_DATE, self.EMSX_SETTLE_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_ORDER_ORIGIN is not None:
+            request.set(EMSX_ORDER_ORIGIN, self.EMSX_ORDER_ORIGIN)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_RESERVED_FIELD1 is not None:
+            request.set(EMSX_RESERVED_FIELD1, self.EMSX_RESERVED_FIELD1)
+        if self.EMSX_BASKET_NAME is not None:
+            request.set(EMSX_BASKET_NAME, self.EMSX_BASKET_NAME)
+        if self.EMSX_ORDER_REF_ID is not None:
+            request.set(EMSX_ORDER_REF_ID, self.EMSX_ORDER_REF_ID)
+        if self.EMSX_INVESTOR_ID is not None:
+            request.set(EMSX_INVESTOR_ID, self.EMSX_INVESTOR_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_CUSTOM_NOTE1 is not None:
+            request.set(EMSX_CUSTOM_NOTE1, self.EMSX_CUSTOM_NOTE1)
+        if self.EMSX_CUSTOM_NOTE2 is not None:
+            request.set(EMSX_CUSTOM_NOTE2, self.EMSX_CUSTOM_NOTE2)
+        if self.EMSX_CUSTOM_NOTE3 is not None:
+            request.set(EMSX_CUSTOM_NOTE3, self.EMSX_CUSTOM_NOTE3)
+        if self.EMSX_CUSTOM_NOTE4 is not None:
+            request.set(EMSX_CUSTOM_NOTE4, self.EMSX_CUSTOM_NOTE4)
+        if self.EMSX_CUSTOM_NOTE5 is not None:
+            request.set(EMSX_CUSTOM_NOTE5, self.EMSX_CUSTOM_NOTE5)
+        if self.EMSX_SETTLE_TYPE is not None:
+            request.set(EMSX_SETTLE_TYPE, self.EMSX_SETTLE_TYPE)
+        if self.EMSX_SETTLE_CURRENCY is not None:
+            request.set(EMSX_SETTLE_CURRENCY, self.EMSX_SETTLE_CURRENCY)
+        if self.EMSX_BUYSIDE_LEI is not None:
+            request.set(EMSX_BUYSIDE_LEI, self.EMSX_BUYSIDE_LEI)
+        if self.EMSX_CLIENT_IDENTIFICATION is not None:
+            request.set(EMSX_CLIENT_IDENTIFICATION, self.EMSX_CLIENT_IDENTIFICATION)
+        if self.EMSX_SI is not None:
+            request.set(EMSX_SI, self.EMSX_SI)
+        if self.EMSX_MIFID_II_INSTRUCTION is not None:
+            request.set(EMSX_MIFID_II_INSTRUCTION, self.EMSX_MIFID_II_INSTRUCTION)
+        if self.EMSX_GPI is not None:
+            request.set(EMSX_GPI, self.EMSX_GPI)
+        if self.EMSX_AS_OF_DATE is not None:
+            request.set(EMSX_AS_OF_DATE, self.EMSX_AS_OF_DATE)
+        if self.EMSX_AS_OF_TIME_MICROSEC is not None:
+            request.set(EMSX_AS_OF_TIME_MICROSEC, self.EMSX_AS_OF_TIME_MICROSEC)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CreateOrderAndRouteRequest(object):
+    """ CreateOrderAndRoute request (CreateOrderAndRouteRequest). """
+
+    OPERATION = "CreateOrderAndRoute"
+    FIELDS = (
+        ("EMSX_SIDE", "SideEnum", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_BROKER", "String", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_SETTLE_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_ORDER_ORIGIN", "String", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_RESERVED_FIELD1", "String", False, False),
+        ("EMSX_RESERVED_FIELD2", "String", False, False),
+        ("EMSX_ORDER_REF_ID", "String", False, False),
+        ("EMSX_INVESTOR_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SIDE",
+        "EMSX_AMOUNT",
+        "EMSX_TICKER",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_BROKER",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_GTD_DATE",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_SETTLE_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_P_A",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_ORDER_ORIGIN",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_RESERVED_FIELD1",
+        "EMSX_RESERVED_FIELD2",
+        "EMSX_ORDER_REF_ID",
+        "EMSX_INVESTOR_ID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SIDE=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_TICKER=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_BROKER=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_SETTLE_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_P_A=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_ORDER_ORIGIN=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_RESERVED_FIELD1=None,
+                 EMSX_RESERVED_FIELD2=None,
+                 EMSX_ORDER_REF_ID=None,
+                 EMSX_INVESTOR_ID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SIDE = EMSX_SIDE
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_SETTLE_DATE = EMSX_SETTLE_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_ORDER_ORIGIN = EMSX_ORDER_ORIGIN
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_RESERVED_FIELD1 = EMSX_RESERVED_FIELD1
+        self.EMSX_RESERVED_FIELD2 = EMSX_RESERVED_FIELD2
+        self.EMSX_ORDER_REF_ID = EMSX_ORDER_REF_ID
+        self.EMSX_INVESTOR_ID = EMSX_INVESTOR_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SIDE is None:
+            errors.append("EMSX_SIDE is required")
+        if self.EMSX_SIDE is not None and self.EMSX_SIDE not in SIDE_ENUM:
+            errors.append("%s is not a valid EMSX_SIDE" % (self.EMSX_SIDE,))
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SIDE is not None:
+            request.set(EMSX_SIDE, self.EMSX_SIDE)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_SETTLE_DATE is not None:
+            request.set(EMSX_SETTLE_DATE, self.EMSX_SETTLE_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_ORDER_ORIGIN is not None:
+            request.set(EMSX_ORDER_ORIGIN, self.EMSX_ORDER_ORIGIN)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_RESERVED_FIELD1 is not None:
+            request.set(EMSX_RESERVED_FIELD1, self.EMSX_RESERVED_FIELD1)
+        if self.EMSX_RESERVED_FIELD2 is not None:
+            request.set(EMSX_RESERVED_FIELD2, self.EMSX_RESERVED_FIELD2)
+        if self.EMSX_ORDER_REF_ID is not None:
+            request.set(EMSX_ORDER_REF_ID, self.EMSX_ORDER_REF_ID)
+        if self.EMSX_INVESTOR_ID is not None:
+            request.set(EMSX_INVESTOR_ID, self.EMSX_INVESTOR_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CreateOrderAndRouteManuallyRequest(object):
+    """ CreateOrderAndRouteManually request (CreateOrderAndRouteRequest). """
+
+    OPERATION = "CreateOrderAndRouteManually"
+    FIELDS = (
+        ("EMSX_SIDE", "SideEnum", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_BROKER", "String", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_SETTLE_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_ORDER_ORIGIN", "String", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_RESERVED_FIELD1", "String", False, False),
+        ("EMSX_RESERVED_FIELD2", "String", False, False),
+        ("EMSX_ORDER_REF_ID", "String", False, False),
+        ("EMSX_INVESTOR_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SIDE",
+        "EMSX_AMOUNT",
+        "EMSX_TICKER",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_BROKER",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_GTD_DATE",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_SETTLE_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_P_A",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_ORDER_ORIGIN",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_RESERVED_FIELD1",
+        "EMSX_RESERVED_FIELD2",
+        "EMSX_ORDER_REF_ID",
+        "EMSX_INVESTOR_ID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SIDE=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_TICKER=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_BROKER=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_SETTLE_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_P_A=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_ORDER_ORIGIN=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_RESERVED_FIELD1=None,
+                 EMSX_RESERVED_FIELD2=None,
+                 EMSX_ORDER_REF_ID=None,
+                 EMSX_INVESTOR_ID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SIDE = EMSX_SIDE
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_SETTLE_DATE = EMSX_SETTLE_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_ORDER_ORIGIN = EMSX_ORDER_ORIGIN
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_RESERVED_FIELD1 = EMSX_RESERVED_FIELD1
+        self.EMSX_RESERVED_FIELD2 = EMSX_RESERVED_FIELD2
+        self.EMSX_ORDER_REF_ID = EMSX_ORDER_REF_ID
+        self.EMSX_INVESTOR_ID = EMSX_INVESTOR_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SIDE is None:
+            errors.append("EMSX_SIDE is required")
+        if self.EMSX_SIDE is not None and self.EMSX_SIDE not in SIDE_ENUM:
+            errors.append("%s is not a valid EMSX_SIDE" % (self.EMSX_SIDE,))
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SIDE is not None:
+            request.set(EMSX_SIDE, self.EMSX_SIDE)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_SETTLE_DATE is not None:
+            request.set(EMSX_SETTLE_DATE, self.EMSX_SETTLE_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_ORDER_ORIGIN is not None:
+            request.set(EMSX_ORDER_ORIGIN, self.EMSX_ORDER_ORIGIN)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_RESERVED_FIELD1 is not None:
+            request.set(EMSX_RESERVED_FIELD1, self.EMSX_RESERVED_FIELD1)
+        if self.EMSX_RESERVED_FIELD2 is not None:
+            request.set(EMSX_RESERVED_FIELD2, self.EMSX_RESERVED_FIELD2)
+        if self.EMSX_ORDER_REF_ID is not None:
+            request.set(EMSX_ORDER_REF_ID, self.EMSX_ORDER_REF_ID)
+        if self.EMSX_INVESTOR_ID is not None:
+            request.set(EMSX_INVESTOR_ID, self.EMSX_INVESTOR_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class ModifyOrderRequest(object):
+    """ ModifyOrder request (ModifyOrderRequest). """
+
+    OPERATION = "ModifyOrder"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", False, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_INVESTOR_ID", "String", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_CFD_FLAG",
+        "EMSX_GET_WARNINGS",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_INVESTOR_ID",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_GET_WARNINGS=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_INVESTOR_ID=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_INVESTOR_ID = EMSX_INVESTOR_ID
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_INVESTOR_ID is not None:
+            request.set(EMSX_INVESTOR_ID, self.EMSX_INVESTOR_ID)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class DeleteOrderRequest(object):
+    """ DeleteOrder request (DeleteOrderRequest). """
+
+    OPERATION = "DeleteOrder"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class OrderInfoRequest(object):
+    """ OrderInfo request (OrderInfoRequest). """
+
+    OPERATION = "OrderInfo"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_IS_AGGREGATED", "Int32", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_IS_AGGREGATED",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_IS_AGGREGATED=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_IS_AGGREGATED = EMSX_IS_AGGREGATED
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_IS_AGGREGATED is None:
+            errors.append("EMSX_IS_AGGREGATED is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_IS_AGGREGATED is not None:
+            request.set(EMSX_IS_AGGREGATED, self.EMSX_IS_AGGREGATED)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class RouteInfoRequest(object):
+    """ RouteInfo request (RouteInfoRequest). """
+
+    OPERATION = "RouteInfo"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_ROUTE_ID", "Int32", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_ROUTE_ID",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_ROUTE_ID=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_ROUTE_ID = EMSX_ROUTE_ID
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_ROUTE_ID is None:
+            errors.append("EMSX_ROUTE_ID is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_ROUTE_ID is not None:
+            request.set(EMSX_ROUTE_ID, self.EMSX_ROUTE_ID)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class RouteRequest(object):
+    """ Route request (RouteOrderRequest). """
+
+    OPERATION = "Route"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_P_A",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_BROKER=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_P_A=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class RouteManuallyRequest(object):
+    """ RouteManually request (RouteOrderRequest). """
+
+    OPERATION = "RouteManually"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_P_A",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_BROKER=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_P_A=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class ModifyRouteRequest(object):
+    """ ModifyRoute request (ModifyRouteRequest). """
+
+    OPERATION = "ModifyRoute"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_ROUTE_ID", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_COMM_TYPE", "String", False, False),
+        ("EMSX_USER_COMM_RATE", "Float64", False, False),
+        ("EMSX_USER_FEES", "Float64", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_TRADER_NOTES", "String", False, False),
+        ("EMSX_LOC_BROKER", "String", False, False),
+        ("EMSX_LOC_ID", "String", False, False),
+        ("EMSX_LOC_REQ", "String", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_ROUTE_ID",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_P_A",
+        "EMSX_COMM_TYPE",
+        "EMSX_USER_COMM_RATE",
+        "EMSX_USER_FEES",
+        "EMSX_ODD_LOT",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_TRADER_NOTES",
+        "EMSX_LOC_BROKER",
+        "EMSX_LOC_ID",
+        "EMSX_LOC_REQ",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_FIRM",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_ROUTE_ID=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_P_A=None,
+                 EMSX_COMM_TYPE=None,
+                 EMSX_USER_COMM_RATE=None,
+                 EMSX_USER_FEES=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_TRADER_NOTES=None,
+                 EMSX_LOC_BROKER=None,
+                 EMSX_LOC_ID=None,
+                 EMSX_LOC_REQ=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_FIRM=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_ROUTE_ID = EMSX_ROUTE_ID
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_COMM_TYPE = EMSX_COMM_TYPE
+        self.EMSX_USER_COMM_RATE = EMSX_USER_COMM_RATE
+        self.EMSX_USER_FEES = EMSX_USER_FEES
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_TRADER_NOTES = EMSX_TRADER_NOTES
+        self.EMSX_LOC_BROKER = EMSX_LOC_BROKER
+        self.EMSX_LOC_ID = EMSX_LOC_ID
+        self.EMSX_LOC_REQ = EMSX_LOC_REQ
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_ROUTE_ID is None:
+            errors.append("EMSX_ROUTE_ID is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_ROUTE_ID is not None:
+            request.set(EMSX_ROUTE_ID, self.EMSX_ROUTE_ID)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_COMM_TYPE is not None:
+            request.set(EMSX_COMM_TYPE, self.EMSX_COMM_TYPE)
+        if self.EMSX_USER_COMM_RATE is not None:
+            request.set(EMSX_USER_COMM_RATE, self.EMSX_USER_COMM_RATE)
+        if self.EMSX_USER_FEES is not None:
+            request.set(EMSX_USER_FEES, self.EMSX_USER_FEES)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_TRADER_NOTES is not None:
+            request.set(EMSX_TRADER_NOTES, self.EMSX_TRADER_NOTES)
+        if self.EMSX_LOC_BROKER is not None:
+            request.set(EMSX_LOC_BROKER, self.EMSX_LOC_BROKER)
+        if self.EMSX_LOC_ID is not None:
+            request.set(EMSX_LOC_ID, self.EMSX_LOC_ID)
+        if self.EMSX_LOC_REQ is not None:
+            request.set(EMSX_LOC_REQ, self.EMSX_LOC_REQ)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CancelRouteRequest(object):
+    """ CancelRoute request (CancelRouteRequest). """
+
+    OPERATION = "CancelRoute"
+    FIELDS = (
+        ("ROUTES", "TranInfo", True, True),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "ROUTES",
+        "REQUEST_EXT",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 ROUTES=None,
+                 REQUEST_EXT=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.ROUTES = ROUTES
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.ROUTES is None:
+            errors.append("ROUTES is required")
+        if self.ROUTES is not None and not isinstance(self.ROUTES, (list, tuple)):
+            errors.append("ROUTES must be a list")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.ROUTES is not None:
+            fillElement(request.getElement(ROUTES), self.ROUTES)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CancelRouteExRequest(object):
+    """ CancelRouteEx request (CancelRouteRequestEx). """
+
+    OPERATION = "CancelRouteEx"
+    FIELDS = (
+        ("ID_TYPE", "IdType", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "ID_TYPE",
+        "REQUEST_EXT",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 ID_TYPE=None,
+                 REQUEST_EXT=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.ID_TYPE = ID_TYPE
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.ID_TYPE is None:
+            errors.append("ID_TYPE is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.ID_TYPE is not None:
+            fillElement(request.getElement(ID_TYPE), self.ID_TYPE)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetTeamsRequest(object):
+    """ GetTeams request (GetTeamsRequest). """
+
+    OPERATION = "GetTeams"
+    FIELDS = (
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetFieldMetaDataRequest(object):
+    """ GetFieldMetaData request (GetFieldMetaDataRequest). """
+
+    OPERATION = "GetFieldMetaData"
+    FIELDS = (
+        ("EMSX_FIELD_NAMES", "String", True, True),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_FIELD_NAMES",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_FIELD_NAMES=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_FIELD_NAMES = EMSX_FIELD_NAMES
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_FIELD_NAMES is None:
+            errors.append("EMSX_FIELD_NAMES is required")
+        if self.EMSX_FIELD_NAMES is not None and not isinstance(self.EMSX_FIELD_NAMES, (list, tuple)):
+            errors.append("EMSX_FIELD_NAMES must be a list")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_FIELD_NAMES is not None:
+            fillElement(request.getElement(EMSX_FIELD_NAMES), self.EMSX_FIELD_NAMES)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetAllFieldMetaDataRequest(object):
+    """ GetAllFieldMetaData request (GetAllFieldMetaDataRequest). """
+
+    OPERATION = "GetAllFieldMetaData"
+    FIELDS = (
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetAssetClassRequest(object):
+    """ GetAssetClass request (GetAssetClassRequest). """
+
+    OPERATION = "GetAssetClass"
+    FIELDS = (
+        ("EMSX_TICKER", "String", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_TICKER",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_TICKER=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_TICKER = EMSX_TICKER
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetBrokersWithAssetClassRequest(object):
+    """ GetBrokersWithAssetClass request (GetBrokersWithAssetClassRequest). """
+
+    OPERATION = "GetBrokersWithAssetClass"
+    FIELDS = (
+        ("EMSX_ASSET_CLASS", "AssetClassEnum", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_ASSET_CLASS",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_ASSET_CLASS=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_ASSET_CLASS = EMSX_ASSET_CLASS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_ASSET_CLASS is None:
+            errors.append("EMSX_ASSET_CLASS is required")
+        if self.EMSX_ASSET_CLASS is not None and self.EMSX_ASSET_CLASS not in ASSET_CLASS_ENUM:
+            errors.append("%s is not a valid EMSX_ASSET_CLASS" % (self.EMSX_ASSET_CLASS,))
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_ASSET_CLASS is not None:
+            request.set(EMSX_ASSET_CLASS, self.EMSX_ASSET_CLASS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetBrokerStrategiesWithAssetClassRequest(object):
+    """ GetBrokerStrategiesWithAssetClass request (GetBrokerStrategiesWithAssetClassRequest). """
+
+    OPERATION = "GetBrokerStrategiesWithAssetClass"
+    FIELDS = (
+        ("EMSX_ASSET_CLASS", "AssetClassEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_ASSET_CLASS",
+        "EMSX_BROKER",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_ASSET_CLASS=None,
+                 EMSX_BROKER=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_ASSET_CLASS = EMSX_ASSET_CLASS
+        self.EMSX_BROKER = EMSX_BROKER
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_ASSET_CLASS is None:
+            errors.append("EMSX_ASSET_CLASS is required")
+        if self.EMSX_ASSET_CLASS is not None and self.EMSX_ASSET_CLASS not in ASSET_CLASS_ENUM:
+            errors.append("%s is not a valid EMSX_ASSET_CLASS" % (self.EMSX_ASSET_CLASS,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_ASSET_CLASS is not None:
+            request.set(EMSX_ASSET_CLASS, self.EMSX_ASSET_CLASS)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetBrokerStrategyInfoWithAssetClassRequest(object):
+    """ GetBrokerStrategyInfoWithAssetClass request (GetBrokerStrategyInfoWithAssetClassRequest). """
+
+    OPERATION = "GetBrokerStrategyInfoWithAssetClass"
+    FIELDS = (
+        ("EMSX_ASSET_CLASS", "AssetClassEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_STRATEGY", "String", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_ASSET_CLASS",
+        "EMSX_BROKER",
+        "EMSX_STRATEGY",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_ASSET_CLASS=None,
+                 EMSX_BROKER=None,
+                 EMSX_STRATEGY=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_ASSET_CLASS = EMSX_ASSET_CLASS
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_STRATEGY = EMSX_STRATEGY
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_ASSET_CLASS is None:
+            errors.append("EMSX_ASSET_CLASS is required")
+        if self.EMSX_ASSET_CLASS is not None and self.EMSX_ASSET_CLASS not in ASSET_CLASS_ENUM:
+            errors.append("%s is not a valid EMSX_ASSET_CLASS" % (self.EMSX_ASSET_CLASS,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_STRATEGY is None:
+            errors.append("EMSX_STRATEGY is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_ASSET_CLASS is not None:
+            request.set(EMSX_ASSET_CLASS, self.EMSX_ASSET_CLASS)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_STRATEGY is not None:
+            request.set(EMSX_STRATEGY, self.EMSX_STRATEGY)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetBrokersRequest(object):
+    """ GetBrokers request (GetBrokersRequest). """
+
+    OPERATION = "GetBrokers"
+    FIELDS = (
+        ("EMSX_TICKER", "String", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_TICKER",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_TICKER=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_TICKER = EMSX_TICKER
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetBrokerStrategiesRequest(object):
+    """ GetBrokerStrategies request (GetBrokerStrategiesRequest). """
+
+    OPERATION = "GetBrokerStrategies"
+    FIELDS = (
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_TICKER",
+        "EMSX_BROKER",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_TICKER=None,
+                 EMSX_BROKER=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_BROKER = EMSX_BROKER
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetBrokerStrategyInfoRequest(object):
+    """ GetBrokerStrategyInfo request (GetBrokerStrategyInfoRequest). """
+
+    OPERATION = "GetBrokerStrategyInfo"
+    FIELDS = (
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_STRATEGY", "String", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_TICKER",
+        "EMSX_BROKER",
+        "EMSX_STRATEGY",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_TICKER=None,
+                 EMSX_BROKER=None,
+                 EMSX_STRATEGY=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_STRATEGY = EMSX_STRATEGY
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_STRATEGY is None:
+            errors.append("EMSX_STRATEGY is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_STRATEGY is not None:
+            request.set(EMSX_STRATEGY, self.EMSX_STRATEGY)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CreateOrderAndRouteWithStratRequest(object):
+    """ CreateOrderAndRouteWithStrat request (CreateOrderWithStratRequest). """
+
+    OPERATION = "CreateOrderAndRouteWithStrat"
+    FIELDS = (
+        ("EMSX_SIDE", "SideEnum", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_BROKER", "String", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_SETTLE_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_ORDER_ORIGIN", "String", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_ORDER_REF_ID", "String", False, False),
+        ("EMSX_INVESTOR_ID", "String", False, False),
+        ("EMSX_CUSTOM_NOTE1", "String", False, False),
+        ("EMSX_CUSTOM_NOTE2", "String", False, False),
+        ("EMSX_CUSTOM_NOTE3", "String", False, False),
+        ("EMSX_CUSTOM_NOTE4", "String", False, False),
+        ("EMSX_CUSTOM_NOTE5", "String", False, False),
+        ("EMSX_SETTLE_TYPE", "SettleTypeEnum", False, False),
+        ("EMSX_SETTLE_CURRENCY", "String", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SIDE",
+        "EMSX_AMOUNT",
+        "EMSX_TICKER",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_BROKER",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_GTD_DATE",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_SETTLE_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_P_A",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_ORDER_ORIGIN",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_ORDER_REF_ID",
+        "EMSX_INVESTOR_ID",
+        "EMSX_CUSTOM_NOTE1",
+        "EMSX_CUSTOM_NOTE2",
+        "EMSX_CUSTOM_NOTE3",
+        "EMSX_CUSTOM_NOTE4",
+        "EMSX_CUSTOM_NOTE5",
+        "EMSX_SETTLE_TYPE",
+        "EMSX_SETTLE_CURRENCY",
+    )
+
+    def __init__(self,
+                 EMSX_SIDE=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_TICKER=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_BROKER=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_SETTLE_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_P_A=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_ORDER_ORIGIN=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_ORDER_REF_ID=None,
+                 EMSX_INVESTOR_ID=None,
+                 EMSX_CUSTOM_NOTE1=None,
+                 EMSX_CUSTOM_NOTE2=None,
+                 EMSX_CUSTOM_NOTE3=None,
+                 EMSX_CUSTOM_NOTE4=None,
+                 EMSX_CUSTOM_NOTE5=None,
+                 EMSX_SETTLE_TYPE=None,
+                 EMSX_SETTLE_CURRENCY=None):
+        self.EMSX_SIDE = EMSX_SIDE
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_SETTLE_DATE = EMSX_SETTLE_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_ORDER_ORIGIN = EMSX_ORDER_ORIGIN
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_ORDER_REF_ID = EMSX_ORDER_REF_ID
+        self.EMSX_INVESTOR_ID = EMSX_INVESTOR_ID
+        self.EMSX_CUSTOM_NOTE1 = EMSX_CUSTOM_NOTE1
+        self.EMSX_CUSTOM_NOTE2 = EMSX_CUSTOM_NOTE2
+        self.EMSX_CUSTOM_NOTE3 = EMSX_CUSTOM_NOTE3
+        self.EMSX_CUSTOM_NOTE4 = EMSX_CUSTOM_NOTE4
+        self.EMSX_CUSTOM_NOTE5 = EMSX_CUSTOM_NOTE5
+        self.EMSX_SETTLE_TYPE = EMSX_SETTLE_TYPE
+        self.EMSX_SETTLE_CURRENCY = EMSX_SETTLE_CURRENCY
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SIDE is None:
+            errors.append("EMSX_SIDE is required")
+        if self.EMSX_SIDE is not None and self.EMSX_SIDE not in SIDE_ENUM:
+            errors.append("%s is not a valid EMSX_SIDE" % (self.EMSX_SIDE,))
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        if self.EMSX_SETTLE_TYPE is not None and self.EMSX_SETTLE_TYPE not in SETTLE_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_SETTLE_TYPE" % (self.EMSX_SETTLE_TYPE,))
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SIDE is not None:
+            request.set(EMSX_SIDE, self.EMSX_SIDE)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_SETTLE_DATE is not None:
+            request.set(EMSX_SETTLE_DATE, self.EMSX_SETTLE_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_ORDER_ORIGIN is not None:
+            request.set(EMSX_ORDER_ORIGIN, self.EMSX_ORDER_ORIGIN)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_ORDER_REF_ID is not None:
+            request.set(EMSX_ORDER_REF_ID, self.EMSX_ORDER_REF_ID)
+        if self.EMSX_INVESTOR_ID is not None:
+            request.set(EMSX_INVESTOR_ID, self.EMSX_INVESTOR_ID)
+        if self.EMSX_CUSTOM_NOTE1 is not None:
+            request.set(EMSX_CUSTOM_NOTE1, self.EMSX_CUSTOM_NOTE1)
+        if self.EMSX_CUSTOM_NOTE2 is not None:
+            request.set(EMSX_CUSTOM_NOTE2, self.EMSX_CUSTOM_NOTE2)
+        if self.EMSX_CUSTOM_NOTE3 is not None:
+            request.set(EMSX_CUSTOM_NOTE3, self.EMSX_CUSTOM_NOTE3)
+        if self.EMSX_CUSTOM_NOTE4 is not None:
+            request.set(EMSX_CUSTOM_NOTE4, self.EMSX_CUSTOM_NOTE4)
+        if self.EMSX_CUSTOM_NOTE5 is not None:
+            request.set(EMSX_CUSTOM_NOTE5, self.EMSX_CUSTOM_NOTE5)
+        if self.EMSX_SETTLE_TYPE is not None:
+            request.set(EMSX_SETTLE_TYPE, self.EMSX_SETTLE_TYPE)
+        if self.EMSX_SETTLE_CURRENCY is not None:
+            request.set(EMSX_SETTLE_CURRENCY, self.EMSX_SETTLE_CURRENCY)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class RouteWithStratRequest(object):
+    """ RouteWithStrat request (RouteOrderWithStratRequest). """
+
+    OPERATION = "RouteWithStrat"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_P_A",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_BROKER=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_P_A=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class ModifyRouteWithStratRequest(object):
+    """ ModifyRouteWithStrat request (ModifyRouteWithStratRequest). """
+
+    OPERATION = "ModifyRouteWithStrat"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_ROUTE_ID", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_COMM_TYPE", "String", False, False),
+        ("EMSX_USER_COMM_RATE", "Float64", False, False),
+        ("EMSX_USER_FEES", "Float64", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_TRADER_NOTES", "String", False, False),
+        ("EMSX_LOC_BROKER", "String", False, False),
+        ("EMSX_LOC_ID", "String", False, False),
+        ("EMSX_LOC_REQ", "String", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_ROUTE_ID",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_P_A",
+        "EMSX_COMM_TYPE",
+        "EMSX_USER_COMM_RATE",
+        "EMSX_USER_FEES",
+        "EMSX_ODD_LOT",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_TRADER_NOTES",
+        "EMSX_LOC_BROKER",
+        "EMSX_LOC_ID",
+        "EMSX_LOC_REQ",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_ROUTE_ID=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_P_A=None,
+                 EMSX_COMM_TYPE=None,
+                 EMSX_USER_COMM_RATE=None,
+                 EMSX_USER_FEES=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_TRADER_NOTES=None,
+                 EMSX_LOC_BROKER=None,
+                 EMSX_LOC_ID=None,
+                 EMSX_LOC_REQ=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_ROUTE_ID = EMSX_ROUTE_ID
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_COMM_TYPE = EMSX_COMM_TYPE
+        self.EMSX_USER_COMM_RATE = EMSX_USER_COMM_RATE
+        self.EMSX_USER_FEES = EMSX_USER_FEES
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_TRADER_NOTES = EMSX_TRADER_NOTES
+        self.EMSX_LOC_BROKER = EMSX_LOC_BROKER
+        self.EMSX_LOC_ID = EMSX_LOC_ID
+        self.EMSX_LOC_REQ = EMSX_LOC_REQ
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_ROUTE_ID is None:
+            errors.append("EMSX_ROUTE_ID is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_ROUTE_ID is not None:
+            request.set(EMSX_ROUTE_ID, self.EMSX_ROUTE_ID)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_COMM_TYPE is not None:
+            request.set(EMSX_COMM_TYPE, self.EMSX_COMM_TYPE)
+        if self.EMSX_USER_COMM_RATE is not None:
+            request.set(EMSX_USER_COMM_RATE, self.EMSX_USER_COMM_RATE)
+        if self.EMSX_USER_FEES is not None:
+            request.set(EMSX_USER_FEES, self.EMSX_USER_FEES)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_TRADER_NOTES is not None:
+            request.set(EMSX_TRADER_NOTES, self.EMSX_TRADER_NOTES)
+        if self.EMSX_LOC_BROKER is not None:
+            request.set(EMSX_LOC_BROKER, self.EMSX_LOC_BROKER)
+        if self.EMSX_LOC_ID is not None:
+            request.set(EMSX_LOC_ID, self.EMSX_LOC_ID)
+        if self.EMSX_LOC_REQ is not None:
+            request.set(EMSX_LOC_REQ, self.EMSX_LOC_REQ)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GroupRouteWithStratRequest(object):
+    """ GroupRouteWithStrat request (GroupRouteWithStratRequest). """
+
+    OPERATION = "GroupRouteWithStrat"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT_PERCENT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT_PERCENT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_P_A",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT_PERCENT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_BROKER=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_P_A=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT_PERCENT = EMSX_AMOUNT_PERCENT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT_PERCENT is None:
+            errors.append("EMSX_AMOUNT_PERCENT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT_PERCENT is not None:
+            request.set(EMSX_AMOUNT_PERCENT, self.EMSX_AMOUNT_PERCENT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class RouteExRequest(object):
+    """ RouteEx request (RouteOrderRequestEx). """
+
+    OPERATION = "RouteEx"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_ROUTE_REF_ID", "String", False, False),
+        ("EMSX_BOOKNAME", "String", False, False),
+        ("EMSX_MIFID_II_INSTRUCTION", "MifidTradingInsructionEnum", False, False),
+        ("EMSX_GPI", "String", False, False),
+        ("EMSX_AS_OF_DATE", "Int32", False, False),
+        ("EMSX_AS_OF_TIME_MICROSEC", "Float64", False, False),
+        ("EMSX_TOMS_PXNUM", "Int32", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_P_A",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_ROUTE_REF_ID",
+        "EMSX_BOOKNAME",
+        "EMSX_MIFID_II_INSTRUCTION",
+        "EMSX_GPI",
+        "EMSX_AS_OF_DATE",
+        "EMSX_AS_OF_TIME_MICROSEC",
+        "EMSX_TOMS_PXNUM",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_BROKER=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_P_A=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_ROUTE_REF_ID=None,
+                 EMSX_BOOKNAME=None,
+                 EMSX_MIFID_II_INSTRUCTION=None,
+                 EMSX_GPI=None,
+                 EMSX_AS_OF_DATE=None,
+                 EMSX_AS_OF_TIME_MICROSEC=None,
+                 EMSX_TOMS_PXNUM=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_ROUTE_REF_ID = EMSX_ROUTE_REF_ID
+        self.EMSX_BOOKNAME = EMSX_BOOKNAME
+        self.EMSX_MIFID_II_INSTRUCTION = EMSX_MIFID_II_INSTRUCTION
+        self.EMSX_GPI = EMSX_GPI
+        self.EMSX_AS_OF_DATE = EMSX_AS_OF_DATE
+        self.EMSX_AS_OF_TIME_MICROSEC = EMSX_AS_OF_TIME_MICROSEC
+        self.EMSX_TOMS_PXNUM = EMSX_TOMS_PXNUM
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        if self.EMSX_MIFID_II_INSTRUCTION is not None and self.EMSX_MIFID_II_INSTRUCTION not in MIFID_TRADING_INSRUCTION_ENUM:
+            errors.append("%s is not a valid EMSX_MIFID_II_INSTRUCTION" % (self.EMSX_MIFID_II_INSTRUCTION,))
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_ROUTE_REF_ID is not None:
+            request.set(EMSX_ROUTE_REF_ID, self.EMSX_ROUTE_REF_ID)
+        if self.EMSX_BOOKNAME is not None:
+            request.set(EMSX_BOOKNAME, self.EMSX_BOOKNAME)
+        if self.EMSX_MIFID_II_INSTRUCTION is not None:
+            request.set(EMSX_MIFID_II_INSTRUCTION, self.EMSX_MIFID_II_INSTRUCTION)
+        if self.EMSX_GPI is not None:
+            request.set(EMSX_GPI, self.EMSX_GPI)
+        if self.EMSX_AS_OF_DATE is not None:
+            request.set(EMSX_AS_OF_DATE, self.EMSX_AS_OF_DATE)
+        if self.EMSX_AS_OF_TIME_MICROSEC is not None:
+            request.set(EMSX_AS_OF_TIME_MICROSEC, self.EMSX_AS_OF_TIME_MICROSEC)
+        if self.EMSX_TOMS_PXNUM is not None:
+            request.set(EMSX_TOMS_PXNUM, self.EMSX_TOMS_PXNUM)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class ModifyRouteExRequest(object):
+    """ ModifyRouteEx request (ModifyRouteRequestEx). """
+
+    OPERATION = "ModifyRouteEx"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", False, False),
+        ("EMSX_ROUTE_ID", "Int32", False, False),
+        ("EMSX_TICKER", "String", False, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_COMM_TYPE", "String", False, False),
+        ("EMSX_USER_COMM_RATE", "Float64", False, False),
+        ("EMSX_USER_FEES", "Float64", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_TRADER_NOTES", "String", False, False),
+        ("EMSX_LOC_BROKER", "String", False, False),
+        ("EMSX_LOC_ID", "String", False, False),
+        ("EMSX_LOC_REQ", "String", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_REQUEST_TYPE", "ModifyRequestType", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_ROUTE_ID",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_P_A",
+        "EMSX_COMM_TYPE",
+        "EMSX_USER_COMM_RATE",
+        "EMSX_USER_FEES",
+        "EMSX_ODD_LOT",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_TRADER_NOTES",
+        "EMSX_LOC_BROKER",
+        "EMSX_LOC_ID",
+        "EMSX_LOC_REQ",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_REQUEST_TYPE",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_ROUTE_ID=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_P_A=None,
+                 EMSX_COMM_TYPE=None,
+                 EMSX_USER_COMM_RATE=None,
+                 EMSX_USER_FEES=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_TRADER_NOTES=None,
+                 EMSX_LOC_BROKER=None,
+                 EMSX_LOC_ID=None,
+                 EMSX_LOC_REQ=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_REQUEST_TYPE=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_ROUTE_ID = EMSX_ROUTE_ID
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_COMM_TYPE = EMSX_COMM_TYPE
+        self.EMSX_USER_COMM_RATE = EMSX_USER_COMM_RATE
+        self.EMSX_USER_FEES = EMSX_USER_FEES
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_TRADER_NOTES = EMSX_TRADER_NOTES
+        self.EMSX_LOC_BROKER = EMSX_LOC_BROKER
+        self.EMSX_LOC_ID = EMSX_LOC_ID
+        self.EMSX_LOC_REQ = EMSX_LOC_REQ
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_REQUEST_TYPE = EMSX_REQUEST_TYPE
+
+    def errors(self):
+        errors = []
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_ROUTE_ID is not None:
+            request.set(EMSX_ROUTE_ID, self.EMSX_ROUTE_ID)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_COMM_TYPE is not None:
+            request.set(EMSX_COMM_TYPE, self.EMSX_COMM_TYPE)
+        if self.EMSX_USER_COMM_RATE is not None:
+            request.set(EMSX_USER_COMM_RATE, self.EMSX_USER_COMM_RATE)
+        if self.EMSX_USER_FEES is not None:
+            request.set(EMSX_USER_FEES, self.EMSX_USER_FEES)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_TRADER_NOTES is not None:
+            request.set(EMSX_TRADER_NOTES, self.EMSX_TRADER_NOTES)
+        if self.EMSX_LOC_BROKER is not None:
+            request.set(EMSX_LOC_BROKER, self.EMSX_LOC_BROKER)
+        if self.EMSX_LOC_ID is not None:
+            request.set(EMSX_LOC_ID, self.EMSX_LOC_ID)
+        if self.EMSX_LOC_REQ is not None:
+            request.set(EMSX_LOC_REQ, self.EMSX_LOC_REQ)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_REQUEST_TYPE is not None:
+            fillElement(request.getElement(EMSX_REQUEST_TYPE), self.EMSX_REQUEST_TYPE)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GroupRouteExRequest(object):
+    """ GroupRouteEx request (GroupRouteRequestEx). """
+
+    OPERATION = "GroupRouteEx"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("EMSX_TICKER", "String", False, False),
+        ("EMSX_AMOUNT_PERCENT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_REQUEST_TYPE", "RouteRequestType", False, False),
+        ("EMSX_ROUTE_REF_ID_PAIRS", "RouteRefIDs", False, True),
+        ("EMSX_BOOKNAME", "String", False, False),
+        ("EMSX_MIFID_II_INSTRUCTION", "MifidTradingInsructionEnum", False, False),
+        ("EMSX_GPI", "String", False, False),
+        ("EMSX_AS_OF_DATE", "Int32", False, False),
+        ("EMSX_AS_OF_TIME_MICROSEC", "Float64", False, False),
+        ("EMSX_TOMS_PXNUM", "Int32", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT_PERCENT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_P_A",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_REQUEST_TYPE",
+        "EMSX_ROUTE_REF_ID_PAIRS",
+        "EMSX_BOOKNAME",
+        "EMSX_MIFID_II_INSTRUCTION",
+        "EMSX_GPI",
+        "EMSX_AS_OF_DATE",
+        "EMSX_AS_OF_TIME_MICROSEC",
+        "EMSX_TOMS_PXNUM",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT_PERCENT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_BROKER=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_P_A=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_REQUEST_TYPE=None,
+                 EMSX_ROUTE_REF_ID_PAIRS=None,
+                 EMSX_BOOKNAME=None,
+                 EMSX_MIFID_II_INSTRUCTION=None,
+                 EMSX_GPI=None,
+                 EMSX_AS_OF_DATE=None,
+                 EMSX_AS_OF_TIME_MICROSEC=None,
+                 EMSX_TOMS_PXNUM=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT_PERCENT = EMSX_AMOUNT_PERCENT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_REQUEST_TYPE = EMSX_REQUEST_TYPE
+        self.EMSX_ROUTE_REF_ID_PAIRS = EMSX_ROUTE_REF_ID_PAIRS
+        self.EMSX_BOOKNAME = EMSX_BOOKNAME
+        self.EMSX_MIFID_II_INSTRUCTION = EMSX_MIFID_II_INSTRUCTION
+        self.EMSX_GPI = EMSX_GPI
+        self.EMSX_AS_OF_DATE = EMSX_AS_OF_DATE
+        self.EMSX_AS_OF_TIME_MICROSEC = EMSX_AS_OF_TIME_MICROSEC
+        self.EMSX_TOMS_PXNUM = EMSX_TOMS_PXNUM
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.EMSX_AMOUNT_PERCENT is None:
+            errors.append("EMSX_AMOUNT_PERCENT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        if self.EMSX_ROUTE_REF_ID_PAIRS is not None and not isinstance(self.EMSX_ROUTE_REF_ID_PAIRS, (list, tuple)):
+            errors.append("EMSX_ROUTE_REF_ID_PAIRS must be a list")
+        if self.EMSX_MIFID_II_INSTRUCTION is not None and self.EMSX_MIFID_II_INSTRUCTION not in MIFID_TRADING_INSRUCTION_ENUM:
+            errors.append("%s is not a valid EMSX_MIFID_II_INSTRUCTION" % (self.EMSX_MIFID_II_INSTRUCTION,))
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT_PERCENT is not None:
+            request.set(EMSX_AMOUNT_PERCENT, self.EMSX_AMOUNT_PERCENT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_REQUEST_TYPE is not None:
+            fillElement(request.getElement(EMSX_REQUEST_TYPE), self.EMSX_REQUEST_TYPE)
+        if self.EMSX_ROUTE_REF_ID_PAIRS is not None:
+            fillElement(request.getElement(EMSX_ROUTE_REF_ID_PAIRS), self.EMSX_ROUTE_REF_ID_PAIRS)
+        if self.EMSX_BOOKNAME is not None:
+            request.set(EMSX_BOOKNAME, self.EMSX_BOOKNAME)
+        if self.EMSX_MIFID_II_INSTRUCTION is not None:
+            request.set(EMSX_MIFID_II_INSTRUCTION, self.EMSX_MIFID_II_INSTRUCTION)
+        if self.EMSX_GPI is not None:
+            request.set(EMSX_GPI, self.EMSX_GPI)
+        if self.EMSX_AS_OF_DATE is not None:
+            request.set(EMSX_AS_OF_DATE, self.EMSX_AS_OF_DATE)
+        if self.EMSX_AS_OF_TIME_MICROSEC is not None:
+            request.set(EMSX_AS_OF_TIME_MICROSEC, self.EMSX_AS_OF_TIME_MICROSEC)
+        if self.EMSX_TOMS_PXNUM is not None:
+            request.set(EMSX_TOMS_PXNUM, self.EMSX_TOMS_PXNUM)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CreateOrderAndRouteExRequest(object):
+    """ CreateOrderAndRouteEx request (CreateOrderAndRouteRequestEx). """
+
+    OPERATION = "CreateOrderAndRouteEx"
+    FIELDS = (
+        ("EMSX_SIDE", "SideEnum", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_BROKER", "String", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_SETTLE_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_EXCHANGE_DESTINATION", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_ORDER_ORIGIN", "String", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("EMSX_ORDER_REF_ID", "String", False, False),
+        ("EMSX_INVESTOR_ID", "String", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_CUSTOM_NOTE1", "String", False, False),
+        ("EMSX_CUSTOM_NOTE2", "String", False, False),
+        ("EMSX_CUSTOM_NOTE3", "String", False, False),
+        ("EMSX_CUSTOM_NOTE4", "String", False, False),
+        ("EMSX_CUSTOM_NOTE5", "String", False, False),
+        ("EMSX_SETTLE_TYPE", "SettleTypeEnum", False, False),
+        ("EMSX_SETTLE_CURRENCY", "String", False, False),
+        ("EMSX_ROUTE_REF_ID", "String", False, False),
+        ("EMSX_BOOKNAME", "String", False, False),
+        ("EMSX_BUYSIDE_LEI", "String", False, False),
+        ("EMSX_CLIENT_IDENTIFICATION", "MifidClientIdentification", False, False),
+        ("EMSX_SI", "MifidIsSi", False, False),
+        ("EMSX_MIFID_II_INSTRUCTION", "MifidTradingInsructionEnum", False, False),
+        ("EMSX_GPI", "String", False, False),
+        ("EMSX_AS_OF_DATE", "Int32", False, False),
+        ("EMSX_AS_OF_TIME_MICROSEC", "Float64", False, False),
+        ("EMSX_TOMS_PXNUM", "Int32", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SIDE",
+        "EMSX_AMOUNT",
+        "EMSX_TICKER",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_BROKER",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_GTD_DATE",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_SETTLE_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_P_A",
+        "EMSX_EXCHANGE_DESTINATION",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_ORDER_ORIGIN",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_STRATEGY_PARAMS",
+        "EMSX_ORDER_REF_ID",
+        "EMSX_INVESTOR_ID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_CUSTOM_NOTE1",
+        "EMSX_CUSTOM_NOTE2",
+        "EMSX_CUSTOM_NOTE3",
+        "EMSX_CUSTOM_NOTE4",
+        "EMSX_CUSTOM_NOTE5",
+        "EMSX_SETTLE_TYPE",
+        "EMSX_SETTLE_CURRENCY",
+        "EMSX_ROUTE_REF_ID",
+        "EMSX_BOOKNAME",
+        "EMSX_BUYSIDE_LEI",
+        "EMSX_CLIENT_IDENTIFICATION",
+        "EMSX_SI",
+        "EMSX_MIFID_II_INSTRUCTION",
+        "EMSX_GPI",
+        "EMSX_AS_OF_DATE",
+        "EMSX_AS_OF_TIME_MICROSEC",
+        "EMSX_TOMS_PXNUM",
+    )
+
+    def __init__(self,
+                 EMSX_SIDE=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_TICKER=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_BROKER=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_SETTLE_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_P_A=None,
+                 EMSX_EXCHANGE_DESTINATION=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_ORDER_ORIGIN=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 EMSX_ORDER_REF_ID=None,
+                 EMSX_INVESTOR_ID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_CUSTOM_NOTE1=None,
+                 EMSX_CUSTOM_NOTE2=None,
+                 EMSX_CUSTOM_NOTE3=None,
+                 EMSX_CUSTOM_NOTE4=None,
+                 EMSX_CUSTOM_NOTE5=None,
+                 EMSX_SETTLE_TYPE=None,
+                 EMSX_SETTLE_CURRENCY=None,
+                 EMSX_ROUTE_REF_ID=None,
+                 EMSX_BOOKNAME=None,
+                 EMSX_BUYSIDE_LEI=None,
+                 EMSX_CLIENT_IDENTIFICATION=None,
+                 EMSX_SI=None,
+                 EMSX_MIFID_II_INSTRUCTION=None,
+                 EMSX_GPI=None,
+                 EMSX_AS_OF_DATE=None,
+                 EMSX_AS_OF_TIME_MICROSEC=None,
+                 EMSX_TOMS_PXNUM=None):
+        self.EMSX_SIDE = EMSX_SIDE
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_SETTLE_DATE = EMSX_SETTLE_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_EXCHANGE_DESTINATION = EMSX_EXCHANGE_DESTINATION
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_ORDER_ORIGIN = EMSX_ORDER_ORIGIN
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.EMSX_ORDER_REF_ID = EMSX_ORDER_REF_ID
+        self.EMSX_INVESTOR_ID = EMSX_INVESTOR_ID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_CUSTOM_NOTE1 = EMSX_CUSTOM_NOTE1
+        self.EMSX_CUSTOM_NOTE2 = EMSX_CUSTOM_NOTE2
+        self.EMSX_CUSTOM_NOTE3 = EMSX_CUSTOM_NOTE3
+        self.EMSX_CUSTOM_NOTE4 = EMSX_CUSTOM_NOTE4
+        self.EMSX_CUSTOM_NOTE5 = EMSX_CUSTOM_NOTE5
+        self.EMSX_SETTLE_TYPE = EMSX_SETTLE_TYPE
+        self.EMSX_SETTLE_CURRENCY = EMSX_SETTLE_CURRENCY
+        self.EMSX_ROUTE_REF_ID = EMSX_ROUTE_REF_ID
+        self.EMSX_BOOKNAME = EMSX_BOOKNAME
+        self.EMSX_BUYSIDE_LEI = EMSX_BUYSIDE_LEI
+        self.EMSX_CLIENT_IDENTIFICATION = EMSX_CLIENT_IDENTIFICATION
+        self.EMSX_SI = EMSX_SI
+        self.EMSX_MIFID_II_INSTRUCTION = EMSX_MIFID_II_INSTRUCTION
+        self.EMSX_GPI = EMSX_GPI
+        self.EMSX_AS_OF_DATE = EMSX_AS_OF_DATE
+        self.EMSX_AS_OF_TIME_MICROSEC = EMSX_AS_OF_TIME_MICROSEC
+        self.EMSX_TOMS_PXNUM = EMSX_TOMS_PXNUM
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SIDE is None:
+            errors.append("EMSX_SIDE is required")
+        if self.EMSX_SIDE is not None and self.EMSX_SIDE not in SIDE_ENUM:
+            errors.append("%s is not a valid EMSX_SIDE" % (self.EMSX_SIDE,))
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        if self.EMSX_SETTLE_TYPE is not None and self.EMSX_SETTLE_TYPE not in SETTLE_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_SETTLE_TYPE" % (self.EMSX_SETTLE_TYPE,))
+        if self.EMSX_CLIENT_IDENTIFICATION is not None and self.EMSX_CLIENT_IDENTIFICATION not in MIFID_CLIENT_IDENTIFICATION:
+            errors.append("%s is not a valid EMSX_CLIENT_IDENTIFICATION" % (self.EMSX_CLIENT_IDENTIFICATION,))
+        if self.EMSX_SI is not None and self.EMSX_SI not in MIFID_IS_SI:
+            errors.append("%s is not a valid EMSX_SI" % (self.EMSX_SI,))
+        if self.EMSX_MIFID_II_INSTRUCTION is not None and self.EMSX_MIFID_II_INSTRUCTION not in MIFID_TRADING_INSRUCTION_ENUM:
+            errors.append("%s is not a valid EMSX_MIFID_II_INSTRUCTION" % (self.EMSX_MIFID_II_INSTRUCTION,))
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SIDE is not None:
+            request.set(EMSX_SIDE, self.EMSX_SIDE)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_SETTLE_DATE is not None:
+            request.set(EMSX_SETTLE_DATE, self.EMSX_SETTLE_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_EXCHANGE_DESTINATION is not None:
+            request.set(EMSX_EXCHANGE_DESTINATION, self.EMSX_EXCHANGE_DESTINATION)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_ORDER_ORIGIN is not None:
+            request.set(EMSX_ORDER_ORIGIN, self.EMSX_ORDER_ORIGIN)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.EMSX_ORDER_REF_ID is not None:
+            request.set(EMSX_ORDER_REF_ID, self.EMSX_ORDER_REF_ID)
+        if self.EMSX_INVESTOR_ID is not None:
+            request.set(EMSX_INVESTOR_ID, self.EMSX_INVESTOR_ID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_CUSTOM_NOTE1 is not None:
+            request.set(EMSX_CUSTOM_NOTE1, self.EMSX_CUSTOM_NOTE1)
+        if self.EMSX_CUSTOM_NOTE2 is not None:
+            request.set(EMSX_CUSTOM_NOTE2, self.EMSX_CUSTOM_NOTE2)
+        if self.EMSX_CUSTOM_NOTE3 is not None:
+            request.set(EMSX_CUSTOM_NOTE3, self.EMSX_CUSTOM_NOTE3)
+        if self.EMSX_CUSTOM_NOTE4 is not None:
+            request.set(EMSX_CUSTOM_NOTE4, self.EMSX_CUSTOM_NOTE4)
+        if self.EMSX_CUSTOM_NOTE5 is not None:
+            request.set(EMSX_CUSTOM_NOTE5, self.EMSX_CUSTOM_NOTE5)
+        if self.EMSX_SETTLE_TYPE is not None:
+            request.set(EMSX_SETTLE_TYPE, self.EMSX_SETTLE_TYPE)
+        if self.EMSX_SETTLE_CURRENCY is not None:
+            request.set(EMSX_SETTLE_CURRENCY, self.EMSX_SETTLE_CURRENCY)
+        if self.EMSX_ROUTE_REF_ID is not None:
+            request.set(EMSX_ROUTE_REF_ID, self.EMSX_ROUTE_REF_ID)
+        if self.EMSX_BOOKNAME is not None:
+            request.set(EMSX_BOOKNAME, self.EMSX_BOOKNAME)
+        if self.EMSX_BUYSIDE_LEI is not None:
+            request.set(EMSX_BUYSIDE_LEI, self.EMSX_BUYSIDE_LEI)
+        if self.EMSX_CLIENT_IDENTIFICATION is not None:
+            request.set(EMSX_CLIENT_IDENTIFICATION, self.EMSX_CLIENT_IDENTIFICATION)
+        if self.EMSX_SI is not None:
+            request.set(EMSX_SI, self.EMSX_SI)
+        if self.EMSX_MIFID_II_INSTRUCTION is not None:
+            request.set(EMSX_MIFID_II_INSTRUCTION, self.EMSX_MIFID_II_INSTRUCTION)
+        if self.EMSX_GPI is not None:
+            request.set(EMSX_GPI, self.EMSX_GPI)
+        if self.EMSX_AS_OF_DATE is not None:
+            request.set(EMSX_AS_OF_DATE, self.EMSX_AS_OF_DATE)
+        if self.EMSX_AS_OF_TIME_MICROSEC is not None:
+            request.set(EMSX_AS_OF_TIME_MICROSEC, self.EMSX_AS_OF_TIME_MICROSEC)
+        if self.EMSX_TOMS_PXNUM is not None:
+            request.set(EMSX_TOMS_PXNUM, self.EMSX_TOMS_PXNUM)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class RouteManuallyExRequest(object):
+    """ RouteManuallyEx request (RouteOrderRequestEx). """
+
+    OPERATION = "RouteManuallyEx"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_BROKER", "String", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", True, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_P_A", "String", False, False),
+        ("EMSX_ODD_LOT", "Int32", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_RELEASE_TIME", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("EMSX_CLEARING_ACCOUNT", "String", False, False),
+        ("EMSX_CLEARING_FIRM", "String", False, False),
+        ("EMSX_STRATEGY_PARAMS", "Strategy", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_LOCATE_REQ", "String", False, False),
+        ("EMSX_LOCATE_BROKER", "String", False, False),
+        ("EMSX_LOCATE_ID", "String", False, False),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_ROUTE_REF_ID", "String", False, False),
+        ("EMSX_BOOKNAME", "String", False, False),
+        ("EMSX_MIFID_II_INSTRUCTION", "MifidTradingInsructionEnum", False, False),
+        ("EMSX_GPI", "String", False, False),
+        ("EMSX_AS_OF_DATE", "Int32", False, False),
+        ("EMSX_AS_OF_TIME_MICROSEC", "Float64", False, False),
+        ("EMSX_TOMS_PXNUM", "Int32", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_P_A",
+        "EMSX_ODD_LOT",
+        "EMSX_CFD_FLAG",
+        "EMSX_RELEASE_TIME",
+        "EMSX_GET_WARNINGS",
+        "EMSX_CLEARING_ACCOUNT",
+        "EMSX_CLEARING_FIRM",
+        "EMSX_STRATEGY_PARAMS",
+        "REQUEST_EXT",
+        "EMSX_LOCATE_REQ",
+        "EMSX_LOCATE_BROKER",
+        "EMSX_LOCATE_ID",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_ROUTE_REF_ID",
+        "EMSX_BOOKNAME",
+        "EMSX_MIFID_II_INSTRUCTION",
+        "EMSX_GPI",
+        "EMSX_AS_OF_DATE",
+        "EMSX_AS_OF_TIME_MICROSEC",
+        "EMSX_TOMS_PXNUM",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_BROKER=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_P_A=None,
+                 EMSX_ODD_LOT=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_RELEASE_TIME=None,
+                 EMSX_GET_WARNINGS=None,
+                 EMSX_CLEARING_ACCOUNT=None,
+                 EMSX_CLEARING_FIRM=None,
+                 EMSX_STRATEGY_PARAMS=None,
+                 REQUEST_EXT=None,
+                 EMSX_LOCATE_REQ=None,
+                 EMSX_LOCATE_BROKER=None,
+                 EMSX_LOCATE_ID=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_ROUTE_REF_ID=None,
+                 EMSX_BOOKNAME=None,
+                 EMSX_MIFID_II_INSTRUCTION=None,
+                 EMSX_GPI=None,
+                 EMSX_AS_OF_DATE=None,
+                 EMSX_AS_OF_TIME_MICROSEC=None,
+                 EMSX_TOMS_PXNUM=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_BROKER = EMSX_BROKER
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_P_A = EMSX_P_A
+        self.EMSX_ODD_LOT = EMSX_ODD_LOT
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_RELEASE_TIME = EMSX_RELEASE_TIME
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.EMSX_CLEARING_ACCOUNT = EMSX_CLEARING_ACCOUNT
+        self.EMSX_CLEARING_FIRM = EMSX_CLEARING_FIRM
+        self.EMSX_STRATEGY_PARAMS = EMSX_STRATEGY_PARAMS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_LOCATE_REQ = EMSX_LOCATE_REQ
+        self.EMSX_LOCATE_BROKER = EMSX_LOCATE_BROKER
+        self.EMSX_LOCATE_ID = EMSX_LOCATE_ID
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_ROUTE_REF_ID = EMSX_ROUTE_REF_ID
+        self.EMSX_BOOKNAME = EMSX_BOOKNAME
+        self.EMSX_MIFID_II_INSTRUCTION = EMSX_MIFID_II_INSTRUCTION
+        self.EMSX_GPI = EMSX_GPI
+        self.EMSX_AS_OF_DATE = EMSX_AS_OF_DATE
+        self.EMSX_AS_OF_TIME_MICROSEC = EMSX_AS_OF_TIME_MICROSEC
+        self.EMSX_TOMS_PXNUM = EMSX_TOMS_PXNUM
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.EMSX_BROKER is None:
+            errors.append("EMSX_BROKER is required")
+        if self.EMSX_HAND_INSTRUCTION is None:
+            errors.append("EMSX_HAND_INSTRUCTION is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        if self.EMSX_MIFID_II_INSTRUCTION is not None and self.EMSX_MIFID_II_INSTRUCTION not in MIFID_TRADING_INSRUCTION_ENUM:
+            errors.append("%s is not a valid EMSX_MIFID_II_INSTRUCTION" % (self.EMSX_MIFID_II_INSTRUCTION,))
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_BROKER is not None:
+            request.set(EMSX_BROKER, self.EMSX_BROKER)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_P_A is not None:
+            request.set(EMSX_P_A, self.EMSX_P_A)
+        if self.EMSX_ODD_LOT is not None:
+            request.set(EMSX_ODD_LOT, self.EMSX_ODD_LOT)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_RELEASE_TIME is not None:
+            request.set(EMSX_RELEASE_TIME, self.EMSX_RELEASE_TIME)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.EMSX_CLEARING_ACCOUNT is not None:
+            request.set(EMSX_CLEARING_ACCOUNT, self.EMSX_CLEARING_ACCOUNT)
+        if self.EMSX_CLEARING_FIRM is not None:
+            request.set(EMSX_CLEARING_FIRM, self.EMSX_CLEARING_FIRM)
+        if self.EMSX_STRATEGY_PARAMS is not None:
+            fillElement(request.getElement(EMSX_STRATEGY_PARAMS), self.EMSX_STRATEGY_PARAMS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_LOCATE_REQ is not None:
+            request.set(EMSX_LOCATE_REQ, self.EMSX_LOCATE_REQ)
+        if self.EMSX_LOCATE_BROKER is not None:
+            request.set(EMSX_LOCATE_BROKER, self.EMSX_LOCATE_BROKER)
+        if self.EMSX_LOCATE_ID is not None:
+            request.set(EMSX_LOCATE_ID, self.EMSX_LOCATE_ID)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_ROUTE_REF_ID is not None:
+            request.set(EMSX_ROUTE_REF_ID, self.EMSX_ROUTE_REF_ID)
+        if self.EMSX_BOOKNAME is not None:
+            request.set(EMSX_BOOKNAME, self.EMSX_BOOKNAME)
+        if self.EMSX_MIFID_II_INSTRUCTION is not None:
+            request.set(EMSX_MIFID_II_INSTRUCTION, self.EMSX_MIFID_II_INSTRUCTION)
+        if self.EMSX_GPI is not None:
+            request.set(EMSX_GPI, self.EMSX_GPI)
+        if self.EMSX_AS_OF_DATE is not None:
+            request.set(EMSX_AS_OF_DATE, self.EMSX_AS_OF_DATE)
+        if self.EMSX_AS_OF_TIME_MICROSEC is not None:
+            request.set(EMSX_AS_OF_TIME_MICROSEC, self.EMSX_AS_OF_TIME_MICROSEC)
+        if self.EMSX_TOMS_PXNUM is not None:
+            request.set(EMSX_TOMS_PXNUM, self.EMSX_TOMS_PXNUM)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class AssignTraderRequest(object):
+    """ AssignTrader request (AssignTraderRequest). """
+
+    OPERATION = "AssignTrader"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("EMSX_ASSIGNEE_TRADER_UUID", "Int32", True, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_TRADE_DESK", "String", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_ASSIGNEE_TRADER_UUID",
+        "REQUEST_EXT",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_TRADE_DESK",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_ASSIGNEE_TRADER_UUID=None,
+                 REQUEST_EXT=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_TRADE_DESK=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_ASSIGNEE_TRADER_UUID = EMSX_ASSIGNEE_TRADER_UUID
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_TRADE_DESK = EMSX_TRADE_DESK
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.EMSX_ASSIGNEE_TRADER_UUID is None:
+            errors.append("EMSX_ASSIGNEE_TRADER_UUID is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.EMSX_ASSIGNEE_TRADER_UUID is not None:
+            request.set(EMSX_ASSIGNEE_TRADER_UUID, self.EMSX_ASSIGNEE_TRADER_UUID)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_TRADE_DESK is not None:
+            request.set(EMSX_TRADE_DESK, self.EMSX_TRADE_DESK)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class SellSideAckRequest(object):
+    """ SellSideAck request (SellSideAckRequest). """
+
+    OPERATION = "SellSideAck"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "REQUEST_EXT",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 REQUEST_EXT=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class SellSideRejectRequest(object):
+    """ SellSideReject request (SellSideRejectRequest). """
+
+    OPERATION = "SellSideReject"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "REQUEST_EXT",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 REQUEST_EXT=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CancelOrderExRequest(object):
+    """ CancelOrderEx request (CancelOrderRequestEx). """
+
+    OPERATION = "CancelOrderEx"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "REQUEST_EXT",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 REQUEST_EXT=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class ModifyOrderExRequest(object):
+    """ ModifyOrderEx request (ModifyOrderRequestEx). """
+
+    OPERATION = "ModifyOrderEx"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, False),
+        ("EMSX_TICKER", "String", True, False),
+        ("EMSX_AMOUNT", "Int32", True, False),
+        ("EMSX_ORDER_TYPE", "OrderTypeEnum", True, False),
+        ("EMSX_TIF", "TifEnum", True, False),
+        ("EMSX_HAND_INSTRUCTION", "String", False, False),
+        ("EMSX_LIMIT_PRICE", "Float64", False, False),
+        ("EMSX_GTD_DATE", "Int32", False, False),
+        ("EMSX_STOP_PRICE", "Float64", False, False),
+        ("EMSX_ACCOUNT", "String", False, False),
+        ("EMSX_NOTES", "String", False, False),
+        ("EMSX_EXEC_INSTRUCTION", "String", False, False),
+        ("EMSX_CFD_FLAG", "Int32", False, False),
+        ("EMSX_GET_WARNINGS", "Int32", False, False),
+        ("REQUEST_EXT", "String", False, True),
+        ("EMSX_TRADER_UUID", "Int32", False, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("EMSX_INVESTOR_ID", "String", False, False),
+        ("EMSX_BUYSIDE_LEI", "String", False, False),
+        ("EMSX_CLIENT_IDENTIFICATION", "MifidClientIdentification", False, False),
+        ("EMSX_SI", "MifidIsSi", False, False),
+        ("EMSX_MIFID_II_INSTRUCTION", "MifidTradingInsructionEnum", False, False),
+        ("EMSX_GPI", "String", False, False),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_TICKER",
+        "EMSX_AMOUNT",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_GTD_DATE",
+        "EMSX_STOP_PRICE",
+        "EMSX_ACCOUNT",
+        "EMSX_NOTES",
+        "EMSX_EXEC_INSTRUCTION",
+        "EMSX_CFD_FLAG",
+        "EMSX_GET_WARNINGS",
+        "REQUEST_EXT",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+        "EMSX_INVESTOR_ID",
+        "EMSX_BUYSIDE_LEI",
+        "EMSX_CLIENT_IDENTIFICATION",
+        "EMSX_SI",
+        "EMSX_MIFID_II_INSTRUCTION",
+        "EMSX_GPI",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_TICKER=None,
+                 EMSX_AMOUNT=None,
+                 EMSX_ORDER_TYPE=None,
+                 EMSX_TIF=None,
+                 EMSX_HAND_INSTRUCTION=None,
+                 EMSX_LIMIT_PRICE=None,
+                 EMSX_GTD_DATE=None,
+                 EMSX_STOP_PRICE=None,
+                 EMSX_ACCOUNT=None,
+                 EMSX_NOTES=None,
+                 EMSX_EXEC_INSTRUCTION=None,
+                 EMSX_CFD_FLAG=None,
+                 EMSX_GET_WARNINGS=None,
+                 REQUEST_EXT=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 EMSX_INVESTOR_ID=None,
+                 EMSX_BUYSIDE_LEI=None,
+                 EMSX_CLIENT_IDENTIFICATION=None,
+                 EMSX_SI=None,
+                 EMSX_MIFID_II_INSTRUCTION=None,
+                 EMSX_GPI=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_TICKER = EMSX_TICKER
+        self.EMSX_AMOUNT = EMSX_AMOUNT
+        self.EMSX_ORDER_TYPE = EMSX_ORDER_TYPE
+        self.EMSX_TIF = EMSX_TIF
+        self.EMSX_HAND_INSTRUCTION = EMSX_HAND_INSTRUCTION
+        self.EMSX_LIMIT_PRICE = EMSX_LIMIT_PRICE
+        self.EMSX_GTD_DATE = EMSX_GTD_DATE
+        self.EMSX_STOP_PRICE = EMSX_STOP_PRICE
+        self.EMSX_ACCOUNT = EMSX_ACCOUNT
+        self.EMSX_NOTES = EMSX_NOTES
+        self.EMSX_EXEC_INSTRUCTION = EMSX_EXEC_INSTRUCTION
+        self.EMSX_CFD_FLAG = EMSX_CFD_FLAG
+        self.EMSX_GET_WARNINGS = EMSX_GET_WARNINGS
+        self.REQUEST_EXT = REQUEST_EXT
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.EMSX_INVESTOR_ID = EMSX_INVESTOR_ID
+        self.EMSX_BUYSIDE_LEI = EMSX_BUYSIDE_LEI
+        self.EMSX_CLIENT_IDENTIFICATION = EMSX_CLIENT_IDENTIFICATION
+        self.EMSX_SI = EMSX_SI
+        self.EMSX_MIFID_II_INSTRUCTION = EMSX_MIFID_II_INSTRUCTION
+        self.EMSX_GPI = EMSX_GPI
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_TICKER is None:
+            errors.append("EMSX_TICKER is required")
+        if self.EMSX_AMOUNT is None:
+            errors.append("EMSX_AMOUNT is required")
+        if self.EMSX_ORDER_TYPE is None:
+            errors.append("EMSX_ORDER_TYPE is required")
+        if self.EMSX_ORDER_TYPE is not None and self.EMSX_ORDER_TYPE not in ORDER_TYPE_ENUM:
+            errors.append("%s is not a valid EMSX_ORDER_TYPE" % (self.EMSX_ORDER_TYPE,))
+        if self.EMSX_TIF is None:
+            errors.append("EMSX_TIF is required")
+        if self.EMSX_TIF is not None and self.EMSX_TIF not in TIF_ENUM:
+            errors.append("%s is not a valid EMSX_TIF" % (self.EMSX_TIF,))
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        if self.EMSX_CLIENT_IDENTIFICATION is not None and self.EMSX_CLIENT_IDENTIFICATION not in MIFID_CLIENT_IDENTIFICATION:
+            errors.append("%s is not a valid EMSX_CLIENT_IDENTIFICATION" % (self.EMSX_CLIENT_IDENTIFICATION,))
+        if self.EMSX_SI is not None and self.EMSX_SI not in MIFID_IS_SI:
+            errors.append("%s is not a valid EMSX_SI" % (self.EMSX_SI,))
+        if self.EMSX_MIFID_II_INSTRUCTION is not None and self.EMSX_MIFID_II_INSTRUCTION not in MIFID_TRADING_INSRUCTION_ENUM:
+            errors.append("%s is not a valid EMSX_MIFID_II_INSTRUCTION" % (self.EMSX_MIFID_II_INSTRUCTION,))
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            request.set(EMSX_SEQUENCE, self.EMSX_SEQUENCE)
+        if self.EMSX_TICKER is not None:
+            request.set(EMSX_TICKER, self.EMSX_TICKER)
+        if self.EMSX_AMOUNT is not None:
+            request.set(EMSX_AMOUNT, self.EMSX_AMOUNT)
+        if self.EMSX_ORDER_TYPE is not None:
+            request.set(EMSX_ORDER_TYPE, self.EMSX_ORDER_TYPE)
+        if self.EMSX_TIF is not None:
+            request.set(EMSX_TIF, self.EMSX_TIF)
+        if self.EMSX_HAND_INSTRUCTION is not None:
+            request.set(EMSX_HAND_INSTRUCTION, self.EMSX_HAND_INSTRUCTION)
+        if self.EMSX_LIMIT_PRICE is not None:
+            request.set(EMSX_LIMIT_PRICE, self.EMSX_LIMIT_PRICE)
+        if self.EMSX_GTD_DATE is not None:
+            request.set(EMSX_GTD_DATE, self.EMSX_GTD_DATE)
+        if self.EMSX_STOP_PRICE is not None:
+            request.set(EMSX_STOP_PRICE, self.EMSX_STOP_PRICE)
+        if self.EMSX_ACCOUNT is not None:
+            request.set(EMSX_ACCOUNT, self.EMSX_ACCOUNT)
+        if self.EMSX_NOTES is not None:
+            request.set(EMSX_NOTES, self.EMSX_NOTES)
+        if self.EMSX_EXEC_INSTRUCTION is not None:
+            request.set(EMSX_EXEC_INSTRUCTION, self.EMSX_EXEC_INSTRUCTION)
+        if self.EMSX_CFD_FLAG is not None:
+            request.set(EMSX_CFD_FLAG, self.EMSX_CFD_FLAG)
+        if self.EMSX_GET_WARNINGS is not None:
+            request.set(EMSX_GET_WARNINGS, self.EMSX_GET_WARNINGS)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.EMSX_INVESTOR_ID is not None:
+            request.set(EMSX_INVESTOR_ID, self.EMSX_INVESTOR_ID)
+        if self.EMSX_BUYSIDE_LEI is not None:
+            request.set(EMSX_BUYSIDE_LEI, self.EMSX_BUYSIDE_LEI)
+        if self.EMSX_CLIENT_IDENTIFICATION is not None:
+            request.set(EMSX_CLIENT_IDENTIFICATION, self.EMSX_CLIENT_IDENTIFICATION)
+        if self.EMSX_SI is not None:
+            request.set(EMSX_SI, self.EMSX_SI)
+        if self.EMSX_MIFID_II_INSTRUCTION is not None:
+            request.set(EMSX_MIFID_II_INSTRUCTION, self.EMSX_MIFID_II_INSTRUCTION)
+        if self.EMSX_GPI is not None:
+            request.set(EMSX_GPI, self.EMSX_GPI)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class ManualFillRequest(object):
+    """ ManualFill request (ManualFillRequest). """
+
+    OPERATION = "ManualFill"
+    FIELDS = (
+        ("ROUTE_TO_FILL", "TranInfo", True, False),
+        ("FILLS", "ManualFillDetails", False, True),
+        ("EMSX_TRADER_UUID", "Int32", True, False),
+        ("EMSX_REQUEST_SEQ", "Int64", False, False),
+        ("REQUEST_EXT", "String", False, True),
+    )
+
+    __slots__ = (
+        "ROUTE_TO_FILL",
+        "FILLS",
+        "EMSX_TRADER_UUID",
+        "EMSX_REQUEST_SEQ",
+        "REQUEST_EXT",
+    )
+
+    def __init__(self,
+                 ROUTE_TO_FILL=None,
+                 FILLS=None,
+                 EMSX_TRADER_UUID=None,
+                 EMSX_REQUEST_SEQ=None,
+                 REQUEST_EXT=None):
+        self.ROUTE_TO_FILL = ROUTE_TO_FILL
+        self.FILLS = FILLS
+        self.EMSX_TRADER_UUID = EMSX_TRADER_UUID
+        self.EMSX_REQUEST_SEQ = EMSX_REQUEST_SEQ
+        self.REQUEST_EXT = REQUEST_EXT
+
+    def errors(self):
+        errors = []
+        if self.ROUTE_TO_FILL is None:
+            errors.append("ROUTE_TO_FILL is required")
+        if self.FILLS is not None and not isinstance(self.FILLS, (list, tuple)):
+            errors.append("FILLS must be a list")
+        if self.EMSX_TRADER_UUID is None:
+            errors.append("EMSX_TRADER_UUID is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.ROUTE_TO_FILL is not None:
+            fillElement(request.getElement(ROUTE_TO_FILL), self.ROUTE_TO_FILL)
+        if self.FILLS is not None:
+            fillElement(request.getElement(FILLS), self.FILLS)
+        if self.EMSX_TRADER_UUID is not None:
+            request.set(EMSX_TRADER_UUID, self.EMSX_TRADER_UUID)
+        if self.EMSX_REQUEST_SEQ is not None:
+            request.set(EMSX_REQUEST_SEQ, self.EMSX_REQUEST_SEQ)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetTradersRequest(object):
+    """ GetTraders request (GetTradersRequest). """
+
+    OPERATION = "GetTraders"
+    FIELDS = (
+    )
+
+    __slots__ = ()
+
+    def errors(self):
+        errors = []
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        pass
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class GetTradeDesksRequest(object):
+    """ GetTradeDesks request (GetTradeDesksRequest). """
+
+    OPERATION = "GetTradeDesks"
+    FIELDS = (
+        ("Scope", "IdentityType", False, False),
+    )
+
+    __slots__ = ("Scope",)
+
+    def __init__(self,
+                 Scope=None):
+        self.Scope = Scope
+
+    def errors(self):
+        errors = []
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.Scope is not None:
+            fillElement(request.getElement(SCOPE), self.Scope)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class CreateBasketRequest(object):
+    """ CreateBasket request (CreateBasketRequest). """
+
+    OPERATION = "CreateBasket"
+    FIELDS = (
+        ("EMSX_SEQUENCE", "Int32", True, True),
+        ("EMSX_BASKET_NAME", "String", True, False),
+        ("REQUEST_EXT", "String", False, True),
+    )
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_BASKET_NAME",
+        "REQUEST_EXT",
+    )
+
+    def __init__(self,
+                 EMSX_SEQUENCE=None,
+                 EMSX_BASKET_NAME=None,
+                 REQUEST_EXT=None):
+        self.EMSX_SEQUENCE = EMSX_SEQUENCE
+        self.EMSX_BASKET_NAME = EMSX_BASKET_NAME
+        self.REQUEST_EXT = REQUEST_EXT
+
+    def errors(self):
+        errors = []
+        if self.EMSX_SEQUENCE is None:
+            errors.append("EMSX_SEQUENCE is required")
+        if self.EMSX_SEQUENCE is not None and not isinstance(self.EMSX_SEQUENCE, (list, tuple)):
+            errors.append("EMSX_SEQUENCE must be a list")
+        if self.EMSX_BASKET_NAME is None:
+            errors.append("EMSX_BASKET_NAME is required")
+        if self.REQUEST_EXT is not None and not isinstance(self.REQUEST_EXT, (list, tuple)):
+            errors.append("REQUEST_EXT must be a list")
+        return errors
+
+    def validate(self):
+        errors = self.errors()
+        if errors:
+            raise RequestValidationError(errors)
+
+    def fill(self, request):
+        if self.EMSX_SEQUENCE is not None:
+            fillElement(request.getElement(EMSX_SEQUENCE), self.EMSX_SEQUENCE)
+        if self.EMSX_BASKET_NAME is not None:
+            request.set(EMSX_BASKET_NAME, self.EMSX_BASKET_NAME)
+        if self.REQUEST_EXT is not None:
+            fillElement(request.getElement(REQUEST_EXT), self.REQUEST_EXT)
+
+    def create(self, service, validate=True):
+        # service is the blpapi.Service the request is created on.
+        if validate:
+            self.validate()
+        request = service.createRequest(self.OPERATION)
+        self.fill(request)
+        return request
+
+
+class OrderStaticData(object):
+    """ Decoded CreateOrder, ModifyOrder, ModifyOrderEx response. """
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "MESSAGE",
+    )
+
+    def __init__(self):
+        self.EMSX_SEQUENCE = None
+        self.MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = OrderStaticData()
+        if msg.hasElement(EMSX_SEQUENCE, True):
+            response.EMSX_SEQUENCE = msg.getElementAsInteger(EMSX_SEQUENCE)
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "OrderStaticData(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class ErrorInfoResponse(object):
+    """ Decoded ErrorInfo response. """
+
+    __slots__ = (
+        "ERROR_CODE",
+        "ERROR_MESSAGE",
+    )
+
+    def __init__(self):
+        self.ERROR_CODE = None
+        self.ERROR_MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = ErrorInfoResponse()
+        if msg.hasElement(ERROR_CODE, True):
+            response.ERROR_CODE = msg.getElementAsInteger(ERROR_CODE)
+        if msg.hasElement(ERROR_MESSAGE, True):
+            response.ERROR_MESSAGE = msg.getElementAsString(ERROR_MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "ErrorInfoResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class RouteStaticData(object):
+    """ Decoded CreateOrderAndRoute, CreateOrderAndRouteManually, Route, RouteManually, ModifyRoute, CreateOrderAndRouteWithStrat, RouteWithStrat, ModifyRouteWithStrat, ModifyRouteEx, CreateOrderAndRouteEx response. """
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "EMSX_ROUTE_ID",
+        "MESSAGE",
+    )
+
+    def __init__(self):
+        self.EMSX_SEQUENCE = None
+        self.EMSX_ROUTE_ID = None
+        self.MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = RouteStaticData()
+        if msg.hasElement(EMSX_SEQUENCE, True):
+            response.EMSX_SEQUENCE = msg.getElementAsInteger(EMSX_SEQUENCE)
+        if msg.hasElement(EMSX_ROUTE_ID, True):
+            response.EMSX_ROUTE_ID = msg.getElementAsInteger(EMSX_ROUTE_ID)
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "RouteStaticData(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class DeleteOrderResponse(object):
+    """ Decoded DeleteOrder response. """
+
+    __slots__ = (
+        "STATUS",
+        "MESSAGE",
+    )
+
+    def __init__(self):
+        self.STATUS = None
+        self.MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = DeleteOrderResponse()
+        if msg.hasElement(STATUS, True):
+            response.STATUS = msg.getElementAsInteger(STATUS)
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "DeleteOrderResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class OrderInfoResponse(object):
+    """ Decoded OrderInfo response. """
+
+    __slots__ = (
+        "EMSX_TICKER",
+        "EMSX_EXCHANGE",
+        "EMSX_SIDE",
+        "EMSX_POSITION",
+        "EMSX_PORT_MGR",
+        "EMSX_TRADER",
+        "EMSX_NOTES",
+        "EMSX_AMOUNT",
+        "EMSX_IDLE_AMOUNT",
+        "EMSX_WORKING",
+        "EMSX_FILLED",
+        "EMSX_TS_ORDNUM",
+        "EMSX_LIMIT_PRICE",
+        "EMSX_AVG_PRICE",
+        "EMSX_FLAG",
+        "EMSX_SUB_FLAG",
+        "EMSX_YELLOW_KEY",
+        "EMSX_BASKET_NAME",
+        "EMSX_ORDER_CREATE_DATE",
+        "EMSX_ORDER_CREATE_TIME",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_BROKER",
+        "EMSX_TRADER_UUID",
+        "EMSX_STEP_OUT_BROKER",
+    )
+
+    def __init__(self):
+        self.EMSX_TICKER = None
+        self.EMSX_EXCHANGE = None
+        self.EMSX_SIDE = None
+        self.EMSX_POSITION = None
+        self.EMSX_PORT_MGR = None
+        self.EMSX_TRADER = None
+        self.EMSX_NOTES = None
+        self.EMSX_AMOUNT = None
+        self.EMSX_IDLE_AMOUNT = None
+        self.EMSX_WORKING = None
+        self.EMSX_FILLED = None
+        self.EMSX_TS_ORDNUM = None
+        self.EMSX_LIMIT_PRICE = None
+        self.EMSX_AVG_PRICE = None
+        self.EMSX_FLAG = None
+        self.EMSX_SUB_FLAG = None
+        self.EMSX_YELLOW_KEY = None
+        self.EMSX_BASKET_NAME = None
+        self.EMSX_ORDER_CREATE_DATE = None
+        self.EMSX_ORDER_CREATE_TIME = None
+        self.EMSX_ORDER_TYPE = None
+        self.EMSX_TIF = None
+        self.EMSX_BROKER = None
+        self.EMSX_TRADER_UUID = None
+        self.EMSX_STEP_OUT_BROKER = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = OrderInfoResponse()
+        if msg.hasElement(EMSX_TICKER, True):
+            response.EMSX_TICKER = msg.getElementAsString(EMSX_TICKER)
+        if msg.hasElement(EMSX_EXCHANGE, True):
+            response.EMSX_EXCHANGE = msg.getElementAsString(EMSX_EXCHANGE)
+        if msg.hasElement(EMSX_SIDE, True):
+            response.EMSX_SIDE = msg.getElementAsString(EMSX_SIDE)
+        if msg.hasElement(EMSX_POSITION, True):
+            response.EMSX_POSITION = msg.getElementAsString(EMSX_POSITION)
+        if msg.hasElement(EMSX_PORT_MGR, True):
+            response.EMSX_PORT_MGR = msg.getElementAsString(EMSX_PORT_MGR)
+        if msg.hasElement(EMSX_TRADER, True):
+            response.EMSX_TRADER = msg.getElementAsString(EMSX_TRADER)
+        if msg.hasElement(EMSX_NOTES, True):
+            response.EMSX_NOTES = msg.getElementAsString(EMSX_NOTES)
+        if msg.hasElement(EMSX_AMOUNT, True):
+            response.EMSX_AMOUNT = msg.getElementAsInteger(EMSX_AMOUNT)
+        if msg.hasElement(EMSX_IDLE_AMOUNT, True):
+            response.EMSX_IDLE_AMOUNT = msg.getElementAsInteger(EMSX_IDLE_AMOUNT)
+        if msg.hasElement(EMSX_WORKING, True):
+            response.EMSX_WORKING = msg.getElementAsInteger(EMSX_WORKING)
+        if msg.hasElement(EMSX_FILLED, True):
+            response.EMSX_FILLED = msg.getElementAsInteger(EMSX_FILLED)
+        if msg.hasElement(EMSX_TS_ORDNUM, True):
+            response.EMSX_TS_ORDNUM = msg.getElementAsInteger(EMSX_TS_ORDNUM)
+        if msg.hasElement(EMSX_LIMIT_PRICE, True):
+            response.EMSX_LIMIT_PRICE = msg.getElementAsFloat(EMSX_LIMIT_PRICE)
+        if msg.hasElement(EMSX_AVG_PRICE, True):
+            response.EMSX_AVG_PRICE = msg.getElementAsFloat(EMSX_AVG_PRICE)
+        if msg.hasElement(EMSX_FLAG, True):
+            response.EMSX_FLAG = msg.getElementAsInteger(EMSX_FLAG)
+        if msg.hasElement(EMSX_SUB_FLAG, True):
+            response.EMSX_SUB_FLAG = msg.getElementAsInteger(EMSX_SUB_FLAG)
+        if msg.hasElement(EMSX_YELLOW_KEY, True):
+            response.EMSX_YELLOW_KEY = msg.getElementAsString(EMSX_YELLOW_KEY)
+        if msg.hasElement(EMSX_BASKET_NAME, True):
+            response.EMSX_BASKET_NAME = msg.getElementAsString(EMSX_BASKET_NAME)
+        if msg.hasElement(EMSX_ORDER_CREATE_DATE, True):
+            response.EMSX_ORDER_CREATE_DATE = msg.getElementAsString(EMSX_ORDER_CREATE_DATE)
+        if msg.hasElement(EMSX_ORDER_CREATE_TIME, True):
+            response.EMSX_ORDER_CREATE_TIME = msg.getElementAsString(EMSX_ORDER_CREATE_TIME)
+        if msg.hasElement(EMSX_ORDER_TYPE, True):
+            response.EMSX_ORDER_TYPE = msg.getElementAsString(EMSX_ORDER_TYPE)
+        if msg.hasElement(EMSX_TIF, True):
+            response.EMSX_TIF = msg.getElementAsString(EMSX_TIF)
+        if msg.hasElement(EMSX_BROKER, True):
+            response.EMSX_BROKER = msg.getElementAsString(EMSX_BROKER)
+        if msg.hasElement(EMSX_TRADER_UUID, True):
+            response.EMSX_TRADER_UUID = msg.getElementAsInteger(EMSX_TRADER_UUID)
+        if msg.hasElement(EMSX_STEP_OUT_BROKER, True):
+            response.EMSX_STEP_OUT_BROKER = msg.getElementAsString(EMSX_STEP_OUT_BROKER)
+        return response
+
+    def __repr__(self):
+        return "OrderInfoResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class RouteInfoResponse(object):
+    """ Decoded RouteInfo response. """
+
+    __slots__ = (
+        "EMSX_LIMIT_PRICE",
+        "EMSX_YIELD",
+        "EMSX_AVG_PRICE",
+        "EMSX_ROUTE_CREATE_DATE",
+        "EMSX_ROUTE_CREATE_TIME",
+        "EMSX_ROUTE_LAST_UPDATE_DATE",
+        "EMSX_ROUTE_LAST_UPDATE_TIME",
+        "EMSX_SETTLE_DATE",
+        "EMSX_AMOUNT",
+        "EMSX_FILLED",
+        "EMSX_IS_MANUAL_ROUTE",
+        "EMSX_BROKER",
+        "EMSX_ACCOUNT",
+        "EMSX_STATUS_ID",
+        "EMSX_STATUS",
+        "EMSX_HAND_INSTRUCTION",
+        "EMSX_ORDER_TYPE",
+        "EMSX_TIF",
+        "EMSX_LOC_ID",
+        "EMSX_LOC_BROKER",
+        "EMSX_STOP_PRICE",
+        "EMSX_BLOT_SEQ_NUM",
+        "EMSX_BLOT_DATE",
+        "EMSX_COMM_TYPE",
+        "EMSX_COMM_RATE",
+        "EMSX_USER_COMM_AMOUNT",
+        "EMSX_LSTTR2ID0",
+        "EMSX_LSTTR2ID1",
+        "EMSX_STRATEGY_PARAMS",
+        "EMSX_STRATEGY_FIELD_NAMES",
+    )
+
+    def __init__(self):
+        self.EMSX_LIMIT_PRICE = None
+        self.EMSX_YIELD = None
+        self.EMSX_AVG_PRICE = None
+        self.EMSX_ROUTE_CREATE_DATE = None
+        self.EMSX_ROUTE_CREATE_TIME = None
+        self.EMSX_ROUTE_LAST_UPDATE_DATE = None
+        self.EMSX_ROUTE_LAST_UPDATE_TIME = None
+        self.EMSX_SETTLE_DATE = None
+        self.EMSX_AMOUNT = None
+        self.EMSX_FILLED = None
+        self.EMSX_IS_MANUAL_ROUTE = None
+        self.EMSX_BROKER = None
+        self.EMSX_ACCOUNT = None
+        self.EMSX_STATUS_ID = None
+        self.EMSX_STATUS = None
+        self.EMSX_HAND_INSTRUCTION = None
+        self.EMSX_ORDER_TYPE = None
+        self.EMSX_TIF = None
+        self.EMSX_LOC_ID = None
+        self.EMSX_LOC_BROKER = None
+        self.EMSX_STOP_PRICE = None
+        self.EMSX_BLOT_SEQ_NUM = None
+        self.EMSX_BLOT_DATE = None
+        self.EMSX_COMM_TYPE = None
+        self.EMSX_COMM_RATE = None
+        self.EMSX_USER_COMM_AMOUNT = None
+        self.EMSX_LSTTR2ID0 = None
+        self.EMSX_LSTTR2ID1 = None
+        self.EMSX_STRATEGY_PARAMS = None
+        self.EMSX_STRATEGY_FIELD_NAMES = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = RouteInfoResponse()
+        if msg.hasElement(EMSX_LIMIT_PRICE, True):
+            response.EMSX_LIMIT_PRICE = msg.getElementAsFloat(EMSX_LIMIT_PRICE)
+        if msg.hasElement(EMSX_YIELD, True):
+            response.EMSX_YIELD = msg.getElementAsFloat(EMSX_YIELD)
+        if msg.hasElement(EMSX_AVG_PRICE, True):
+            response.EMSX_AVG_PRICE = msg.getElementAsFloat(EMSX_AVG_PRICE)
+        if msg.hasElement(EMSX_ROUTE_CREATE_DATE, True):
+            response.EMSX_ROUTE_CREATE_DATE = msg.getElementAsInteger(EMSX_ROUTE_CREATE_DATE)
+        if msg.hasElement(EMSX_ROUTE_CREATE_TIME, True):
+            response.EMSX_ROUTE_CREATE_TIME = msg.getElementAsInteger(EMSX_ROUTE_CREATE_TIME)
+        if msg.hasElement(EMSX_ROUTE_LAST_UPDATE_DATE, True):
+            response.EMSX_ROUTE_LAST_UPDATE_DATE = msg.getElementAsInteger(EMSX_ROUTE_LAST_UPDATE_DATE)
+        if msg.hasElement(EMSX_ROUTE_LAST_UPDATE_TIME, True):
+            response.EMSX_ROUTE_LAST_UPDATE_TIME = msg.getElementAsInteger(EMSX_ROUTE_LAST_UPDATE_TIME)
+        if msg.hasElement(EMSX_SETTLE_DATE, True):
+            response.EMSX_SETTLE_DATE = msg.getElementAsInteger(EMSX_SETTLE_DATE)
+        if msg.hasElement(EMSX_AMOUNT, True):
+            response.EMSX_AMOUNT = msg.getElementAsInteger(EMSX_AMOUNT)
+        if msg.hasElement(EMSX_FILLED, True):
+            response.EMSX_FILLED = msg.getElementAsInteger(EMSX_FILLED)
+        if msg.hasElement(EMSX_IS_MANUAL_ROUTE, True):
+            response.EMSX_IS_MANUAL_ROUTE = msg.getElementAsInteger(EMSX_IS_MANUAL_ROUTE)
+        if msg.hasElement(EMSX_BROKER, True):
+            response.EMSX_BROKER = msg.getElementAsString(EMSX_BROKER)
+        if msg.hasElement(EMSX_ACCOUNT, True):
+            response.EMSX_ACCOUNT = msg.getElementAsString(EMSX_ACCOUNT)
+        if msg.hasElement(EMSX_STATUS_ID, True):
+            response.EMSX_STATUS_ID = msg.getElementAsInteger(EMSX_STATUS_ID)
+        if msg.hasElement(EMSX_STATUS, True):
+            response.EMSX_STATUS = msg.getElementAsString(EMSX_STATUS)
+        if msg.hasElement(EMSX_HAND_INSTRUCTION, True):
+            response.EMSX_HAND_INSTRUCTION = msg.getElementAsString(EMSX_HAND_INSTRUCTION)
+        if msg.hasElement(EMSX_ORDER_TYPE, True):
+            response.EMSX_ORDER_TYPE = msg.getElementAsString(EMSX_ORDER_TYPE)
+        if msg.hasElement(EMSX_TIF, True):
+            response.EMSX_TIF = msg.getElementAsString(EMSX_TIF)
+        if msg.hasElement(EMSX_LOC_ID, True):
+            response.EMSX_LOC_ID = msg.getElementAsString(EMSX_LOC_ID)
+        if msg.hasElement(EMSX_LOC_BROKER, True):
+            response.EMSX_LOC_BROKER = msg.getElementAsString(EMSX_LOC_BROKER)
+        if msg.hasElement(EMSX_STOP_PRICE, True):
+            response.EMSX_STOP_PRICE = msg.getElementAsFloat(EMSX_STOP_PRICE)
+        if msg.hasElement(EMSX_BLOT_SEQ_NUM, True):
+            response.EMSX_BLOT_SEQ_NUM = msg.getElementAsInteger(EMSX_BLOT_SEQ_NUM)
+        if msg.hasElement(EMSX_BLOT_DATE, True):
+            response.EMSX_BLOT_DATE = msg.getElementAsInteger(EMSX_BLOT_DATE)
+        if msg.hasElement(EMSX_COMM_TYPE, True):
+            response.EMSX_COMM_TYPE = msg.getElementAsString(EMSX_COMM_TYPE)
+        if msg.hasElement(EMSX_COMM_RATE, True):
+            response.EMSX_COMM_RATE = msg.getElementAsFloat(EMSX_COMM_RATE)
+        if msg.hasElement(EMSX_USER_COMM_AMOUNT, True):
+            response.EMSX_USER_COMM_AMOUNT = msg.getElementAsFloat(EMSX_USER_COMM_AMOUNT)
+        if msg.hasElement(EMSX_LSTTR2_ID0, True):
+            response.EMSX_LSTTR2ID0 = msg.getElementAsInteger(EMSX_LSTTR2_ID0)
+        if msg.hasElement(EMSX_LSTTR2_ID1, True):
+            response.EMSX_LSTTR2ID1 = msg.getElementAsInteger(EMSX_LSTTR2_ID1)
+        if msg.hasElement(EMSX_STRATEGY_PARAMS, True):
+            response.EMSX_STRATEGY_PARAMS = elementToPython(msg.getElement(EMSX_STRATEGY_PARAMS))
+        if msg.hasElement(EMSX_STRATEGY_FIELD_NAMES, True):
+            response.EMSX_STRATEGY_FIELD_NAMES = elementToPython(msg.getElement(EMSX_STRATEGY_FIELD_NAMES))
+        return response
+
+    def __repr__(self):
+        return "RouteInfoResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class CancelRouteResponse(object):
+    """ Decoded CancelRoute, CancelRouteEx response. """
+
+    __slots__ = (
+        "STATUS",
+        "MESSAGE",
+    )
+
+    def __init__(self):
+        self.STATUS = None
+        self.MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = CancelRouteResponse()
+        if msg.hasElement(STATUS, True):
+            response.STATUS = msg.getElementAsInteger(STATUS)
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "CancelRouteResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetTeamsResponse(object):
+    """ Decoded GetTeams response. """
+
+    __slots__ = ("TEAMS",)
+
+    def __init__(self):
+        self.TEAMS = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetTeamsResponse()
+        if msg.hasElement(TEAMS, True):
+            response.TEAMS = elementToPython(msg.getElement(TEAMS))
+        return response
+
+    def __repr__(self):
+        return "GetTeamsResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetFieldMetaDataResponse(object):
+    """ Decoded GetFieldMetaData response. """
+
+    __slots__ = ("MetaData",)
+
+    def __init__(self):
+        self.MetaData = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetFieldMetaDataResponse()
+        if msg.hasElement(META_DATA, True):
+            response.MetaData = elementToPython(msg.getElement(META_DATA))
+        return response
+
+    def __repr__(self):
+        return "GetFieldMetaDataResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetAllFieldMetaDataResponse(object):
+    """ Decoded GetAllFieldMetaData response. """
+
+    __slots__ = ("MetaData",)
+
+    def __init__(self):
+        self.MetaData = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetAllFieldMetaDataResponse()
+        if msg.hasElement(META_DATA, True):
+            response.MetaData = elementToPython(msg.getElement(META_DATA))
+        return response
+
+    def __repr__(self):
+        return "GetAllFieldMetaDataResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetAssetClassResponse(object):
+    """ Decoded GetAssetClass response. """
+
+    __slots__ = ("EMSX_ASSET_CLASS",)
+
+    def __init__(self):
+        self.EMSX_ASSET_CLASS = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetAssetClassResponse()
+        if msg.hasElement(EMSX_ASSET_CLASS, True):
+            response.EMSX_ASSET_CLASS = msg.getElementAsString(EMSX_ASSET_CLASS)
+        return response
+
+    def __repr__(self):
+        return "GetAssetClassResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetBrokersWithAssetClassResponse(object):
+    """ Decoded GetBrokersWithAssetClass response. """
+
+    __slots__ = ("EMSX_BROKERS",)
+
+    def __init__(self):
+        self.EMSX_BROKERS = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetBrokersWithAssetClassResponse()
+        if msg.hasElement(EMSX_BROKERS, True):
+            response.EMSX_BROKERS = elementToPython(msg.getElement(EMSX_BROKERS))
+        return response
+
+    def __repr__(self):
+        return "GetBrokersWithAssetClassResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetBrokerStrategiesWithAssetClassResponse(object):
+    """ Decoded GetBrokerStrategiesWithAssetClass response. """
+
+    __slots__ = ("EMSX_STRATEGIES",)
+
+    def __init__(self):
+        self.EMSX_STRATEGIES = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetBrokerStrategiesWithAssetClassResponse()
+        if msg.hasElement(EMSX_STRATEGIES, True):
+            response.EMSX_STRATEGIES = elementToPython(msg.getElement(EMSX_STRATEGIES))
+        return response
+
+    def __repr__(self):
+        return "GetBrokerStrategiesWithAssetClassResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetBrokerStrategyInfoWithAssetClassResponse(object):
+    """ Decoded GetBrokerStrategyInfoWithAssetClass response. """
+
+    __slots__ = ("EMSX_STRATEGY_INFO",)
+
+    def __init__(self):
+        self.EMSX_STRATEGY_INFO = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetBrokerStrategyInfoWithAssetClassResponse()
+        if msg.hasElement(EMSX_STRATEGY_INFO, True):
+            response.EMSX_STRATEGY_INFO = elementToPython(msg.getElement(EMSX_STRATEGY_INFO))
+        return response
+
+    def __repr__(self):
+        return "GetBrokerStrategyInfoWithAssetClassResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetBrokersResponse(object):
+    """ Decoded GetBrokers response. """
+
+    __slots__ = ("EMSX_BROKERS",)
+
+    def __init__(self):
+        self.EMSX_BROKERS = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetBrokersResponse()
+        if msg.hasElement(EMSX_BROKERS, True):
+            response.EMSX_BROKERS = elementToPython(msg.getElement(EMSX_BROKERS))
+        return response
+
+    def __repr__(self):
+        return "GetBrokersResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetBrokerStrategiesResponse(object):
+    """ Decoded GetBrokerStrategies response. """
+
+    __slots__ = ("EMSX_STRATEGIES",)
+
+    def __init__(self):
+        self.EMSX_STRATEGIES = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetBrokerStrategiesResponse()
+        if msg.hasElement(EMSX_STRATEGIES, True):
+            response.EMSX_STRATEGIES = elementToPython(msg.getElement(EMSX_STRATEGIES))
+        return response
+
+    def __repr__(self):
+        return "GetBrokerStrategiesResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetBrokerStrategyInfoResponse(object):
+    """ Decoded GetBrokerStrategyInfo response. """
+
+    __slots__ = ("EMSX_STRATEGY_INFO",)
+
+    def __init__(self):
+        self.EMSX_STRATEGY_INFO = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetBrokerStrategyInfoResponse()
+        if msg.hasElement(EMSX_STRATEGY_INFO, True):
+            response.EMSX_STRATEGY_INFO = elementToPython(msg.getElement(EMSX_STRATEGY_INFO))
+        return response
+
+    def __repr__(self):
+        return "GetBrokerStrategyInfoResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GroupRouteResponse(object):
+    """ Decoded GroupRouteWithStrat, GroupRouteEx response. """
+
+    __slots__ = (
+        "EMSX_SUCCESS_ROUTES",
+        "EMSX_FAILED_ROUTES",
+        "MESSAGE",
+        "EMSX_ML_ID",
+    )
+
+    def __init__(self):
+        self.EMSX_SUCCESS_ROUTES = None
+        self.EMSX_FAILED_ROUTES = None
+        self.MESSAGE = None
+        self.EMSX_ML_ID = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GroupRouteResponse()
+        if msg.hasElement(EMSX_SUCCESS_ROUTES, True):
+            response.EMSX_SUCCESS_ROUTES = elementToPython(msg.getElement(EMSX_SUCCESS_ROUTES))
+        if msg.hasElement(EMSX_FAILED_ROUTES, True):
+            response.EMSX_FAILED_ROUTES = elementToPython(msg.getElement(EMSX_FAILED_ROUTES))
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        if msg.hasElement(EMSX_ML_ID, True):
+            response.EMSX_ML_ID = msg.getElementAsString(EMSX_ML_ID)
+        return response
+
+    def __repr__(self):
+        return "GroupRouteResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class AssignTraderResponse(object):
+    """ Decoded AssignTrader response. """
+
+    __slots__ = (
+        "EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS",
+        "EMSX_ASSIGN_TRADER_FAILED_ORDERS",
+        "EMSX_ALL_SUCCESS",
+    )
+
+    def __init__(self):
+        self.EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS = None
+        self.EMSX_ASSIGN_TRADER_FAILED_ORDERS = None
+        self.EMSX_ALL_SUCCESS = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = AssignTraderResponse()
+        if msg.hasElement(EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS, True):
+            response.EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS = elementToPython(msg.getElement(EMSX_ASSIGN_TRADER_SUCCESSFUL_ORDERS))
+        if msg.hasElement(EMSX_ASSIGN_TRADER_FAILED_ORDERS, True):
+            response.EMSX_ASSIGN_TRADER_FAILED_ORDERS = elementToPython(msg.getElement(EMSX_ASSIGN_TRADER_FAILED_ORDERS))
+        if msg.hasElement(EMSX_ALL_SUCCESS, True):
+            response.EMSX_ALL_SUCCESS = msg.getElementAsBool(EMSX_ALL_SUCCESS)
+        return response
+
+    def __repr__(self):
+        return "AssignTraderResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class StatusResponse(object):
+    """ Decoded SellSideAck, SellSideReject response. """
+
+    __slots__ = (
+        "STATUS",
+        "MESSAGE",
+    )
+
+    def __init__(self):
+        self.STATUS = None
+        self.MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = StatusResponse()
+        if msg.hasElement(STATUS, True):
+            response.STATUS = msg.getElementAsInteger(STATUS)
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "StatusResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class CancelOrderResponse(object):
+    """ Decoded CancelOrderEx response. """
+
+    __slots__ = (
+        "STATUS",
+        "MESSAGE",
+    )
+
+    def __init__(self):
+        self.STATUS = None
+        self.MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = CancelOrderResponse()
+        if msg.hasElement(STATUS, True):
+            response.STATUS = msg.getElementAsInteger(STATUS)
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "CancelOrderResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class ManualFillResponse(object):
+    """ Decoded ManualFill response. """
+
+    __slots__ = (
+        "MESSAGE",
+        "EMSX_FILL_ID",
+    )
+
+    def __init__(self):
+        self.MESSAGE = None
+        self.EMSX_FILL_ID = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = ManualFillResponse()
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        if msg.hasElement(EMSX_FILL_ID, True):
+            response.EMSX_FILL_ID = elementToPython(msg.getElement(EMSX_FILL_ID))
+        return response
+
+    def __repr__(self):
+        return "ManualFillResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetTradersResponse(object):
+    """ Decoded GetTraders response. """
+
+    __slots__ = ("EMSX_TRADER_UUID",)
+
+    def __init__(self):
+        self.EMSX_TRADER_UUID = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetTradersResponse()
+        if msg.hasElement(EMSX_TRADER_UUID, True):
+            response.EMSX_TRADER_UUID = elementToPython(msg.getElement(EMSX_TRADER_UUID))
+        return response
+
+    def __repr__(self):
+        return "GetTradersResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class GetTradeDesksResponse(object):
+    """ Decoded GetTradeDesks response. """
+
+    __slots__ = ("EMSX_TRADE_DESK",)
+
+    def __init__(self):
+        self.EMSX_TRADE_DESK = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = GetTradeDesksResponse()
+        if msg.hasElement(EMSX_TRADE_DESK, True):
+            response.EMSX_TRADE_DESK = elementToPython(msg.getElement(EMSX_TRADE_DESK))
+        return response
+
+    def __repr__(self):
+        return "GetTradeDesksResponse(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+class OrderStaticDataList(object):
+    """ Decoded CreateBasket response. """
+
+    __slots__ = (
+        "EMSX_SEQUENCE",
+        "MESSAGE",
+    )
+
+    def __init__(self):
+        self.EMSX_SEQUENCE = None
+        self.MESSAGE = None
+
+    @staticmethod
+    def fromMessage(msg):
+        response = OrderStaticDataList()
+        if msg.hasElement(EMSX_SEQUENCE, True):
+            response.EMSX_SEQUENCE = elementToPython(msg.getElement(EMSX_SEQUENCE))
+        if msg.hasElement(MESSAGE, True):
+            response.MESSAGE = msg.getElementAsString(MESSAGE)
+        return response
+
+    def __repr__(self):
+        return "OrderStaticDataList(%s)" % ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__ if getattr(self, name) is not None)
+
+
+REQUESTS = {
+    "CreateOrder": CreateOrderRequest,
+    "CreateOrderAndRoute": CreateOrderAndRouteRequest,
+    "CreateOrderAndRouteManually": CreateOrderAndRouteManuallyRequest,
+    "ModifyOrder": ModifyOrderRequest,
+    "DeleteOrder": DeleteOrderRequest,
+    "OrderInfo": OrderInfoRequest,
+    "RouteInfo": RouteInfoRequest,
+    "Route": RouteRequest,
+    "RouteManually": RouteManuallyRequest,
+    "ModifyRoute": ModifyRouteRequest,
+    "CancelRoute": CancelRouteRequest,
+    "CancelRouteEx": CancelRouteExRequest,
+    "GetTeams": GetTeamsRequest,
+    "GetFieldMetaData": GetFieldMetaDataRequest,
+    "GetAllFieldMetaData": GetAllFieldMetaDataRequest,
+    "GetAssetClass": GetAssetClassRequest,
+    "GetBrokersWithAssetClass": GetBrokersWithAssetClassRequest,
+    "GetBrokerStrategiesWithAssetClass": GetBrokerStrategiesWithAssetClassRequest,
+    "GetBrokerStrategyInfoWithAssetClass": GetBrokerStrategyInfoWithAssetClassRequest,
+    "GetBrokers": GetBrokersRequest,
+    "GetBrokerStrategies": GetBrokerStrategiesRequest,
+    "GetBrokerStrategyInfo": GetBrokerStrategyInfoRequest,
+    "CreateOrderAndRouteWithStrat": CreateOrderAndRouteWithStratRequest,
+    "RouteWithStrat": RouteWithStratRequest,
+    "ModifyRouteWithStrat": ModifyRouteWithStratRequest,
+    "GroupRouteWithStrat": GroupRouteWithStratRequest,
+    "RouteEx": RouteExRequest,
+    "ModifyRouteEx": ModifyRouteExRequest,
+    "GroupRouteEx": GroupRouteExRequest,
+    "CreateOrderAndRouteEx": CreateOrderAndRouteExRequest,
+    "RouteManuallyEx": RouteManuallyExRequest,
+    "AssignTrader": AssignTraderRequest,
+    "SellSideAck": SellSideAckRequest,
+    "SellSideReject": SellSideRejectRequest,
+    "CancelOrderEx": CancelOrderExRequest,
+    "ModifyOrderEx": ModifyOrderExRequest,
+    "ManualFill": ManualFillRequest,
+    "GetTraders": GetTradersRequest,
+    "GetTradeDesks": GetTradeDesksRequest,
+    "CreateBasket": CreateBasketRequest,
+}
+
+# Keyed by message type, as returned by Message.messageType().
+DECODERS = {
+    CREATE_ORDER: OrderStaticData.fromMessage,
+    MODIFY_ORDER: OrderStaticData.fromMessage,
+    MODIFY_ORDER_EX: OrderStaticData.fromMessage,
+    ERROR_INFO: ErrorInfoResponse.fromMessage,
+    CREATE_ORDER_AND_ROUTE: RouteStaticData.fromMessage,
+    CREATE_ORDER_AND_ROUTE_MANUALLY: RouteStaticData.fromMessage,
+    ROUTE: RouteStaticData.fromMessage,
+    ROUTE_MANUALLY: RouteStaticData.fromMessage,
+    MODIFY_ROUTE: RouteStaticData.fromMessage,
+    CREATE_ORDER_AND_ROUTE_WITH_STRAT: RouteStaticData.fromMessage,
+    ROUTE_WITH_STRAT: RouteStaticData.fromMessage,
+    MODIFY_ROUTE_WITH_STRAT: RouteStaticData.fromMessage,
+    MODIFY_ROUTE_EX: RouteStaticData.fromMessage,
+    CREATE_ORDER_AND_ROUTE_EX: RouteStaticData.fromMessage,
+    DELETE_ORDER: DeleteOrderResponse.fromMessage,
+    ORDER_INFO: OrderInfoResponse.fromMessage,
+    ROUTE_INFO: RouteInfoResponse.fromMessage,
+    CANCEL_ROUTE: CancelRouteResponse.fromMessage,
+    CANCEL_ROUTE_EX: CancelRouteResponse.fromMessage,
+    GET_TEAMS: GetTeamsResponse.fromMessage,
+    GET_FIELD_META_DATA: GetFieldMetaDataResponse.fromMessage,
+    GET_ALL_FIELD_META_DATA: GetAllFieldMetaDataResponse.fromMessage,
+    GET_ASSET_CLASS: GetAssetClassResponse.fromMessage,
+    GET_BROKERS_WITH_ASSET_CLASS: GetBrokersWithAssetClassResponse.fromMessage,
+    GET_BROKER_STRATEGIES_WITH_ASSET_CLASS: GetBrokerStrategiesWithAssetClassResponse.fromMessage,
+    GET_BROKER_STRATEGY_INFO_WITH_ASSET_CLASS: GetBrokerStrategyInfoWithAssetClassResponse.fromMessage,
+    GET_BROKERS: GetBrokersResponse.fromMessage,
+    GET_BROKER_STRATEGIES: GetBrokerStrategiesResponse.fromMessage,
+    GET_BROKER_STRATEGY_INFO: GetBrokerStrategyInfoResponse.fromMessage,
+    GROUP_ROUTE_WITH_STRAT: GroupRouteResponse.fromMessage,
+    GROUP_ROUTE_EX: GroupRouteResponse.fromMessage,
+    ASSIGN_TRADER: AssignTraderResponse.fromMessage,
+    SELL_SIDE_ACK: StatusResponse.fromMessage,
+    SELL_SIDE_REJECT: StatusResponse.fromMessage,
+    CANCEL_ORDER_EX: CancelOrderResponse.fromMessage,
+    MANUAL_FILL: ManualFillResponse.fromMessage,
+    GET_TRADERS: GetTradersResponse.fromMessage,
+    GET_TRADE_DESKS: GetTradeDesksResponse.fromMessage,
+    CREATE_BASKET: OrderStaticDataList.fromMessage,
+}
+
+
+def decodeResponse(msg):
+    # The decoded response or ErrorInfo of a request, or None for other
+    # message types.
+    decoder = DECODERS.get(msg.messageType())
+    if decoder is None:
+        return None
+    return decoder(msg)
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
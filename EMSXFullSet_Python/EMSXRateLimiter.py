@@ -0,0 +1,207 @@
+# EMSXRateLimiter.py
+
+import threading
+import time
+
+
+d_rate=50.0                 # requests per second across all operations
+d_burst=20
+d_initialWindow=8
+d_minWindow=1
+d_maxWindow=200
+d_targetLatency=0.5         # seconds
+d_throttleErrorCodes=set()
+d_throttleKeywords=["throttl", "rate limit", "too many"]
+
+# Per-operation budgets (requests per second, burst). Operations not listed
+# are only subject to the overall rate.
+d_operationBudgets = {
+    "RouteEx":          (20.0, 10),
+    "ModifyRouteEx":    (20.0, 10),
+    "CancelRoute":      (20.0, 10),
+    "GroupRouteEx":     (5.0, 5),
+}
+
+
+class TokenBucket(object):
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.time()
+        self.lock = threading.Lock()
+
+    def refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def tryAcquire(self, tokens=1):
+        # Returns 0 if the tokens were taken, otherwise the seconds to wait.
+        with self.lock:
+            self.refill(time.time())
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0
+            return (tokens - self.tokens) / self.rate
+
+    def acquire(self, tokens=1, timeout=None, deadline=None):
+        if timeout is not None:
+            deadline = time.time() + timeout
+        while True:
+            wait = self.tryAcquire(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None and time.time() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def refund(self, tokens=1):
+        # Returns tokens taken for a request that was never sent.
+        with self.lock:
+            self.tokens = min(self.burst, self.tokens + tokens)
+
+
+class AdaptiveWindow(object):
+    """ AIMD limit on the number of requests in flight.
+
+    The limit grows by one per window's worth of successful responses and is
+    halved when a response is throttled or slower than targetLatency. At
+    most one decrease is applied per round trip, so a burst of slow
+    responses from the same window only halves it once. A slot given back
+    with cancel() (the request was never sent) leaves the limit alone.
+    """
+
+    def __init__(self, initial=d_initialWindow, minimum=d_minWindow, maximum=d_maxWindow, targetLatency=d_targetLatency, decrease=0.5):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.targetLatency = targetLatency
+        self.decrease = decrease
+        self.inFlight = 0
+        self.lastDecrease = 0
+        self.condition = threading.Condition()
+
+    def acquire(self, timeout=None, deadline=None):
+        with self.condition:
+            if timeout is not None:
+                deadline = time.time() + timeout
+            while self.inFlight >= int(self.limit):
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+            self.inFlight += 1
+            return True
+
+    def release(self, latency=None, congested=False):
+        with self.condition:
+            self.inFlight -= 1
+            now = time.time()
+
+            if congested or (latency is not None and latency > self.targetLatency):
+                if now - self.lastDecrease > (latency or self.targetLatency):
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self.lastDecrease = now
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+            self.condition.notify_all()
+
+    def cancel(self):
+        with self.condition:
+            self.inFlight -= 1
+            self.condition.notify_all()
+
+
+class RateLimiter(object):
+    """ Client-side limits shared by every request sent through a session.
+
+    A request must take a token from the overall bucket and from its
+    operation's bucket (if it has one), and a slot in the adaptive
+    in-flight window, before it is sent, all within one timeout. A request
+    that is admitted but not sent is handed back with cancel(), which
+    returns its tokens and slot without counting it as a response.
+    """
+
+    def __init__(self, rate=d_rate, burst=d_burst, operationBudgets=d_operationBudgets, window=None,
+                 throttleErrorCodes=d_throttleErrorCodes, throttleKeywords=d_throttleKeywords):
+        self.bucket = TokenBucket(rate, burst)
+        self.operationBuckets = dict((op, TokenBucket(r, b)) for op, (r, b) in operationBudgets.items())
+        self.window = window if window is not None else AdaptiveWindow()
+        self.throttleErrorCodes = set(throttleErrorCodes)
+        self.throttleKeywords = [k.lower() for k in throttleKeywords]
+
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.throttled = 0
+
+    def acquire(self, operation, timeout=None):
+        deadline = None if timeout is None else time.time() + timeout
+        if not self.window.acquire(deadline=deadline):
+            return False
+
+        if self.bucket.acquire(deadline=deadline):
+            bucket = self.operationBuckets.get(operation)
+            if bucket is None or bucket.acquire(deadline=deadline):
+                with self.lock:
+                    self.sent += 1
+                return True
+            self.bucket.refund()
+
+        self.window.cancel()
+        return False
+
+    def cancel(self, operation):
+        # Undoes acquire() for a request that could not be sent.
+        self.bucket.refund()
+        bucket = self.operationBuckets.get(operation)
+        if bucket is not None:
+            bucket.refund()
+        with self.lock:
+            self.sent -= 1
+        self.window.cancel()
+
+    def isThrottleError(self, errorCode, errorMessage):
+        if errorCode is not None and errorCode in self.throttleErrorCodes:
+            return True
+        message = (errorMessage or "").lower()
+        return any(keyword in message for keyword in self.throttleKeywords)
+
+    def release(self, operation, latency=None, errorCode=None, errorMessage=None, counted=True):
+        # counted=False frees the slot of a request that ended without a
+        # response from the server, leaving the window as it is.
+        if not counted:
+            self.window.cancel()
+            return
+        throttled = self.isThrottleError(errorCode, errorMessage)
+        if throttled:
+            with self.lock:
+                self.throttled += 1
+        self.window.release(latency, throttled)
+
+    def stats(self):
+        with self.lock:
+            return {"sent": self.sent, "throttled": self.throttled, "window": int(self.window.limit), "inFlight": self.window.inFlight}
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,313 @@
+# EMSXRefDataCache.py
+
+import json
+import os
+import sys
+import threading
+import time
+
+from EMSXOperations import REQUESTS
+
+d_service="//blp/emapisvc"
+d_ttl=900                   # seconds, for operations not listed in d_ttls
+d_ttls = {
+    "GetBrokersWithAssetClass":             3600,
+    "GetBrokerStrategiesWithAssetClass":    3600,
+    "GetBrokerStrategyInfoWithAssetClass":  3600,
+    "GetTeams":                             900,
+    "GetTraders":                           900,
+    "GetTradeDesks":                        900,
+}
+d_requestTimeout=30
+d_snapshotPath=None         # e.g. "refdata.json" to warm start from disk
+
+# The array each operation's response is reduced to.
+RESULT_FIELDS = {
+    "GetBrokersWithAssetClass":             "EMSX_BROKERS",
+    "GetBrokerStrategiesWithAssetClass":    "EMSX_STRATEGIES",
+    "GetBrokerStrategyInfoWithAssetClass":  "EMSX_STRATEGY_INFO",
+    "GetTeams":                             "TEAMS",
+    "GetTraders":                           "EMSX_TRADER_UUID",
+    "GetTradeDesks":                        "EMSX_TRADE_DESK",
+}
+
+
+class RefDataError(Exception):
+    pass
+
+
+def cacheKey(operation, params):
+    # Values are keyed by their JSON form, so choices given as dicts (such
+    # as the Scope of GetTradeDesks) can be part of the key.
+    return (operation, tuple(sorted((name, json.dumps(value, sort_keys=True)) for name, value in params.items())))
+
+
+def keyParams(key):
+    return dict((name, json.loads(value)) for name, value in key[1])
+
+
+def buildRequest(session, service, operation, params):
+    # Filled through the operation's generated request class, which checks
+    # the parameters and sets choices given as dicts.
+    request = session.createRequest(service, operation)
+    generated = REQUESTS[operation](**params)
+    generated.validate()
+    generated.fill(request)
+    return request
+
+
+class Flight(object):
+    """ A fetch in progress that concurrent misses for the same key wait on. """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class RefDataCache(object):
+    """ Process-wide cache of emapisvc reference data lookups.
+
+    Results are keyed by operation and request parameters and kept for the
+    operation's TTL. Concurrent misses for the same key share one request:
+    the first caller fetches, the others wait for its result. Errors are
+    not cached. The cache can be saved to and loaded from a JSON snapshot,
+    entries keeping the age they had when saved, so a restarted process
+    starts warm. Cached values are shared between callers and should be
+    treated as read-only.
+    """
+
+    def __init__(self, sessionManager=None, service=d_service, ttls=d_ttls, defaultTtl=d_ttl, timeout=d_requestTimeout, fetch=None):
+        self.sessionManager = sessionManager
+        self.service = service
+        self.ttls = dict(ttls)
+        self.defaultTtl = defaultTtl
+        self.timeout = timeout
+        if fetch is not None:
+            self.fetch = fetch
+
+        self.entries = {}
+        self.flights = {}
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.expired = 0
+        self.errors = 0
+
+    def ttl(self, operation):
+        return self.ttls.get(operation, self.defaultTtl)
+
+    def fetch(self, operation, params):
+        # Sends the request and returns the result array as plain Python values.
+        if self.sessionManager is None:
+            from EMSXSessionManager import defaultSessionManager
+            self.sessionManager = defaultSessionManager()
+
+        with self.sessionManager.borrow() as session:
+            request = buildRequest(session, self.service, operation, params)
+            pending = session.sendRequest(request, self.timeout)
+
+        if pending.isError():
+            errorCode, errorMessage = pending.error()
+            raise RefDataError("%s failed: (%s) %s" % (operation, errorCode, errorMessage))
+        return pending.response().get(RESULT_FIELDS.get(operation), [])
+
+    def get(self, operation, **params):
+        key = cacheKey(operation, params)
+        now = time.time()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self.hits += 1
+                    return entry[0]
+                del self.entries[key]
+                self.expired += 1
+
+            flight = self.flights.get(key)
+            if flight is not None:
+                self.shared += 1
+                owner = False
+            else:
+                flight = self.flights[key] = Flight()
+                self.misses += 1
+                owner = True
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = self.fetch(operation, params)
+        except BaseException as e:
+            # Waiters get the error too, including KeyboardInterrupt and the
+            # like; nothing is cached.
+            flight.error = e
+            with self.lock:
+                del self.flights[key]
+                self.errors += 1
+            flight.done.set()
+            raise
+
+        flight.value = value
+        with self.lock:
+            del self.flights[key]
+            self.entries[key] = (value, time.time() + self.ttl(operation), time.time())
+        flight.done.set()
+        return value
+
+    def invalidate(self, operation=None, **params):
+        # Drops every entry of operation whose parameters include params, or
+        # everything when no operation is given.
+        with self.lock:
+            if operation is None:
+                self.entries.clear()
+                return
+            wanted = set(cacheKey(operation, params)[1])
+            for key in [k for k in self.entries if k[0] == operation and wanted <= set(k[1])]:
+                del self.entries[key]
+
+    def brokers(self, assetClass):
+        return self.get("GetBrokersWithAssetClass", EMSX_ASSET_CLASS=assetClass)
+
+    def strategies(self, assetClass, broker):
+        return self.get("GetBrokerStrategiesWithAssetClass", EMSX_ASSET_CLASS=assetClass, EMSX_BROKER=broker)
+
+    def strategyInfo(self, assetClass, broker, strategy):
+        return self.get("GetBrokerStrategyInfoWithAssetClass", EMSX_ASSET_CLASS=assetClass, EMSX_BROKER=broker, EMSX_STRATEGY=strategy)
+
+    def teams(self):
+        return self.get("GetTeams")
+
+    def traders(self):
+        return self.get("GetTraders")
+
+    def tradeDesks(self, uuid=None):
+        if uuid is None:
+            return self.get("GetTradeDesks")
+        return self.get("GetTradeDesks", Scope={"EMSX_TRADER_UUID": uuid})
+
+    def save(self, path):
+        # Written to a temporary file and renamed, so a reader never sees a
+        # partial snapshot.
+        now = time.time()
+        with self.lock:
+            entries = [{"operation": key[0], "params": keyParams(key), "value": value, "age": now - fetched}
+                       for key, (value, expires, fetched) in self.entries.items() if expires > now]
+        temp = "%s.%d.tmp" % (path, os.getpid())
+        with open(temp, "w") as f:
+            json.dump({"saved": now, "entries": entries}, f)
+        os.replace(temp, path)
+        return len(entries)
+
+    def load(self, path):
+        # Loads the entries of a snapshot that are still within their TTL;
+        # returns how many were loaded.
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except (IOError, OSError, ValueError):
+            return 0
+
+        now = time.time()
+        loaded = 0
+        with self.lock:
+            for entry in snapshot.get("entries", []):
+                operation = entry["operation"]
+                fetched = snapshot["saved"] - entry["age"]
+                expires = fetched + self.ttl(operation)
+                key = cacheKey(operation, entry["params"])
+                if expires > now and key not in self.entries:
+                    self.entries[key] = (entry["value"], expires, fetched)
+                    loaded += 1
+        return loaded
+
+    def __len__(self):
+        return len(self.entries)
+
+    def stats(self):
+        with self.lock:
+            return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses,
+                    "shared": self.shared, "expired": self.expired, "errors": self.errors}
+
+
+_defaultCache = None
+_defaultCacheLock = threading.Lock()
+
+
+def defaultRefDataCache():
+    # Process-wide cache, loaded from d_snapshotPath on first use if set.
+    global _defaultCache
+    with _defaultCacheLock:
+        if _defaultCache is None:
+            _defaultCache = RefDataCache()
+            if d_snapshotPath is not None:
+                _defaultCache.load(d_snapshotPath)
+        return _defaultCache
+
+
+def main():
+    # EMSXRefDataCache.py [--snapshot=refdata.json] [ASSET_CLASS BROKER STRATEGY]
+    global d_snapshotPath
+
+    args = []
+    for arg in sys.argv[1:]:
+        if arg.startswith("--snapshot="):
+            d_snapshotPath = arg[len("--snapshot="):]
+        else:
+            args.append(arg)
+    assetClass, broker, strategy = (args + ["EQTY", "BMTB", "VWAP"][len(args):])[:3]
+
+    cache = defaultRefDataCache()
+    print ("Loaded %d entries" % len(cache))
+
+    for attempt in ("first", "repeat"):
+        start = time.time()
+        brokers = cache.brokers(assetClass)
+        strategies = cache.strategies(assetClass, broker)
+        info = cache.strategyInfo(assetClass, broker, strategy)
+        teams = cache.teams()
+        elapsed = time.time() - start
+        print ("%s lookup: %d brokers, %d strategies, %d strategy fields, %d teams in %0.6f seconds" %
+               (attempt, len(brokers), len(strategies), len(info), len(teams), elapsed))
+
+    print ("Cache: %s" % cache.stats())
+    if d_snapshotPath is not None:
+        print ("Saved %d entries to %s" % (cache.save(d_snapshotPath), d_snapshotPath))
+
+    if cache.sessionManager is not None:
+        cache.sessionManager.stop()
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXRefDataCache")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,303 @@
+# EMSXRequestRunner.py
+
+import blpapi
+import itertools
+import sys
+import threading
+import time
+
+from EMSXNames import (ERROR_INFO, ERROR_RESPONSE, REQUEST_FAILURE, ERROR_CODE, ERROR_MESSAGE,
+                       HISTORY_ERROR_CODE, ERROR_MSG, REASON, DESCRIPTION)
+
+
+# Correlation IDs handed out by the runner. They start well above the fixed
+# IDs used by the sample scripts (e.g. 98/99 for the subscriptions) and are
+# shared by every runner in the process, so two runners on one session never
+# collide.
+d_firstCorrelationId=1000000
+_correlationIds = itertools.count(d_firstCorrelationId)
+
+
+# Failure given to the requests still pending when their session terminates.
+TERMINATED = "Session terminated"
+
+
+class RequestTimeout(Exception):
+    pass
+
+
+def nextCorrelationId():
+    return blpapi.CorrelationId(next(_correlationIds))
+
+
+def elementToPython(element):
+    # Converts a blpapi Element into plain dict/list/scalar values.
+    if element.isArray():
+        values = []
+        for value in element.values():
+            if isinstance(value, blpapi.Element):
+                values.append(elementToPython(value))
+            else:
+                values.append(value)
+        return values
+
+    if element.isComplexType():
+        fields = {}
+        for child in element.elements():
+            if not child.isNull():
+                fields[str(child.name())] = elementToPython(child)
+        return fields
+
+    return element.getValue()
+
+
+def messageError(msg):
+    # (errorCode, errorMessage) if msg is an ErrorInfo, history ErrorResponse
+    # or RequestFailure message, otherwise None.
+    messageType = msg.messageType()
+    if messageType == ERROR_INFO:
+        return msg.getElementAsInteger(ERROR_CODE), msg.getElementAsString(ERROR_MESSAGE)
+    if messageType == ERROR_RESPONSE:
+        errorMessage = msg.getElementAsString(ERROR_MSG) if msg.hasElement(ERROR_MSG, True) else ""
+        return msg.getElementAsString(HISTORY_ERROR_CODE), errorMessage
+    if messageType == REQUEST_FAILURE:
+        errorMessage = ""
+        if msg.hasElement(REASON, True) and msg.getElement(REASON).hasElement(DESCRIPTION, True):
+            errorMessage = msg.getElement(REASON).getElementAsString(DESCRIPTION)
+        return "RequestFailure", errorMessage
+    return None
+
+
+class PendingRequest(object):
+    """ One outstanding request, completed by the blpapi event thread. """
+
+    def __init__(self, correlationId, operation, onMessage=None):
+        self.correlationId = correlationId
+        self.operation = operation
+        self.onMessage = onMessage
+        self.messages = []
+        self.sentTime = None
+        self.completedTime = None
+        self.failure = None
+        self.completed = threading.Event()
+        self.callbacks = []
+        self.callbackLock = threading.Lock()
+
+    def addMessage(self, msg):
+        # Streaming requests hand each message to onMessage instead of
+        # keeping it.
+        if self.onMessage is not None:
+            self.onMessage(msg)
+        else:
+            self.messages.append(msg)
+
+    def addCallback(self, callback):
+        # callback(pending) runs on completion, or straight away if the
+        # request has already completed.
+        with self.callbackLock:
+            if not self.completed.is_set():
+                self.callbacks.append(callback)
+                return
+        callback(self)
+
+    def complete(self, failure=None):
+        self.failure = failure
+        self.completedTime = time.time()
+        with self.callbackLock:
+            self.completed.set()
+            callbacks = self.callbacks
+            self.callbacks = []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except:
+                print ("Exception:  %s" % sys.exc_info()[0])
+
+    def isComplete(self):
+        return self.completed.is_set()
+
+    def wait(self, timeout=None):
+        if not self.completed.wait(timeout):
+            raise RequestTimeout("%s request (correlation id %d) timed out" % (self.operation, self.correlationId.value()))
+        return self
+
+    def latency(self):
+        if self.sentTime is None or self.completedTime is None:
+            return None
+        return self.completedTime - self.sentTime
+
+    def messageType(self):
+        if not self.messages:
+            return None
+        return self.messages[-1].messageType()
+
+    def isError(self):
+        return self.failure is not None or self.messageType() in (ERROR_INFO, ERROR_RESPONSE)
+
+    def error(self):
+        # (errorCode, errorMessage) of a failed request, or None.
+        if self.failure is not None:
+            if isinstance(self.failure, str):
+                return self.failure, self.failure
+            return messageError(self.failure)
+        if not self.messages:
+            return None
+        return messageError(self.messages[-1])
+
+    def response(self):
+        # Parsed body of the final message (the last PARTIAL_RESPONSE chunks are
+        # available through self.messages).
+        if not self.messages:
+            return None
+        return elementToPython(self.messages[-1].asElement())
+
+    def decoded(self):
+        # The final message as its generated EMSXOperations response class
+        # (e.g. OrderStaticData, ErrorInfoResponse), or None if it has none.
+        if not self.messages:
+            return None
+        from EMSXOperations import decodeResponse      # EMSXOperations imports this module
+        return decodeResponse(self.messages[-1])
+
+
+class RequestRunner(object):
+    """ Sends requests on a started session and blocks on their completion.
+
+    The session's event handler must pass RESPONSE, PARTIAL_RESPONSE and
+    REQUEST_STATUS events to processResponseEvent().
+
+    If a limiter (EMSXRateLimiter.RateLimiter) is given, sendRequestAsync()
+    blocks until it admits the request, and the limiter is told the latency
+    and any error of every completed request. If metrics
+    (EMSXMetrics.RequestMetrics) are given, every request is recorded there.
+    """
+
+    def __init__(self, session, limiter=None, limiterTimeout=None, metrics=None):
+        self.session = session
+        self.limiter = limiter
+        self.limiterTimeout = limiterTimeout
+        self.metrics = metrics
+        self.lock = threading.Lock()
+        self.pending = {}
+
+    def sendRequestAsync(self, request, correlationId=None, onMessage=None):
+        if correlationId is None:
+            correlationId = nextCorrelationId()
+
+        pending = PendingRequest(correlationId, str(request.asElement().name()), onMessage)
+
+        if self.limiter is not None:
+            if not self.limiter.acquire(pending.operation, self.limiterTimeout):
+                raise RequestTimeout("%s request not admitted by the rate limiter" % pending.operation)
+            pending.addCallback(self.releaseLimiter)
+
+        if self.metrics is not None:
+            self.metrics.requestStarted(pending.operation)
+            pending.addCallback(self.recordMetrics)
+
+        with self.lock:
+            self.pending[correlationId.value()] = pending
+
+        pending.sentTime = time.time()
+        try:
+            self.session.sendRequest(request, correlationId=correlationId)
+        except:
+            with self.lock:
+                del self.pending[correlationId.value()]
+            if self.limiter is not None:
+                self.limiter.cancel(pending.operation)
+            if self.metrics is not None:
+                self.metrics.requestCompleted(pending.operation, None, "SendFailed")
+            raise
+
+        return pending
+
+    def releaseLimiter(self, pending):
+        # A request lost with its session says nothing about the server's
+        # capacity, so it does not count as a response.
+        errorCode, errorMessage = pending.error() or (None, None)
+        self.limiter.release(pending.operation, pending.latency(), errorCode, errorMessage, counted=pending.failure != TERMINATED)
+
+    def recordMetrics(self, pending):
+        error = pending.error()
+        self.metrics.requestCompleted(pending.operation, pending.latency(), error[0] if error is not None else None)
+
+    def sendRequest(self, request, timeout=None):
+        pending = self.sendRequestAsync(request)
+        try:
+            return pending.wait(timeout)
+        except RequestTimeout:
+            self.cancel(pending)
+            raise
+
+    def cancel(self, pending):
+        with self.lock:
+            self.pending.pop(pending.correlationId.value(), None)
+        try:
+            self.session.cancel(pending.correlationId)
+        except:
+            print ("Exception:  %s" % sys.exc_info()[0])
+        if not pending.isComplete():
+            pending.complete(failure="Cancelled")
+
+    def failAll(self, failure=TERMINATED):
+        # Completes every pending request with failure, e.g. when the
+        # session has terminated and no response will ever arrive.
+        with self.lock:
+            pending, self.pending = list(self.pending.values()), {}
+        for request in pending:
+            if not request.isComplete():
+                request.complete(failure=failure)
+        return len(pending)
+
+    def outstanding(self):
+        with self.lock:
+            return len(self.pending)
+
+    def processResponseEvent(self, event):
+        # Returns True if any message in the event belonged to this runner.
+        eventType = event.eventType()
+        handled = False
+
+        for msg in event:
+            for cid in msg.correlationIds():
+
+                with self.lock:
+                    pending = self.pending.get(cid.value())
+                    if pending is None:
+                        continue
+                    final = eventType == blpapi.Event.RESPONSE or eventType == blpapi.Event.REQUEST_STATUS
+                    if final:
+                        del self.pending[cid.value()]
+
+                handled = True
+                pending.addMessage(msg)
+
+                if eventType == blpapi.Event.REQUEST_STATUS and msg.messageType() == REQUEST_FAILURE:
+                    pending.complete(failure=msg)
+                elif final:
+                    pending.complete()
+
+        return handled
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,118 @@
+# EMSXResync.py
+
+import threading
+
+from EMSXBlotter import NEW_ORDER_ROUTE, UPDATE_ORDER_ROUTE, DELETE_ORDER_ROUTE
+from EMSXTopics import ORDER, ROUTE
+
+
+# Fields that change on every message and do not make a row different.
+IGNORED_FIELDS = ("API_SEQ_NUM",)
+
+
+class BlotterResync(object):
+    """ Reconciles a fresh initial paint with the blotter it repaints.
+
+    After a resubscribe, begin(kind) remembers which rows the blotter holds.
+    Each painted record is passed to paint(), which applies it and returns
+    what actually changed: a NEW_ORDER_ROUTE for rows the blotter did not
+    have, an UPDATE_ORDER_ROUTE holding the key fields and the changed
+    fields, or None when nothing changed. A painted record replaces the
+    whole row, so a field that is missing from it has been cleared: it is
+    reported with the value the row now holds (None, or 0/"" in a columnar
+    blotter). end(kind), at the end of the
+    paint, deletes the rows that were not repainted and returns them as
+    DELETE_ORDER_ROUTE records. Live updates that arrive during the paint
+    are passed to seen() so their rows are not deleted.
+    """
+
+    def __init__(self, blotter):
+        self.tables = {ORDER: blotter.orders, ROUTE: blotter.routes}
+        self.unseen = {}
+        self.lock = threading.Lock()
+
+        self.resyncs = 0
+        self.added = 0
+        self.changed = 0
+        self.unchanged = 0
+        self.deleted = 0
+
+    def begin(self, kind):
+        keys = set(self.tables[kind].allKeys())
+        with self.lock:
+            self.unseen[kind] = keys
+            self.resyncs += 1
+
+    def active(self, kind):
+        return kind in self.unseen
+
+    def seen(self, kind, record):
+        if kind not in self.unseen:
+            return
+        with self.lock:
+            unseen = self.unseen.get(kind)
+            if unseen is not None:
+                unseen.discard(self.tables[kind].key(record))
+
+    def paint(self, kind, record):
+        # Applies a repainted record; returns (eventStatus, record) to publish, or None.
+        table = self.tables[kind]
+        key = table.key(record)
+        self.seen(kind, record)
+
+        old = table.get(key)
+        table.replace(record)
+        if old is None:
+            self.added += 1
+            return NEW_ORDER_ROUTE, record
+
+        new = table.get(key)
+        changed = dict((name, new.get(name)) for name in set(old) | set(new) if name not in IGNORED_FIELDS and old.get(name) != new.get(name))
+        if not changed:
+            self.unchanged += 1
+            return None
+        for name in table.keyFields:
+            changed[name] = record[name]
+        self.changed += 1
+        return UPDATE_ORDER_ROUTE, changed
+
+    def end(self, kind):
+        # Deletes the rows missing from the repaint and returns them as
+        # [(DELETE_ORDER_ROUTE, key fields)].
+        table = self.tables[kind]
+        with self.lock:
+            unseen = self.unseen.pop(kind, ())
+
+        deletes = []
+        for key in unseen:
+            table.delete(key)
+            values = key if len(table.keyFields) > 1 else (key,)
+            deletes.append((DELETE_ORDER_ROUTE, dict(zip(table.keyFields, values))))
+        self.deleted += len(deletes)
+        return deletes
+
+    def stats(self):
+        return {"resyncs": self.resyncs, "added": self.added, "changed": self.changed,
+                "unchanged": self.unchanged, "deleted": self.deleted}
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
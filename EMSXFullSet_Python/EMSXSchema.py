@@ -0,0 +1,213 @@
+# EMSXSchema.py
+
+import os
+import threading
+import xml.etree.ElementTree as ET
+
+
+d_schemaDir=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+d_emapisvcSchema=os.path.join(d_schemaDir, "emapisvc_3.33.1.4.xml")
+d_historySchema=os.path.join(d_schemaDir, "emsx.history_1.4.0.0.xml")
+
+ORDER_ROUTE_FIELDS_TYPE = "OrderRouteFields"
+
+# Schema primitive types and the blpapi Element accessor that reads them.
+PRIMITIVE_ACCESSORS = {
+    "String":   "getValueAsString",
+    "Int32":    "getValueAsInteger",
+    "Int64":    "getValueAsInteger",
+    "Float32":  "getValueAsFloat",
+    "Float64":  "getValueAsFloat",
+    "Boolean":  "getValueAsBool",
+    "Datetime": "getValueAsString",
+    "Date":     "getValueAsString",
+}
+
+
+def _tag(node):
+    # Strips the namespace from tags such as {http://bloomberg.com/schemas/apidd}element
+    return node.tag.split("}")[-1]
+
+
+def _children(node, tag):
+    return [child for child in node if _tag(child) == tag]
+
+
+def _text(node, tag):
+    for child in node:
+        if _tag(child) == tag:
+            return (child.text or "").strip()
+    return None
+
+
+class ElementDef(object):
+
+    def __init__(self, name, typeName, minOccurs=1, maxOccurs=1, default=None, description=None):
+        self.name = name
+        self.typeName = typeName
+        self.minOccurs = minOccurs
+        self.maxOccurs = maxOccurs          # None means unbounded
+        self.default = default
+        self.description = description
+
+    def isArray(self):
+        return self.maxOccurs is None or self.maxOccurs > 1
+
+    def isRequired(self):
+        return self.minOccurs > 0
+
+
+class TypeDef(object):
+
+    def __init__(self, name, kind, elements=None, enumerators=None, valueType=None):
+        self.name = name
+        self.kind = kind                    # "sequence", "choice" or "enumeration"
+        self.elements = elements or []
+        self.enumerators = enumerators or []
+        self.valueType = valueType          # primitive type of an enumeration
+
+    def element(self, name):
+        for element in self.elements:
+            if element.name == name:
+                return element
+        return None
+
+
+class Operation(object):
+
+    def __init__(self, name, request, requestSelection, response, responseSelections, timeout=None):
+        self.name = name
+        self.request = request
+        self.requestSelection = requestSelection
+        self.response = response
+        self.responseSelections = responseSelections
+        self.timeout = timeout
+
+
+class ServiceSchema(object):
+    """ Types, events and operations read from a service definition XML. """
+
+    def __init__(self, path):
+        root = ET.parse(path).getroot()
+
+        self.path = path
+        self.types = {}
+        self.operations = {}
+        self.events = {}
+        self.serviceName = None
+        self.version = root.get("version")
+
+        for schema in _children(root, "schema"):
+            for node in schema:
+                tag = _tag(node)
+                if tag == "sequenceType" or tag == "choiceType":
+                    elements = [self.parseElement(e) for e in _children(node, "element")]
+                    kind = "sequence" if tag == "sequenceType" else "choice"
+                    self.types[node.get("name")] = TypeDef(node.get("name"), kind, elements=elements)
+                elif tag == "enumerationType":
+                    enumerators = [e.get("name") for e in _children(node, "enumerator")]
+                    self.types[node.get("name")] = TypeDef(node.get("name"), "enumeration", enumerators=enumerators, valueType=node.get("type"))
+
+        for service in _children(root, "service"):
+            self.serviceName = service.get("name")
+
+            for event in _children(service, "event"):
+                self.events[event.get("name")] = event.get("eventType")
+
+            for op in _children(service, "operation"):
+                timeout = _text(op, "timeout")
+                self.operations[op.get("name")] = Operation(
+                    op.get("name"),
+                    _text(op, "request"),
+                    _text(op, "requestSelection"),
+                    _text(op, "response"),
+                    [(s.text or "").strip() for s in _children(op, "responseSelection")],
+                    int(timeout) if timeout else None)
+
+    def parseElement(self, node):
+        minOccurs = int(node.get("minOccurs", "1"))
+        maxOccurs = node.get("maxOccurs", "1")
+        maxOccurs = None if maxOccurs == "unbounded" else int(maxOccurs)
+        return ElementDef(node.get("name"), node.get("type"), minOccurs, maxOccurs, node.get("default"), node.get("description"))
+
+    def isPrimitive(self, typeName):
+        return typeName in PRIMITIVE_ACCESSORS
+
+    def primitiveType(self, typeName):
+        # Enumerations are carried as their underlying primitive type.
+        if typeName in PRIMITIVE_ACCESSORS:
+            return typeName
+        typeDef = self.types.get(typeName)
+        if typeDef is not None and typeDef.kind == "enumeration":
+            return typeDef.valueType
+        return None
+
+    def selectionType(self, choiceName, selection):
+        choice = self.types[choiceName]
+        element = choice.element(selection)
+        if element is None:
+            return None
+        return self.types.get(element.typeName)
+
+    def requestType(self, operation):
+        op = self.operations[operation]
+        return self.selectionType(op.request, op.requestSelection)
+
+    def responseTypes(self, operation):
+        op = self.operations[operation]
+        return dict((selection, self.selectionType(op.response, selection)) for selection in op.responseSelections)
+
+    def elementNames(self):
+        names = set()
+        for typeDef in self.types.values():
+            for element in typeDef.elements:
+                names.add(element.name)
+        names.update(self.types.keys())
+        names.update(self.operations.keys())
+        for op in self.operations.values():
+            names.update(op.responseSelections)
+        return names
+
+
+_schemas = {}
+_schemasLock = threading.Lock()
+
+
+def loadSchema(path):
+    # Parsed schemas are cached, the XML is only read once per process.
+    with _schemasLock:
+        schema = _schemas.get(path)
+        if schema is None:
+            schema = ServiceSchema(path)
+            _schemas[path] = schema
+        return schema
+
+
+def emapisvcSchema():
+    return loadSchema(d_emapisvcSchema)
+
+
+def historySchema():
+    return loadSchema(d_historySchema)
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
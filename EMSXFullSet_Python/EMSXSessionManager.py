@@ -0,0 +1,337 @@
+# EMSXSessionManager.py
+
+import blpapi
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from EMSXNames import SESSION_STARTED, SESSION_STARTUP_FAILURE, SESSION_TERMINATED, SERVICE_OPENED, SERVICE_OPEN_FAILURE
+from EMSXOperations import REQUESTS
+from EMSXRequestRunner import TERMINATED, RequestRunner, nextCorrelationId
+
+
+d_host="localhost"
+d_port=8194
+d_services=["//blp/emapisvc", "//blp/emsx.history", "//blp/emsx.brokerspec"]
+d_startTimeout=30
+d_restartInterval=5         # seconds between background attempts after a failed start
+
+
+class SessionError(Exception):
+    pass
+
+
+class ManagedSession(object):
+    """ A started blpapi session with its services already opened.
+
+    RESPONSE, PARTIAL_RESPONSE and REQUEST_STATUS events go to the session's
+    RequestRunner; every other event is passed to the registered listeners.
+    When the session terminates, every request still pending on it fails.
+    """
+
+    def __init__(self, host=d_host, port=d_port, services=d_services, limiter=None, metrics=None):
+        self.host = host
+        self.port = port
+        self.services = list(services)
+        self.listeners = []
+
+        self.started = threading.Event()
+        self.startFailed = False
+        self.terminated = False
+
+        self.serviceStatus = {}
+        self.serviceOpened = {}
+        self.serviceCorrelationIds = {}
+        for service in self.services:
+            self.serviceOpened[service] = threading.Event()
+
+        sessionOptions = blpapi.SessionOptions()
+        sessionOptions.setServerHost(self.host)
+        sessionOptions.setServerPort(self.port)
+
+        self.session = blpapi.Session(sessionOptions, self.processEvent)
+        self.runner = RequestRunner(self.session, limiter, metrics=metrics)
+
+    def start(self, timeout=d_startTimeout):
+        # Raises SessionError, with the session stopped, unless the session
+        # started and every service opened within timeout seconds.
+        print ("Connecting to %s:%d" % (self.host, self.port))
+
+        if not self.session.startAsync():
+            raise SessionError("Failed to start session")
+
+        try:
+            if not self.started.wait(timeout):
+                raise SessionError("Timed out starting session")
+            if self.startFailed:
+                raise SessionError("Session startup failed")
+
+            for service in self.services:
+                correlationId = nextCorrelationId()
+                self.serviceStatus[service] = None
+                self.serviceCorrelationIds[correlationId.value()] = service
+                self.session.openServiceAsync(service, correlationId)
+
+            for service in self.services:
+                if not self.serviceOpened[service].wait(timeout):
+                    raise SessionError("Timed out opening %s" % service)
+                if not self.serviceStatus[service]:
+                    raise SessionError("Failed to open %s" % service)
+        except SessionError:
+            print ("Error: %s" % sys.exc_info()[1], file=sys.stderr)
+            self.stop()
+            raise
+
+    def stop(self):
+        self.terminated = True
+        try:
+            self.session.stop()
+        except:
+            print ("Exception:  %s" % sys.exc_info()[0])
+        self.runner.failAll(TERMINATED)
+
+    def isAlive(self):
+        return self.started.is_set() and not self.startFailed and not self.terminated
+
+    def addListener(self, listener):
+        # listener(event, session) receives the non-response events
+        self.listeners.append(listener)
+
+    def getService(self, service):
+        if not self.serviceStatus.get(service):
+            raise SessionError("Service %s is not open on this session" % service)
+        return self.session.getService(service)
+
+    def createRequest(self, service, operation):
+        return self.getService(service).createRequest(operation)
+
+    def sendRequestAsync(self, request, onMessage=None):
+        return self.runner.sendRequestAsync(request, onMessage=onMessage)
+
+    def sendRequest(self, request, timeout=None):
+        return self.runner.sendRequest(request, timeout)
+
+    def processEvent(self, event, session):
+        try:
+            eventType = event.eventType()
+
+            if eventType == blpapi.Event.SESSION_STATUS:
+                self.processSessionStatusEvent(event)
+
+            elif eventType == blpapi.Event.SERVICE_STATUS:
+                self.processServiceStatusEvent(event)
+
+            elif eventType == blpapi.Event.RESPONSE or eventType == blpapi.Event.PARTIAL_RESPONSE or eventType == blpapi.Event.REQUEST_STATUS:
+                if self.runner.processResponseEvent(event):
+                    return False
+
+            for listener in self.listeners:
+                listener(event, session)
+
+        except:
+            print ("Exception:  %s" % sys.exc_info()[0])
+
+        return False
+
+    def processSessionStatusEvent(self, event):
+        for msg in event:
+            if msg.messageType() == SESSION_STARTED:
+                self.started.set()
+
+            elif msg.messageType() == SESSION_STARTUP_FAILURE:
+                print ("Error: Session startup failed", file=sys.stderr)
+                self.startFailed = True
+                self.started.set()
+
+            elif msg.messageType() == SESSION_TERMINATED:
+                self.terminated = True
+                failed = self.runner.failAll(TERMINATED)
+                if failed:
+                    print ("Error: Session terminated with %d requests pending" % failed, file=sys.stderr)
+
+    def processServiceStatusEvent(self, event):
+        for msg in event:
+            service = self.serviceCorrelationIds.get(msg.correlationIds()[0].value())
+            if service is None:
+                continue
+
+            if msg.messageType() == SERVICE_OPENED:
+                self.serviceStatus[service] = True
+                self.serviceOpened[service].set()
+
+            elif msg.messageType() == SERVICE_OPEN_FAILURE:
+                self.serviceStatus[service] = False
+                self.serviceOpened[service].set()
+
+
+class SessionManager(object):
+    """ Keeps a pool of warm sessions and lends them out to operations.
+
+    Requests are multiplexed by correlation ID, so a borrowed session is not
+    exclusive: borrow() hands out the live session with the fewest
+    outstanding requests straight away and replaces sessions that have
+    terminated on a background thread, so a slow or failing start only
+    holds up callers when the pool has no live session at all. A
+    limiter, if given, is shared by every session in the pool since the
+    server-side limits apply per user rather than per connection; so are
+    metrics, so one set of histograms covers the whole pool.
+    """
+
+    def __init__(self, host=d_host, port=d_port, services=d_services, poolSize=1, startTimeout=d_startTimeout, limiter=None, metrics=None,
+                 restartInterval=d_restartInterval):
+        self.host = host
+        self.port = port
+        self.services = list(services)
+        self.poolSize = poolSize
+        self.startTimeout = startTimeout
+        self.limiter = limiter
+        self.metrics = metrics
+        self.restartInterval = restartInterval
+        self.condition = threading.Condition()
+        self.sessions = []
+        self.starting = 0
+        self.replenishing = False
+        self.lastFailure = None
+
+    def start(self):
+        self.replenish()
+
+    def stop(self):
+        with self.condition:
+            sessions = self.sessions
+            self.sessions = []
+        for session in sessions:
+            session.stop()
+
+    def newSession(self):
+        session = ManagedSession(self.host, self.port, self.services, self.limiter, self.metrics)
+        session.start(self.startTimeout)
+        return session
+
+    def replenish(self):
+        # Replaces terminated sessions and starts any the pool is missing;
+        # sessions another thread is already starting are not started twice.
+        with self.condition:
+            terminated = [s for s in self.sessions if not s.isAlive()]
+            for session in terminated:
+                self.sessions.remove(session)
+            missing = max(0, self.poolSize - len(self.sessions) - self.starting)
+            self.starting += missing
+
+        for session in terminated:
+            print ("Replacing terminated session")
+            session.stop()
+
+        started = []
+        try:
+            for i in range(missing):
+                started.append(self.newSession())
+        except SessionError:
+            self.lastFailure = time.time()
+            raise
+        finally:
+            with self.condition:
+                self.starting -= missing
+                self.sessions.extend(started)
+                self.condition.notify_all()
+
+    def replenishInBackground(self):
+        # At most one background replenish runs at a time, and none within
+        # restartInterval of a failed start.
+        with self.condition:
+            if self.replenishing or (self.lastFailure is not None and time.time() - self.lastFailure < self.restartInterval):
+                return
+            self.replenishing = True
+
+        def run():
+            try:
+                self.replenish()
+            except SessionError:
+                pass                    # ManagedSession.start() has reported it
+            except:
+                print ("Exception:  %s" % sys.exc_info()[0])
+            finally:
+                with self.condition:
+                    self.replenishing = False
+
+        thread = threading.Thread(target=run, name="EMSXSessionReplenish")
+        thread.daemon = True
+        thread.start()
+
+    def acquire(self):
+        # Returns a live session without waiting for replacements; only when
+        # none is alive does the caller start one (or wait for the thread
+        # already starting one) and get a SessionError if that fails.
+        with self.condition:
+            alive = [s for s in self.sessions if s.isAlive()]
+            complete = len(alive) == len(self.sessions) and len(self.sessions) + self.starting >= self.poolSize
+        if alive:
+            if not complete:
+                self.replenishInBackground()
+            return min(alive, key=lambda s: s.runner.outstanding())
+
+        self.replenish()
+        with self.condition:
+            while True:
+                alive = [s for s in self.sessions if s.isAlive()]
+                if alive or not self.starting:
+                    break
+                self.condition.wait()
+            if not alive:
+                raise SessionError("No session available")
+            return min(alive, key=lambda s: s.runner.outstanding())
+
+    @contextmanager
+    def borrow(self):
+        yield self.acquire()
+
+    def sendRequest(self, service, operation, fields, timeout=None):
+        # emapisvc requests are filled through their generated class, so
+        # arrays and choices may be given as lists and dicts; other
+        # operations only take scalar fields.
+        with self.borrow() as session:
+            request = session.createRequest(service, operation)
+            generated = REQUESTS.get(operation)
+            if generated is not None:
+                generated(**fields).fill(request)
+            else:
+                for name, value in fields.items():
+                    request.set(name, value)
+            return session.sendRequest(request, timeout)
+
+
+_defaultManager = None
+_defaultManagerLock = threading.Lock()
+
+
+def defaultSessionManager():
+    # Process-wide manager, created and started on first use.
+    global _defaultManager
+    with _defaultManagerLock:
+        if _defaultManager is None:
+            _defaultManager = SessionManager()
+            _defaultManager.start()
+        return _defaultManager
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
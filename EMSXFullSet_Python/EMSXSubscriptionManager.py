@@ -0,0 +1,323 @@
+# EMSXSubscriptionManager.py
+
+import blpapi
+import sys
+import threading
+import time
+
+from EMSXBlotter import BlotterStore, HEARTBEAT, INIT_PAINT_END
+from EMSXNames import ORDER_ROUTE_FIELDS, EVENT_STATUS, SUBSCRIPTION_STARTED, SUBSCRIPTION_FAILURE, SUBSCRIPTION_TERMINATED
+from EMSXRequestRunner import nextCorrelationId
+from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, emapisvcSchema
+from EMSXTopics import FieldProjection, ORDER, ROUTE, ORDER_FIELDS, ROUTE_FIELDS
+
+
+PENDING                 = "pending"
+STARTED                 = "started"
+FAILED                  = "failed"
+TERMINATED              = "terminated"
+
+INTEGER_BITS = {"Int32": 32, "Int64": 64}
+
+d_service="//blp/emapisvc"
+d_teamOption="team"
+d_traderOption="trader_uuid"
+d_traderField="EMSX_TRAD_UUID"  # OrderRouteFields element a trader_uuid option has to match
+d_resubscribe=True              # subscribe again when a subscription fails or is terminated
+d_resubscribeDelay=1.0          # seconds
+d_maxResubscribes=5             # attempts in a row before a subscription is left failed
+d_reportInterval=10             # seconds between status lines in main()
+
+
+class ManagedSubscription(object):
+    """ One order or route topic of a SubscriptionManager. """
+
+    def __init__(self, projection, handler, label):
+        self.projection = projection
+        self.handler = handler
+        self.label = label
+        self.correlationId = nextCorrelationId()
+        self.state = PENDING
+        self.reason = None
+        self.painted = False
+        self.messages = 0
+        self.heartbeats = 0
+        self.resubscribes = 0
+
+    @property
+    def kind(self):
+        return self.projection.kind
+
+    @property
+    def topic(self):
+        return self.projection.topic
+
+    def decode(self, msg):
+        return self.projection.decode(msg)
+
+    def __repr__(self):
+        return "%s %s (%s, %d messages)" % (self.label, self.kind, self.state, self.messages)
+
+
+class SubscriptionManager(object):
+    """ Many order/route subscriptions multiplexed on one session.
+
+    Every topic gets its own correlation ID. Incoming messages are routed
+    through a table from correlation ID value to subscription, which is
+    replaced rather than changed when subscriptions are added or removed,
+    so the event thread reads it without taking a lock. For each
+    OrderRouteFields message the subscription's handler is called as
+    handler(subscription, eventStatus, record), with the record decoded for
+    that subscription's fields; the end of the initial paint is passed on
+    with record None and heartbeats are only counted. A subscription that
+    fails or is terminated is subscribed again after resubscribeDelay
+    seconds, up to maxResubscribes times until it starts again, and gets a
+    new initial paint.
+
+    The manager is added as a listener of a ManagedSession, or its
+    processEvent() can be called from any other session event handler.
+    """
+
+    def __init__(self, session, service=d_service, schema=None, resubscribe=d_resubscribe,
+                 resubscribeDelay=d_resubscribeDelay, maxResubscribes=d_maxResubscribes):
+        self.session = session
+        self.service = service
+        self.schema = schema if schema is not None else emapisvcSchema()
+        self.resubscribe = resubscribe
+        self.resubscribeDelay = resubscribeDelay
+        self.maxResubscribes = maxResubscribes
+        self.table = {}
+        self.lock = threading.Lock()
+        self.unknown = 0
+
+        if hasattr(session, "addListener"):
+            session.addListener(self.processEvent)
+            self.session = session.session
+
+    def add(self, kind, handler, fields=None, options=None, label=None):
+        if fields is None:
+            fields = ORDER_FIELDS if kind == ORDER else ROUTE_FIELDS
+        projection = FieldProjection(self.service, kind, fields, options, self.schema)
+        subscription = ManagedSubscription(projection, handler, label if label is not None else kind)
+        self.subscribe([subscription])
+        return subscription
+
+    def addTeam(self, team, handler, orderFields=None, routeFields=None):
+        # Order and route subscriptions for every order of the team.
+        options = {d_teamOption: team}
+        return self.addPair(options, handler, orderFields, routeFields, team)
+
+    def addTrader(self, uuid, handler, orderFields=None, routeFields=None):
+        # Order and route subscriptions for the orders of one trader UUID.
+        options = {d_traderOption: self.optionValue(d_traderOption, d_traderField, uuid)}
+        return self.addPair(options, handler, orderFields, routeFields, "%s" % uuid)
+
+    def addPair(self, options, handler, orderFields, routeFields, label):
+        if orderFields is None:
+            orderFields = ORDER_FIELDS
+        if routeFields is None:
+            routeFields = ROUTE_FIELDS
+        subscriptions = [ManagedSubscription(FieldProjection(self.service, ORDER, orderFields, options, self.schema), handler, label),
+                         ManagedSubscription(FieldProjection(self.service, ROUTE, routeFields, options, self.schema), handler, label)]
+        self.subscribe(subscriptions)
+        return subscriptions
+
+    def optionValue(self, option, field, value):
+        # Checks a topic option value against the schema type of the
+        # OrderRouteFields element it selects on, and returns it as a string.
+        definition = self.schema.types[ORDER_ROUTE_FIELDS_TYPE].element(field)
+        typeName = self.schema.primitiveType(definition.typeName)
+        if typeName not in INTEGER_BITS:
+            return "%s" % value
+
+        text = "%s" % value
+        if isinstance(value, bool) or not text.lstrip("-").isdigit():
+            raise ValueError("Invalid %s option %r: %s is %s" % (option, value, field, typeName))
+        limit = 2 ** (INTEGER_BITS[typeName] - 1)
+        if not -limit <= int(text) < limit:
+            raise ValueError("Invalid %s option %r: out of range for %s %s" % (option, value, typeName, field))
+        return "%d" % int(text)
+
+    def subscribe(self, subscriptions):
+        # The table is updated before subscribing so the initial paint,
+        # which can arrive before subscribe() returns, is not lost.
+        with self.lock:
+            table = dict(self.table)
+            for subscription in subscriptions:
+                table[subscription.correlationId.value()] = subscription
+            self.table = table
+
+        subscriptionList = blpapi.SubscriptionList()
+        for subscription in subscriptions:
+            subscriptionList.add(topic=subscription.topic, correlationId=subscription.correlationId)
+        self.session.subscribe(subscriptionList)
+
+    def remove(self, subscriptions):
+        if isinstance(subscriptions, ManagedSubscription):
+            subscriptions = [subscriptions]
+
+        with self.lock:
+            table = dict(self.table)
+            for subscription in subscriptions:
+                table.pop(subscription.correlationId.value(), None)
+            self.table = table
+
+        subscriptionList = blpapi.SubscriptionList()
+        for subscription in subscriptions:
+            subscriptionList.add(topic=subscription.topic, correlationId=subscription.correlationId)
+            subscription.state = TERMINATED
+        self.session.unsubscribe(subscriptionList)
+
+    def removeLabel(self, label):
+        self.remove([s for s in self.subscriptions() if s.label == label])
+
+    def removeAll(self):
+        self.remove(self.subscriptions())
+
+    def subscriptions(self):
+        return list(self.table.values())
+
+    def get(self, correlationId):
+        return self.table.get(correlationId.value())
+
+    def processEvent(self, event, session=None):
+        # Returns True if the event was a subscription event.
+        eventType = event.eventType()
+        if eventType == blpapi.Event.SUBSCRIPTION_DATA:
+            self.processSubscriptionDataEvent(event)
+            return True
+        if eventType == blpapi.Event.SUBSCRIPTION_STATUS:
+            self.processSubscriptionStatusEvent(event)
+            return True
+        return False
+
+    def processSubscriptionDataEvent(self, event):
+        table = self.table
+        for msg in event:
+            subscription = table.get(msg.correlationIds()[0].value())
+            if subscription is None or msg.messageType() != ORDER_ROUTE_FIELDS:
+                self.unknown += 1
+                continue
+
+            eventStatus = msg.getElementAsInteger(EVENT_STATUS)
+            if eventStatus == HEARTBEAT:
+                subscription.heartbeats += 1
+                continue
+
+            subscription.messages += 1
+            if eventStatus == INIT_PAINT_END:
+                subscription.painted = True
+                record = None
+            else:
+                record = subscription.decode(msg)
+
+            try:
+                subscription.handler(subscription, eventStatus, record)
+            except:
+                print ("Exception:  %s" % sys.exc_info()[0])
+
+    def processSubscriptionStatusEvent(self, event):
+        table = self.table
+        for msg in event:
+            subscription = table.get(msg.correlationIds()[0].value())
+            if subscription is None:
+                continue
+
+            if msg.messageType() == SUBSCRIPTION_STARTED:
+                subscription.state = STARTED
+                subscription.resubscribes = 0
+
+            elif msg.messageType() == SUBSCRIPTION_FAILURE or msg.messageType() == SUBSCRIPTION_TERMINATED:
+                subscription.state = FAILED if msg.messageType() == SUBSCRIPTION_FAILURE else TERMINATED
+                subscription.reason = str(msg)
+                print ("Error: %s subscription %s: %s" % (subscription.label, subscription.state, subscription.topic), file=sys.stderr)
+                if self.resubscribe and subscription.resubscribes < self.maxResubscribes:
+                    subscription.resubscribes += 1
+                    timer = threading.Timer(self.resubscribeDelay, self.resubscribeLost, (subscription,))
+                    timer.daemon = True
+                    timer.start()
+
+    def resubscribeLost(self, subscription):
+        # Skipped if the subscription was removed or has started meanwhile.
+        with self.lock:
+            if self.table.get(subscription.correlationId.value()) is not subscription:
+                return
+            if subscription.state != FAILED and subscription.state != TERMINATED:
+                return
+            subscription.state = PENDING
+            subscription.painted = False
+        print ("Resubscribing %s %s" % (subscription.label, subscription.kind))
+        self.subscribe([subscription])
+
+    def stats(self):
+        subscriptions = self.subscriptions()
+        return {"subscriptions": len(subscriptions),
+                "started": len([s for s in subscriptions if s.state == STARTED]),
+                "painted": len([s for s in subscriptions if s.painted]),
+                "messages": sum(s.messages for s in subscriptions),
+                "unknown": self.unknown}
+
+
+def main():
+    from EMSXSessionManager import ManagedSession
+
+    if len(sys.argv) < 2:
+        print ("Usage: EMSXSubscriptionManager.py TEAM [TEAM ...]")
+        return
+
+    session = ManagedSession(services=[d_service])
+    session.start()
+
+    blotters = {}
+
+    def onRecord(subscription, eventStatus, record):
+        if record is None:
+            print ("%s - %s end of initial paint" % (subscription.label, subscription.kind))
+        elif subscription.kind == ORDER:
+            blotters[subscription.label].applyOrder(eventStatus, record)
+        else:
+            blotters[subscription.label].applyRoute(eventStatus, record)
+
+    manager = SubscriptionManager(session)
+    try:
+        for team in sys.argv[1:]:
+            blotters[team] = BlotterStore()
+            manager.addTeam(team, onRecord)
+
+        print ("Press Ctrl+C to quit")
+        while True:
+            time.sleep(d_reportInterval)
+            for team, blotter in blotters.items():
+                print ("%s: %d orders, %d routes" % (team, len(blotter.orders), len(blotter.routes)))
+            print ("Subscriptions: %s" % manager.stats())
+    finally:
+        session.stop()
+
+if __name__ == "__main__":
+    print ("Bloomberg - EMSX API Example - EMSXSubscriptionManager")
+    try:
+        main()
+    except KeyboardInterrupt:
+        print ("Ctrl+C pressed. Stopping...")
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -2,42 +2,86 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXBlotter import BlotterStore
+from EMSXCapture import CaptureWriter, captureHandler
+from EMSXColumnarBlotter import ColumnarBlotterStore
+from EMSXConflator import Conflator
+from EMSXEventQueue import EventQueue
+from EMSXNames import (ORDER_ROUTE_FIELDS, EVENT_STATUS, SLOW_CONSUMER_WARNING, SLOW_CONSUMER_WARNING_CLEARED,
+                       SESSION_STARTED, SESSION_TERMINATED, SESSION_STARTUP_FAILURE, SESSION_CONNECTION_UP, SESSION_CONNECTION_DOWN,
+                       SERVICE_OPENED, SERVICE_OPEN_FAILURE, SUBSCRIPTION_FAILURE, SUBSCRIPTION_STARTED, SUBSCRIPTION_TERMINATED,
+                       EXCEPTIONS, FIELD_ID, REASON, REASON_ERROR_CODE, CATEGORY, DESCRIPTION)
+from EMSXResync import BlotterResync
+from EMSXTopics import FieldProjection, ORDER, ROUTE, ORDER_FIELDS, ROUTE_FIELDS
 
-ORDER_ROUTE_FIELDS              = blpapi.Name("OrderRouteFields")
-
-SLOW_CONSUMER_WARNING           = blpapi.Name("SlowConsumerWarning")
-SLOW_CONSUMER_WARNING_CLEARED   = blpapi.Name("SlowConsumerWarningCleared")
-
-SESSION_STARTED                 = blpapi.Name("SessionStarted")
-SESSION_TERMINATED              = blpapi.Name("SessionTerminated")
-SESSION_STARTUP_FAILURE         = blpapi.Name("SessionStartupFailure")
-SESSION_CONNECTION_UP           = blpapi.Name("SessionConnectionUp")
-SESSION_CONNECTION_DOWN         = blpapi.Name("SessionConnectionDown")
-
-SERVICE_OPENED                  = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE            = blpapi.Name("ServiceOpenFailure")
-
-SUBSCRIPTION_FAILURE            = blpapi.Name("SubscriptionFailure")
-SUBSCRIPTION_STARTED            = blpapi.Name("SubscriptionStarted")
-SUBSCRIPTION_TERMINATED         = blpapi.Name("SubscriptionTerminated")
-
-EXCEPTIONS = blpapi.Name("exceptions")
-FIELD_ID = blpapi.Name("fieldId")
-REASON = blpapi.Name("reason")
-CATEGORY = blpapi.Name("category")
-DESCRIPTION = blpapi.Name("description")
 
 #d_service="//blp/emapisvc"
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
+d_orderFields=ORDER_FIELDS  # any OrderRouteFields subset; the key fields are always included
+d_routeFields=ROUTE_FIELDS
+d_topicOptions=None     # e.g. "team=TKTEAM"
+d_columnarBlotter=False # requires numpy
+d_capture=None          # path of a capture log to record incoming events to
+d_queuePolicy=None      # "block", "drop" or "coalesce" to process subscription data on worker threads
+d_queueCapacity=10000
+d_queueWorkers=1
+d_conflateInterval=None # seconds; publish merged order/route updates once per interval (e.g. 0.1)
+d_fastPaint=True        # load the initial paint into the blotter in bulk at its end, without printing it
+d_resubscribe=True      # resubscribe (or restart the session) when subscriptions are lost
+d_resubscribeDelay=1.0  # seconds
 orderSubscriptionID=blpapi.CorrelationId(98)
 routeSubscriptionID=blpapi.CorrelationId(99)
 
 
 class SessionEventHandler(object):
 
+    def __init__(self):
+        self.orderProjection = FieldProjection(d_service, ORDER, d_orderFields, d_topicOptions)
+        self.routeProjection = FieldProjection(d_service, ROUTE, d_routeFields, d_topicOptions)
+        self.blotter = ColumnarBlotterStore() if d_columnarBlotter else BlotterStore()
+        self.queue = None
+        if d_queuePolicy is not None:
+            self.queue = EventQueue(self.processSubscriptionDataEvent, d_queueWorkers, d_queueCapacity, d_queuePolicy)
+        self.conflator = None
+        if d_conflateInterval is not None:
+            self.conflator = Conflator(self.printChange, d_conflateInterval)
+            self.conflator.start()
+        self.resync = BlotterResync(self.blotter)
+        self.subscribed = set()
+        self.painted = set()
+        self.paintRecords = {ORDER: [], ROUTE: []}
+        self.lost = set()
+        self.connected = True
+        self.stopping = False
+        self.session = None
+        self.lock = threading.Lock()
+
+    def startSession(self, sessionOptions, processEvent):
+        # processEvent is this handler's processEvent, possibly wrapped; it
+        # is kept so that a terminated session can be replaced.
+        self.sessionOptions = sessionOptions
+        self.processEventCallback = processEvent
+        self.subscribed.clear()
+        self.session = blpapi.Session(sessionOptions, processEvent)
+        return self.session.startAsync()
+
+    def stop(self):
+        self.stopping = True
+        self.session.stop()
+
+    def restartSession(self):
+        if self.stopping:
+            return
+        print ("Restarting session")
+        with self.lock:
+            self.lost.clear()
+        if not self.startSession(self.sessionOptions, self.processEventCallback):
+            print ("Error: Failed to restart session", file=sys.stderr)
+
     def processEvent(self, event, session):
         try:
             if event.eventType() == blpapi.Event.ADMIN:
@@ -53,7 +97,10 @@ class SessionEventHandler(object):
                 self.processSubscriptionStatusEvent(event, session)
 
             elif event.eventType() == blpapi.Event.SUBSCRIPTION_DATA:
-                self.processSubscriptionDataEvent(event)
+                if self.queue is not None:
+                    self.queue.submit(event)
+                else:
+                    self.processSubscriptionDataEvent(event)
             
             else:
                 self.processMiscEvents(event)
@@ -72,6 +119,8 @@ class SessionEventHandler(object):
             
             if msg.messageType() == SLOW_CONSUMER_WARNING:
                 print ("Warning: Entered Slow Consumer status")
+                if self.queue is not None:
+                    print ("Event queue: %s" % self.queue.stats())
             elif msg.messageType() ==  SLOW_CONSUMER_WARNING_CLEARED:
                 print ("Slow consumer status cleared")
                 
@@ -90,12 +139,17 @@ class SessionEventHandler(object):
                 
             elif msg.messageType() == SESSION_TERMINATED:
                 print ("Error: Session has been terminated")
+                if d_resubscribe and not self.stopping and session is self.session:
+                    self.schedule(self.restartSession)
                 
             elif msg.messageType() == SESSION_CONNECTION_UP:
                 print ("Session connection is up")
+                self.connected = True
+                self.resubscribe(session)
                 
             elif msg.messageType() == SESSION_CONNECTION_DOWN:
                 print ("Error: Session connection is down")
+                self.connected = False
                 
                 
 
@@ -121,7 +175,8 @@ class SessionEventHandler(object):
                 
                 if msg.correlationIds()[0].value() == orderSubscriptionID.value():
                     print ("Order subscription started successfully")
-                    self.createRouteSubscription(session)
+                    if ROUTE not in self.subscribed:
+                        self.createRouteSubscription(session)
                     
                 elif msg.correlationIds()[0].value() == routeSubscriptionID.value():
                     print ("Route subscription started successfully")
@@ -130,15 +185,41 @@ class SessionEventHandler(object):
                 print ("Error: Subscription failed", file=sys.stderr)
                 print ("MESSAGE: %s" % (msg), file=sys.stderr)
                     
-                reason = msg.getElement("reason");
-                errorcode = reason.getElementAsInteger("errorCode")
-                description = reason.getElementAsString("description")
+                reason = msg.getElement(REASON);
+                errorcode = reason.getElementAsInteger(REASON_ERROR_CODE)
+                description = reason.getElementAsString(DESCRIPTION)
             
                 print ("Error: (%d) %s" % (errorcode, description), file=sys.stderr)                
                 
             elif msg.messageType() == SUBSCRIPTION_TERMINATED:
                 print ("Error: Subscription terminated", file=sys.stderr)
                 print ("MESSAGE: %s" % (msg), file=sys.stderr)
+                
+                kind = self.kind(msg)
+                with self.lock:
+                    self.subscribed.discard(kind)
+                    self.lost.add(kind)
+                if d_resubscribe and self.connected and not self.stopping:
+                    self.schedule(self.resubscribe, session)
+
+
+    def schedule(self, function, *args):
+        timer = threading.Timer(d_resubscribeDelay, function, args)
+        timer.daemon = True
+        timer.start()
+
+
+    def resubscribe(self, session):
+        # Subscribes again to what was terminated. The routes are subscribed
+        # once the orders have started, as at startup.
+        with self.lock:
+            lost, self.lost = self.lost, set()
+        if self.stopping or session is not self.session:
+            return
+        if ORDER in lost:
+            self.createOrderSubscription(session)
+        elif ROUTE in lost:
+            self.createRouteSubscription(session)
 
 
     def processSubscriptionDataEvent(self, event):
@@ -148,7 +229,7 @@ class SessionEventHandler(object):
             
             if msg.messageType() == ORDER_ROUTE_FIELDS:
                 
-                event_status = msg.getElementAsInteger("EVENT_STATUS")
+                event_status = msg.getElementAsInteger(EVENT_STATUS)
                 
                 if event_status == 1:
                 
@@ -163,444 +244,110 @@ class SessionEventHandler(object):
                     
                 elif event_status == 11:
                 
+                    if self.resync.active(self.kind(msg)):
+                        for eventStatus, record in self.resync.end(self.kind(msg)):
+                            self.publishChange(self.kind(msg), eventStatus, record)
+                        print ("%s - End of resync: %s" % (self.kind(msg).capitalize(), self.resync.stats()))
+                    else:
+                        self.loadInitialPaint(self.kind(msg))
+                        if msg.correlationIds()[0].value() == orderSubscriptionID.value():
+                            print ("Order - End of initial paint")
+                        elif msg.correlationIds()[0].value() == routeSubscriptionID.value():
+                            print ("Route - End of initial paint")
+                    self.painted.add(self.kind(msg))
+
+                elif event_status == 4 and self.resync.active(self.kind(msg)):
+                    
+                    change = self.resync.paint(self.kind(msg), self.decode(msg))
+                    if change is not None:
+                        self.publishChange(self.kind(msg), change[0], change[1])
+
+                elif event_status == 4 and d_fastPaint and self.kind(msg) not in self.painted:
+                    
+                    self.paintRecords[self.kind(msg)].append(self.decode(msg))
+
+                elif self.conflator is not None:
+                    
+                    record = self.decode(msg)
+                    self.resync.seen(self.kind(msg), record)
+                    
                     if msg.correlationIds()[0].value() == orderSubscriptionID.value():
-                        print ("Order - End of initial paint")
+                        self.blotter.applyOrder(event_status, record)
+                        self.conflator.submit(ORDER, event_status, record)
                     elif msg.correlationIds()[0].value() == routeSubscriptionID.value():
-                        print ("Route - End of initial paint")
+                        self.blotter.applyRoute(event_status, record)
+                        self.conflator.submit(ROUTE, event_status, record)
 
                 else:
                     print ("")
                     
+                    record = self.decode(msg)
+                    self.resync.seen(self.kind(msg), record)
+                    
                     if msg.correlationIds()[0].value() == orderSubscriptionID.value():
-                        
-                        api_seq_num = msg.getElementAsInteger("API_SEQ_NUM") if msg.hasElement("API_SEQ_NUM") else 0
-                        emsx_account = msg.getElementAsString("EMSX_ACCOUNT") if msg.hasElement("EMSX_ACCOUNT") else ""
-                        emsx_amount = msg.getElementAsInteger("EMSX_AMOUNT") if msg.hasElement("EMSX_AMOUNT") else 0
-                        emsx_arrival_price = msg.getElementAsFloat("EMSX_ARRIVAL_PRICE") if msg.hasElement("EMSX_ARRIVAL_PRICE") else 0
-                        emsx_asset_class = msg.getElementAsString("EMSX_ASSET_CLASS") if msg.hasElement("EMSX_ASSET_CLASS") else ""
-                        emsx_assigned_trader = msg.getElementAsString("EMSX_ASSIGNED_TRADER") if msg.hasElement("EMSX_ASSIGNED_TRADER") else ""
-                        emsx_avg_price = msg.getElementAsFloat("EMSX_AVG_PRICE") if msg.hasElement("EMSX_AVG_PRICE") else 0
-                        emsx_basket_name = msg.getElementAsString("EMSX_BASKET_NAME") if msg.hasElement("EMSX_BASKET_NAME") else ""
-                        emsx_basket_num = msg.getElementAsInteger("EMSX_BASKET_NUM") if msg.hasElement("EMSX_BASKET_NUM") else 0
-                        emsx_block_id = msg.getElementAsString("EMSX_BLOCK_ID") if msg.hasElement("EMSX_BLOCK_ID") else ""
-                        emsx_broker = msg.getElementAsString("EMSX_BROKER") if msg.hasElement("EMSX_BROKER") else ""
-                        emsx_broker_comm = msg.getElementAsFloat("EMSX_BROKER_COMM") if msg.hasElement("EMSX_BROKER_COMM") else 0
-                        emsx_bse_avg_price = msg.getElementAsFloat("EMSX_BSE_AVG_PRICE") if msg.hasElement("EMSX_BSE_AVG_PRICE") else 0
-                        emsx_bse_filled = msg.getElementAsInteger("EMSX_BSE_FILLED") if msg.hasElement("EMSX_BSE_FILLED") else 0
-                        emsx_buyside_lei = msg.getElementAsString("EMSX_BUYSIDE_LEI") if msg.hasElement("EMSX_BUYSIDE_LEI") else ""
-                        emsx_cfd_flag = msg.getElementAsString("EMSX_CFD_FLAG") if msg.hasElement("EMSX_CFD_FLAG") else ""
-                        emsx_client_identification = msg.getElementAsString("EMSX_CLIENT_IDENTIFICATION") if msg.hasElement("EMSX_CLIENT_IDENTIFICATION") else ""
-                        emsx_comm_diff_flag = msg.getElementAsString("EMSX_COMM_DIFF_FLAG") if msg.hasElement("EMSX_COMM_DIFF_FLAG") else ""
-                        emsx_comm_rate = msg.getElementAsFloat("EMSX_COMM_RATE") if msg.hasElement("EMSX_COMM_RATE") else 0
-                        emsx_currency_pair = msg.getElementAsString("EMSX_CURRENCY_PAIR") if msg.hasElement("EMSX_CURRENCY_PAIR") else ""
-                        emsx_custom_note1 = msg.getElementAsString("EMSX_CUSTOM_NOTE1") if msg.hasElement("EMSX_CUSTOM_NOTE1") else ""
-                        emsx_custom_note2 = msg.getElementAsString("EMSX_CUSTOM_NOTE2") if msg.hasElement("EMSX_CUSTOM_NOTE2") else ""
-                        emsx_custom_note3 = msg.getElementAsString("EMSX_CUSTOM_NOTE3") if msg.hasElement("EMSX_CUSTOM_NOTE3") else ""
-                        emsx_custom_note4 = msg.getElementAsString("EMSX_CUSTOM_NOTE4") if msg.hasElement("EMSX_CUSTOM_NOTE4") else ""
-                        emsx_custom_note5 = msg.getElementAsString("EMSX_CUSTOM_NOTE5") if msg.hasElement("EMSX_CUSTOM_NOTE5") else ""                                               
-                        emsx_date = msg.getElementAsInteger("EMSX_DATE") if msg.hasElement("EMSX_DATE") else 0
-                        emsx_day_avg_price = msg.getElementAsFloat("EMSX_DAY_AVG_PRICE") if msg.hasElement("EMSX_DAY_AVG_PRICE") else 0
-                        emsx_day_fill = msg.getElementAsInteger("EMSX_DAY_FILL") if msg.hasElement("EMSX_DAY_FILL") else 0
-                        emsx_dir_broker_flag = msg.getElementAsString("EMSX_DIR_BROKER_FLAG") if msg.hasElement("EMSX_DIR_BROKER_FLAG") else ""
-                        emsx_exchange = msg.getElementAsString("EMSX_EXCHANGE") if msg.hasElement("EMSX_EXCHANGE") else ""
-                        emsx_exchange_destination = msg.getElementAsString("EMSX_EXCHANGE_DESTINATION") if msg.hasElement("EMSX_EXCHANGE_DESTINATION") else ""
-                        emsx_exec_instruction = msg.getElementAsString("EMSX_EXEC_INSTRUCTION") if msg.hasElement("EMSX_EXEC_INSTRUCTION") else ""
-                        emsx_fill_id = msg.getElementAsInteger("EMSX_FILL_ID") if msg.hasElement("EMSX_FILL_ID") else 0
-                        emsx_filled = msg.getElementAsInteger("EMSX_FILLED") if msg.hasElement("EMSX_FILLED") else 0
-                        emsx_gpi = msg.getElementAsString("EMSX_GPI") if msg.hasElement("EMSX_GPI") else ""
-                        emsx_gtd_date = msg.getElementAsInteger("EMSX_GTD_DATE") if msg.hasElement("EMSX_GTD_DATE") else 0
-                        emsx_hand_instruction = msg.getElementAsString("EMSX_HAND_INSTRUCTION") if msg.hasElement("EMSX_HAND_INSTRUCTION") else ""
-                        emsx_idle_amount = msg.getElementAsInteger("EMSX_IDLE_AMOUNT") if msg.hasElement("EMSX_IDLE_AMOUNT") else 0
-                        emsx_investor_id = msg.getElementAsString("EMSX_INVESTOR_ID") if msg.hasElement("EMSX_INVESTOR_ID") else ""
-                        emsx_isin = msg.getElementAsString("EMSX_ISIN") if msg.hasElement("EMSX_ISIN") else ""
-                        emsx_limit_price = msg.getElementAsFloat("EMSX_LIMIT_PRICE") if msg.hasElement("EMSX_LIMIT_PRICE") else 0
-                        emsx_mifid_ii_instruction = msg.getElementAsString("EMSX_MIFID_II_INSTRUCTION") if msg.hasElement("EMSX_MIFID_II_INSTRUCTION") else ""
-                        emsx_mod_pend_status = msg.getElementAsString("EMSX_MOD_PEND_STATUS") if msg.hasElement("EMSX_MOD_PEND_STATUS") else ""
-                        emsx_notes = msg.getElementAsString("EMSX_NOTES") if msg.hasElement("EMSX_NOTES") else ""
-                        emsx_nse_avg_price = msg.getElementAsFloat("EMSX_NSE_AVG_PRICE") if msg.hasElement("EMSX_NSE_AVG_PRICE") else 0
-                        emsx_nse_filled = msg.getElementAsInteger("EMSX_NSE_FILLED") if msg.hasElement("EMSX_NSE_FILLED") else 0
-                        emsx_order_as_of_date = msg.getElementAsInteger("EMSX_ORDER_AS_OF_DATE") if msg.hasElement("EMSX_ORDER_AS_OF_DATE") else 0
-                        emsx_order_as_of_time_microsec = msg.getElementAsFloat("EMSX_ORDER_AS_OF_TIME_MICROSEC") if msg.hasElement("EMSX_ORDER_AS_OF_TIME_MICROSEC") else 0
-                        emsx_ord_ref_id = msg.getElementAsString("EMSX_ORD_REF_ID") if msg.hasElement("EMSX_ORD_REF_ID") else ""
-                        emsx_order_type = msg.getElementAsString("EMSX_ORDER_TYPE") if msg.hasElement("EMSX_ORDER_TYPE") else ""
-                        emsx_originate_trader = msg.getElementAsString("EMSX_ORIGINATE_TRADER") if msg.hasElement("EMSX_ORIGINATE_TRADER") else ""
-                        emsx_originate_trader_firm = msg.getElementAsString("EMSX_ORIGINATE_TRADER_FIRM") if msg.hasElement("EMSX_ORIGINATE_TRADER_FIRM") else ""
-                        emsx_percent_remain = msg.getElementAsFloat("EMSX_PERCENT_REMAIN") if msg.hasElement("EMSX_PERCENT_REMAIN") else 0
-                        emsx_pm_uuid = msg.getElementAsInteger("EMSX_PM_UUID") if msg.hasElement("EMSX_PM_UUID") else 0
-                        emsx_port_mgr = msg.getElementAsString("EMSX_PORT_MGR") if msg.hasElement("EMSX_PORT_MGR") else ""
-                        emsx_port_name = msg.getElementAsString("EMSX_PORT_NAME") if msg.hasElement("EMSX_PORT_NAME") else ""
-                        emsx_port_num = msg.getElementAsInteger("EMSX_PORT_NUM") if msg.hasElement("EMSX_PORT_NUM") else 0
-                        emsx_position = msg.getElementAsString("EMSX_POSITION") if msg.hasElement("EMSX_POSITION") else ""
-                        emsx_principle = msg.getElementAsFloat("EMSX_PRINCIPAL") if msg.hasElement("EMSX_PRINCIPAL") else 0
-                        emsx_product = msg.getElementAsString("EMSX_PRODUCT") if msg.hasElement("EMSX_PRODUCT") else ""
-                        emsx_queued_date = msg.getElementAsInteger("EMSX_QUEUED_DATE") if msg.hasElement("EMSX_QUEUED_DATE") else 0
-                        emsx_queued_time = msg.getElementAsInteger("EMSX_QUEUED_TIME") if msg.hasElement("EMSX_QUEUED_TIME") else 0
-                        emsx_queued_time_microsec = msg.getElementAsFloat("EMSX_QUEUED_TIME_MICROSEC") if msg.hasElement("EMSX_QUEUED_TIME_MICROSEC") else 0
-                        emsx_reason_code = msg.getElementAsString("EMSX_REASON_CODE") if msg.hasElement("EMSX_REASON_CODE") else ""
-                        emsx_reason_desc = msg.getElementAsString("EMSX_REASON_DESC") if msg.hasElement("EMSX_REASON_DESC") else ""
-                        emsx_remain_balance = msg.getElementAsFloat("EMSX_REMAIN_BALANCE") if msg.hasElement("EMSX_REMAIN_BALANCE") else 0
-                        emsx_route_id = msg.getElementAsInteger("EMSX_ROUTE_ID") if msg.hasElement("EMSX_ROUTE_ID") else 0
-                        emsx_route_price = msg.getElementAsFloat("EMSX_ROUTE_PRICE") if msg.hasElement("EMSX_ROUTE_PRICE") else 0
-                        emsx_sec_name = msg.getElementAsString("EMSX_SEC_NAME") if msg.hasElement("EMSX_SEC_NAME") else ""
-                        emsx_sedol = msg.getElementAsString("EMSX_SEDOL") if msg.hasElement("EMSX_SEDOL") else ""
-                        emsx_sequence = msg.getElementAsInteger("EMSX_SEQUENCE") if msg.hasElement("EMSX_SEQUENCE") else 0
-                        emsx_settle_amount = msg.getElementAsFloat("EMSX_SETTLE_AMOUNT") if msg.hasElement("EMSX_SETTLE_AMOUNT") else 0
-                        emsx_settle_date = msg.getElementAsInteger("EMSX_SETTLE_DATE") if msg.hasElement("EMSX_SETTLE_DATE") else 0
-                        emsx_si = msg.getElementAsString("EMSX_SI") if msg.hasElement("EMSX_SI") else ""
-                        emsx_side = msg.getElementAsString("EMSX_SIDE") if msg.hasElement("EMSX_SIDE") else ""
-                        emsx_start_amount = msg.getElementAsInteger("EMSX_START_AMOUNT") if msg.hasElement("EMSX_START_AMOUNT") else 0
-                        emsx_status = msg.getElementAsString("EMSX_STATUS") if msg.hasElement("EMSX_STATUS") else ""
-                        emsx_step_out_broker = msg.getElementAsString("EMSX_STEP_OUT_BROKER") if msg.hasElement("EMSX_STEP_OUT_BROKER") else ""
-                        emsx_stop_price = msg.getElementAsFloat("EMSX_STOP_PRICE") if msg.hasElement("EMSX_STOP_PRICE") else 0
-                        emsx_strategy_end_time = msg.getElementAsInteger("EMSX_STRATEGY_END_TIME") if msg.hasElement("EMSX_STRATEGY_END_TIME") else 0
-                        emsx_strategy_part_rate1 = msg.getElementAsFloat("EMSX_STRATEGY_PART_RATE1") if msg.hasElement("EMSX_STRATEGY_PART_RATE1") else 0
-                        emsx_strategy_part_rate2 = msg.getElementAsFloat("EMSX_STRATEGY_PART_RATE2") if msg.hasElement("EMSX_STRATEGY_PART_RATE2") else 0
-                        emsx_strategy_style = msg.getElementAsString("EMSX_STRATEGY_STYLE") if msg.hasElement("EMSX_STRATEGY_STYLE") else ""
-                        emsx_strategy_type = msg.getElementAsString("EMSX_STRATEGY_TYPE") if msg.hasElement("EMSX_STRATEGY_TYPE") else ""
-                        emsx_ticker = msg.getElementAsString("EMSX_TICKER") if msg.hasElement("EMSX_TICKER") else ""
-                        emsx_tif = msg.getElementAsString("EMSX_TIF") if msg.hasElement("EMSX_TIF") else ""
-                        emsx_time_stamp = msg.getElementAsInteger("EMSX_TIME_STAMP") if msg.hasElement("EMSX_TIME_STAMP") else 0
-                        emsx_time_stamp_microsec = msg.getElementAsFloat("EMSX_TIME_STAMP_MICROSEC") if msg.hasElement("EMSX_TIME_STAMP_MICROSEC") else 0
-                        emsx_trad_uuid = msg.getElementAsInteger("EMSX_TRAD_UUID") if msg.hasElement("EMSX_TRAD_UUID") else 0
-                        emsx_trade_desk = msg.getElementAsString("EMSX_TRADE_DESK") if msg.hasElement("EMSX_TRADE_DESK") else ""
-                        emsx_trader = msg.getElementAsString("EMSX_TRADER") if msg.hasElement("EMSX_TRADER") else ""
-                        emsx_trader_notes = msg.getElementAsString("EMSX_TRADER_NOTES") if msg.hasElement("EMSX_TRADER_NOTES") else ""
-                        emsx_ts_ordnum = msg.getElementAsInteger("EMSX_TS_ORDNUM") if msg.hasElement("EMSX_TS_ORDNUM") else 0
-                        emsx_type = msg.getElementAsString("EMSX_TYPE") if msg.hasElement("EMSX_TYPE") else ""
-                        emsx_underlying_ticker = msg.getElementAsString("EMSX_UNDERLYING_TICKER") if msg.hasElement("EMSX_UNDERLYING_TICKER") else ""
-                        emsx_user_comm_amount = msg.getElementAsFloat("EMSX_USER_COMM_AMOUNT") if msg.hasElement("EMSX_USER_COMM_AMOUNT") else 0
-                        emsx_user_comm_rate = msg.getElementAsFloat("EMSX_USER_COMM_RATE") if msg.hasElement("EMSX_USER_COMM_RATE") else 0
-                        emsx_user_fees = msg.getElementAsFloat("EMSX_USER_FEES") if msg.hasElement("EMSX_USER_FEES") else 0
-                        emsx_user_net_money = msg.getElementAsFloat("EMSX_USER_NET_MONEY") if msg.hasElement("EMSX_USER_NET_MONEY") else 0
-                        emsx_user_work_price = msg.getElementAsFloat("EMSX_WORK_PRICE") if msg.hasElement("EMSX_WORK_PRICE") else 0
-                        emsx_working = msg.getElementAsInteger("EMSX_WORKING") if msg.hasElement("EMSX_WORKING") else 0
-                        emsx_yellow_key = msg.getElementAsString("EMSX_YELLOW_KEY") if msg.hasElement("EMSX_YELLOW_KEY") else ""
-                        
+                        self.blotter.applyOrder(event_status, record)
                         print ("ORDER MESSAGE: CorrelationID(%d)   Status(%d)" % (msg.correlationIds()[0].value(),event_status))
                         print ("MESSAGE: %s" % (msg))
-                        
-                        print ("API_SEQ_NUM: %d" % (api_seq_num))
-                        print ("EMSX_ACCOUNT: %s" % (emsx_account))
-                        print ("EMSX_AMOUNT: %d" % (emsx_amount))
-                        print ("EMSX_ARRIVAL_PRICE: %d" % (emsx_arrival_price))
-                        print ("EMSX_ASSET_CLASS: %s" % (emsx_asset_class))
-                        print ("EMSX_ASSIGNED_TRADER: %s" % (emsx_assigned_trader))
-                        print ("EMSX_AVG_PRICE: %d" % (emsx_avg_price))
-                        print ("EMSX_BASKET_NAME: %s" % (emsx_basket_name))
-                        print ("EMSX_BASKET_NUM: %d" % (emsx_basket_num))
-                        print ("EMSX_BLOCK_ID: %s" % (emsx_block_id))
-                        print ("EMSX_BROKER: %s" % (emsx_broker))
-                        print ("EMSX_BROKER_COMM: %d" % (emsx_broker_comm))
-                        print ("EMSX_BSE_AVG_PRICE: %d" % (emsx_bse_avg_price))
-                        print ("EMSX_BSE_FILLED: %d" % (emsx_bse_filled))
-                        print ("EMSX_BUYSIDE_LEI: %s" % (emsx_buyside_lei))
-                        print ("EMSX_CFD_FLAG: %s" % (emsx_cfd_flag))
-                        print ("EMSX_CLIENT_IDENTIFICATION: %s" % (emsx_client_identification))
-                        print ("EMSX_COMM_DIFF_FLAG: %s" % (emsx_comm_diff_flag))
-                        print ("EMSX_COMM_RATE: %d" % (emsx_comm_rate))
-                        print ("EMSX_CUSTOM_NOTE1: %s" % (emsx_custom_note1))
-                        print ("EMSX_CUSTOM_NOTE2: %s" % (emsx_custom_note2))
-                        print ("EMSX_CUSTOM_NOTE3: %s" % (emsx_custom_note3))
-                        print ("EMSX_CUSTOM_NOTE4: %s" % (emsx_custom_note4))
-                        print ("EMSX_CUSTOM_NOTE5: %s" % (emsx_custom_note5))    
-                        print ("EMSX_CURRENCY_PAIR: %s" % (emsx_currency_pair))
-                        print ("EMSX_DATE: %d" % (emsx_date))
-                        print ("EMSX_DAY_AVG_PRICE: %d" % (emsx_day_avg_price))
-                        print ("EMSX_DAY_FILL: %d" % (emsx_day_fill))
-                        print ("EMSX_DIR_BROKER_FLAG: %s" % (emsx_dir_broker_flag))
-                        print ("EMSX_EXCHANGE: %s" % (emsx_exchange))
-                        print ("EMSX_EXCHANGE_DESTINATION: %s" % (emsx_exchange_destination))
-                        print ("EMSX_EXEC_INSTRUCTION: %s" % (emsx_exec_instruction))
-                        print ("EMSX_FILL_ID: %d" % (emsx_fill_id))
-                        print ("EMSX_FILLED: %d" % (emsx_filled))
-                        print ("EMSX_GPI: %s" % (emsx_gpi))
-                        print ("EMSX_GTD_DATE: %d" % (emsx_gtd_date))
-                        print ("EMSX_HAND_INSTRUCTION: %s" % (emsx_hand_instruction))
-                        print ("EMSX_IDLE_AMOUNT: %d" % (emsx_idle_amount))
-                        print ("EMSX_INVESTOR_ID: %s" % (emsx_investor_id))
-                        print ("EMSX_ISIN: %s" % (emsx_isin))
-                        print ("EMSX_LIMIT_PRICE: %0.8f" % (emsx_limit_price))
-                        print ("EMSX_MIFID_II_INSTRUCTION: %s" % (emsx_mifid_ii_instruction))
-                        print ("EMSX_MOD_PEND_STATUS: %s" % (emsx_mod_pend_status))
-                        print ("EMSX_NOTES: %s" % (emsx_notes))
-                        print ("EMSX_NSE_AVG_PRICE: %d" % (emsx_nse_avg_price))
-                        print ("EMSX_NSE_FILLED: %d" % (emsx_nse_filled))
-                        print ("EMSX_ORD_REF_ID: %s" % (emsx_ord_ref_id))
-                        print ("EMSX_ORDER_AS_OF_DATE: %d" % (emsx_order_as_of_date))
-                        print ("EMSX_ORDER_AS_OF_TIME_MICROSEC: %0.8f" % (emsx_order_as_of_time_microsec))
-                        print ("EMSX_ORDER_TYPE: %s" % (emsx_order_type))
-                        print ("EMSX_ORIGINATE_TRADER: %s" % (emsx_originate_trader))
-                        print ("EMSX_ORIGINATE_TRADER_FIRM: %s" % (emsx_originate_trader_firm))
-                        print ("EMSX_PERCENT_REMAIN: %d" % (emsx_percent_remain))
-                        print ("EMSX_PM_UUID: %d" % (emsx_pm_uuid))
-                        print ("EMSX_PORT_MGR: %s" % (emsx_port_mgr))
-                        print ("EMSX_PORT_NAME: %s" % (emsx_port_name))
-                        print ("EMSX_PORT_NUM: %d" % (emsx_port_num))
-                        print ("EMSX_POSITION: %s" % (emsx_position))
-                        print ("EMSX_PRINCIPAL: %d" % (emsx_principle))
-                        print ("EMSX_PRODUCT: %s" % (emsx_product))
-                        print ("EMSX_QUEUED_DATE: %d" % (emsx_queued_date))
-                        print ("EMSX_QUEUED_TIME: %d" % (emsx_queued_time))
-                        print ("EMSX_QUEUED_TIME_MICROSEC: %0.8f" % (emsx_queued_time_microsec))
-                        print ("EMSX_REASON_CODE: %s" % (emsx_reason_code))
-                        print ("EMSX_REASON_DESC: %s" % (emsx_reason_desc))
-                        print ("EMSX_REMAIN_BALANCE: %d" % (emsx_remain_balance))
-                        print ("EMSX_ROUTE_ID: %d" % (emsx_route_id))
-                        print ("EMSX_ROUTE_PRICE: %d" % (emsx_route_price))
-                        print ("EMSX_SEC_NAME: %s" % (emsx_sec_name))
-                        print ("EMSX_SEDOL: %s" % (emsx_sedol))
-                        print ("EMSX_SEQUENCE: %d" % (emsx_sequence))
-                        print ("EMSX_SETTLE_AMOUNT: %d" % (emsx_settle_amount))
-                        print ("EMSX_SETTLE_DATE: %d" % (emsx_settle_date))
-                        print ("EMSX_SI: %s" % (emsx_si))
-                        print ("EMSX_SIDE: %s" % (emsx_side))
-                        print ("EMSX_START_AMOUNT: %d" % (emsx_start_amount))
-                        print ("EMSX_STATUS: %s" % (emsx_status))
-                        print ("EMSX_STEP_OUT_BROKER: %s" % (emsx_step_out_broker))
-                        print ("EMSX_STOP_PRICE: %d" % (emsx_stop_price))
-                        print ("EMSX_STRATEGY_END_TIME: %d" % (emsx_strategy_end_time))
-                        print ("EMSX_STRATEGY_PART_RATE1: %d" % (emsx_strategy_part_rate1))
-                        print ("EMSX_STRATEGY_PART_RATE2: %d" % (emsx_strategy_part_rate2))
-                        print ("EMSX_STRATEGY_STYLE: %s" % (emsx_strategy_style))
-                        print ("EMSX_STRATEGY_TYPE: %s" % (emsx_strategy_type))
-                        print ("EMSX_TICKER: %s" % (emsx_ticker))
-                        print ("EMSX_TIF: %s" % (emsx_tif))
-                        print ("EMSX_TIME_STAMP: %d" % (emsx_time_stamp))
-                        print ("EMSX_TIME_STAMP_MICROSEC: %0.8f" % (emsx_time_stamp_microsec))
-                        print ("EMSX_TRAD_UUID: %d" % (emsx_trad_uuid))
-                        print ("EMSX_TRADE_DESK: %s" % (emsx_trade_desk))
-                        print ("EMSX_TRADER: %s" % (emsx_trader))
-                        print ("EMSX_TRADER_NOTES: %s" % (emsx_trader_notes))
-                        print ("EMSX_TS_ORDNUM: %d" % (emsx_ts_ordnum))
-                        print ("EMSX_TYPE: %s" % (emsx_type))
-                        print ("EMSX_UNDERLYING_TICKER: %s" % (emsx_underlying_ticker))
-                        print ("EMSX_USER_COMM_AMOUNT: %d" % (emsx_user_comm_amount))
-                        print ("EMSX_USER_COMM_RATE: %d" % (emsx_user_comm_rate))
-                        print ("EMSX_USER_FEES: %d" % (emsx_user_fees))
-                        print ("EMSX_USER_NET_MONEY: %d" % (emsx_user_net_money))
-                        print ("EMSX_WORK_PRICE: %d" % (emsx_user_work_price))
-                        print ("EMSX_WORKING: %d" % (emsx_working))
-                        print ("EMSX_YELLOW_KEY: %s" % (emsx_yellow_key))
+                        self.printRecord(record)
             
                     elif msg.correlationIds()[0].value() == routeSubscriptionID.value():
-                            
-                        api_seq_num = msg.getElementAsInteger("API_SEQ_NUM") if msg.hasElement("API_SEQ_NUM") else 0
-                        emsx_amount = msg.getElementAsInteger("EMSX_AMOUNT") if msg.hasElement("EMSX_AMOUNT") else 0
-                        emsx_apa_mic = msg.getElementAsString("EMSX_APA_MIC") if msg.hasElement("EMSX_APA_MIC") else ""
-                        emsx_avg_price = msg.getElementAsFloat("EMSX_AVG_PRICE") if msg.hasElement("EMSX_AVG_PRICE") else 0
-                        emsx_broker = msg.getElementAsString("EMSX_BROKER") if msg.hasElement("EMSX_BROKER") else ""
-                        emsx_broker_comm = msg.getElementAsFloat("EMSX_BROKER_COMM") if msg.hasElement("EMSX_BROKER_COMM") else 0
-                        emsx_broker_lei = msg.getElementAsString("EMSX_BROKER_LEI") if msg.hasElement("EMSX_BROKER_LEI") else ""
-                        emsx_broker_si = msg.getElementAsString("EMSX_BROKER_SI") if msg.hasElement("EMSX_BROKER_SI") else ""
-                        emsx_broker_status = msg.getElementAsString("EMSX_BROKER_STATUS") if msg.hasElement("EMSX_BROKER_STATUS") else ""
-                        emsx_bse_avg_price = msg.getElementAsFloat("EMSX_BSE_AVG_PRICE") if msg.hasElement("EMSX_BSE_AVG_PRICE") else 0
-                        emsx_bse_filled = msg.getElementAsInteger("EMSX_BSE_FILLED") if msg.hasElement("EMSX_BSE_FILLED") else 0
-                        emsx_buyside_lei = msg.getElementAsString("EMSX_BUYSIDE_LEI") if msg.hasElement("EMSX_BUYSIDE_LEI") else ""
-                        emsx_clearing_account = msg.getElementAsString("EMSX_CLEARING_ACCOUNT") if msg.hasElement("EMSX_CLEARING_ACCOUNT") else ""
-                        emsx_clearing_firm = msg.getElementAsString("EMSX_CLEARING_FIRM") if msg.hasElement("EMSX_CLEARING_FIRM") else ""
-                        emsx_client_identification = msg.getElementAsString("EMSX_CLIENT_IDENTIFICATION") if msg.hasElement("EMSX_CLIENT_IDENTIFICATION") else ""
-                        emsx_comm_diff_flag = msg.getElementAsString("EMSX_COMM_DIFF_FLAG") if msg.hasElement("EMSX_COMM_DIFF_FLAG") else ""
-                        emsx_comm_rate = msg.getElementAsFloat("EMSX_COMM_RATE") if msg.hasElement("EMSX_COMM_RATE") else 0
-                        emsx_currency_pair = msg.getElementAsString("EMSX_CURRENCY_PAIR") if msg.hasElement("EMSX_CURRENCY_PAIR") else ""
-                        emsx_custom_account = msg.getElementAsString("EMSX_CUSTOM_ACCOUNT") if msg.hasElement("EMSX_CUSTOM_ACCOUNT") else ""
-                        emsx_day_avg_price = msg.getElementAsFloat("EMSX_DAY_AVG_PRICE") if msg.hasElement("EMSX_DAY_AVG_PRICE") else 0
-                        emsx_day_fill = msg.getElementAsInteger("EMSX_DAY_FILL") if msg.hasElement("EMSX_DAY_FILL") else 0
-                        emsx_exchange_destination = msg.getElementAsString("EMSX_EXCHANGE_DESTINATION") if msg.hasElement("EMSX_EXCHANGE_DESTINATION") else ""
-                        emsx_exec_instruction = msg.getElementAsString("EMSX_EXEC_INSTRUCTION") if msg.hasElement("EMSX_EXEC_INSTRUCTION") else ""
-                        emsx_execute_broker = msg.getElementAsString("EMSX_EXECUTE_BROKER") if msg.hasElement("EMSX_EXECUTE_BROKER") else ""
-                        emsx_fill_id = msg.getElementAsInteger("EMSX_FILL_ID") if msg.hasElement("EMSX_FILL_ID") else 0
-                        emsx_filled = msg.getElementAsInteger("EMSX_FILLED") if msg.hasElement("EMSX_FILLED") else 0
-                        emsx_gpi = msg.getElementAsString("EMSX_GPI") if msg.hasElement("EMSX_GPI") else ""
-                        emsx_gtd_date = msg.getElementAsInteger("EMSX_GTD_DATE") if msg.hasElement("EMSX_GTD_DATE") else 0
-                        emsx_hand_instruction = msg.getElementAsString("EMSX_HAND_INSTRUCTION") if msg.hasElement("EMSX_HAND_INSTRUCTION") else ""
-                        emsx_is_manual_route = msg.getElementAsInteger("EMSX_IS_MANUAL_ROUTE") if msg.hasElement("EMSX_IS_MANUAL_ROUTE") else 0
-                        emsx_last_capacity = msg.getElementAsString("EMSX_LAST_CAPACITY") if msg.hasElement("EMSX_LAST_CAPACITY") else ""
-                        emsx_last_fill_date = msg.getElementAsInteger("EMSX_LAST_FILL_DATE") if msg.hasElement("EMSX_LAST_FILL_DATE") else 0
-                        emsx_last_fill_time = msg.getElementAsInteger("EMSX_LAST_FILL_TIME") if msg.hasElement("EMSX_LAST_FILL_TIME") else 0
-                        emsx_last_fill_time_microsec = msg.getElementAsFloat("EMSX_LAST_FILL_TIME_MICROSEC") if msg.hasElement("EMSX_LAST_FILL_TIME_MICROSEC") else 0
-                        emsx_last_market = msg.getElementAsString("EMSX_LAST_MARKET") if msg.hasElement("EMSX_LAST_MARKET") else ""
-                        emsx_last_price = msg.getElementAsFloat("EMSX_LAST_PRICE") if msg.hasElement("EMSX_LAST_PRICE") else 0
-                        emsx_last_shares = msg.getElementAsInteger("EMSX_LAST_SHARES") if msg.hasElement("EMSX_LAST_SHARES") else 0
-                        emsx_leg_fill_date_added = msg.getElementAsInteger("EMSX_LEG_FILL_DATE_ADDED") if msg.hasElement("EMSX_LEG_FILL_DATE_ADDED") else 0
-                        emsx_leg_fill_price = msg.getElementAsFloat("EMSX_LEG_FILL_PRICE") if msg.hasElement("EMSX_LEG_FILL_PRICE") else 0
-                        emsx_leg_fill_seq_no = msg.getElementAsInteger("EMSX_LEG_FILL_SEQ_NO") if msg.hasElement("EMSX_LEG_FILL_SEQ_NO") else 0
-                        emsx_leg_fill_shares = msg.getElementAsFloat("EMSX_LEG_FILL_SHARES") if msg.hasElement("EMSX_LEG_FILL_SHARES") else 0
-                        emsx_leg_fill_side = msg.getElementAsString("EMSX_LEG_FILL_SIDE") if msg.hasElement("EMSX_LEG_FILL_SIDE") else ""
-                        emsx_leg_fill_ticker = msg.getElementAsString("EMSX_LEG_FILL_TICKER") if msg.hasElement("EMSX_LEG_FILL_TICKER") else ""
-                        emsx_leg_fill_time_added = msg.getElementAsInteger("EMSX_LEG_FILL_TIME_ADDED") if msg.hasElement("EMSX_LEG_FILL_TIME_ADDED") else 0
-                        emsx_limit_price = msg.getElementAsFloat("EMSX_LIMIT_PRICE") if msg.hasElement("EMSX_LIMIT_PRICE") else 0
-                        emsx_mifid_ii_instruction = msg.getElementAsString("EMSX_MIFID_II_INSTRUCTION") if msg.hasElement("EMSX_MIFID_II_INSTRUCTION") else ""
-                        emsx_misc_fees = msg.getElementAsFloat("EMSX_MISC_FEES") if msg.hasElement("EMSX_MISC_FEES") else 0
-                        emsx_ml_id = msg.getElementAsString("EMSX_ML_ID") if msg.hasElement("EMSX_ML_ID") else ""
-                        emsx_ml_leg_quantity = msg.getElementAsInteger("EMSX_ML_LEG_QUANTITY") if msg.hasElement("EMSX_ML_LEG_QUANTITY") else 0
-                        emsx_ml_num_legs = msg.getElementAsInteger("EMSX_ML_NUM_LEGS") if msg.hasElement("EMSX_ML_NUM_LEGS") else 0
-                        emsx_ml_percent_filled = msg.getElementAsFloat("EMSX_ML_PERCENT_FILLED") if msg.hasElement("EMSX_ML_PERCENT_FILLED") else 0
-                        emsx_ml_ratio = msg.getElementAsFloat("EMSX_ML_RATIO") if msg.hasElement("EMSX_ML_RATIO") else 0
-                        emsx_ml_remain_balance = msg.getElementAsFloat("EMSX_ML_REMAIN_BALANCE") if msg.hasElement("EMSX_ML_REMAIN_BALANCE") else 0
-                        emsx_ml_strategy = msg.getElementAsString("EMSX_ML_STRATEGY") if msg.hasElement("EMSX_ML_STRATEGY") else ""
-                        emsx_ml_total_quantity = msg.getElementAsInteger("EMSX_ML_TOTAL_QUANTITY") if msg.hasElement("EMSX_ML_TOTAL_QUANTITY") else 0
-                        emsx_notes = msg.getElementAsString("EMSX_NOTES") if msg.hasElement("EMSX_NOTES") else ""
-                        emsx_nse_avg_price = msg.getElementAsFloat("EMSX_NSE_AVG_PRICE") if msg.hasElement("EMSX_NSE_AVG_PRICE") else 0
-                        emsx_nse_filled = msg.getElementAsInteger("EMSX_NSE_FILLED") if msg.hasElement("EMSX_NSE_FILLED") else 0
-                        emsx_order_type = msg.getElementAsString("EMSX_ORDER_TYPE") if msg.hasElement("EMSX_ORDER_TYPE") else ""
-                        emsx_otc_flag = msg.getElementAsString("EMSX_OTC_FLAG") if msg.hasElement("EMSX_OTC_FLAG") else ""
-                        emsx_p_a = msg.getElementAsString("EMSX_P_A") if msg.hasElement("EMSX_P_A") else ""
-                        emsx_percent_remain = msg.getElementAsFloat("EMSX_PERCENT_REMAIN") if msg.hasElement("EMSX_PERCENT_REMAIN") else 0
-                        emsx_principal = msg.getElementAsFloat("EMSX_PRINCIPAL") if msg.hasElement("EMSX_PRINCIPAL") else 0
-                        emsx_queued_date = msg.getElementAsInteger("EMSX_QUEUED_DATE") if msg.hasElement("EMSX_QUEUED_DATE") else 0
-                        emsx_queued_time = msg.getElementAsInteger("EMSX_QUEUED_TIME") if msg.hasElement("EMSX_QUEUED_TIME") else 0
-                        emsx_queued_time_microsec = msg.getElementAsFloat("EMSX_QUEUED_TIME_MICROSEC") if msg.hasElement("EMSX_QUEUED_TIME_MICROSEC") else ""
-                        emsx_reason_code = msg.getElementAsString("EMSX_REASON_CODE") if msg.hasElement("EMSX_REASON_CODE") else ""
-                        emsx_reason_desc = msg.getElementAsString("EMSX_REASON_DESC") if msg.hasElement("EMSX_REASON_DESC") else ""
-                        emsx_remain_balance = msg.getElementAsFloat("EMSX_REMAIN_BALANCE") if msg.hasElement("EMSX_REMAIN_BALANCE") else 0
-                        emsx_route_as_of_date = msg.getElementAsInteger("EMSX_ROUTE_AS_OF_DATE") if msg.hasElement("EMSX_ROUTE_AS_OF_DATE") else 0
-                        emsx_route_as_of_time_microsec = msg.getElementAsFloat("EMSX_ROUTE_AS_OF_TIME_MICROSEC") if msg.hasElement("EMSX_ROUTE_AS_OF_TIME_MICROSEC") else 0
-                        emsx_route_create_date = msg.getElementAsInteger("EMSX_ROUTE_CREATE_DATE") if msg.hasElement("EMSX_ROUTE_CREATE_DATE") else 0
-                        emsx_route_create_time = msg.getElementAsInteger("EMSX_ROUTE_CREATE_TIME") if msg.hasElement("EMSX_ROUTE_CREATE_TIME") else 0
-                        emsx_route_create_time_microsec = msg.getElementAsFloat("EMSX_ROUTE_CREATE_TIME_MICROSEC") if msg.hasElement("EMSX_ROUTE_CREATE_TIME_MICROSEC") else 0
-                        emsx_route_id = msg.getElementAsInteger("EMSX_ROUTE_ID") if msg.hasElement("EMSX_ROUTE_ID") else 0
-                        emsx_route_last_update_time = msg.getElementAsInteger("EMSX_ROUTE_LAST_UPDATE_TIME") if msg.hasElement("EMSX_ROUTE_LAST_UPDATE_TIME") else 0
-                        emsx_route_last_update_time_microsec = msg.getElementAsFloat("EMSX_ROUTE_LAST_UPDATE_TIME_MICROSEC") if msg.hasElement("EMSX_ROUTE_LAST_UPDATE_TIME_MICROSEC") else 0
-                        emsx_route_price = msg.getElementAsFloat("EMSX_ROUTE_PRICE") if msg.hasElement("EMSX_ROUTE_PRICE") else 0
-                        emsx_route_ref_id = msg.getElementAsString("EMSX_ROUTE_REF_ID") if msg.hasElement("EMSX_ROUTE_REF_ID") else ""
-                        emsx_sequence = msg.getElementAsInteger("EMSX_SEQUENCE") if msg.hasElement("EMSX_SEQUENCE") else 0
-                        emsx_settle_amount = msg.getElementAsFloat("EMSX_SETTLE_AMOUNT") if msg.hasElement("EMSX_SETTLE_AMOUNT") else 0
-                        emsx_settle_date = msg.getElementAsInteger("EMSX_SETTLE_DATE") if msg.hasElement("EMSX_SETTLE_DATE") else 0
-                        emsx_status = msg.getElementAsString("EMSX_STATUS") if msg.hasElement("EMSX_STATUS") else ""
-                        emsx_stop_price = msg.getElementAsFloat("EMSX_STOP_PRICE") if msg.hasElement("EMSX_STOP_PRICE") else 0
-                        emsx_strategy_end_time = msg.getElementAsInteger("EMSX_STRATEGY_END_TIME") if msg.hasElement("EMSX_STRATEGY_END_TIME") else 0
-                        emsx_strategy_part_rate1 = msg.getElementAsFloat("EMSX_STRATEGY_PART_RATE1") if msg.hasElement("EMSX_STRATEGY_PART_RATE1") else 0
-                        emsx_strategy_part_rate2 = msg.getElementAsFloat("EMSX_STRATEGY_PART_RATE2") if msg.hasElement("EMSX_STRATEGY_PART_RATE2") else 0
-                        emsx_strategy_start_time = msg.getElementAsInteger("EMSX_STRATEGY_START_TIME") if msg.hasElement("EMSX_STRATEGY_START_TIME") else 0
-                        emsx_strategy_style = msg.getElementAsString("EMSX_STRATEGY_STYLE") if msg.hasElement("EMSX_STRATEGY_STYLE") else ""
-                        emsx_strategy_type = msg.getElementAsString("EMSX_STRATEGY_TYPE") if msg.hasElement("EMSX_STRATEGY_TYPE") else ""
-                        emsx_tif = msg.getElementAsString("EMSX_TIF") if msg.hasElement("EMSX_TIF") else ""
-                        emsx_time_stamp = msg.getElementAsInteger("EMSX_TIME_STAMP") if msg.hasElement("EMSX_TIME_STAMP") else 0
-                        emsx_time_stamp_microsec = msg.getElementAsFloat("EMSX_TIME_STAMP_MICROSEC") if msg.hasElement("EMSX_TIME_STAMP_MICROSEC") else 0
-                        emsx_trade_reporting_indicator = msg.getElementAsString("EMSX_TRADE_REPORTING_INDICATOR") if msg.hasElement("EMSX_TRADE_REPORTING_INDICATOR") else ""
-                        emsx_transaction_reporting_mic = msg.getElementAsString("EMSX_TRANSACTION_REPORTING_MIC") if msg.hasElement("EMSX_TRANSACTION_REPORTING_MIC") else ""
-                        emsx_type = msg.getElementAsString("EMSX_TYPE") if msg.hasElement("EMSX_TYPE") else ""
-                        emsx_urgency_level = msg.getElementAsInteger("EMSX_URGENCY_LEVEL") if msg.hasElement("EMSX_URGENCY_LEVEL") else ""
-                        emsx_user_comm_amount = msg.getElementAsFloat("EMSX_USER_COMM_AMOUNT") if msg.hasElement("EMSX_USER_COMM_AMOUNT") else 0
-                        emsx_user_comm_rate = msg.getElementAsFloat("EMSX_USER_COMM_RATE") if msg.hasElement("EMSX_USER_COMM_RATE") else 0
-                        emsx_user_fees = msg.getElementAsFloat("EMSX_USER_FEES") if msg.hasElement("EMSX_USER_FEES") else 0
-                        emsx_user_net_money = msg.getElementAsFloat("EMSX_USER_NET_MONEY") if msg.hasElement("EMSX_USER_NET_MONEY") else 0
-                        emsx_waiver_flag = msg.getElementAsString("EMSX_WAIVER_FLAG") if msg.hasElement("EMSX_WORKING") else ""
-                        emsx_working = msg.getElementAsInteger("EMSX_WORKING") if msg.hasElement("EMSX_WORKING") else 0
-                        emsx_route_as_of_date = msg.getElementAsInteger("EMSX_ROUTE_AS_OF_DATE") if msg.hasElement("EMSX_ROUTE_AS_OF_DATE") else 0
-                        
+                        self.blotter.applyRoute(event_status, record)
                         print ("ROUTE MESSAGE: CorrelationID(%d)   Status(%d)" % (msg.correlationIds()[0].value(),event_status))
                         print ("MESSAGE: %s" % (msg))
-                        
-                        print ("API_SEQ_NUM: %d" % (api_seq_num))
-                        print ("EMSX_AMOUNT: %d" % (emsx_amount))
-                        print ("EMSX_APA_MIC: %s" % (emsx_apa_mic))
-                        print ("EMSX_AVG_PRICE: %d" % (emsx_avg_price))
-                        print ("EMSX_BROKER: %s" % (emsx_broker))
-                        print ("EMSX_BROKER_COMM: %d" % (emsx_broker_comm))
-                        print ("EMSX_BROKER_LEI: %s" % (emsx_broker_lei))
-                        print ("EMSX_BROKER_SI: %s" % (emsx_broker_si))
-                        print ("EMSX_BROKER_STATUS: %s" % (emsx_broker_status))
-                        print ("EMSX_BSE_AVG_PRICE: %d" % (emsx_bse_avg_price))
-                        print ("EMSX_BSE_FILLED: %d" % (emsx_bse_filled))
-                        print ("EMSX_BUYSIDE_LEI: %s" % (emsx_buyside_lei))
-                        print ("EMSX_CLEARING_ACCOUNT: %s" % (emsx_clearing_account))
-                        print ("EMSX_CLEARING_FIRM: %s" % (emsx_clearing_firm))
-                        print ("EMSX_CLIENT_IDENTIFICATION: %s" % (emsx_client_identification))
-                        print ("EMSX_COMM_DIFF_FLAG: %s" % (emsx_comm_diff_flag))
-                        print ("EMSX_COMM_RATE: %d" % (emsx_comm_rate))
-                        print ("EMSX_CURRENCY_PAIR: %s" % (emsx_currency_pair))
-                        print ("EMSX_CUSTOM_ACCOUNT: %s" % (emsx_custom_account))
-                        print ("EMSX_DAY_AVG_PRICE: %d" % (emsx_day_avg_price))
-                        print ("EMSX_DAY_FILL: %d" % (emsx_day_fill))
-                        print ("EMSX_EXCHANGE_DESTINATION: %s" % (emsx_exchange_destination))
-                        print ("EMSX_EXEC_INSTRUCTION: %s" % (emsx_exec_instruction))
-                        print ("EMSX_EXECUTE_BROKER: %s" % (emsx_execute_broker))
-                        print ("EMSX_FILL_ID: %d" % (emsx_fill_id))
-                        print ("EMSX_FILLED: %d" % (emsx_filled))
-                        print ("EMSX_GPI: %s" % (emsx_gpi))
-                        print ("EMSX_GTD_DATE: %d" % (emsx_gtd_date))
-                        print ("EMSX_HAND_INSTRUCTION: %s" % (emsx_hand_instruction))
-                        print ("EMSX_IS_MANUAL_ROUTE: %d" % (emsx_is_manual_route))
-                        print ("EMSX_LAST_CAPACITY: %s" % (emsx_last_capacity))
-                        print ("EMSX_LAST_FILL_DATE: %d" % (emsx_last_fill_date))
-                        print ("EMSX_LAST_FILL_TIME: %d" % (emsx_last_fill_time))
-                        print ("EMSX_LAST_FILL_TIME_MICROSEC: %0.8f" % (emsx_last_fill_time_microsec))
-                        print ("EMSX_LAST_MARKET: %s" % (emsx_last_market))
-                        print ("EMSX_LAST_PRICE: %d" % (emsx_last_price))
-                        print ("EMSX_LAST_SHARES: %d" % (emsx_last_shares))
-                        print ("EMSX_LEG_FILL_DATE_ADDED: %d" % (emsx_leg_fill_date_added))
-                        print ("EMSX_LEG_FILL_PRICE: %0.8f" % (emsx_leg_fill_price))
-                        print ("EMSX_LEG_FILL_SEQ_NO: %d" % (emsx_leg_fill_seq_no))
-                        print ("EMSX_LEG_FILL_SHARES: %0.8f" % (emsx_leg_fill_shares))
-                        print ("EMSX_LEG_FILL_SIDE: %s" % (emsx_leg_fill_side))
-                        print ("EMSX_LEG_FILL_TICKER: %s" % (emsx_leg_fill_ticker))
-                        print ("EMSX_LEG_FILL_TIME_ADDED: %d" % (emsx_leg_fill_time_added))
-                        print ("EMSX_LIMIT_PRICE: %0.8f" % (emsx_limit_price))
-                        print ("EMSX_MIFID_II_INSTRUCTION: %s" % (emsx_mifid_ii_instruction))
-                        print ("EMSX_MISC_FEES: %d" % (emsx_misc_fees))
-                        print ("EMSX_ML_ID: %s" % (emsx_ml_id))
-                        print ("EMSX_ML_LEG_QUANTITY: %d" % (emsx_ml_leg_quantity))
-                        print ("EMSX_ML_NUM_LEGS: %d" % (emsx_ml_num_legs))
-                        print ("EMSX_ML_PERCENT_FILLED: %d" % (emsx_ml_percent_filled))
-                        print ("EMSX_ML_RATIO: %d" % (emsx_ml_ratio))
-                        print ("EMSX_ML_REMAIN_BALANCE: %d" % (emsx_ml_remain_balance))
-                        print ("EMSX_ML_STRATEGY: %s" % (emsx_ml_strategy))
-                        print ("EMSX_ML_TOTAL_QUANTITY: %d" % (emsx_ml_total_quantity))
-                        print ("EMSX_NOTES: %s" % (emsx_notes))
-                        print ("EMSX_NSE_AVG_PRICE: %d" % (emsx_nse_avg_price))
-                        print ("EMSX_NSE_FILLED: %d" % (emsx_nse_filled))
-                        print ("EMSX_ORDER_TYPE: %s" % (emsx_order_type))
-                        print ("EMSX_OTC_FLAG: %s" % (emsx_otc_flag))
-                        print ("EMSX_P_A: %s" % (emsx_p_a))
-                        print ("EMSX_PERCENT_REMAIN: %d" % (emsx_percent_remain))
-                        print ("EMSX_PRINCIPAL: %d" % (emsx_principal))
-                        print ("EMSX_QUEUED_DATE: %d" % (emsx_queued_date))
-                        print ("EMSX_QUEUED_TIME: %d" % (emsx_queued_time))
-                        print ("EMSX_QUEUED_TIME_MICROSEC: %0.8f" % (emsx_queued_time_microsec))
-                        print ("EMSX_REASON_CODE: %s" % (emsx_reason_code))
-                        print ("EMSX_REASON_DESC: %s" % (emsx_reason_desc))
-                        print ("EMSX_REMAIN_BALANCE: %d" % (emsx_remain_balance))
-                        print ("EMSX_ROUTE_AS_OF_DATE: %d" % (emsx_route_as_of_date))
-                        print ("EMSX_ROUTE_AS_OF_TIME_MICROSEC: %0.8f" % (emsx_route_as_of_time_microsec))
-                        print ("EMSX_ROUTE_CREATE_DATE: %d" % (emsx_route_create_date))
-                        print ("EMSX_ROUTE_CREATE_TIME: %d" % (emsx_route_create_time))
-                        print ("EMSX_ROUTE_CREATE_TIME_MICROSEC: %0.8f" % (emsx_route_create_time_microsec))
-                        print ("EMSX_ROUTE_ID: %d" % (emsx_route_id))
-                        print ("EMSX_ROUTE_LAST_UPDATE_TIME: %d" % (emsx_route_last_update_time))
-                        print ("EMSX_ROUTE_LAST_UPDATE_TIME_MICROSEC: %0.8f" % (emsx_route_last_update_time_microsec))
-                        print ("EMSX_ROUTE_PRICE: %d" % (emsx_route_price))
-                        print ("EMSX_ROUTE_REF_ID: %s" % (emsx_route_ref_id))
-                        print ("EMSX_SEQUENCE: %d" % (emsx_sequence))
-                        print ("EMSX_SETTLE_AMOUNT: %d" % (emsx_settle_amount))
-                        print ("EMSX_SETTLE_DATE: %d" % (emsx_settle_date))
-                        print ("EMSX_STATUS: %s" % (emsx_status))
-                        print ("EMSX_STOP_PRICE: %d" % (emsx_stop_price))
-                        print ("EMSX_STRATEGY_END_TIME: %d" % (emsx_strategy_end_time))
-                        print ("EMSX_STRATEGY_PART_RATE1: %d" % (emsx_strategy_part_rate1))
-                        print ("EMSX_STRATEGY_PART_RATE2: %d" % (emsx_strategy_part_rate2))
-                        print ("EMSX_STRATEGY_START_TIME: %s" % (emsx_strategy_start_time))
-                        print ("EMSX_STRATEGY_STYLE: %s" % (emsx_strategy_style))
-                        print ("EMSX_STRATEGY_TYPE: %s" % (emsx_strategy_type))
-                        print ("EMSX_TIF: %s" % (emsx_tif))
-                        print ("EMSX_TIME_STAMP: %d" % (emsx_time_stamp))
-                        print ("EMSX_TIME_STAMP_MICROSEC: %0.8f" % (emsx_time_stamp_microsec))
-                        print ("EMSX_TRADE_REPORTING_INDICATOR: %s" % (emsx_trade_reporting_indicator))
-                        print ("EMSX_TRANSACTION_REPORTING_MIC: %s" % (emsx_transaction_reporting_mic))
-                        print ("EMSX_TYPE: %s" % (emsx_type))
-                        print ("EMSX_URGENCY_LEVEL: %d" % (emsx_urgency_level))
-                        print ("EMSX_USER_COMM_AMOUNT: %d" % (emsx_user_comm_amount))
-                        print ("EMSX_USER_COMM_RATE: %d" % (emsx_user_comm_rate))
-                        print ("EMSX_USER_FEES: %d" % (emsx_user_fees))
-                        print ("EMSX_USER_NET_MONEY: %d" % (emsx_user_net_money))
-                        print ("EMSX_WAIVER_FLAG: %s" % (emsx_waiver_flag))
-                        print ("EMSX_WORKING: %d" % (emsx_working))
-                        print ("EMSX_ROUTE_AS_OF_DATE: %d" % (emsx_route_as_of_date))
+                        self.printRecord(record)
 
             else:
                 print ("Error: Unexpected message", file=sys.stderr)
 
 
+    def loadInitialPaint(self, kind):
+        # Loads the records buffered during a fast initial paint in one go.
+        with self.lock:
+            records, self.paintRecords[kind] = self.paintRecords[kind], []
+        if not records:
+            return
+        if kind == ORDER:
+            self.blotter.loadOrders(records)
+        else:
+            self.blotter.loadRoutes(records)
+        print ("%s - Loaded %d records" % (kind.capitalize(), len(records)))
+
+
+    def publishChange(self, kind, eventStatus, record):
+        # Changes found by a resync go through the conflator when there is one.
+        if self.conflator is not None:
+            self.conflator.submit(kind, eventStatus, record)
+        else:
+            self.printChange(kind, eventStatus, record)
+
+
+    def printChange(self, kind, eventStatus, record):
+        # Called with each conflated or resynced order/route change.
+        print ("")
+        print ("%s MESSAGE: Status(%d)" % (kind.upper(), eventStatus))
+        self.printRecord(record)
+
+
+    def kind(self, msg):
+        if msg.correlationIds()[0].value() == routeSubscriptionID.value():
+            return ROUTE
+        return ORDER
+
+
+    def decode(self, msg):
+        if msg.correlationIds()[0].value() == routeSubscriptionID.value():
+            return self.routeProjection.decode(msg)
+        return self.orderProjection.decode(msg)
+
+
+    def printRecord(self, record):
+        for name, value in record.items():
+            if isinstance(value, float):
+                print ("%s: %0.8f" % (name, value))
+            else:
+                print ("%s: %s" % (name, value))
+
+
     def processMiscEvents(self, event):
         
         print ("Processing " + event.eventType() + " event")
@@ -614,115 +361,17 @@ class SessionEventHandler(object):
         
         print ("Create Order subscription")
         
-        #orderTopic = d_service + "/order;team=TKTEAM?fields="
-        orderTopic = d_service + "/order?fields="
-        orderTopic = orderTopic + "API_SEQ_NUM,"
-        orderTopic = orderTopic + "EMSX_ACCOUNT,"
-        orderTopic = orderTopic + "EMSX_AMOUNT,"
-        orderTopic = orderTopic + "EMSX_ARRIVAL_PRICE,"
-        orderTopic = orderTopic + "EMSX_ASSET_CLASS,"
-        orderTopic = orderTopic + "EMSX_ASSIGNED_TRADER,"
-        orderTopic = orderTopic + "EMSX_AVG_PRICE,"
-        orderTopic = orderTopic + "EMSX_BASKET_NAME,"
-        orderTopic = orderTopic + "EMSX_BASKET_NUM,"
-        orderTopic = orderTopic + "EMSX_BLOCK_ID,"
-        orderTopic = orderTopic + "EMSX_BROKER,"
-        orderTopic = orderTopic + "EMSX_BROKER_COMM,"
-        orderTopic = orderTopic + "EMSX_BSE_AVG_PRICE,"
-        orderTopic = orderTopic + "EMSX_BSE_FILLED,"
-        orderTopic = orderTopic + "EMSX_BUYSIDE_LEI,"
-        orderTopic = orderTopic + "EMSX_CFD_FLAG,"
-        orderTopic = orderTopic + "EMSX_CLIENT_IDENTIFICATION,"
-        orderTopic = orderTopic + "EMSX_COMM_DIFF_FLAG,"
-        orderTopic = orderTopic + "EMSX_COMM_RATE,"
-        orderTopic = orderTopic + "EMSX_CUSTOM_NOTE1,"
-        orderTopic = orderTopic + "EMSX_CUSTOM_NOTE2,"
-        orderTopic = orderTopic + "EMSX_CUSTOM_NOTE3,"
-        orderTopic = orderTopic + "EMSX_CUSTOM_NOTE4,"
-        orderTopic = orderTopic + "EMSX_CUSTOM_NOTE5,"
-        orderTopic = orderTopic + "EMSX_CURRENCY_PAIR,"
-        orderTopic = orderTopic + "EMSX_DATE,"
-        orderTopic = orderTopic + "EMSX_DAY_AVG_PRICE,"
-        orderTopic = orderTopic + "EMSX_DAY_FILL,"
-        orderTopic = orderTopic + "EMSX_DIR_BROKER_FLAG,"
-        orderTopic = orderTopic + "EMSX_EXCHANGE,"
-        orderTopic = orderTopic + "EMSX_EXCHANGE_DESTINATION,"
-        orderTopic = orderTopic + "EMSX_EXEC_INSTRUCTION,"
-        orderTopic = orderTopic + "EMSX_FILL_ID,"
-        orderTopic = orderTopic + "EMSX_FILLED,"
-        orderTopic = orderTopic + "EMSX_GPI,"
-        orderTopic = orderTopic + "EMSX_GTD_DATE,"
-        orderTopic = orderTopic + "EMSX_HAND_INSTRUCTION,"
-        orderTopic = orderTopic + "EMSX_IDLE_AMOUNT,"
-        orderTopic = orderTopic + "EMSX_INVESTOR_ID,"
-        orderTopic = orderTopic + "EMSX_ISIN,"
-        orderTopic = orderTopic + "EMSX_LIMIT_PRICE,"
-        orderTopic = orderTopic + "EMSX_MIFID_II_INSTRUCTION,"
-        orderTopic = orderTopic + "EMSX_MOD_PEND_STATUS,"
-        orderTopic = orderTopic + "EMSX_NOTES,"
-        orderTopic = orderTopic + "EMSX_NSE_AVG_PRICE,"
-        orderTopic = orderTopic + "EMSX_NSE_FILLED,"
-        orderTopic = orderTopic + "EMSX_ORD_REF_ID,"
-        orderTopic = orderTopic + "EMSX_ORDER_AS_OF_DATE,"
-        orderTopic = orderTopic + "EMSX_ORDER_AS_OF_TIME_MICROSEC,"
-        orderTopic = orderTopic + "EMSX_ORDER_TYPE,"
-        orderTopic = orderTopic + "EMSX_ORIGINATE_TRADER,"
-        orderTopic = orderTopic + "EMSX_ORIGINATE_TRADER_FIRM,"
-        orderTopic = orderTopic + "EMSX_PERCENT_REMAIN,"
-        orderTopic = orderTopic + "EMSX_PM_UUID,"
-        orderTopic = orderTopic + "EMSX_PORT_MGR,"
-        orderTopic = orderTopic + "EMSX_PORT_NAME,"
-        orderTopic = orderTopic + "EMSX_PORT_NUM,"
-        orderTopic = orderTopic + "EMSX_POSITION,"
-        orderTopic = orderTopic + "EMSX_PRINCIPAL,"
-        orderTopic = orderTopic + "EMSX_PRODUCT,"
-        orderTopic = orderTopic + "EMSX_QUEUED_DATE,"
-        orderTopic = orderTopic + "EMSX_QUEUED_TIME,"
-        orderTopic = orderTopic + "EMSX_QUEUED_TIME_MICROSEC,"
-        orderTopic = orderTopic + "EMSX_REASON_CODE,"
-        orderTopic = orderTopic + "EMSX_REASON_DESC,"
-        orderTopic = orderTopic + "EMSX_REMAIN_BALANCE,"
-        orderTopic = orderTopic + "EMSX_ROUTE_ID,"
-        orderTopic = orderTopic + "EMSX_ROUTE_PRICE,"
-        orderTopic = orderTopic + "EMSX_SEC_NAME,"
-        orderTopic = orderTopic + "EMSX_SEDOL,"
-        orderTopic = orderTopic + "EMSX_SEQUENCE,"
-        orderTopic = orderTopic + "EMSX_SETTLE_AMOUNT,"
-        orderTopic = orderTopic + "EMSX_SETTLE_DATE,"
-        orderTopic = orderTopic + "EMSX_SI,"
-        orderTopic = orderTopic + "EMSX_SIDE,"
-        orderTopic = orderTopic + "EMSX_START_AMOUNT,"
-        orderTopic = orderTopic + "EMSX_STATUS,"
-        orderTopic = orderTopic + "EMSX_STEP_OUT_BROKER,"
-        orderTopic = orderTopic + "EMSX_STOP_PRICE,"
-        orderTopic = orderTopic + "EMSX_STRATEGY_END_TIME,"
-        orderTopic = orderTopic + "EMSX_STRATEGY_PART_RATE1,"
-        orderTopic = orderTopic + "EMSX_STRATEGY_PART_RATE2,"
-        orderTopic = orderTopic + "EMSX_STRATEGY_START_TIME,"
-        orderTopic = orderTopic + "EMSX_STRATEGY_STYLE,"
-        orderTopic = orderTopic + "EMSX_STRATEGY_TYPE,"
-        orderTopic = orderTopic + "EMSX_TICKER,"
-        orderTopic = orderTopic + "EMSX_TIF,"
-        orderTopic = orderTopic + "EMSX_TIME_STAMP,"
-        orderTopic = orderTopic + "EMSX_TIME_STAMP_MICROSEC,"
-        orderTopic = orderTopic + "EMSX_TRAD_UUID,"
-        orderTopic = orderTopic + "EMSX_TRADE_DESK,"
-        orderTopic = orderTopic + "EMSX_TRADER,"
-        orderTopic = orderTopic + "EMSX_TRADER_NOTES,"
-        orderTopic = orderTopic + "EMSX_TS_ORDNUM,"
-        orderTopic = orderTopic + "EMSX_TYPE,"
-        orderTopic = orderTopic + "EMSX_UNDERLYING_TICKER,"
-        orderTopic = orderTopic + "EMSX_USER_COMM_AMOUNT,"
-        orderTopic = orderTopic + "EMSX_USER_COMM_RATE,"
-        orderTopic = orderTopic + "EMSX_USER_FEES,"
-        orderTopic = orderTopic + "EMSX_USER_NET_MONEY,"
-        orderTopic = orderTopic + "EMSX_WORK_PRICE,"
-        orderTopic = orderTopic + "EMSX_WORKING,"
-        orderTopic = orderTopic + "EMSX_YELLOW_KEY"
-
+        self.subscribed.add(ORDER)
+        if ORDER in self.painted:
+            self.resync.begin(ORDER)
+            if self.conflator is not None:
+                self.conflator.forget(ORDER)
+        else:
+            self.paintRecords[ORDER] = []
+        
         subscriptions = blpapi.SubscriptionList()
         
-        subscriptions.add(topic=orderTopic,correlationId=orderSubscriptionID)
+        subscriptions.add(topic=self.orderProjection.topic,correlationId=orderSubscriptionID)
 
         session.subscribe(subscriptions)
 
@@ -731,115 +380,17 @@ class SessionEventHandler(object):
         
         print ("Create Route subscription")
         
-        #routeTopic = d_service + "/route;team=EMSX_API?fields="
-        routeTopic = d_service + "/route?fields="
-        routeTopic = routeTopic + "API_SEQ_NUM,"
-        routeTopic = routeTopic + "EMSX_AMOUNT,"
-        routeTopic = routeTopic + "EMSX_APA_MIC,"
-        routeTopic = routeTopic + "EMSX_AVG_PRICE,"
-        routeTopic = routeTopic + "EMSX_BROKER,"
-        routeTopic = routeTopic + "EMSX_BROKER_COMM,"
-        routeTopic = routeTopic + "EMSX_BROKER_LEI,"
-        routeTopic = routeTopic + "EMSX_BROKER_SI,"
-        routeTopic = routeTopic + "EMSX_BSE_AVG_PRICE,"
-        routeTopic = routeTopic + "EMSX_BSE_FILLED,"
-        routeTopic = routeTopic + "EMSX_BROKER_STATUS,"
-        routeTopic = routeTopic + "EMSX_BUYSIDE_LEI,"
-        routeTopic = routeTopic + "EMSX_CLEARING_ACCOUNT,"
-        routeTopic = routeTopic + "EMSX_CLEARING_FIRM,"
-        routeTopic = routeTopic + "EMSX_CLIENT_IDENTIFICATION,"
-        routeTopic = routeTopic + "EMSX_COMM_DIFF_FLAG,"
-        routeTopic = routeTopic + "EMSX_COMM_RATE,"
-        routeTopic = routeTopic + "EMSX_CURRENCY_PAIR,"
-        routeTopic = routeTopic + "EMSX_CUSTOM_ACCOUNT,"
-        routeTopic = routeTopic + "EMSX_DAY_AVG_PRICE,"
-        routeTopic = routeTopic + "EMSX_DAY_FILL,"
-        routeTopic = routeTopic + "EMSX_EXCHANGE_DESTINATION,"
-        routeTopic = routeTopic + "EMSX_EXEC_INSTRUCTION,"
-        routeTopic = routeTopic + "EMSX_EXECUTE_BROKER,"
-        routeTopic = routeTopic + "EMSX_FILL_ID,"
-        routeTopic = routeTopic + "EMSX_FILLED,"
-        routeTopic = routeTopic + "EMSX_GPI,"
-        routeTopic = routeTopic + "EMSX_GTD_DATE,"
-        routeTopic = routeTopic + "EMSX_HAND_INSTRUCTION,"
-        routeTopic = routeTopic + "EMSX_IS_MANUAL_ROUTE,"
-        routeTopic = routeTopic + "EMSX_LAST_CAPACITY,"
-        routeTopic = routeTopic + "EMSX_LAST_FILL_DATE,"
-        routeTopic = routeTopic + "EMSX_LAST_FILL_TIME,"
-        routeTopic = routeTopic + "EMSX_LAST_FILL_TIME_MICROSEC,"
-        routeTopic = routeTopic + "EMSX_LAST_MARKET,"
-        routeTopic = routeTopic + "EMSX_LAST_PRICE,"
-        routeTopic = routeTopic + "EMSX_LAST_SHARES,"
-        routeTopic = routeTopic + "EMSX_LEG_FILL_DATE_ADDED,"
-        routeTopic = routeTopic + "EMSX_LEG_FILL_PRICE,"
-        routeTopic = routeTopic + "EMSX_LEG_FILL_SEQ_NO,"
-        routeTopic = routeTopic + "EMSX_LEG_FILL_SHARES,"
-        routeTopic = routeTopic + "EMSX_LEG_FILL_SIDE,"
-        routeTopic = routeTopic + "EMSX_LEG_FILL_TICKER,"
-        rotueTopic = routeTopic + "EMSX_LEG_FILL_TIME_ADDED,"
-        routeTopic = routeTopic + "EMSX_LIMIT_PRICE,"
-        routeTopic = routeTopic + "EMSX_MIFID_II_INSTRUCTION,"
-        routeTopic = routeTopic + "EMSX_MISC_FEES,"
-        routeTopic = routeTopic + "EMSX_ML_ID,"
-        routeTopic = routeTopic + "EMSX_ML_LEG_QUANTITY,"
-        routeTopic = routeTopic + "EMSX_ML_NUM_LEGS,"
-        routeTopic = routeTopic + "EMSX_ML_PERCENT_FILLED,"
-        routeTopic = routeTopic + "EMSX_ML_RATIO,"
-        routeTopic = routeTopic + "EMSX_ML_REMAIN_BALANCE,"
-        routeTopic = routeTopic + "EMSX_ML_STRATEGY,"
-        routeTopic = routeTopic + "EMSX_ML_TOTAL_QUANTITY,"
-        routeTopic = routeTopic + "EMSX_NOTES,"
-        routeTopic = routeTopic + "EMSX_NSE_AVG_PRICE,"
-        routeTopic = routeTopic + "EMSX_NSE_FILLED,"
-        routeTopic = routeTopic + "EMSX_ORDER_TYPE,"
-        routeTopic = routeTopic + "EMSX_OTC_FLAG,"
-        routeTopic = routeTopic + "EMSX_P_A,"
-        routeTopic = routeTopic + "EMSX_PERCENT_REMAIN,"
-        routeTopic = routeTopic + "EMSX_PRINCIPAL,"
-        routeTopic = routeTopic + "EMSX_QUEUED_DATE,"
-        routeTopic = routeTopic + "EMSX_QUEUED_TIME,"
-        routeTopic = routeTopic + "EMSX_QUEUED_TIME_MICROSEC,"
-        routeTopic = routeTopic + "EMSX_REASON_CODE,"
-        routeTopic = routeTopic + "EMSX_REASON_DESC,"
-        routeTopic = routeTopic + "EMSX_REMAIN_BALANCE,"
-        routeTopic = routeTopic + "EMSX_ROUTE_AS_OF_DATE,"
-        routeTopic = routeTopic + "EMSX_ROUTE_AS_OF_TIME_MICROSEC,"
-        routeTopic = routeTopic + "EMSX_ROUTE_CREATE_DATE,"
-        routeTopic = routeTopic + "EMSX_ROUTE_CREATE_TIME,"
-        routeTopic = routeTopic + "EMSX_ROUTE_CREATE_TIME_MICROSEC,"
-        routeTopic = routeTopic + "EMSX_ROUTE_ID,"
-        routeTopic = routeTopic + "EMSX_ROUTE_LAST_UPDATE_TIME,"
-        routeTopic = routeTopic + "EMSX_ROUTE_LAST_UPDATE_TIME_MICROSEC,"
-        routeTopic = routeTopic + "EMSX_ROUTE_PRICE,"
-        routeTopic = routeTopic + "EMSX_ROUTE_REF_ID,"
-        routeTopic = routeTopic + "EMSX_SEQUENCE,"
-        routeTopic = routeTopic + "EMSX_SETTLE_AMOUNT,"
-        routeTopic = routeTopic + "EMSX_SETTLE_DATE,"
-        routeTopic = routeTopic + "EMSX_STATUS,"
-        routeTopic = routeTopic + "EMSX_STOP_PRICE,"
-        routeTopic = routeTopic + "EMSX_STRATEGY_END_TIME,"
-        routeTopic = routeTopic + "EMSX_STRATEGY_PART_RATE1,"
-        routeTopic = routeTopic + "EMSX_STRATEGY_PART_RATE2,"
-        routeTopic = routeTopic + "EMSX_STRATEGY_START_TIME,"
-        routeTopic = routeTopic + "EMSX_STRATEGY_STYLE,"
-        routeTopic = routeTopic + "EMSX_STRATEGY_TYPE,"
-        routeTopic = routeTopic + "EMSX_TIF,"
-        routeTopic = routeTopic + "EMSX_TIME_STAMP,"
-        routeTopic = routeTopic + "EMSX_TIME_STAMP_MICROSEC,"
-        routeTopic = routeTopic + "EMSX_TRADE_REPORTING_INDICATOR,"
-        routeTopic = routeTopic + "EMSX_TRANSACTION_REPORTING_MIC,"
-        routeTopic = routeTopic + "EMSX_TYPE,"
-        routeTopic = routeTopic + "EMSX_URGENCY_LEVEL,"
-        routeTopic = routeTopic + "EMSX_USER_COMM_AMOUNT,"
-        routeTopic = routeTopic + "EMSX_USER_COMM_RATE,"
-        routeTopic = routeTopic + "EMSX_USER_FEES,"
-        routeTopic = routeTopic + "EMSX_USER_NET_MONEY,"
-        routeTopic = routeTopic + "EMSX_WAIVER_FLAG,"
-        routeTopic = routeTopic + "EMSX_WORKING"
-
+        self.subscribed.add(ROUTE)
+        if ROUTE in self.painted:
+            self.resync.begin(ROUTE)
+            if self.conflator is not None:
+                self.conflator.forget(ROUTE)
+        else:
+            self.paintRecords[ROUTE] = []
+        
         subscriptions = blpapi.SubscriptionList()
         
-        subscriptions.add(topic=routeTopic,correlationId=routeSubscriptionID)
+        subscriptions.add(topic=self.routeProjection.topic,correlationId=routeSubscriptionID)
 
         session.subscribe(subscriptions)
 
@@ -853,9 +404,14 @@ def main():
 
     eventHandler = SessionEventHandler()
 
-    session = blpapi.Session(sessionOptions, eventHandler.processEvent)
-    
-    if not session.startAsync():
+    processEvent = eventHandler.processEvent
+    writer = None
+    if d_capture is not None:
+        print ("Capturing events to %s" % d_capture)
+        writer = CaptureWriter(d_capture)
+        processEvent = captureHandler(processEvent, writer)
+
+    if not eventHandler.startSession(sessionOptions, processEvent):
         print ("Failed to start session.")
         return
 
@@ -864,7 +420,15 @@ def main():
         print ("Press ENTER to quit")
         input()
     finally:
-        session.stop()
+        eventHandler.stop()
+        if eventHandler.queue is not None:
+            eventHandler.queue.stop()
+            print ("Event queue: %s" % eventHandler.queue.stats())
+        if eventHandler.conflator is not None:
+            eventHandler.conflator.stop()
+            print ("Conflator: %s" % eventHandler.conflator.stats())
+        if writer is not None:
+            writer.close()
 
 if __name__ == "__main__":
     print ("Bloomberg - EMSX API Example - EMSXSubscriptions")
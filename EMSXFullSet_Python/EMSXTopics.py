@@ -0,0 +1,305 @@
+# EMSXTopics.py
+
+from EMSXBlotter import ORDER_KEY_FIELDS, ROUTE_KEY_FIELDS
+from EMSXFieldDecoder import FieldDecoder
+from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, emapisvcSchema
+
+
+ORDER                   = "order"
+ROUTE                   = "route"
+
+# The full field sets subscribed to by EMSXSubscriptions.
+ORDER_FIELDS = [
+    "API_SEQ_NUM",
+    "EMSX_ACCOUNT",
+    "EMSX_AMOUNT",
+    "EMSX_ARRIVAL_PRICE",
+    "EMSX_ASSET_CLASS",
+    "EMSX_ASSIGNED_TRADER",
+    "EMSX_AVG_PRICE",
+    "EMSX_BASKET_NAME",
+    "EMSX_BASKET_NUM",
+    "EMSX_BLOCK_ID",
+    "EMSX_BROKER",
+    "EMSX_BROKER_COMM",
+    "EMSX_BSE_AVG_PRICE",
+    "EMSX_BSE_FILLED",
+    "EMSX_BUYSIDE_LEI",
+    "EMSX_CFD_FLAG",
+    "EMSX_CLIENT_IDENTIFICATION",
+    "EMSX_COMM_DIFF_FLAG",
+    "EMSX_COMM_RATE",
+    "EMSX_CUSTOM_NOTE1",
+    "EMSX_CUSTOM_NOTE2",
+    "EMSX_CUSTOM_NOTE3",
+    "EMSX_CUSTOM_NOTE4",
+    "EMSX_CUSTOM_NOTE5",
+    "EMSX_CURRENCY_PAIR",
+    "EMSX_DATE",
+    "EMSX_DAY_AVG_PRICE",
+    "EMSX_DAY_FILL",
+    "EMSX_DIR_BROKER_FLAG",
+    "EMSX_EXCHANGE",
+    "EMSX_EXCHANGE_DESTINATION",
+    "EMSX_EXEC_INSTRUCTION",
+    "EMSX_FILL_ID",
+    "EMSX_FILLED",
+    "EMSX_GPI",
+    "EMSX_GTD_DATE",
+    "EMSX_HAND_INSTRUCTION",
+    "EMSX_IDLE_AMOUNT",
+    "EMSX_INVESTOR_ID",
+    "EMSX_ISIN",
+    "EMSX_LIMIT_PRICE",
+    "EMSX_MIFID_II_INSTRUCTION",
+    "EMSX_MOD_PEND_STATUS",
+    "EMSX_NOTES",
+    "EMSX_NSE_AVG_PRICE",
+    "EMSX_NSE_FILLED",
+    "EMSX_ORD_REF_ID",
+    "EMSX_ORDER_AS_OF_DATE",
+    "EMSX_ORDER_AS_OF_TIME_MICROSEC",
+    "EMSX_ORDER_TYPE",
+    "EMSX_ORIGINATE_TRADER",
+    "EMSX_ORIGINATE_TRADER_FIRM",
+    "EMSX_PERCENT_REMAIN",
+    "EMSX_PM_UUID",
+    "EMSX_PORT_MGR",
+    "EMSX_PORT_NAME",
+    "EMSX_PORT_NUM",
+    "EMSX_POSITION",
+    "EMSX_PRINCIPAL",
+    "EMSX_PRODUCT",
+    "EMSX_QUEUED_DATE",
+    "EMSX_QUEUED_TIME",
+    "EMSX_QUEUED_TIME_MICROSEC",
+    "EMSX_REASON_CODE",
+    "EMSX_REASON_DESC",
+    "EMSX_REMAIN_BALANCE",
+    "EMSX_ROUTE_ID",
+    "EMSX_ROUTE_PRICE",
+    "EMSX_SEC_NAME",
+    "EMSX_SEDOL",
+    "EMSX_SEQUENCE",
+    "EMSX_SETTLE_AMOUNT",
+    "EMSX_SETTLE_DATE",
+    "EMSX_SI",
+    "EMSX_SIDE",
+    "EMSX_START_AMOUNT",
+    "EMSX_STATUS",
+    "EMSX_STEP_OUT_BROKER",
+    "EMSX_STOP_PRICE",
+    "EMSX_STRATEGY_END_TIME",
+    "EMSX_STRATEGY_PART_RATE1",
+    "EMSX_STRATEGY_PART_RATE2",
+    "EMSX_STRATEGY_START_TIME",
+    "EMSX_STRATEGY_STYLE",
+    "EMSX_STRATEGY_TYPE",
+    "EMSX_TICKER",
+    "EMSX_TIF",
+    "EMSX_TIME_STAMP",
+    "EMSX_TIME_STAMP_MICROSEC",
+    "EMSX_TRAD_UUID",
+    "EMSX_TRADE_DESK",
+    "EMSX_TRADER",
+    "EMSX_TRADER_NOTES",
+    "EMSX_TS_ORDNUM",
+    "EMSX_TYPE",
+    "EMSX_UNDERLYING_TICKER",
+    "EMSX_USER_COMM_AMOUNT",
+    "EMSX_USER_COMM_RATE",
+    "EMSX_USER_FEES",
+    "EMSX_USER_NET_MONEY",
+    "EMSX_WORK_PRICE",
+    "EMSX_WORKING",
+    "EMSX_YELLOW_KEY",
+]
+
+ROUTE_FIELDS = [
+    "API_SEQ_NUM",
+    "EMSX_AMOUNT",
+    "EMSX_APA_MIC",
+    "EMSX_AVG_PRICE",
+    "EMSX_BROKER",
+    "EMSX_BROKER_COMM",
+    "EMSX_BROKER_LEI",
+    "EMSX_BROKER_SI",
+    "EMSX_BSE_AVG_PRICE",
+    "EMSX_BSE_FILLED",
+    "EMSX_BROKER_STATUS",
+    "EMSX_BUYSIDE_LEI",
+    "EMSX_CLEARING_ACCOUNT",
+    "EMSX_CLEARING_FIRM",
+    "EMSX_CLIENT_IDENTIFICATION",
+    "EMSX_COMM_DIFF_FLAG",
+    "EMSX_COMM_RATE",
+    "EMSX_CURRENCY_PAIR",
+    "EMSX_CUSTOM_ACCOUNT",
+    "EMSX_DAY_AVG_PRICE",
+    "EMSX_DAY_FILL",
+    "EMSX_EXCHANGE_DESTINATION",
+    "EMSX_EXEC_INSTRUCTION",
+    "EMSX_EXECUTE_BROKER",
+    "EMSX_FILL_ID",
+    "EMSX_FILLED",
+    "EMSX_GPI",
+    "EMSX_GTD_DATE",
+    "EMSX_HAND_INSTRUCTION",
+    "EMSX_IS_MANUAL_ROUTE",
+    "EMSX_LAST_CAPACITY",
+    "EMSX_LAST_FILL_DATE",
+    "EMSX_LAST_FILL_TIME",
+    "EMSX_LAST_FILL_TIME_MICROSEC",
+    "EMSX_LAST_MARKET",
+    "EMSX_LAST_PRICE",
+    "EMSX_LAST_SHARES",
+    "EMSX_LEG_FILL_DATE_ADDED",
+    "EMSX_LEG_FILL_PRICE",
+    "EMSX_LEG_FILL_SEQ_NO",
+    "EMSX_LEG_FILL_SHARES",
+    "EMSX_LEG_FILL_SIDE",
+    "EMSX_LEG_FILL_TICKER",
+    "EMSX_LEG_FILL_TIME_ADDED",
+    "EMSX_LIMIT_PRICE",
+    "EMSX_MIFID_II_INSTRUCTION",
+    "EMSX_MISC_FEES",
+    "EMSX_ML_ID",
+    "EMSX_ML_LEG_QUANTITY",
+    "EMSX_ML_NUM_LEGS",
+    "EMSX_ML_PERCENT_FILLED",
+    "EMSX_ML_RATIO",
+    "EMSX_ML_REMAIN_BALANCE",
+    "EMSX_ML_STRATEGY",
+    "EMSX_ML_TOTAL_QUANTITY",
+    "EMSX_NOTES",
+    "EMSX_NSE_AVG_PRICE",
+    "EMSX_NSE_FILLED",
+    "EMSX_ORDER_TYPE",
+    "EMSX_OTC_FLAG",
+    "EMSX_P_A",
+    "EMSX_PERCENT_REMAIN",
+    "EMSX_PRINCIPAL",
+    "EMSX_QUEUED_DATE",
+    "EMSX_QUEUED_TIME",
+    "EMSX_QUEUED_TIME_MICROSEC",
+    "EMSX_REASON_CODE",
+    "EMSX_REASON_DESC",
+    "EMSX_REMAIN_BALANCE",
+    "EMSX_ROUTE_AS_OF_DATE",
+    "EMSX_ROUTE_AS_OF_TIME_MICROSEC",
+    "EMSX_ROUTE_CREATE_DATE",
+    "EMSX_ROUTE_CREATE_TIME",
+    "EMSX_ROUTE_CREATE_TIME_MICROSEC",
+    "EMSX_ROUTE_ID",
+    "EMSX_ROUTE_LAST_UPDATE_TIME",
+    "EMSX_ROUTE_LAST_UPDATE_TIME_MICROSEC",
+    "EMSX_ROUTE_PRICE",
+    "EMSX_ROUTE_REF_ID",
+    "EMSX_SEQUENCE",
+    "EMSX_SETTLE_AMOUNT",
+    "EMSX_SETTLE_DATE",
+    "EMSX_STATUS",
+    "EMSX_STOP_PRICE",
+    "EMSX_STRATEGY_END_TIME",
+    "EMSX_STRATEGY_PART_RATE1",
+    "EMSX_STRATEGY_PART_RATE2",
+    "EMSX_STRATEGY_START_TIME",
+    "EMSX_STRATEGY_STYLE",
+    "EMSX_STRATEGY_TYPE",
+    "EMSX_TIF",
+    "EMSX_TIME_STAMP",
+    "EMSX_TIME_STAMP_MICROSEC",
+    "EMSX_TRADE_REPORTING_INDICATOR",
+    "EMSX_TRANSACTION_REPORTING_MIC",
+    "EMSX_TYPE",
+    "EMSX_URGENCY_LEVEL",
+    "EMSX_USER_COMM_AMOUNT",
+    "EMSX_USER_COMM_RATE",
+    "EMSX_USER_FEES",
+    "EMSX_USER_NET_MONEY",
+    "EMSX_WAIVER_FLAG",
+    "EMSX_WORKING",
+]
+
+KEY_FIELDS = {
+    ORDER:  ORDER_KEY_FIELDS,
+    ROUTE:  ROUTE_KEY_FIELDS,
+}
+
+
+def projectFields(kind, fields, schema=None):
+    # Validates fields against OrderRouteFields and returns them without
+    # duplicates, with the key fields of kind added first if missing so the
+    # records can still be applied to a blotter.
+    if kind not in KEY_FIELDS:
+        raise ValueError("Unknown subscription kind %s (choose from %s, %s)" % (kind, ORDER, ROUTE))
+    if schema is None:
+        schema = emapisvcSchema()
+
+    known = set(d.name for d in schema.types[ORDER_ROUTE_FIELDS_TYPE].elements)
+    unknown = [f for f in fields if f not in known]
+    if unknown:
+        raise ValueError("Unknown %s fields: %s" % (ORDER_ROUTE_FIELDS_TYPE, ", ".join(unknown)))
+
+    projected = [f for f in KEY_FIELDS[kind] if f not in fields]
+    for field in fields:
+        if field not in projected:
+            projected.append(field)
+    return projected
+
+
+def buildTopic(service, kind, fields, options=None, schema=None):
+    # //blp/emapisvc/order;team=TKTEAM?fields=EMSX_SEQUENCE,... where options
+    # is the optional ";"-part ("team=TKTEAM" or {"team": "TKTEAM"}).
+    topic = service + "/" + kind
+    if options:
+        if isinstance(options, dict):
+            options = ";".join("%s=%s" % item for item in options.items())
+        topic = topic + ";" + options
+    return topic + "?fields=" + ",".join(projectFields(kind, fields, schema))
+
+
+def orderTopic(service, fields=ORDER_FIELDS, options=None):
+    return buildTopic(service, ORDER, fields, options)
+
+
+def routeTopic(service, fields=ROUTE_FIELDS, options=None):
+    return buildTopic(service, ROUTE, fields, options)
+
+
+class FieldProjection(object):
+    """ A subscription topic and the decoder for exactly its fields. """
+
+    def __init__(self, service, kind, fields, options=None, schema=None):
+        self.kind = kind
+        self.fields = projectFields(kind, fields, schema)
+        self.topic = buildTopic(service, kind, self.fields, options, schema)
+        self.decoder = FieldDecoder(self.fields, schema)
+
+    def decode(self, msg):
+        return self.decoder.decode(msg)
+
+    def __repr__(self):
+        return "FieldProjection(%s)" % self.topic
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -2,19 +2,17 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       GET_ALL_FIELD_META_DATA, ERROR_CODE, ERROR_MESSAGE, META_DATA, EMSX_FIELD_NAME, EMSX_DISP_NAME,
+                       EMSX_TYPE, EMSX_LEVEL, EMSX_LEN)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-GET_ALL_FIELD_METADATA  = blpapi.Name("GetAllFieldMetaData")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +45,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -74,7 +73,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -89,25 +89,24 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
-                elif msg.messageType() == GET_ALL_FIELD_METADATA:
+                elif msg.messageType() == GET_ALL_FIELD_META_DATA:
 
-                    md = msg.getElement("MetaData")
+                    md = msg.getElement(META_DATA)
                     
                     for e in md.values():
                         
-                        emsx_field_name = e.getElementAsString("EMSX_FIELD_NAME")
-                        emsx_disp_name = e.getElementAsString("EMSX_DISP_NAME")
-                        emsx_type = e.getElementAsString("EMSX_TYPE")
-                        emsx_level = e.getElementAsInteger("EMSX_LEVEL")
-                        emsx_len = e.getElementAsInteger("EMSX_LEN")
+                        emsx_field_name = e.getElementAsString(EMSX_FIELD_NAME)
+                        emsx_disp_name = e.getElementAsString(EMSX_DISP_NAME)
+                        emsx_type = e.getElementAsString(EMSX_TYPE)
+                        emsx_level = e.getElementAsInteger(EMSX_LEVEL)
+                        emsx_len = e.getElementAsInteger(EMSX_LEN)
                         
                         print ("MetaData: %s,%s,%s,%d,%d" % (emsx_field_name, emsx_disp_name, emsx_type, emsx_level, emsx_len))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -134,8 +133,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
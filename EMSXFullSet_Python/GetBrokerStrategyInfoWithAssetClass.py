@@ -2,19 +2,17 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       GET_BROKER_STRATEGY_INFO_WITH_ASSET_CLASS, EMSX_REQUEST_SEQ, EMSX_ASSET_CLASS, EMSX_BROKER,
+                       EMSX_STRATEGY, ERROR_CODE, ERROR_MESSAGE, EMSX_STRATEGY_INFO, FIELD_NAME, DISABLE, STRING_VALUE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-GET_BROKER_STRATEGY_INFO_WITH_ASSET_CLASS  = blpapi.Name("GetBrokerStrategyInfoWithAssetClass")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +45,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -65,11 +64,11 @@ class SessionEventHandler():
     
                 request = service.createRequest("GetBrokerStrategyInfoWithAssetClass")
 
-                request.set("EMSX_REQUEST_SEQ", 1)
+                request.set(EMSX_REQUEST_SEQ, 1)
                 
-                request.set("EMSX_ASSET_CLASS","EQTY")  # one of EQTY, OPT, FUT or MULTILEG_OPT
-                request.set("EMSX_BROKER","BMTB")
-                request.set("EMSX_STRATEGY","VWAP")
+                request.set(EMSX_ASSET_CLASS,"EQTY")  # one of EQTY, OPT, FUT or MULTILEG_OPT
+                request.set(EMSX_BROKER,"BMTB")
+                request.set(EMSX_STRATEGY,"VWAP")
                     
                 print ("Request: %s" % request.toString())
                     
@@ -78,7 +77,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -93,22 +93,21 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == GET_BROKER_STRATEGY_INFO_WITH_ASSET_CLASS:
 
-                    strategies = msg.getElement("EMSX_STRATEGY_INFO")
+                    strategies = msg.getElement(EMSX_STRATEGY_INFO)
 
                     for s in strategies.values():
-                        fieldname = s.getElementAsString("FieldName")
-                        disable = s.getElementAsString("Disable")
-                        stringvalue = s.getElementAsString("StringValue")
+                        fieldname = s.getElementAsString(FIELD_NAME)
+                        disable = s.getElementAsString(DISABLE)
+                        stringvalue = s.getElementAsString(STRING_VALUE)
                         
                         print ("EMSX_STRATEGY_INFO: %s, %s, %s" % (fieldname,disable,stringvalue))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -135,8 +134,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
@@ -2,19 +2,21 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       GROUP_ROUTE_EX, EMSX_AMOUNT_PERCENT, EMSX_BROKER, EMSX_HAND_INSTRUCTION, EMSX_ORDER_TYPE,
+                       EMSX_TICKER, EMSX_TIF, EMSX_REQUEST_TYPE, MULTILEG, EMSX_AMOUNT, EMSX_ML_RATIO,
+                       EMSX_ROUTE_REF_ID_PAIRS, EMSX_ROUTE_REF_ID, EMSX_SEQUENCE, EMSX_STRATEGY_PARAMS,
+                       EMSX_STRATEGY_NAME, EMSX_STRATEGY_FIELD_INDICATORS, EMSX_STRATEGY_FIELDS, EMSX_FIELD_DATA,
+                       EMSX_FIELD_INDICATOR, ERROR_CODE, ERROR_MESSAGE, EMSX_SUCCESS_ROUTES, EMSX_ROUTE_ID,
+                       EMSX_FAILED_ROUTES)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-GROUP_ROUTE_EX          = blpapi.Name("GroupRouteEx")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 
 class SessionEventHandler():
@@ -48,7 +50,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -67,20 +70,20 @@ class SessionEventHandler():
                 request = service.createRequest("GroupRouteEx")
 
                 # Multiple order numbers can be added
-                request.append("EMSX_SEQUENCE", 4116143) 
-                request.append("EMSX_SEQUENCE", 4116144) 
-                request.append("EMSX_SEQUENCE", 4116145) 
+                request.append(EMSX_SEQUENCE, 4116143) 
+                request.append(EMSX_SEQUENCE, 4116144) 
+                request.append(EMSX_SEQUENCE, 4116145) 
 
                 # The fields below are mandatory
-                request.set("EMSX_AMOUNT_PERCENT", 50)  # Note the amount here is %age of order amount
-                request.set("EMSX_BROKER", "BB");
+                request.set(EMSX_AMOUNT_PERCENT, 50)  # Note the amount here is %age of order amount
+                request.set(EMSX_BROKER, "BB");
                 
                 # For GroupRoute, the below values need to be added, but are taken 
                 # from the original order when the route is created.
-                request.set("EMSX_HAND_INSTRUCTION", "ANY")
-                request.set("EMSX_ORDER_TYPE", "MKT")
-                request.set("EMSX_TICKER", "XOM US Equity")
-                request.set("EMSX_TIF", "DAY")
+                request.set(EMSX_HAND_INSTRUCTION, "ANY")
+                request.set(EMSX_ORDER_TYPE, "MKT")
+                request.set(EMSX_TICKER, "XOM US Equity")
+                request.set(EMSX_TIF, "DAY")
             
                 # The fields below are optional
                 #request.set("EMSX_ACCOUNT","TestAccount")
@@ -106,76 +109,76 @@ class SessionEventHandler():
                 # Set the Request Type if this is for multi-leg orders
                 # only valid for options
                 '''
-                requestType = request.getElement("EMSX_REQUEST_TYPE") 
-                requestType.setChoice("Multileg")
-                multileg = requestType.getElement("Multileg")
-                multileg.setElement("EMSX_AMOUNT",10)
-                multileg.getElement("EMSX_ML_RATIO").appendValue(2)
-                multileg.getElement("EMSX_ML_RATIO").appendValue(3)
+                requestType = request.getElement(EMSX_REQUEST_TYPE) 
+                requestType.setChoice(MULTILEG)
+                multileg = requestType.getElement(MULTILEG)
+                multileg.setElement(EMSX_AMOUNT,10)
+                multileg.getElement(EMSX_ML_RATIO).appendValue(2)
+                multileg.getElement(EMSX_ML_RATIO).appendValue(3)
                 '''
                 
                 # Add the Route Ref ID values
-                routeRefIDPairs = request.getElement("EMSX_ROUTE_REF_ID_PAIRS")
+                routeRefIDPairs = request.getElement(EMSX_ROUTE_REF_ID_PAIRS)
                 route1 = routeRefIDPairs.appendElement()
-                route1.setElement("EMSX_ROUTE_REF_ID","MyRouteRef1")
-                route1.setElement("EMSX_SEQUENCE",4116143)
+                route1.setElement(EMSX_ROUTE_REF_ID,"MyRouteRef1")
+                route1.setElement(EMSX_SEQUENCE,4116143)
                 
                 route2 = routeRefIDPairs.appendElement();
-                route2.setElement("EMSX_ROUTE_REF_ID","MyRouteRef2")
-                route2.setElement("EMSX_SEQUENCE",4116144)
+                route2.setElement(EMSX_ROUTE_REF_ID,"MyRouteRef2")
+                route2.setElement(EMSX_SEQUENCE,4116144)
                 
                 route3 = routeRefIDPairs.appendElement()
-                route3.setElement("EMSX_ROUTE_REF_ID","MyRouteRef3")
-                route3.setElement("EMSX_SEQUENCE",4116145)
+                route3.setElement(EMSX_ROUTE_REF_ID,"MyRouteRef3")
+                route3.setElement(EMSX_SEQUENCE,4116145)
                 
                 # Below we establish the strategy details. Strategy details
                 # are common across all orders in a GroupRoute operation.
                 '''
-                strategy = request.getElement("EMSX_STRATEGY_PARAMS")
-                strategy.setElement("EMSX_STRATEGY_NAME", "VWAP")
+                strategy = request.getElement(EMSX_STRATEGY_PARAMS)
+                strategy.setElement(EMSX_STRATEGY_NAME, "VWAP")
                 
-                indicator = strategy.getElement("EMSX_STRATEGY_FIELD_INDICATORS")
-                data = strategy.getElement("EMSX_STRATEGY_FIELDS")
+                indicator = strategy.getElement(EMSX_STRATEGY_FIELD_INDICATORS)
+                data = strategy.getElement(EMSX_STRATEGY_FIELDS)
                 
                 # Strategy parameters must be appended in the correct order. See the output 
                 # of GetBrokerStrategyInfo request for the order. The indicator value is 0 for 
                 # a field that carries a value, and 1 where the field should be ignored
                 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "09:30:00")  # StartTime
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 0)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "09:30:00")  # StartTime
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 0)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "10:30:00")  # EndTime
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 0)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "10:30:00")  # EndTime
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 0)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # Max%Volume
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # Max%Volume
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # %AMSession
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # %AMSession
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # OPG
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # OPG
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # MOC
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # MOC
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # CompletePX
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # CompletePX
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
                    
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # TriggerPX
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # TriggerPX
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # DarkComplete
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # DarkComplete
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # DarkCompPX
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # DarkCompPX
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # RefIndex
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # RefIndex
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
 
-                data.appendElement().setElement("EMSX_FIELD_DATA", "")          # Discretion
-                indicator.appendElement().setElement("EMSX_FIELD_INDICATOR", 1)
+                data.appendElement().setElement(EMSX_FIELD_DATA, "")          # Discretion
+                indicator.appendElement().setElement(EMSX_FIELD_INDICATOR, 1)
                 '''
                 print ("Request: %s" % request.toString())
                     
@@ -184,7 +187,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -199,36 +203,35 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == GROUP_ROUTE_EX:
 
-                    if(msg.hasElement("EMSX_SUCCESS_ROUTES")):
-                        success = msg.getElement("EMSX_SUCCESS_ROUTES")
+                    if(msg.hasElement(EMSX_SUCCESS_ROUTES)):
+                        success = msg.getElement(EMSX_SUCCESS_ROUTES)
 
                         nV = success.numValues()
                         
                         for i in range(0,nV):
                             e = success.getValueAsElement(i)
-                            sq = e.getElementAsInteger("EMSX_SEQUENCE")
-                            rid = e.getElementAsInteger("EMSX_ROUTE_ID")
+                            sq = e.getElementAsInteger(EMSX_SEQUENCE)
+                            rid = e.getElementAsInteger(EMSX_ROUTE_ID)
 
                             print ("SUCCESS: %d,%d" % (sq,rid))
                     
-                    if(msg.hasElement("EMSX_FAILED_ROUTES")):
-                        failed = msg.getElement("EMSX_FAILED_ROUTES")
+                    if(msg.hasElement(EMSX_FAILED_ROUTES)):
+                        failed = msg.getElement(EMSX_FAILED_ROUTES)
 
                         nV = failed.numValues()
                         
                         for i in range(0,nV):
                             e = failed.getValueAsElement(i)
-                            sq = e.getElementAsInteger("EMSX_SEQUENCE")
+                            sq = e.getElementAsInteger(EMSX_SEQUENCE)
 
                             print ("FAILED: %d" % (sq))                                                            
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -255,8 +258,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
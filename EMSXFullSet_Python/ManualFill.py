@@ -2,19 +2,18 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       MANUAL_FILL, ROUTE_TO_FILL, EMSX_SEQUENCE, EMSX_ROUTE_ID, FILLS, EMSX_FILL_AMOUNT,
+                       EMSX_FILL_PRICE, EMSX_FILL_DATE_TIME, LEGACY, EMSX_FILL_DATE, EMSX_FILL_TIME,
+                       EMSX_FILL_TIME_FORMAT, ERROR_CODE, ERROR_MESSAGE, EMSX_FILL_ID, MESSAGE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-MANUAL_FILL             = blpapi.Name("ManualFill")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 class SessionEventHandler():
 
@@ -47,7 +46,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -67,24 +67,24 @@ class SessionEventHandler():
                 #request.set("EMSX_REQUEST_SEQ", 1)
                 #request.set("EMSX_TRADER_UUID", 1234567) # Trader UUID
 
-                routeToFill = request.getElement("ROUTE_TO_FILL")
-                routeToFill.setElement("EMSX_SEQUENCE", 12345) # EMSX_SEQUENCE or Order# from EMSX blotter
-                routeToFill.setElement("EMSX_ROUTE_ID", 1)
+                routeToFill = request.getElement(ROUTE_TO_FILL)
+                routeToFill.setElement(EMSX_SEQUENCE, 12345) # EMSX_SEQUENCE or Order# from EMSX blotter
+                routeToFill.setElement(EMSX_ROUTE_ID, 1)
                     
-                fills = request.getElement("FILLS")
+                fills = request.getElement(FILLS)
 
                 fill = fills.appendElement()
                     
-                fill.setElement("EMSX_FILL_AMOUNT", 100)
-                fill.setElement("EMSX_FILL_PRICE", 168.11)
+                fill.setElement(EMSX_FILL_AMOUNT, 100)
+                fill.setElement(EMSX_FILL_PRICE, 168.11)
                 #fill.setElement("EMSX_LAST_MARKET", "XLON")
                 #fills.setElement("EMSX_INDIA_EXCHANGE","BGL")
-                fillDateTime = fill.getElement("EMSX_FILL_DATE_TIME")
+                fillDateTime = fill.getElement(EMSX_FILL_DATE_TIME)
                     
-                legacy = fillDateTime.setChoice("Legacy");
-                legacy.setElement("EMSX_FILL_DATE",20171103)
-                legacy.setElement("EMSX_FILL_TIME",26070)
-                legacy.setElement("EMSX_FILL_TIME_FORMAT","SecondsFromMidnight")
+                legacy = fillDateTime.setChoice(LEGACY);
+                legacy.setElement(EMSX_FILL_DATE,20171103)
+                legacy.setElement(EMSX_FILL_TIME,26070)
+                legacy.setElement(EMSX_FILL_TIME_FORMAT,"SecondsFromMidnight")
 
                 print ("Request: %s" % request.toString())
     
@@ -93,7 +93,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -108,16 +109,15 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == MANUAL_FILL:
-                    fillID = msg.getElementAsInteger("EMSX_FILL_ID")
-                    message = msg.getElementAsString("MESSAGE")
+                    fillID = msg.getElementAsInteger(EMSX_FILL_ID)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("EMSX_FILL_ID: %d\tMESSAGE: %s" % (fillID,message))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -144,8 +144,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
@@ -2,19 +2,17 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       MODIFY_ORDER_EX, EMSX_SEQUENCE, EMSX_AMOUNT, EMSX_ORDER_TYPE, EMSX_TIF, EMSX_TICKER,
+                       ERROR_CODE, ERROR_MESSAGE, MESSAGE)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-MODIFY_ORDER_EX         = blpapi.Name("ModifyOrderEx")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 
 class SessionEventHandler():
@@ -48,7 +46,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -67,11 +66,11 @@ class SessionEventHandler():
                 request = service.createRequest("ModifyOrderEx")
 
                 # The fields below are mandatory
-                request.set("EMSX_SEQUENCE", 4116143)
-                request.set("EMSX_AMOUNT", 500)
-                request.set("EMSX_ORDER_TYPE", "MKT")
-                request.set("EMSX_TIF", "DAY")
-                request.set("EMSX_TICKER", "CVX US Equity")
+                request.set(EMSX_SEQUENCE, 4116143)
+                request.set(EMSX_AMOUNT, 500)
+                request.set(EMSX_ORDER_TYPE, "MKT")
+                request.set(EMSX_TIF, "DAY")
+                request.set(EMSX_TICKER, "CVX US Equity")
             
                 # The fields below are optional
                 #request.set("EMSX_HAND_INSTRUCTION", "ANY")
@@ -102,7 +101,8 @@ class SessionEventHandler():
                 session.sendRequest(request, correlationId=self.requestID )
                             
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")        
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event):
         print ("Processing RESPONSE event")
@@ -117,16 +117,15 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == MODIFY_ORDER_EX:
-                    emsx_sequence = msg.getElementAsInteger("EMSX_SEQUENCE")
-                    message = msg.getElementAsString("MESSAGE")
+                    emsx_sequence = msg.getElementAsInteger(EMSX_SEQUENCE)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("EMSX_SEQUENCE: %d\tMESSAGE: %s" % (emsx_sequence,message))
 
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -153,8 +152,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
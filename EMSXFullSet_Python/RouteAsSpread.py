@@ -2,20 +2,19 @@
 
 import blpapi
 import sys
+import threading
 
+from EMSXNames import (SESSION_STARTED, SESSION_STARTUP_FAILURE, SERVICE_OPENED, SERVICE_OPEN_FAILURE, ERROR_INFO,
+                       GROUP_ROUTE_EX, CREATE_ORDER, ERROR_CODE, ERROR_MESSAGE, EMSX_SEQUENCE, MESSAGE,
+                       EMSX_SUCCESS_ROUTES, EMSX_ROUTE_ID, EMSX_FAILED_ROUTES, EMSX_TICKER, EMSX_AMOUNT,
+                       EMSX_ORDER_TYPE, EMSX_TIF, EMSX_HAND_INSTRUCTION, EMSX_SIDE, EMSX_AMOUNT_PERCENT, EMSX_BROKER,
+                       EMSX_RELEASE_TIME, EMSX_REQUEST_TYPE, SPREAD)
 
-SESSION_STARTED         = blpapi.Name("SessionStarted")
-SESSION_STARTUP_FAILURE = blpapi.Name("SessionStartupFailure")
-SERVICE_OPENED          = blpapi.Name("ServiceOpened")
-SERVICE_OPEN_FAILURE    = blpapi.Name("ServiceOpenFailure")
-ERROR_INFO              = blpapi.Name("ErrorInfo")
-GROUP_ROUTE_EX          = blpapi.Name("GroupRouteEx")
-CREATE_ORDER            = blpapi.Name("CreateOrder")
 
 d_service="//blp/emapisvc_beta"
 d_host="localhost"
 d_port=8194
-bEnd=False
+d_done=threading.Event()
 
 
 class SessionEventHandler():
@@ -57,7 +56,8 @@ class SessionEventHandler():
                 session.openServiceAsync(d_service)
                 
             elif msg.messageType() == SESSION_STARTUP_FAILURE:
-                print >> sys.stderr, ("Error: Session startup failed")
+                print ("Error: Session startup failed", file=sys.stderr)
+                d_done.set()
                 
             else:
                 print (msg)
@@ -76,7 +76,8 @@ class SessionEventHandler():
                 self.createBuyOrder(session)
                 
             elif msg.messageType() == SERVICE_OPEN_FAILURE:
-                print >> sys.stderr, ("Error: Service failed to open")
+                print ("Error: Service failed to open", file=sys.stderr)
+                d_done.set()
                 
     def processResponseEvent(self, event, session):
         print ("Processing RESPONSE event")
@@ -90,12 +91,12 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("Failed to create buy order >> ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == CREATE_ORDER:
-                    self.buySeqNo = msg.getElementAsInteger("EMSX_SEQUENCE")
-                    message = msg.getElementAsString("MESSAGE")
+                    self.buySeqNo = msg.getElementAsInteger(EMSX_SEQUENCE)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("Buy order created >> EMSX_SEQUENCE: %d\tMESSAGE: %s" % (self.buySeqNo ,message))
                 
                 if self.sellSeqNo > 0: # already received sell order response
@@ -108,12 +109,12 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("Failed to create sell order >> ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == CREATE_ORDER:
-                    self.sellSeqNo = msg.getElementAsInteger("EMSX_SEQUENCE")
-                    message = msg.getElementAsString("MESSAGE")
+                    self.sellSeqNo = msg.getElementAsInteger(EMSX_SEQUENCE)
+                    message = msg.getElementAsString(MESSAGE)
                     print ("Sell order created >> EMSX_SEQUENCE: %d\tMESSAGE: %s" % (self.sellSeqNo ,message))
                 
                 if self.buySeqNo > 0: # already received buy order response
@@ -126,31 +127,31 @@ class SessionEventHandler():
                 print ("MESSAGE TYPE: %s" % msg.messageType())
                 
                 if msg.messageType() == ERROR_INFO:
-                    errorCode = msg.getElementAsInteger("ERROR_CODE")
-                    errorMessage = msg.getElementAsString("ERROR_MESSAGE")
+                    errorCode = msg.getElementAsInteger(ERROR_CODE)
+                    errorMessage = msg.getElementAsString(ERROR_MESSAGE)
                     print ("ERROR CODE: %d\tERROR MESSAGE: %s" % (errorCode,errorMessage))
                 elif msg.messageType() == GROUP_ROUTE_EX:
 
-                    if(msg.hasElement("EMSX_SUCCESS_ROUTES")):
-                        success = msg.getElement("EMSX_SUCCESS_ROUTES")
+                    if(msg.hasElement(EMSX_SUCCESS_ROUTES)):
+                        success = msg.getElement(EMSX_SUCCESS_ROUTES)
 
                         nV = success.numValues()
                         
                         for i in range(0,nV):
                             e = success.getValueAsElement(i)
-                            sq = e.getElementAsInteger("EMSX_SEQUENCE")
-                            rid = e.getElementAsInteger("EMSX_ROUTE_ID")
+                            sq = e.getElementAsInteger(EMSX_SEQUENCE)
+                            rid = e.getElementAsInteger(EMSX_ROUTE_ID)
 
                             print ("SUCCESS: %d,%d" % (sq,rid))
                     
-                    if(msg.hasElement("EMSX_FAILED_ROUTES")):
-                        failed = msg.getElement("EMSX_FAILED_ROUTES")
+                    if(msg.hasElement(EMSX_FAILED_ROUTES)):
+                        failed = msg.getElement(EMSX_FAILED_ROUTES)
 
                         nV = failed.numValues()
                         
                         for i in range(0,nV):
                             e = failed.getValueAsElement(i)
-                            sq = e.getElementAsInteger("EMSX_SEQUENCE")
+                            sq = e.getElementAsInteger(EMSX_SEQUENCE)
 
                             print ("FAILED: %d" % (sq))
 
@@ -259,8 +260,7 @@ SessionTerminated = {
 
                 '''
                             
-                global bEnd
-                bEnd = True
+                d_done.set()
                 
     def processMiscEvents(self, event):
         
@@ -276,12 +276,12 @@ SessionTerminated = {
         request = self.service.createRequest("CreateOrder")
 
         # The fields below are mandatory
-        request.set("EMSX_TICKER", "CLN7 Comdty")
-        request.set("EMSX_AMOUNT", 100)
-        request.set("EMSX_ORDER_TYPE", "MKT")
-        request.set("EMSX_TIF", "DAY")
-        request.set("EMSX_HAND_INSTRUCTION", "ANY")
-        request.set("EMSX_SIDE", "BUY")
+        request.set(EMSX_TICKER, "CLN7 Comdty")
+        request.set(EMSX_AMOUNT, 100)
+        request.set(EMSX_ORDER_TYPE, "MKT")
+        request.set(EMSX_TIF, "DAY")
+        request.set(EMSX_HAND_INSTRUCTION, "ANY")
+        request.set(EMSX_SIDE, "BUY")
         
         print ("Request: %s" % request.toString())
                     
@@ -294,12 +294,12 @@ SessionTerminated = {
         request = self.service.createRequest("CreateOrder")
 
         # The fields below are mandatory
-        request.set("EMSX_TICKER", "CLQ7 Comdty")
-        request.set("EMSX_AMOUNT", 100)
-        request.set("EMSX_ORDER_TYPE", "MKT")
-        request.set("EMSX_TIF", "DAY")
-        request.set("EMSX_HAND_INSTRUCTION", "ANY")
-        request.set("EMSX_SIDE", "SELL")
+        request.set(EMSX_TICKER, "CLQ7 Comdty")
+        request.set(EMSX_AMOUNT, 100)
+        request.set(EMSX_ORDER_TYPE, "MKT")
+        request.set(EMSX_TIF, "DAY")
+        request.set(EMSX_HAND_INSTRUCTION, "ANY")
+        request.set(EMSX_SIDE, "SELL")
         
         print ("Request: %s" % request.toString())
                     
@@ -311,17 +311,17 @@ SessionTerminated = {
         
         request = self.service.createRequest("GroupRouteEx")
 
-        request.append("EMSX_SEQUENCE", self.buySeqNo) 
-        request.append("EMSX_SEQUENCE", self.sellSeqNo) 
-        request.set("EMSX_AMOUNT_PERCENT", 100)
-        request.set("EMSX_BROKER", "EFIX");
-        request.set("EMSX_HAND_INSTRUCTION", "ANY")
-        request.set("EMSX_ORDER_TYPE", "MKT")
-        request.set("EMSX_TIF", "DAY")
-        request.set("EMSX_TICKER","CLN7 Comdty")
-        request.set("EMSX_RELEASE_TIME",-1)
-        requestType = request.getElement("EMSX_REQUEST_TYPE") 
-        requestType.setChoice("Spread")
+        request.append(EMSX_SEQUENCE, self.buySeqNo) 
+        request.append(EMSX_SEQUENCE, self.sellSeqNo) 
+        request.set(EMSX_AMOUNT_PERCENT, 100)
+        request.set(EMSX_BROKER, "EFIX");
+        request.set(EMSX_HAND_INSTRUCTION, "ANY")
+        request.set(EMSX_ORDER_TYPE, "MKT")
+        request.set(EMSX_TIF, "DAY")
+        request.set(EMSX_TICKER,"CLN7 Comdty")
+        request.set(EMSX_RELEASE_TIME,-1)
+        requestType = request.getElement(EMSX_REQUEST_TYPE) 
+        requestType.setChoice(SPREAD)
     
         print ("Request: %s" % request.toString())
             
@@ -346,8 +346,7 @@ def main():
         print ("Failed to start session.")
         return
     
-    global bEnd
-    while bEnd==False:
+    while not d_done.wait(0.5):
         pass
     
     session.stop()
@@ -0,0 +1,134 @@
+# test_EMSXBlotter.py
+
+import unittest
+
+from EMSXBlotter import BlotterStore, BlotterTable, ORDER_KEY_FIELDS, INIT_PAINT, NEW_ORDER_ROUTE, UPDATE_ORDER_ROUTE, DELETE_ORDER_ROUTE
+
+
+ORDERS = [{"EMSX_SEQUENCE": 1, "EMSX_TICKER": "IBM US Equity", "EMSX_STATUS": "NEW", "EMSX_BROKER": "BMTB"},
+          {"EMSX_SEQUENCE": 2, "EMSX_TICKER": "IBM US Equity", "EMSX_STATUS": "WORKING", "EMSX_BROKER": "EFIX"},
+          {"EMSX_SEQUENCE": 3, "EMSX_TICKER": "VOD LN Equity", "EMSX_STATUS": "NEW"}]
+
+
+class BlotterTableTest(unittest.TestCase):
+    """ The indexes always hold exactly the keys of the rows with each value. """
+
+    def setUp(self):
+        self.table = BlotterTable(ORDER_KEY_FIELDS)
+        self.table.load([dict(order) for order in ORDERS])
+
+    def assertIndexesMatchRows(self):
+        for field, index in self.table.indexes.items():
+            expected = {}
+            for key, row in self.table.rows.items():
+                if field in row:
+                    expected.setdefault(row[field], set()).add(key)
+            self.assertEqual(index, expected, field)
+
+    def test_load_indexes_every_row(self):
+        self.assertEqual(self.table.keys("EMSX_TICKER", "IBM US Equity"), {1, 2})
+        self.assertEqual(self.table.keys("EMSX_BROKER", "BMTB"), {1})
+        self.assertIndexesMatchRows()
+
+    def test_update_moves_the_key_to_the_new_value(self):
+        self.table.upsert({"EMSX_SEQUENCE": 1, "EMSX_STATUS": "WORKING", "EMSX_FILLED": 100})
+
+        self.assertEqual(self.table.keys("EMSX_STATUS", "WORKING"), {1, 2})
+        self.assertEqual(self.table.keys("EMSX_STATUS", "NEW"), {3})
+        self.assertEqual(self.table.get(1)["EMSX_TICKER"], "IBM US Equity")
+        self.assertIndexesMatchRows()
+
+    def test_last_key_of_a_value_removes_the_value(self):
+        self.table.upsert({"EMSX_SEQUENCE": 3, "EMSX_TICKER": "IBM US Equity"})
+
+        self.assertNotIn("VOD LN Equity", self.table.values("EMSX_TICKER"))
+        self.assertEqual(self.table.lookup("EMSX_TICKER", "VOD LN Equity"), [])
+        self.assertIndexesMatchRows()
+
+    def test_update_adds_a_field_the_row_did_not_have(self):
+        self.table.upsert({"EMSX_SEQUENCE": 3, "EMSX_BROKER": "BMTB"})
+
+        self.assertEqual(self.table.keys("EMSX_BROKER", "BMTB"), {1, 3})
+        self.assertIndexesMatchRows()
+
+    def test_delete_removes_the_key_from_every_index(self):
+        self.assertEqual(self.table.delete(1)["EMSX_BROKER"], "BMTB")
+
+        self.assertEqual(self.table.keys("EMSX_TICKER", "IBM US Equity"), {2})
+        self.assertNotIn("BMTB", self.table.values("EMSX_BROKER"))
+        self.assertIsNone(self.table.delete(1))
+        self.assertIndexesMatchRows()
+
+    def test_replace_unindexes_dropped_fields(self):
+        self.table.replace({"EMSX_SEQUENCE": 2, "EMSX_TICKER": "IBM US Equity", "EMSX_STATUS": "FILLED"})
+
+        self.assertEqual(self.table.keys("EMSX_BROKER", "EFIX"), set())
+        self.assertEqual(self.table.keys("EMSX_STATUS", "FILLED"), {2})
+        self.assertIndexesMatchRows()
+
+    def test_reloading_a_row_updates_its_indexes(self):
+        self.table.load([{"EMSX_SEQUENCE": 1, "EMSX_STATUS": "FILLED"}, {"EMSX_SEQUENCE": 4, "EMSX_STATUS": "NEW"}])
+
+        self.assertEqual(self.table.keys("EMSX_STATUS", "NEW"), {3, 4})
+        self.assertEqual(self.table.keys("EMSX_STATUS", "FILLED"), {1})
+        self.assertIndexesMatchRows()
+
+    def test_added_index_covers_existing_rows(self):
+        self.table.addIndex("EMSX_SEQUENCE")
+        self.table.upsert({"EMSX_SEQUENCE": 4, "EMSX_STATUS": "NEW"})
+
+        self.assertEqual(self.table.keys("EMSX_SEQUENCE", 2), {2})
+        self.assertEqual(self.table.select(EMSX_STATUS="NEW", EMSX_SEQUENCE=4), [{"EMSX_SEQUENCE": 4, "EMSX_STATUS": "NEW"}])
+        self.assertIndexesMatchRows()
+
+    def test_clear_empties_the_indexes(self):
+        self.table.clear()
+
+        self.assertEqual(len(self.table), 0)
+        self.assertEqual(self.table.values("EMSX_TICKER"), [])
+
+
+class BlotterStoreTest(unittest.TestCase):
+
+    def test_event_statuses(self):
+        store = BlotterStore()
+        store.applyOrder(INIT_PAINT, dict(ORDERS[0]))
+        store.applyRoute(NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1, "EMSX_STATUS": "WORKING"})
+        store.applyRoute(NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 2, "EMSX_STATUS": "WORKING"})
+        store.applyRoute(UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1, "EMSX_STATUS": "FILLED"})
+
+        self.assertEqual(store.routes.keys("EMSX_STATUS", "WORKING"), {(1, 2)})
+        self.assertEqual(store.routes.keys("EMSX_STATUS", "FILLED"), {(1, 1)})
+
+        store.applyRoute(DELETE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 2})
+        self.assertEqual([route["EMSX_ROUTE_ID"] for route in store.routesForOrder(1)], [1])
+        self.assertIsNone(store.route(1, 2))
+
+        store.applyOrder(DELETE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1})
+        self.assertIsNone(store.order(1))
+        self.assertEqual(store.orders.lookup("EMSX_TICKER", "IBM US Equity"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,64 @@
+# test_EMSXBrokerSpecIndex.py
+
+import unittest
+
+import blpapi
+
+from EMSXBrokerSpecIndex import BrokerSpecIndex, StrategyValidationError, d_service
+from EMSXRefDataCache import RefDataError
+from EMSXSessionManager import ManagedSession
+
+
+class BrokerSpecIndexTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session = ManagedSession(services=[d_service])
+        cls.session.start()
+        cls.index = BrokerSpecIndex.fetch(cls.session)
+        broker, assetClass, name = sorted(cls.index.strategies)[0]
+        cls.spec = cls.index.strategy(broker, assetClass, name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.stop()
+
+    def test_enumerations_are_sent_as_fix_values(self):
+        # "High" and "3" are the same Urgency; both go on the wire as "3".
+        self.assertEqual(self.spec.fields({"Urgency": "High", "MaxPctVolume": 10}), self.spec.fields({"Urgency": "3", "MaxPctVolume": 10}))
+
+        urgency = [p.position for p in self.spec.parameters if p.name == "Urgency"][0]
+        self.assertEqual(self.spec.fields({"Urgency": "High"})[urgency], ("3", 0))
+
+    def test_validation(self):
+        self.assertEqual(self.spec.errors({"Urgency": "Low"}), [])
+        self.assertRaises(StrategyValidationError, self.spec.validate, {"Urgency": "Urgent"})
+        self.assertRaises(StrategyValidationError, self.spec.validate, {"MaxPctVolume": 10})
+
+    def test_failed_fetch_raises_a_request_error(self):
+        blpapi.emulator.setErrorRate(1.0, "GetBrokerSpecForUuid")
+        self.addCleanup(blpapi.emulator.setErrorRate, 0.0, "GetBrokerSpecForUuid")
+        self.assertRaises(RefDataError, BrokerSpecIndex.fetch, self.session)
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,119 @@
+# test_EMSXBrokerSpecStore.py
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from EMSXBrokerSpecIndex import d_service
+from EMSXBrokerSpecStore import BrokerSpecStore
+from EMSXRefDataCache import RefDataError
+from EMSXSessionManager import SessionManager
+
+
+class BrokerSpecStoreTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.manager = SessionManager(services=[d_service])
+        cls.brokers = BrokerSpecStore(None, sessionManager=cls.manager).fetch()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.manager.stop()
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "brokerspec.json")
+        self.fetches = 0
+
+    def fetch(self):
+        self.fetches += 1
+        return self.brokers
+
+    def failingFetch(self):
+        self.fetches += 1
+        time.sleep(0.1)
+        raise RefDataError("GetBrokerSpecForUuid failed")
+
+    def test_emulated_fetch(self):
+        store = BrokerSpecStore(self.path, sessionManager=self.manager, refreshInterval=None)
+        index = store.index()
+
+        self.assertIsNotNone(index)
+        self.assertTrue(index.strategyNames("BMTB", "EQTY"))
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_snapshot_is_used_before_the_first_fetch(self):
+        BrokerSpecStore(self.path, fetch=self.fetch, refreshInterval=None).refresh()
+        self.assertEqual(self.fetches, 1)
+
+        store = BrokerSpecStore(self.path, fetch=self.failingFetch, refreshInterval=None)
+        index = store.index()
+        self.assertIsNotNone(index)
+        self.assertEqual(self.fetches, 1)
+        self.assertEqual(store.stats()["loads"], 1)
+
+    def test_unchanged_spec_is_not_swapped(self):
+        store = BrokerSpecStore(self.path, fetch=self.fetch, refreshInterval=None)
+        self.assertTrue(store.refresh())
+        index = store.index()
+        saved = os.path.getmtime(self.path)
+
+        self.assertFalse(store.refresh())
+        self.assertIs(store.index(), index)
+        self.assertEqual(os.path.getmtime(self.path), saved)
+        self.assertEqual(store.stats()["swaps"], 1)
+
+    def test_failed_first_fetch_wakes_waiters(self):
+        store = BrokerSpecStore(self.path, fetch=self.failingFetch, refreshInterval=None)
+        store.start()
+        self.addCleanup(store.stop)
+
+        results = []
+        waiters = [threading.Thread(target=lambda: results.append(store.index())) for i in range(3)]
+        start = time.time()
+        for waiter in waiters:
+            waiter.start()
+        for waiter in waiters:
+            waiter.join(5)
+
+        self.assertEqual(results, [None, None, None])
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(store.stats()["errors"], 1)
+
+    def test_malformed_snapshot_is_ignored(self):
+        for snapshot in ({"uuid": 12109783}, {"uuid": 12109783, "brokers": 5, "digest": "x", "saved": 0}, ["not", "a", "snapshot"]):
+            with open(self.path, "w") as f:
+                json.dump(snapshot, f)
+            store = BrokerSpecStore(self.path, uuid=12109783, fetch=self.fetch, refreshInterval=None)
+            self.assertFalse(store.load())
+            self.assertIsNotNone(store.index())
+            self.assertEqual(store.stats()["loads"], 0)
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,100 @@
+# test_EMSXBulkOrders.py
+
+import unittest
+
+import blpapi
+
+from EMSXBlotter import BlotterStore
+from EMSXBulkOrders import BulkOrderCreator, CREATED, FAILED, UNKNOWN, d_service
+from EMSXSessionManager import ManagedSession
+
+
+SPECS = [{"EMSX_TICKER": "IBM US Equity", "EMSX_AMOUNT": 100 * (i + 1), "EMSX_ORDER_TYPE": "MKT",
+          "EMSX_TIF": "DAY", "EMSX_HAND_INSTRUCTION": "ANY", "EMSX_SIDE": "BUY"} for i in range(3)]
+
+
+class BulkOrdersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = blpapi.emulator
+        self.session = ManagedSession(services=[d_service])
+        self.session.start()
+        self.addCleanup(self.session.stop)
+        self.creator = BulkOrderCreator(self.session, requestTimeout=0.1)
+
+    def blotter(self):
+        blotter = BlotterStore()
+        blotter.loadOrders(list(self.emulator.orders.values()))
+        return blotter
+
+    def slowResponses(self):
+        latency, self.emulator.latency = self.emulator.latency, 2.0
+        self.addCleanup(setattr, self.emulator, "latency", latency)
+
+    def test_rows_carry_a_reference_id(self):
+        results = self.creator.createOrders(SPECS)
+
+        self.assertEqual([result.state for result in results], [CREATED] * 3)
+        self.assertEqual(len(set(result.refId for result in results)), 3)
+        for result in results:
+            self.assertEqual(self.emulator.orders[result.sequence]["EMSX_ORD_REF_ID"], result.refId)
+
+    def test_timed_out_request_is_unknown_not_failed(self):
+        self.slowResponses()
+        results = self.creator.createOrders(SPECS[:1])
+
+        self.assertEqual(results[0].state, UNKNOWN)
+        self.assertFalse(results[0].isError())
+        self.assertIsNone(results[0].errorCode)
+
+    def test_reconcile_finds_orders_created_despite_the_timeout(self):
+        self.slowResponses()
+        results = self.creator.createOrders(SPECS[:1])
+
+        self.assertEqual(self.creator.reconcile(results, self.blotter()), [])
+        self.assertEqual(results[0].state, CREATED)
+        self.assertEqual(self.emulator.orders[results[0].sequence]["EMSX_ORD_REF_ID"], results[0].refId)
+
+    def test_retry_does_not_duplicate_created_orders(self):
+        self.slowResponses()
+        results = self.creator.createOrders(SPECS[:1])
+        self.emulator.latency = 0.002
+        before = len(self.emulator.orders)
+
+        self.creator.retry(results, self.blotter())
+        self.assertEqual(results[0].state, CREATED)
+        self.assertEqual(len(self.emulator.orders), before)
+
+    def test_retry_resends_rows_that_were_not_created(self):
+        self.emulator.setErrorRate(1.0, "CreateOrder")
+        self.addCleanup(self.emulator.setErrorRate, 0.0, "CreateOrder")
+        results = self.creator.createOrders(SPECS[:1])
+        self.assertEqual(results[0].state, FAILED)
+        self.emulator.setErrorRate(0.0, "CreateOrder")
+
+        self.creator.retry(results, self.blotter())
+        self.assertEqual(results[0].state, CREATED)
+        self.assertEqual(self.emulator.orders[results[0].sequence]["EMSX_ORD_REF_ID"], results[0].refId)
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
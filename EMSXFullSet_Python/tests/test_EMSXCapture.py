@@ -0,0 +1,141 @@
+# test_EMSXCapture.py
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import blpapi
+
+import EMSXFieldDecoder
+from EMSXCapture import CaptureReader, CaptureWriter, captureHandler, replay, replaySessionClass
+from EMSXEmulator import Emulator
+from EMSXFieldDecoder import FieldDecoder
+from EMSXNames import ORDER_ROUTE_FIELDS
+from EMSXTopics import orderTopic, routeTopic
+
+
+d_service="//blp/emapisvc_beta"
+
+ORDERS = 5
+
+
+class ForeignElement(object):
+    """ Stands in for the real blpapi.Element: its accessors only work on
+    its own instances, not on the emulator's elements. """
+
+    def getValueAsString(self, index=0):
+        return self._handle.getValueAsString(index)
+
+    getValueAsInteger = getValueAsFloat = getValueAsBool = getValueAsString
+
+
+class Collector(object):
+    """ Decodes the OrderRouteFields messages of every event it is given. """
+
+    def __init__(self, decoder=None):
+        self.decoder = decoder if decoder is not None else FieldDecoder()
+        self.events = 0
+        self.records = []
+        self.painted = threading.Event()
+        self.updated = threading.Event()
+
+    def __call__(self, event, session):
+        self.events += 1
+        for msg in event:
+            if msg.messageType() == ORDER_ROUTE_FIELDS:
+                record = self.decoder.decode(msg)
+                self.records.append((msg.correlationIds()[0].value(), record))
+                if record["EVENT_STATUS"] == 11:
+                    self.painted.set()
+                elif record["EVENT_STATUS"] == 7:
+                    self.updated.set()
+
+
+class CaptureReplayTest(unittest.TestCase):
+    """ Records a live emulator subscription and replays the log. """
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "capture.bin")
+
+        emulator = Emulator(latency=0.001)
+        emulator.loadBlotter(ORDERS)
+        self.live = Collector()
+        with CaptureWriter(self.path) as writer:
+            session = blpapi.Session(blpapi.SessionOptions(), captureHandler(self.live, writer), emulator=emulator)
+            session.startAsync()
+            subscriptions = blpapi.SubscriptionList()
+            subscriptions.add(topic=orderTopic(d_service), correlationId=blpapi.CorrelationId(98))
+            subscriptions.add(topic=routeTopic(d_service, ["EMSX_STATUS", "EMSX_FILLED"]), correlationId=blpapi.CorrelationId(99))
+            session.subscribe(subscriptions)
+            self.assertTrue(self.live.painted.wait(5))
+
+            emulator.fill(min(emulator.orders), 1, 100, 10.0)
+            self.assertTrue(self.live.updated.wait(5))
+            time.sleep(0.05)
+            session.stop()
+            self.writer = writer
+
+    def test_log_holds_every_event(self):
+        records = list(CaptureReader(self.path))
+
+        self.assertEqual(len(records), self.writer.events)
+        self.assertEqual(len(records), self.live.events)
+        self.assertEqual(sum(len(messages) for receiveTime, eventType, messages in records), self.writer.messages)
+
+    def test_replay_decodes_the_recorded_records(self):
+        replayed = Collector()
+
+        self.assertEqual(replay(self.path, replayed), self.live.events)
+        self.assertEqual(replayed.records, self.live.records)
+        self.assertEqual(len([r for cid, r in replayed.records if cid == 99 and r["EVENT_STATUS"] == 4]), ORDERS)
+
+    def test_replay_session_delivers_the_log(self):
+        replayed = Collector()
+        session = replaySessionClass(self.path)(blpapi.SessionOptions(), replayed)
+        session.startAsync()
+        self.assertTrue(session.finished.wait(5))
+        session.stop()
+
+        self.assertEqual(session.delivered, self.live.events)
+        self.assertEqual(replayed.records, self.live.records)
+
+    def test_replay_with_another_element_class_installed(self):
+        # With the real blpapi installed, FieldDecoder is compiled against
+        # its Element class, but replayed messages are emulator elements.
+        with mock.patch.object(EMSXFieldDecoder.blpapi, "Element", ForeignElement):
+            decoder = FieldDecoder()
+        replayed = Collector(decoder)
+        replay(self.path, replayed)
+
+        self.assertEqual(replayed.records, self.live.records)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
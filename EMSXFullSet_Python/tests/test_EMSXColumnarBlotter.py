@@ -0,0 +1,78 @@
+# test_EMSXColumnarBlotter.py
+
+import unittest
+
+import blpapi
+
+from EMSXBlotter import BlotterStore, NEW_ORDER_ROUTE, DELETE_ORDER_ROUTE
+from EMSXColumnarBlotter import ColumnarBlotterStore, np
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class ColumnarBlotterStoreTest(unittest.TestCase):
+    """ The columnar store answers the same queries as BlotterStore. """
+
+    def setUp(self):
+        emulator = blpapi.emulator
+        self.orders, self.routes = [], []
+        for i, ticker in enumerate(["IBM US Equity", "VOD LN Equity", "IBM US Equity", "AAPL US Equity"]):
+            order = emulator.createOrder(fields={"EMSX_TICKER": ticker, "EMSX_AMOUNT": 100 * (i + 1), "EMSX_BROKER": "BMTB"}, publish=False)
+            self.orders.append(order)
+            for _ in range(i % 3):
+                self.routes.append(emulator.createRoute(order, publish=False))
+
+        self.stores = [BlotterStore(), ColumnarBlotterStore()]
+        for store in self.stores:
+            store.loadOrders(self.orders)
+            for route in self.routes:
+                store.applyRoute(NEW_ORDER_ROUTE, route)
+
+    def sequences(self, rows):
+        return sorted(row["EMSX_SEQUENCE"] for row in rows)
+
+    def test_lookup_and_select(self):
+        ibm = self.sequences(order for order in self.orders if order["EMSX_TICKER"] == "IBM US Equity")
+        for store in self.stores:
+            self.assertEqual(self.sequences(store.orders.lookup("EMSX_TICKER", "IBM US Equity")), ibm)
+            self.assertEqual(self.sequences(store.orders.select(EMSX_TICKER="IBM US Equity", EMSX_BROKER="BMTB")), ibm)
+            self.assertEqual(self.sequences(store.orders.select(lambda row: row["EMSX_AMOUNT"] > 200, EMSX_TICKER="IBM US Equity")), ibm[1:])
+            self.assertEqual(store.orders.select(EMSX_TICKER="MSFT US Equity"), [])
+            self.assertEqual(set(store.orders.keys("EMSX_TICKER", "IBM US Equity")), set(ibm))
+            self.assertEqual(sorted(store.orders.values("EMSX_TICKER")), ["AAPL US Equity", "IBM US Equity", "VOD LN Equity"])
+
+    def test_routes_for_order(self):
+        for order in self.orders:
+            expected = sorted(route["EMSX_ROUTE_ID"] for route in self.routes if route["EMSX_SEQUENCE"] == order["EMSX_SEQUENCE"])
+            for store in self.stores:
+                routes = store.routesForOrder(order["EMSX_SEQUENCE"])
+                self.assertEqual(sorted(route["EMSX_ROUTE_ID"] for route in routes), expected)
+
+    def test_deleted_rows_are_not_selected(self):
+        deleted = self.orders[0]
+        for store in self.stores:
+            store.applyOrder(DELETE_ORDER_ROUTE, deleted)
+            self.assertNotIn(deleted["EMSX_SEQUENCE"], self.sequences(store.orders.lookup("EMSX_TICKER", "IBM US Equity")))
+            self.assertIsNone(store.order(deleted["EMSX_SEQUENCE"]))
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,74 @@
+# test_EMSXConflator.py
+
+import unittest
+
+from EMSXBlotter import NEW_ORDER_ROUTE, UPDATE_ORDER_ROUTE, DELETE_ORDER_ROUTE
+from EMSXConflator import Conflator
+from EMSXTopics import ORDER, ROUTE
+
+
+class ConflatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.published = []
+        self.conflator = Conflator(lambda kind, eventStatus, record: self.published.append((kind, eventStatus, record)))
+
+    def tick(self, *submits):
+        for submit in submits:
+            self.conflator.submit(*submit)
+        self.published = []
+        self.conflator.flush()
+        return self.published
+
+    def test_updates_in_a_tick_are_merged(self):
+        self.tick((ORDER, NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "NEW", "EMSX_FILLED": 0}))
+        published = self.tick((ORDER, UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "WORKING"}),
+                              (ORDER, UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_FILLED": 100}))
+        self.assertEqual(published, [(ORDER, UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "WORKING", "EMSX_FILLED": 100})])
+
+    def test_delete_forgets_the_key(self):
+        self.tick((ROUTE, NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1, "EMSX_STATUS": "WORKING"}),
+                  (ROUTE, NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 2, "EMSX_STATUS": "WORKING"}))
+        self.tick((ROUTE, DELETE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1}))
+
+        self.assertEqual(list(self.conflator.published), [(ROUTE, 1, 2)])
+
+    def test_update_after_delete_does_not_replace_it(self):
+        self.tick((ROUTE, NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1, "EMSX_STATUS": "WORKING"}))
+        published = self.tick((ROUTE, DELETE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1}),
+                              (ROUTE, UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1, "EMSX_STATUS": "CANCEL"}))
+
+        self.assertEqual(published, [(ROUTE, DELETE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1})])
+        self.assertEqual(self.conflator.published, {})
+
+    def test_forget_before_resync_republishes_full_records(self):
+        self.tick((ORDER, NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "WORKING", "EMSX_FILLED": 0}))
+        self.conflator.forget(ORDER)
+
+        # Unchanged against the stale state, but it may not be what
+        # subscribers hold after the repaint, so it is published again.
+        published = self.tick((ORDER, UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "WORKING"}))
+        self.assertEqual(published, [(ORDER, UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "WORKING"})])
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
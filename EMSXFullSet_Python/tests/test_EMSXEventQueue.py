@@ -0,0 +1,163 @@
+# test_EMSXEventQueue.py
+
+import threading
+import unittest
+
+import blpapi
+
+from EMSXEmulator import Subscription, defaultEmulator
+from EMSXEventQueue import BLOCK, DROP, COALESCE, EventQueue
+from EMSXFieldDecoder import FieldDecoder
+
+
+ORDER_ID = blpapi.CorrelationId(98)
+ROUTE_ID = blpapi.CorrelationId(99)
+
+
+def message(eventStatus, record, correlationId=ORDER_ID):
+    kind = "route" if correlationId is ROUTE_ID else "order"
+    subscription = Subscription(None, correlationId, "//blp/emapisvc/%s" % kind, kind, None)
+    return defaultEmulator().orderRouteMessage(subscription, eventStatus, record)
+
+
+def event(*messages):
+    return blpapi.Event(blpapi.Event.SUBSCRIPTION_DATA, list(messages))
+
+
+class GatedHandler(object):
+    """ Records what it handles; the first call waits until open() so that
+    the test can fill the queue behind it. """
+
+    def __init__(self):
+        self.handled = []
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.lock = threading.Lock()
+        self.decoder = FieldDecoder()
+
+    def __call__(self, batch):
+        self.entered.set()
+        self.gate.wait(5)
+        with self.lock:
+            for msg in batch:
+                self.handled.append((threading.current_thread().name, msg.correlationIds()[0].value(),
+                                     self.decoder.decode(msg)))
+
+    def open(self):
+        self.gate.set()
+
+
+class EventQueueTest(unittest.TestCase):
+
+    def start(self, handler, **options):
+        queue = EventQueue(handler, **options)
+        self.addCleanup(queue.stop, 5)
+        return queue
+
+    def hold(self, queue, handler):
+        # Leaves the worker busy with an unrelated order.
+        queue.submit(event(message(6, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "NEW"})))
+        self.assertTrue(handler.entered.wait(5))
+
+    def test_coalesce_merges_updates_field_by_field(self):
+        handler = GatedHandler()
+        queue = self.start(handler, policy=COALESCE)
+        self.hold(queue, handler)
+
+        queue.submit(event(message(7, {"EMSX_SEQUENCE": 2, "EMSX_STATUS": "WORKING", "EMSX_WORKING": 100})))
+        queue.submit(event(message(7, {"EMSX_SEQUENCE": 2, "EMSX_FILLED": 40})))
+        queue.submit(event(message(7, {"EMSX_SEQUENCE": 2, "EMSX_WORKING": 60})))
+        handler.open()
+        queue.stop(5)
+
+        records = [record for thread, cid, record in handler.handled if record["EMSX_SEQUENCE"] == 2]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["EMSX_STATUS"], "WORKING")
+        self.assertEqual(records[0]["EMSX_FILLED"], 40)
+        self.assertEqual(records[0]["EMSX_WORKING"], 60)
+        self.assertEqual(queue.stats()["coalesced"], 2)
+
+    def test_coalesce_never_merges_across_other_messages(self):
+        handler = GatedHandler()
+        queue = self.start(handler, policy=COALESCE)
+        self.hold(queue, handler)
+
+        queue.submit(event(message(7, {"EMSX_SEQUENCE": 2, "EMSX_FILLED": 40})))
+        queue.submit(event(message(8, {"EMSX_SEQUENCE": 2})))
+        queue.submit(event(message(7, {"EMSX_SEQUENCE": 2, "EMSX_FILLED": 50})))
+        handler.open()
+        queue.stop(5)
+
+        statuses = [record["EVENT_STATUS"] for thread, cid, record in handler.handled if record["EMSX_SEQUENCE"] == 2]
+        self.assertEqual(statuses, [7, 8, 7])
+
+    def test_drop_discards_only_updates(self):
+        handler = GatedHandler()
+        queue = self.start(handler, policy=DROP, capacity=1)
+        self.hold(queue, handler)
+
+        queue.submit(event(message(7, {"EMSX_SEQUENCE": 2, "EMSX_FILLED": 40})))
+        queue.submit(event(message(7, {"EMSX_SEQUENCE": 3, "EMSX_FILLED": 50})))
+
+        # The buffer is full, so the delete has to wait for the worker.
+        submitter = threading.Thread(target=queue.submit, args=(event(message(8, {"EMSX_SEQUENCE": 2}),
+                                                                      message(6, {"EMSX_SEQUENCE": 4})),))
+        submitter.start()
+        submitter.join(0.2)
+        self.assertTrue(submitter.is_alive())
+
+        handler.open()
+        submitter.join(5)
+        queue.stop(5)
+
+        handled = [(record["EMSX_SEQUENCE"], record["EVENT_STATUS"]) for thread, cid, record in handler.handled]
+        self.assertEqual(handled, [(1, 6), (2, 7), (2, 8), (4, 6)])
+        self.assertEqual(queue.stats()["dropped"], 1)
+
+    def test_order_and_routes_share_a_worker(self):
+        handler = GatedHandler()
+        handler.open()
+        queue = self.start(handler, policy=BLOCK, workers=4)
+
+        messages = []
+        for sequence in range(1, 21):
+            messages.append(message(6, {"EMSX_SEQUENCE": sequence}))
+            messages.append(message(6, {"EMSX_SEQUENCE": sequence, "EMSX_ROUTE_ID": 1}, ROUTE_ID))
+            messages.append(message(7, {"EMSX_SEQUENCE": sequence, "EMSX_ROUTE_ID": 1, "EMSX_FILLED": 10}, ROUTE_ID))
+            messages.append(message(7, {"EMSX_SEQUENCE": sequence, "EMSX_FILLED": 10}))
+        queue.submit(event(*messages))
+        queue.stop(5)
+
+        threads = {}
+        order = {}
+        for thread, cid, record in handler.handled:
+            threads.setdefault(record["EMSX_SEQUENCE"], set()).add(thread)
+            order.setdefault(record["EMSX_SEQUENCE"], []).append((cid, record["EVENT_STATUS"]))
+        self.assertEqual(len(threads), 20)
+        self.assertTrue(all(len(names) == 1 for names in threads.values()))
+        self.assertTrue(all(sequence == [(98, 6), (99, 6), (99, 7), (98, 7)] for sequence in order.values()))
+        self.assertGreater(len(set.union(*threads.values())), 1)
+
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
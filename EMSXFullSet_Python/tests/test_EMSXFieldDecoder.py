@@ -0,0 +1,98 @@
+# test_EMSXFieldDecoder.py
+
+import copy
+import unittest
+
+from EMSXEmulator import Element, Message
+from EMSXFieldDecoder import FieldDecoder
+from EMSXSchema import ORDER_ROUTE_FIELDS_TYPE, emapisvcSchema
+
+
+SCHEMA = emapisvcSchema()
+RECORD = {"EMSX_SEQUENCE": 1001, "EMSX_TICKER": "IBM US Equity", "EMSX_AMOUNT": 500, "EMSX_STATUS": "WORKING"}
+
+
+def reorderedSchema(reorder):
+    # A copy of the emapisvc schema with the OrderRouteFields elements in another order.
+    schema = copy.copy(SCHEMA)
+    schema.types = dict(SCHEMA.types)
+    orderRouteType = schema.types[ORDER_ROUTE_FIELDS_TYPE] = copy.copy(SCHEMA.types[ORDER_ROUTE_FIELDS_TYPE])
+    orderRouteType.elements = reorder(list(orderRouteType.elements))
+    return schema
+
+
+def swap(first, second):
+    def reorder(elements):
+        names = [e.name for e in elements]
+        i, j = names.index(first), names.index(second)
+        elements[i], elements[j] = elements[j], elements[i]
+        return elements
+    return reorder
+
+
+def message(record, schema=SCHEMA):
+    element = Element(ORDER_ROUTE_FIELDS_TYPE, schema, ORDER_ROUTE_FIELDS_TYPE)
+    for name, value in record.items():
+        element.setElement(name, value)
+    return Message(element, [])
+
+
+class FieldDecoderTest(unittest.TestCase):
+
+    def test_present_fields_are_decoded(self):
+        decoder = FieldDecoder()
+        self.assertEqual(decoder.decode(message(RECORD)), RECORD)
+        self.assertEqual(decoder.decode(message({"EMSX_SEQUENCE": 1002})), {"EMSX_SEQUENCE": 1002})
+
+    def test_defaults_fill_absent_fields(self):
+        record = FieldDecoder(["EMSX_SEQUENCE", "EMSX_FILLED", "EMSX_TICKER"]).decodeWithDefaults(message({"EMSX_SEQUENCE": 1}))
+        self.assertEqual(record, {"EMSX_SEQUENCE": 1, "EMSX_FILLED": 0, "EMSX_TICKER": ""})
+
+    def test_unknown_fields_are_rejected(self):
+        self.assertRaises(ValueError, FieldDecoder, ["EMSX_NO_SUCH_FIELD"])
+
+    def test_reordered_message_gets_a_new_layout(self):
+        reversedSchema = reorderedSchema(lambda elements: elements[::-1])
+        for fields in (None, list(RECORD)):
+            decoder = FieldDecoder(fields)
+            self.assertEqual(decoder.decode(message(RECORD)), RECORD)
+            self.assertEqual(decoder.decode(message(RECORD, reversedSchema)), RECORD)
+            self.assertEqual(decoder.decode(message(RECORD)), RECORD)
+
+    def test_fields_swapped_between_first_and_last_are_noticed(self):
+        swapped = reorderedSchema(swap("EMSX_SEQUENCE", "EMSX_TICKER"))
+        for fields in (None, list(RECORD)):
+            decoder = FieldDecoder(fields)
+            decoder.decode(message(RECORD))
+            self.assertEqual(decoder.decode(message(RECORD, swapped)), RECORD)
+
+    def test_projected_decoder_reads_by_position(self):
+        decoder = FieldDecoder(["EMSX_SEQUENCE", "EMSX_STATUS"])
+        self.assertEqual(decoder.decode(message(RECORD)), {"EMSX_SEQUENCE": 1001, "EMSX_STATUS": "WORKING"})
+        self.assertIsNotNone(decoder.selected)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,129 @@
+# test_EMSXFillWarehouse.py
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import blpapi
+
+from EMSXFillWarehouse import FillWarehouse
+from EMSXHistoryFetcher import HistoryFetcher, d_service
+from EMSXSessionManager import ManagedSession
+
+
+TO_DATE_TIME = datetime(2017, 3, 3, 0, 7)
+
+
+class RecordingFetcher(HistoryFetcher):
+
+    def __init__(self, session):
+        HistoryFetcher.__init__(self, session, uuidsPerRequest=1)
+        self.requests = []
+
+    def fetch(self, fromDateTime, toDateTime, uuids=None, **options):
+        self.requests.append((fromDateTime, uuids))
+        return HistoryFetcher.fetch(self, fromDateTime, toDateTime, uuids, **options)
+
+
+class FillWarehouseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = ManagedSession(services=[d_service])
+        self.session.start()
+        self.addCleanup(self.session.stop)
+        self.fetcher = RecordingFetcher(self.session)
+        self.warehouse = FillWarehouse(":memory:")
+        self.addCleanup(self.warehouse.close)
+
+    def sync(self, uuids, toDateTime=TO_DATE_TIME):
+        return self.warehouse.sync(self.fetcher, uuids=uuids, toDateTime=toDateTime,
+                                   overlap=timedelta(hours=1), initialHistory=timedelta(days=2))
+
+    def test_mark_is_the_end_of_the_synced_window(self):
+        self.assertGreater(self.sync([1234]), 0)
+        self.assertEqual(self.warehouse.highWater("Uuid:1234"), TO_DATE_TIME)
+
+        self.sync([1234], TO_DATE_TIME + timedelta(hours=1))
+        self.assertEqual(self.fetcher.requests[-1], (TO_DATE_TIME - timedelta(hours=1), [1234]))
+
+    def test_mark_advances_for_a_uuid_without_fills(self):
+        self.assertEqual(self.sync([9999]), 0)
+        self.sync([9999], TO_DATE_TIME + timedelta(hours=1))
+
+        self.assertEqual(self.fetcher.requests[-1], (TO_DATE_TIME - timedelta(hours=1), [9999]))
+        self.assertEqual(self.warehouse.highWater("Uuid:9999"), TO_DATE_TIME + timedelta(hours=1))
+
+    def test_marks_are_kept_per_uuid(self):
+        self.sync([1234])
+        self.fetcher.requests = []
+
+        # 5678 sorts after 1234, so positional chunk keys would have mixed them up.
+        toDateTime = TO_DATE_TIME + timedelta(hours=1)
+        self.sync([5678, 1234], toDateTime)
+        self.assertEqual(sorted(self.fetcher.requests, key=lambda request: request[1]), [(TO_DATE_TIME - timedelta(hours=1), [1234]),
+                                                                                        (toDateTime - timedelta(days=2), [5678])])
+        self.assertEqual(self.warehouse.highWater("Uuid:1234"), toDateTime)
+        self.assertEqual(self.warehouse.highWater("Uuid:5678"), toDateTime)
+
+    def test_resync_stores_each_fill_once(self):
+        self.sync([1234, 5678])
+        count = len(self.warehouse.query())
+        self.sync([1234, 5678])
+
+        fills = self.warehouse.query()
+        self.assertEqual(len(fills), count)
+        self.assertEqual(len(set(fill["FillId"] for fill in fills)), count)
+
+    def test_corrected_originals_are_removed(self):
+        self.sync([1234, 5678])
+        fills = self.warehouse.query()
+        fillIds = set(fill["FillId"] for fill in fills)
+        correctedIds = set(fill["CorrectedFillId"] for fill in fills if fill["CorrectedFillId"])
+
+        self.assertTrue(correctedIds)
+        self.assertFalse(fillIds & correctedIds)
+
+        # An original re-read without its correction does not come back.
+        original = dict(fills[0], FillId=min(correctedIds), CorrectedFillId=0, DateTimeOfFill=None)
+        self.warehouse.store([original])
+        self.assertEqual(len(self.warehouse.query()), len(fills))
+
+    def test_fill_times_are_stored_in_utc(self):
+        local = timezone(timedelta(hours=2))
+        self.warehouse.store([{"FillId": 1, "DateTimeOfFill": datetime(2017, 3, 3, 1, 0, tzinfo=local)},
+                              {"FillId": 2, "DateTimeOfFill": datetime(2017, 3, 2, 23, 30, tzinfo=timezone.utc)}])
+
+        fills = self.warehouse.query()
+        self.assertEqual([fill["FillId"] for fill in fills], [1, 2])
+        self.assertEqual(fills[0]["DateTimeOfFill"], "2017-03-02T23:00:00")
+        self.assertEqual(self.warehouse.tradeDates(), ["2017-03-02"])
+
+    def test_failed_sync_keeps_the_mark(self):
+        self.sync([1234])
+        blpapi.emulator.setErrorRate(1.0, "GetFills")
+        self.addCleanup(blpapi.emulator.setErrorRate, 0.0, "GetFills")
+
+        self.sync([1234], TO_DATE_TIME + timedelta(days=1))
+        self.assertEqual(self.warehouse.highWater("Uuid:1234"), TO_DATE_TIME)
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
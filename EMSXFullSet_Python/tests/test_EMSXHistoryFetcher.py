@@ -0,0 +1,184 @@
+# test_EMSXHistoryFetcher.py
+
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import blpapi
+
+from EMSXEmulator import EmulatorError
+from EMSXHistoryFetcher import (BLOCK, FAIL, FillStream, FillsChunk, HistoryError, HistoryFetcher, StreamSession,
+                                buildFillsRequest, d_service)
+from EMSXRequestRunner import RequestTimeout
+from EMSXSessionManager import ManagedSession
+
+
+FROM_DATE_TIME = datetime(2017, 3, 1)
+TO_DATE_TIME = datetime(2017, 3, 3)
+
+
+class HistoryFetcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = blpapi.emulator
+        self.session = ManagedSession(services=[d_service])
+        self.session.start()
+        self.addCleanup(self.session.stop)
+        self.windows = []
+
+        getFills = self.emulator.getFills
+        def recordingGetFills(request, correlationId):
+            element = request.asElement()
+            fromDateTime = self.emulator.naiveUtc(element.getElementAsDatetime("FromDateTime"))
+            toDateTime = self.emulator.naiveUtc(element.getElementAsDatetime("ToDateTime"))
+            self.windows.append(toDateTime - fromDateTime)
+            if self.maxWindow is not None and toDateTime - fromDateTime > self.maxWindow:
+                raise EmulatorError(9000, "Response too large, narrow the date range")
+            return getFills(request, correlationId)
+        self.maxWindow = None
+        self.emulator.getFills = recordingGetFills
+        self.addCleanup(delattr, self.emulator, "getFills")
+
+    def fetch(self, **options):
+        fetcher = HistoryFetcher(self.session, **options)
+        return fetcher.fetch(FROM_DATE_TIME, TO_DATE_TIME, uuids=[1234])
+
+    def test_too_large_response_is_split_until_it_fits(self):
+        expected, errors = self.fetch(window=timedelta(hours=6))
+        self.assertEqual(errors, [])
+        self.assertTrue(expected)
+
+        self.windows = []
+        self.maxWindow = timedelta(hours=6)
+        fills, errors = self.fetch(window=timedelta(days=1))
+
+        self.assertEqual(errors, [])
+        self.assertEqual([f["FillId"] for f in fills], [f["FillId"] for f in expected])
+        # Each day: one refused request, two refused halves, four quarters.
+        self.assertEqual(sorted(self.windows), [timedelta(hours=6)] * 8 + [timedelta(hours=12)] * 4 + [timedelta(days=1)] * 2)
+
+    def test_split_stops_at_min_window(self):
+        self.maxWindow = timedelta(minutes=10)
+        fills, errors = self.fetch(window=timedelta(days=1), minWindow=timedelta(hours=6))
+
+        self.assertEqual(fills, [])
+        self.assertEqual(len(errors), 8)
+        self.assertTrue(all("too large" in error for chunk, error in errors))
+
+    def test_other_errors_fail_fast(self):
+        self.emulator.setErrorRate(1.0, "GetFills")
+        self.addCleanup(self.emulator.setErrorRate, 0.0, "GetFills")
+
+        fills, errors = self.fetch(window=timedelta(days=1))
+
+        self.assertEqual(fills, [])
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(len(self.windows), 0)
+        self.assertTrue(all("Injected error" in error for chunk, error in errors))
+
+    def test_send_failure_is_recorded_for_its_chunk(self):
+        sendRequestAsync = self.session.sendRequestAsync
+        calls = []
+        def failSecond(request, onMessage=None):
+            calls.append(request)
+            if len(calls) == 2:
+                raise RequestTimeout("GetFills request not admitted by the rate limiter")
+            return sendRequestAsync(request, onMessage)
+        self.session.sendRequestAsync = failSecond
+
+        fills, errors = self.fetch(window=timedelta(days=1))
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("RequestTimeout", errors[0][1])
+        self.assertEqual(errors[0][0].fromDateTime, FROM_DATE_TIME + timedelta(days=1))
+        self.assertTrue(fills)
+        self.assertTrue(all(str(f["DateTimeOfFill"])[:10] <= "2017-03-02" for f in fills))
+        self.assertTrue(all(str(f["DateTimeOfFill"])[:16] != "2017-03-02 00:05" for f in fills))
+
+
+class FillStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = blpapi.emulator
+        partialSize, self.emulator.partialSize = self.emulator.partialSize, 5
+        self.addCleanup(setattr, self.emulator, "partialSize", partialSize)
+
+        self.session = StreamSession("localhost", 8194, maxBuffered=2)
+        self.addCleanup(self.session.stop)
+
+    def fillStream(self, overflowPolicy=BLOCK):
+        chunk = FillsChunk(("Uuids", [1234]), FROM_DATE_TIME, FROM_DATE_TIME + timedelta(days=1))
+        return FillStream(self.session, buildFillsRequest(self.session.getService(), chunk), timeout=5, overflowPolicy=overflowPolicy)
+
+    def consumeSlowly(self, stream):
+        # Takes one fill, then lets the response back up behind the consumer.
+        fills = iter(stream)
+        first = next(fills)
+        time.sleep(0.3)
+        return [first] + list(fills)
+
+    def test_stream_matches_fetch(self):
+        managed = ManagedSession(services=[d_service])
+        managed.start()
+        self.addCleanup(managed.stop)
+        fetched, errors = HistoryFetcher(managed).fetch(FROM_DATE_TIME, TO_DATE_TIME, uuids=[1234])
+
+        streamed = list(HistoryFetcher(managed).stream(FROM_DATE_TIME, TO_DATE_TIME, uuids=[1234], maxBuffered=2))
+
+        self.assertEqual(errors, [])
+        self.assertTrue(set(f["FillId"] for f in fetched) <= set(f["FillId"] for f in streamed))
+
+    def test_block_holds_the_response_until_the_consumer_catches_up(self):
+        expected = list(self.fillStream())
+
+        stream = self.fillStream()
+        fills = iter(stream)
+        next(fills)
+        time.sleep(0.3)
+        # The queue is full, plus the SlowConsumerWarning.
+        self.assertLessEqual(self.session.session.events.qsize(), 3)
+        self.assertFalse(stream.pending.isComplete())
+
+        self.assertEqual(len(list(fills)) + 1, len(expected))
+        self.assertGreater(self.session.slowConsumerWarnings, 0)
+
+    def test_fail_cancels_the_request_of_a_slow_consumer(self):
+        stream = self.fillStream(FAIL)
+        self.assertRaises(HistoryError, self.consumeSlowly, stream)
+        self.assertEqual(stream.pending.failure, "Cancelled")
+
+        # The session is still usable for the next request.
+        self.assertTrue(list(self.fillStream()))
+
+    def test_fail_keeps_up_with_a_fast_consumer(self):
+        self.session.stop()
+        self.session = StreamSession("localhost", 8194, maxBuffered=1000)
+        self.addCleanup(self.session.stop)
+        self.assertTrue(list(self.fillStream(FAIL)))
+
+    def test_unknown_overflow_policy_is_rejected(self):
+        self.assertRaises(ValueError, self.fillStream, "buffer")
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,121 @@
+# test_EMSXMetrics.py
+
+import threading
+import unittest
+
+import blpapi
+
+from EMSXBulkOrders import d_service
+from EMSXMetrics import RequestMetrics, instrumentedSessionClass
+from EMSXOperations import REQUESTS
+
+
+ORDER = {"EMSX_TICKER": "IBM US Equity", "EMSX_AMOUNT": 100, "EMSX_ORDER_TYPE": "MKT",
+         "EMSX_TIF": "DAY", "EMSX_HAND_INSTRUCTION": "ANY", "EMSX_SIDE": "BUY"}
+
+
+class SlowReturnSession(blpapi.Session):
+    # Returns from sendRequest only after the response has been handled, the
+    # way a busy caller thread can lose the race with the event thread.
+
+    responded = None
+
+    def sendRequest(self, request, identity=None, correlationId=None, eventQueue=None, requestLabel=None):
+        correlationId = blpapi.Session.sendRequest(self, request, correlationId=correlationId)
+        self.responded.wait(5)
+        return correlationId
+
+
+class InstrumentedSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = RequestMetrics()
+
+    def start(self, session):
+        session.start()
+        self.addCleanup(session.stop)
+        session.openService(d_service)
+        return session
+
+    def request(self, session):
+        return REQUESTS["CreateOrder"](**ORDER).create(session.getService(d_service))
+
+    def createOrder(self):
+        return self.metrics.snapshot()["operations"]["CreateOrder"]
+
+    def waitForResponse(self, session, correlationId):
+        while True:
+            event = session.nextEvent(5000)
+            self.assertNotEqual(event.eventType(), blpapi.Event.TIMEOUT)
+            if event.eventType() == blpapi.Event.RESPONSE:
+                self.assertEqual(list(event)[0].correlationIds()[0], correlationId)
+                return
+
+    def test_unset_correlation_ids_are_tracked_separately(self):
+        session = self.start(instrumentedSessionClass(blpapi.Session, self.metrics)())
+
+        first = blpapi.CorrelationId()
+        second = blpapi.CorrelationId()
+        self.assertEqual(session.sendRequest(self.request(session), correlationId=first), first)
+        self.assertEqual(session.sendRequest(self.request(session), correlationId=second), second)
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.createOrder()["inFlight"], 2)
+
+        self.waitForResponse(session, first)
+        self.waitForResponse(session, second)
+
+        createOrder = self.createOrder()
+        self.assertEqual(createOrder["completed"], 2)
+        self.assertEqual(createOrder["inFlight"], 0)
+        self.assertEqual(createOrder["latency"]["count"], 2)
+
+    def test_response_before_send_returns_is_kept(self):
+        responded = threading.Event()
+
+        def processEvent(event, session):
+            if event.eventType() == blpapi.Event.RESPONSE:
+                responded.set()
+
+        sessionClass = instrumentedSessionClass(SlowReturnSession, self.metrics)
+        session = self.start(sessionClass(eventHandler=processEvent))
+        session.responded = responded
+
+        session.sendRequest(self.request(session))
+
+        createOrder = self.createOrder()
+        self.assertEqual(createOrder["completed"], 1)
+        self.assertEqual(createOrder["inFlight"], 0)
+        self.assertEqual(createOrder["latency"]["count"], 1)
+
+    def test_failed_send_is_not_counted(self):
+        session = instrumentedSessionClass(blpapi.Session, self.metrics)()
+        request = self.request(self.start(blpapi.Session()))
+
+        self.assertRaises(blpapi.InvalidStateException, session.sendRequest, request)
+        self.assertEqual(self.metrics.snapshot()["operations"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,80 @@
+# test_EMSXOperations.py
+
+import unittest
+
+from EMSXBulkOrders import BulkOrderCreator, CREATED, FAILED
+from EMSXOperations import CreateOrderRequest, OrderStaticData, ErrorInfoResponse, RequestValidationError, d_service
+from EMSXSessionManager import ManagedSession, SessionManager
+
+
+ORDER = {"EMSX_TICKER": "IBM US Equity", "EMSX_AMOUNT": 100, "EMSX_ORDER_TYPE": "MKT",
+         "EMSX_TIF": "DAY", "EMSX_HAND_INSTRUCTION": "ANY", "EMSX_SIDE": "BUY"}
+
+
+class OperationsTest(unittest.TestCase):
+
+    def test_fields_mark_arrays(self):
+        fields = dict((field[0], field) for field in CreateOrderRequest.FIELDS)
+        self.assertTrue(fields["REQUEST_EXT"][3])
+        self.assertFalse(fields["EMSX_TICKER"][3])
+
+    def test_array_fields_must_be_lists(self):
+        request = CreateOrderRequest(REQUEST_EXT="ext", **ORDER)
+        self.assertEqual(request.errors(), ["REQUEST_EXT must be a list"])
+        self.assertRaises(RequestValidationError, request.validate)
+        self.assertEqual(CreateOrderRequest(REQUEST_EXT=["ext"], **ORDER).errors(), [])
+
+    def test_requests_are_sent_and_decoded(self):
+        session = ManagedSession(services=[d_service])
+        session.start()
+        self.addCleanup(session.stop)
+
+        request = CreateOrderRequest(**ORDER).create(session.getService(d_service))
+        response = session.sendRequest(request, 10).decoded()
+        self.assertIsInstance(response, OrderStaticData)
+        self.assertIsNotNone(response.EMSX_SEQUENCE)
+
+        request = session.createRequest(d_service, "ModifyOrderEx")
+        request.set("EMSX_SEQUENCE", 0)
+        self.assertIsInstance(session.sendRequest(request, 10).decoded(), ErrorInfoResponse)
+
+    def test_session_manager_fills_generated_requests(self):
+        manager = SessionManager(services=[d_service])
+        self.addCleanup(manager.stop)
+        response = manager.sendRequest(d_service, "CreateOrder", ORDER, 10).decoded()
+        self.assertIsInstance(response, OrderStaticData)
+
+    def test_bulk_orders_validate_rows_before_sending(self):
+        session = ManagedSession(services=[d_service])
+        session.start()
+        self.addCleanup(session.stop)
+
+        missing = dict(ORDER)
+        del missing["EMSX_SIDE"]
+        results = BulkOrderCreator(session).createOrders([ORDER, missing])
+        self.assertEqual([result.state for result in results], [CREATED, FAILED])
+        self.assertIn("EMSX_SIDE is required", results[1].errorMessage)
+        self.assertEqual(session.runner.outstanding(), 0)
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
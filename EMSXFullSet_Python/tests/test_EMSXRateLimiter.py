@@ -0,0 +1,110 @@
+# test_EMSXRateLimiter.py
+
+import threading
+import time
+import unittest
+
+import blpapi
+
+from EMSXRateLimiter import AdaptiveWindow, RateLimiter
+from EMSXRequestRunner import RequestRunner
+from EMSXSchema import emapisvcSchema
+
+
+class UnsendableSession(object):
+
+    def sendRequest(self, request, correlationId=None):
+        raise blpapi.InvalidStateException("Session is not started")
+
+
+class AdaptiveWindowTest(unittest.TestCase):
+
+    def test_responses_grow_the_limit(self):
+        window = AdaptiveWindow(initial=4)
+        for i in range(4):
+            self.assertTrue(window.acquire(0))
+            window.release(0.01)
+        self.assertAlmostEqual(window.limit, 5.0, delta=0.3)
+        self.assertEqual(window.inFlight, 0)
+
+    def test_slow_response_halves_the_limit(self):
+        window = AdaptiveWindow(initial=8, targetLatency=0.5)
+        window.acquire(0)
+        window.release(1.0)
+        self.assertEqual(window.limit, 4.0)
+
+    def test_cancel_frees_the_slot_without_changing_the_limit(self):
+        window = AdaptiveWindow(initial=2)
+        self.assertTrue(window.acquire(0))
+        self.assertTrue(window.acquire(0))
+        self.assertFalse(window.acquire(0))
+        window.cancel()
+        self.assertEqual(window.limit, 2.0)
+        self.assertTrue(window.acquire(0))
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_operation_bucket_timeout_returns_the_global_token(self):
+        limiter = RateLimiter(rate=1.0, burst=2, operationBudgets={"RouteEx": (0.1, 1)}, window=AdaptiveWindow(initial=4))
+        self.assertTrue(limiter.acquire("RouteEx", 0))
+        self.assertFalse(limiter.acquire("RouteEx", 0))
+
+        self.assertAlmostEqual(limiter.bucket.tokens, 1.0, delta=0.1)
+        self.assertEqual(limiter.window.limit, 4.0)
+        self.assertEqual(limiter.window.inFlight, 1)
+        self.assertTrue(limiter.acquire("CreateOrder", 0))
+
+    def test_one_deadline_covers_every_stage(self):
+        limiter = RateLimiter(rate=5.0, burst=1, operationBudgets={}, window=AdaptiveWindow(initial=1))
+        self.assertTrue(limiter.acquire("CreateOrder", 0))
+
+        # The slot comes back after 0.2s and the next token 0.2s after that;
+        # a fresh timeout per stage would let this through.
+        releaser = threading.Timer(0.2, limiter.window.cancel)
+        releaser.start()
+        limiter.bucket.tokens = -1.0
+        start = time.time()
+        admitted = limiter.acquire("CreateOrder", 0.3)
+        elapsed = time.time() - start
+        releaser.join()
+
+        self.assertFalse(admitted)
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual(limiter.window.inFlight, 0)
+
+    def test_failed_send_is_cancelled(self):
+        limiter = RateLimiter(rate=10.0, burst=1, operationBudgets={"CreateOrder": (10.0, 1)}, window=AdaptiveWindow(initial=1))
+        runner = RequestRunner(UnsendableSession(), limiter)
+        request = blpapi.Service("//blp/emapisvc", emapisvcSchema()).createRequest("CreateOrder")
+
+        for attempt in range(3):
+            self.assertRaises(blpapi.InvalidStateException, runner.sendRequestAsync, request)
+
+        self.assertEqual(limiter.window.limit, 1.0)
+        self.assertEqual(limiter.window.inFlight, 0)
+        self.assertEqual(limiter.stats()["sent"], 0)
+        self.assertEqual(runner.outstanding(), 0)
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
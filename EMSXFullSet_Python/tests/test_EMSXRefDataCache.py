@@ -0,0 +1,122 @@
+# test_EMSXRefDataCache.py
+
+import os
+import tempfile
+import threading
+import unittest
+
+from EMSXOperations import RequestValidationError
+from EMSXRefDataCache import RefDataCache, RefDataError, d_service
+from EMSXSessionManager import SessionManager
+
+
+class RefDataCacheTest(unittest.TestCase):
+
+    def test_values_are_cached(self):
+        calls = []
+        cache = RefDataCache(fetch=lambda operation, params: calls.append(operation) or ["TEAM"])
+
+        self.assertEqual(cache.teams(), ["TEAM"])
+        self.assertEqual(cache.teams(), ["TEAM"])
+        self.assertEqual(calls, ["GetTeams"])
+
+    def test_errors_are_not_cached(self):
+        results = [KeyboardInterrupt(), RefDataError("GetTeams failed"), ["TEAM"]]
+
+        def fetch(operation, params):
+            result = results.pop(0)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        cache = RefDataCache(fetch=fetch)
+        self.assertRaises(KeyboardInterrupt, cache.teams)
+        self.assertRaises(RefDataError, cache.teams)
+        self.assertEqual(cache.teams(), ["TEAM"])
+        self.assertEqual(cache.stats()["errors"], 2)
+
+    def test_waiters_get_the_owners_error(self):
+        started, release = threading.Event(), threading.Event()
+
+        def fetch(operation, params):
+            started.set()
+            release.wait()
+            raise KeyboardInterrupt()
+
+        cache = RefDataCache(fetch=fetch)
+        owner = threading.Thread(target=lambda: self.assertRaises(KeyboardInterrupt, cache.teams))
+        owner.start()
+        started.wait()
+
+        errors = []
+        def wait():
+            try:
+                cache.teams()
+            except BaseException as e:
+                errors.append(e)
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        while cache.stats()["shared"] == 0:
+            waiter.join(0.01)
+        release.set()
+        owner.join()
+        waiter.join()
+
+        self.assertEqual([type(e) for e in errors], [KeyboardInterrupt])
+        self.assertEqual(cache.entries, {})
+
+
+class RefDataRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        manager = SessionManager(services=[d_service])
+        manager.start()
+        self.addCleanup(manager.stop)
+        self.cache = RefDataCache(manager)
+
+    def test_scope_is_set_through_the_generated_request(self):
+        self.assertTrue(self.cache.tradeDesks(1234))
+        self.assertTrue(self.cache.strategies("EQTY", "BMTB"))
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+        self.cache.tradeDesks(1234)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_invalid_parameters_are_not_sent(self):
+        self.assertRaises(RequestValidationError, self.cache.get, "GetBrokerStrategiesWithAssetClass", EMSX_ASSET_CLASS="EQTY")
+        self.assertRaises(TypeError, self.cache.get, "GetTeams", EMSX_BROKER="BMTB")
+
+    def test_snapshot_keeps_choice_parameters(self):
+        desks = self.cache.tradeDesks(1234)
+        path = os.path.join(tempfile.mkdtemp(), "refdata.json")
+        self.cache.save(path)
+
+        cache = RefDataCache(fetch=lambda operation, params: self.fail("fetched %s" % operation))
+        self.assertEqual(cache.load(path), 1)
+        self.assertEqual(cache.tradeDesks(1234), desks)
+
+        cache.invalidate("GetTradeDesks", Scope={"EMSX_TRADER_UUID": 1234})
+        self.assertEqual(len(cache), 0)
+
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
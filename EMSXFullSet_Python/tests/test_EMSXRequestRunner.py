@@ -0,0 +1,112 @@
+# test_EMSXRequestRunner.py
+
+import unittest
+from datetime import datetime, timedelta
+
+import blpapi
+
+from EMSXHistoryFetcher import FillsChunk, buildFillsRequest
+from EMSXOperations import REQUESTS, ErrorInfoResponse, OrderStaticData
+from EMSXRequestRunner import TERMINATED, RequestTimeout
+from EMSXSessionManager import ManagedSession
+
+
+EMAPISVC = "//blp/emapisvc_beta"
+HISTORY = "//blp/emsx.history"
+
+ORDER = {"EMSX_TICKER": "IBM US Equity", "EMSX_AMOUNT": 100, "EMSX_ORDER_TYPE": "MKT",
+         "EMSX_TIF": "DAY", "EMSX_HAND_INSTRUCTION": "ANY", "EMSX_SIDE": "BUY"}
+
+
+class RequestRunnerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = blpapi.emulator
+        self.session = ManagedSession(services=[EMAPISVC, HISTORY])
+        self.session.start()
+        self.addCleanup(self.session.stop)
+        self.runner = self.session.runner
+
+    def createOrder(self):
+        return REQUESTS["CreateOrder"](**ORDER).create(self.session.getService(EMAPISVC))
+
+    def slowResponses(self):
+        latency, self.emulator.latency = self.emulator.latency, 2.0
+        self.addCleanup(setattr, self.emulator, "latency", latency)
+
+    def test_response_completes_the_request(self):
+        pending = self.runner.sendRequest(self.createOrder(), 5)
+
+        self.assertTrue(pending.isComplete())
+        self.assertFalse(pending.isError())
+        self.assertIsInstance(pending.decoded(), OrderStaticData)
+        self.assertIn(pending.decoded().EMSX_SEQUENCE, self.emulator.orders)
+        self.assertGreaterEqual(pending.latency(), 0)
+        self.assertEqual(self.runner.outstanding(), 0)
+
+    def test_error_info_is_an_error(self):
+        self.emulator.setErrorRate(1.0, "CreateOrder")
+        self.addCleanup(self.emulator.setErrorRate, 0.0, "CreateOrder")
+
+        pending = self.runner.sendRequest(self.createOrder(), 5)
+
+        self.assertTrue(pending.isError())
+        self.assertEqual(pending.error()[1], "Injected error")
+        self.assertIsInstance(pending.decoded(), ErrorInfoResponse)
+
+    def test_timed_out_request_is_cancelled(self):
+        self.slowResponses()
+
+        self.assertRaises(RequestTimeout, self.runner.sendRequest, self.createOrder(), 0.1)
+        self.assertEqual(self.runner.outstanding(), 0)
+
+    def test_fail_all_completes_pending_requests(self):
+        self.slowResponses()
+        pending = self.runner.sendRequestAsync(self.createOrder())
+        completed = []
+        pending.addCallback(completed.append)
+
+        self.assertEqual(self.runner.failAll(), 1)
+        self.assertEqual(completed, [pending])
+        self.assertEqual(pending.failure, TERMINATED)
+        self.assertEqual(pending.error(), (TERMINATED, TERMINATED))
+
+    def test_partial_responses_are_streamed_to_on_message(self):
+        partialSize, self.emulator.partialSize = self.emulator.partialSize, 10
+        self.addCleanup(setattr, self.emulator, "partialSize", partialSize)
+        start = datetime(2017, 3, 1)
+        chunk = FillsChunk(("Uuids", [1234]), start, start + timedelta(days=1))
+
+        messages = []
+        pending = self.runner.sendRequestAsync(buildFillsRequest(self.session.getService(HISTORY), chunk), onMessage=messages.append)
+        pending.wait(5)
+
+        self.assertGreater(len(messages), 1)
+        self.assertEqual(pending.messages, [])
+        self.assertEqual(len(set(m.correlationIds()[0] for m in messages)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
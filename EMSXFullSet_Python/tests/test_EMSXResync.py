@@ -0,0 +1,98 @@
+# test_EMSXResync.py
+
+import unittest
+
+from EMSXBlotter import BlotterStore, NEW_ORDER_ROUTE, UPDATE_ORDER_ROUTE, DELETE_ORDER_ROUTE
+from EMSXColumnarBlotter import ColumnarBlotterStore
+from EMSXResync import BlotterResync
+from EMSXTopics import ORDER, ROUTE
+
+
+ORDERS = [{"EMSX_SEQUENCE": 1, "EMSX_TICKER": "IBM US Equity", "EMSX_STATUS": "WORKING", "EMSX_NOTES": "urgent", "EMSX_FILLED": 100},
+          {"EMSX_SEQUENCE": 2, "EMSX_TICKER": "VOD LN Equity", "EMSX_STATUS": "NEW"}]
+
+
+class BlotterResyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.blotter = BlotterStore()
+        self.blotter.loadOrders([dict(order) for order in ORDERS])
+        self.resync = BlotterResync(self.blotter)
+
+    def test_unchanged_rows_are_not_published(self):
+        self.resync.begin(ORDER)
+        self.assertIsNone(self.resync.paint(ORDER, dict(ORDERS[0], API_SEQ_NUM=7)))
+
+    def test_changed_fields_are_published_with_the_key(self):
+        self.resync.begin(ORDER)
+        change = self.resync.paint(ORDER, dict(ORDERS[0], EMSX_STATUS="FILLED"))
+
+        self.assertEqual(change, (UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_STATUS": "FILLED"}))
+        self.assertEqual(self.blotter.orders.lookup("EMSX_STATUS", "FILLED"), [dict(ORDERS[0], EMSX_STATUS="FILLED")])
+        self.assertEqual(self.blotter.orders.lookup("EMSX_STATUS", "WORKING"), [])
+
+    def test_cleared_fields_are_a_change(self):
+        record = dict(ORDERS[0])
+        del record["EMSX_NOTES"]
+        self.resync.begin(ORDER)
+        change = self.resync.paint(ORDER, record)
+
+        self.assertEqual(change, (UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_NOTES": None}))
+        self.assertEqual(self.blotter.order(1), record)
+
+    def test_rows_missing_from_the_paint_are_deleted(self):
+        self.resync.begin(ORDER)
+        self.assertEqual(self.resync.paint(ORDER, {"EMSX_SEQUENCE": 3, "EMSX_STATUS": "NEW"}), (NEW_ORDER_ROUTE, {"EMSX_SEQUENCE": 3, "EMSX_STATUS": "NEW"}))
+        self.resync.seen(ORDER, {"EMSX_SEQUENCE": 2})
+
+        self.assertEqual(self.resync.end(ORDER), [(DELETE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1})])
+        self.assertEqual(sorted(self.blotter.orders.allKeys()), [2, 3])
+        self.assertFalse(self.resync.active(ORDER))
+        self.assertEqual(self.resync.stats(), {"resyncs": 1, "added": 1, "changed": 0, "unchanged": 0, "deleted": 1})
+
+    def test_route_deletes_carry_both_key_fields(self):
+        self.blotter.loadRoutes([{"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1}, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 2}])
+        self.resync.begin(ROUTE)
+        self.resync.paint(ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 2})
+
+        self.assertEqual(self.resync.end(ROUTE), [(DELETE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_ROUTE_ID": 1})])
+
+
+class ColumnarResyncTest(unittest.TestCase):
+
+    def test_cleared_fields_are_reset(self):
+        blotter = ColumnarBlotterStore()
+        blotter.loadOrders([dict(order) for order in ORDERS])
+        resync = BlotterResync(blotter)
+
+        resync.begin(ORDER)
+        change = resync.paint(ORDER, {"EMSX_SEQUENCE": 1, "EMSX_TICKER": "IBM US Equity", "EMSX_STATUS": "WORKING"})
+
+        self.assertEqual(change, (UPDATE_ORDER_ROUTE, {"EMSX_SEQUENCE": 1, "EMSX_NOTES": "", "EMSX_FILLED": 0}))
+        self.assertIsNone(resync.paint(ORDER, dict(ORDERS[1])))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,106 @@
+# test_EMSXSessionManager.py
+
+import threading
+import time
+import unittest
+
+from EMSXBulkOrders import d_service
+from EMSXSessionManager import SessionError, SessionManager
+
+
+class SessionManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = SessionManager(services=[d_service], poolSize=2, startTimeout=5)
+        self.manager.start()
+        self.addCleanup(self.manager.stop)
+
+    def blockStarts(self):
+        # Makes every later session start wait until the returned event is set.
+        release = threading.Event()
+        newSession = self.manager.newSession
+
+        def slowNewSession():
+            release.wait(5)
+            return newSession()
+        self.manager.newSession = slowNewSession
+        self.addCleanup(release.set)
+        return release
+
+    def failStarts(self):
+        def failingNewSession():
+            raise SessionError("Session startup failed")
+        self.manager.newSession = failingNewSession
+
+    def waitFor(self, condition):
+        deadline = time.time() + 5
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    def test_live_session_is_returned_while_a_replacement_starts(self):
+        dead, live = self.manager.sessions
+        dead.stop()
+        release = self.blockStarts()
+
+        started = time.time()
+        self.assertIs(self.manager.acquire(), live)
+        self.assertLess(time.time() - started, 1)
+
+        release.set()
+        self.waitFor(lambda: len(self.manager.sessions) == 2 and all(s.isAlive() for s in self.manager.sessions))
+        self.assertNotIn(dead, self.manager.sessions)
+
+    def test_failed_start_is_not_an_error_while_a_session_is_alive(self):
+        dead, live = self.manager.sessions
+        dead.stop()
+        self.failStarts()
+
+        self.assertIs(self.manager.acquire(), live)
+        self.waitFor(lambda: not self.manager.replenishing)
+        self.assertIs(self.manager.acquire(), live)
+        self.assertEqual(self.manager.sessions, [live])
+
+    def test_failed_start_is_an_error_when_no_session_is_alive(self):
+        for session in self.manager.sessions:
+            session.stop()
+        self.failStarts()
+
+        self.assertRaises(SessionError, self.manager.acquire)
+
+    def test_caller_waits_for_a_session_when_none_is_alive(self):
+        for session in self.manager.sessions:
+            session.stop()
+        release = self.blockStarts()
+        threading.Timer(0.2, release.set).start()
+
+        session = self.manager.acquire()
+
+        self.assertTrue(session.isAlive())
+        self.assertEqual(self.manager.sendRequest(d_service, "GetTeams", {}, timeout=5).messageType(), "GetTeams")
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
@@ -0,0 +1,172 @@
+# test_EMSXSubscriptionManager.py
+
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+import blpapi
+
+from EMSXEmulator import Emulator
+from EMSXSubscriptionManager import SubscriptionManager, STARTED, FAILED, TERMINATED, d_service
+from EMSXTopics import ORDER, ROUTE
+
+
+ORDERS = 10
+
+
+class Recorder(object):
+    """ A subscription handler that keeps what each subscription got. """
+
+    def __init__(self):
+        self.records = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, subscription, eventStatus, record):
+        with self.lock:
+            self.records.setdefault(subscription.correlationId.value(), []).append((eventStatus, record))
+
+    def received(self, subscription, eventStatus=None):
+        with self.lock:
+            return [record for status, record in self.records.get(subscription.correlationId.value(), [])
+                    if eventStatus is None or status == eventStatus]
+
+
+class SubscriptionManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.emulator = Emulator(latency=0.001)
+        self.emulator.loadBlotter(ORDERS)
+        output = contextlib.redirect_stderr(io.StringIO())
+        output.__enter__()
+        self.addCleanup(output.__exit__, None, None, None)
+
+        self.manager = None
+        self.session = blpapi.Session(blpapi.SessionOptions(), self.processEvent, emulator=self.emulator)
+        self.session.startAsync()
+        self.addCleanup(self.session.stop)
+        self.manager = SubscriptionManager(self.session, d_service, resubscribeDelay=0.05)
+        self.handler = Recorder()
+
+    def processEvent(self, event, session):
+        if self.manager is not None:
+            self.manager.processEvent(event, session)
+
+    def waitFor(self, condition):
+        deadline = time.time() + 5
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    def test_each_subscription_gets_its_own_fields(self):
+        full = self.manager.add(ORDER, self.handler)
+        status = self.manager.add(ORDER, self.handler, ["EMSX_STATUS"], label="status")
+        routes = self.manager.add(ROUTE, self.handler, ["EMSX_FILLED"])
+        self.waitFor(lambda: all(s.painted for s in (full, status, routes)))
+
+        self.assertEqual(len(self.handler.received(full, 4)), ORDERS)
+        self.assertEqual(len(self.handler.received(routes, 4)), ORDERS)
+        self.assertTrue(all(set(record) == {"EMSX_SEQUENCE", "EMSX_STATUS"} for record in self.handler.received(status, 4)))
+        self.assertTrue(all(set(record) <= {"EMSX_SEQUENCE", "EMSX_ROUTE_ID", "EMSX_FILLED"} for record in self.handler.received(routes, 4)))
+        self.assertIn("EMSX_TICKER", self.handler.received(full, 4)[0])
+        self.assertEqual([s.state for s in (full, status, routes)], [STARTED] * 3)
+
+        sequence = min(self.emulator.orders)
+        self.emulator.fill(sequence, 1, 100, 10.0)
+        self.waitFor(lambda: self.handler.received(status, 7) and self.handler.received(routes, 7))
+        self.assertEqual(self.handler.received(routes, 7), [{"EMSX_SEQUENCE": sequence, "EMSX_ROUTE_ID": 1, "EMSX_FILLED": 100}])
+        self.assertEqual(self.handler.received(full, 7)[0]["EMSX_SEQUENCE"], sequence)
+        self.assertEqual(self.manager.stats(), {"subscriptions": 3, "started": 3, "painted": 3, "messages": 3 * (ORDERS + 1) + 3, "unknown": 0})
+
+    def test_removed_subscriptions_get_nothing_more(self):
+        kept = self.manager.add(ORDER, self.handler, ["EMSX_STATUS"])
+        removed = self.manager.addPair({}, self.handler, ["EMSX_STATUS"], ["EMSX_STATUS"], "pair")
+        self.waitFor(lambda: all(s.painted for s in [kept] + removed))
+
+        self.manager.removeLabel("pair")
+        self.assertEqual(self.manager.subscriptions(), [kept])
+        self.assertEqual([s.state for s in removed], [TERMINATED, TERMINATED])
+        self.assertEqual([s.correlationId for s in self.emulator.subscriptions], [kept.correlationId])
+
+        before = [len(self.handler.received(s)) for s in removed]
+        self.emulator.fill(min(self.emulator.orders), 1, 100, 10.0)
+        self.waitFor(lambda: self.handler.received(kept, 7))
+        self.assertEqual([len(self.handler.received(s)) for s in removed], before)
+
+        self.manager.removeAll()
+        self.assertEqual(self.manager.subscriptions(), [])
+        self.assertEqual(self.emulator.subscriptions, [])
+
+    def test_trader_uuid_is_checked_against_the_schema(self):
+        for uuid in ("12x", 12.5, True, 2 ** 31):
+            with self.assertRaises(ValueError):
+                self.manager.addTrader(uuid, self.handler)
+        self.assertEqual(self.manager.subscriptions(), [])
+
+        orders, routes = self.manager.addTrader("1234", self.handler, ["EMSX_STATUS"], ["EMSX_STATUS"])
+        self.assertEqual(orders.topic, d_service + "/order;trader_uuid=1234?fields=EMSX_SEQUENCE,EMSX_STATUS")
+        self.assertEqual(routes.label, "1234")
+
+    def test_terminated_subscriptions_are_resubscribed(self):
+        subscription = self.manager.add(ORDER, self.handler, ["EMSX_STATUS"])
+        self.waitFor(lambda: subscription.painted)
+
+        self.emulator.dropConnection(self.session, reconnectDelay=0.01)
+        self.waitFor(lambda: subscription.resubscribes == 1)
+        self.waitFor(lambda: subscription.state == STARTED and subscription.painted)
+
+        self.assertEqual(len(self.handler.received(subscription, 4)), 2 * ORDERS)
+        self.assertEqual(subscription.resubscribes, 0)
+
+    def test_failed_subscriptions_are_retried_a_limited_number_of_times(self):
+        attempts = []
+        subscribe = self.emulator.subscribe
+
+        def failingSubscribe(session, topic, correlationId):
+            attempts.append(topic)
+            if len(attempts) <= failures:
+                reason = {"source": "test", "errorCode": 1, "category": "TIMEOUT", "description": "No response"}
+                session.schedule(session.statusEvent(blpapi.Event.SUBSCRIPTION_STATUS, "SubscriptionFailure", correlationId, reason=reason))
+            else:
+                subscribe(session, topic, correlationId)
+        self.emulator.subscribe = failingSubscribe
+
+        failures = 2
+        recovered = self.manager.add(ORDER, self.handler, ["EMSX_STATUS"])
+        self.waitFor(lambda: recovered.state == STARTED and recovered.painted)
+        self.assertEqual(len(attempts), 3)
+
+        del attempts[:]
+        failures = 100
+        self.manager.maxResubscribes = 3
+        failed = self.manager.add(ORDER, self.handler, ["EMSX_STATUS"])
+        self.waitFor(lambda: len(attempts) == 4 and failed.state == FAILED)
+        time.sleep(0.2)
+        self.assertEqual(len(attempts), 4)
+        self.assertEqual(failed.state, FAILED)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
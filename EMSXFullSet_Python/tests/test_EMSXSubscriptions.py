@@ -0,0 +1,117 @@
+# test_EMSXSubscriptions.py
+
+import contextlib
+import io
+import threading
+import time
+import unittest
+from unittest import mock
+
+import blpapi
+
+import EMSXEmulator
+import EMSXSubscriptions
+from EMSXTopics import ORDER, ROUTE
+
+
+ORDERS = 300
+
+
+class FastPaintTest(unittest.TestCase):
+    """ Runs the sample against a fresh emulator book with the initial paint
+    split over several queue workers. """
+
+    def setUp(self):
+        self.emulator = EMSXEmulator.Emulator(latency=0.001, messagesPerEvent=20)
+        self.emulator.loadBlotter(ORDERS)
+        patcher = mock.patch.object(EMSXEmulator, "_defaultEmulator", self.emulator)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name, value in (("d_fastPaint", True), ("d_queuePolicy", "block"), ("d_queueWorkers", 4)):
+            patcher = mock.patch.object(EMSXSubscriptions, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        output = contextlib.redirect_stdout(io.StringIO())
+        output.__enter__()
+        self.addCleanup(output.__exit__, None, None, None)
+
+    def start(self, handler):
+        self.assertTrue(handler.startSession(blpapi.SessionOptions(), handler.processEvent))
+        self.addCleanup(handler.queue.stop, 5)
+        self.addCleanup(handler.stop)
+
+    def waitFor(self, condition):
+        deadline = time.time() + 10
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    def test_every_painted_record_is_loaded(self):
+        handler = EMSXSubscriptions.SessionEventHandler()
+        self.start(handler)
+        self.waitFor(lambda: handler.painted == {ORDER, ROUTE})
+
+        self.assertEqual(sorted(handler.blotter.orders.allKeys()), sorted(self.emulator.orders))
+        self.assertEqual(sorted(handler.blotter.routes.allKeys()), sorted(self.emulator.routes))
+        self.assertEqual(handler.paintRecords, {ORDER: [], ROUTE: []})
+
+    def test_end_of_paint_waits_for_slow_workers(self):
+        # The worker decoding the first order stalls; the end of the paint
+        # has to wait for it rather than load what the others have buffered.
+        handler = EMSXSubscriptions.SessionEventHandler()
+        first = min(self.emulator.orders)
+        decode = handler.decode
+        stalled = threading.Event()
+
+        def slowDecode(msg):
+            record = decode(msg)
+            if handler.kind(msg) == ORDER and record["EMSX_SEQUENCE"] == first:
+                stalled.set()
+                time.sleep(0.3)
+            return record
+        handler.decode = slowDecode
+
+        self.start(handler)
+        self.waitFor(lambda: ORDER in handler.painted)
+
+        self.assertTrue(stalled.is_set())
+        self.assertEqual(handler.blotter.order(first)["EMSX_SEQUENCE"], first)
+        self.assertEqual(len(handler.blotter.orders), ORDERS)
+
+    def test_updates_after_the_paint_are_applied(self):
+        handler = EMSXSubscriptions.SessionEventHandler()
+        self.start(handler)
+        self.waitFor(lambda: handler.painted == {ORDER, ROUTE})
+
+        sequence = min(self.emulator.orders)
+        amount = self.emulator.orders[sequence]["EMSX_AMOUNT"]
+        self.emulator.fill(sequence, 1, amount, 10.0)
+
+        self.waitFor(lambda: handler.blotter.order(sequence).get("EMSX_STATUS") == "FILLED")
+        self.waitFor(lambda: handler.blotter.route(sequence, 1).get("EMSX_FILLED") == amount)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
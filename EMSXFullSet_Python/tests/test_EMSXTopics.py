@@ -0,0 +1,108 @@
+# test_EMSXTopics.py
+
+import unittest
+
+import blpapi
+
+from EMSXEmulator import Subscription, TOPIC_PATTERN
+from EMSXTopics import (FieldProjection, ORDER, ROUTE, ORDER_FIELDS, ROUTE_FIELDS, projectFields, buildTopic,
+                        orderTopic, routeTopic)
+
+
+d_service="//blp/emapisvc_beta"
+
+ROUTE_RECORD = {"EMSX_SEQUENCE": 1000001, "EMSX_ROUTE_ID": 2, "EMSX_TICKER": "IBM US Equity", "EMSX_STATUS": "WORKING",
+                "EMSX_AMOUNT": 500, "EMSX_FILLED": 100, "EMSX_BROKER": "BMTB", "EMSX_NOTES": "urgent"}
+
+
+class ProjectFieldsTest(unittest.TestCase):
+
+    def test_missing_key_fields_are_added_first(self):
+        self.assertEqual(projectFields(ORDER, ["EMSX_STATUS"]), ["EMSX_SEQUENCE", "EMSX_STATUS"])
+        self.assertEqual(projectFields(ROUTE, ["EMSX_STATUS"]), ["EMSX_SEQUENCE", "EMSX_ROUTE_ID", "EMSX_STATUS"])
+        self.assertEqual(projectFields(ROUTE, ["EMSX_STATUS", "EMSX_ROUTE_ID"]), ["EMSX_SEQUENCE", "EMSX_STATUS", "EMSX_ROUTE_ID"])
+
+    def test_duplicates_are_dropped(self):
+        self.assertEqual(projectFields(ORDER, ["EMSX_STATUS", "EMSX_SEQUENCE", "EMSX_STATUS"]), ["EMSX_STATUS", "EMSX_SEQUENCE"])
+
+    def test_full_field_sets_are_known(self):
+        self.assertEqual(projectFields(ORDER, ORDER_FIELDS), ORDER_FIELDS)
+        self.assertEqual(projectFields(ROUTE, ROUTE_FIELDS), ROUTE_FIELDS)
+
+    def test_unknown_fields_and_kinds_are_rejected(self):
+        with self.assertRaises(ValueError) as raised:
+            projectFields(ORDER, ["EMSX_STATUS", "EMSX_NO_SUCH_FIELD"])
+        self.assertIn("EMSX_NO_SUCH_FIELD", str(raised.exception))
+        with self.assertRaises(ValueError):
+            projectFields("fill", ["EMSX_STATUS"])
+
+
+class BuildTopicTest(unittest.TestCase):
+
+    def test_topic_carries_the_projected_fields(self):
+        topic = buildTopic(d_service, ROUTE, ["EMSX_STATUS"])
+        self.assertEqual(topic, d_service + "/route?fields=EMSX_SEQUENCE,EMSX_ROUTE_ID,EMSX_STATUS")
+        self.assertEqual(TOPIC_PATTERN.match(topic).group(4), "EMSX_SEQUENCE,EMSX_ROUTE_ID,EMSX_STATUS")
+
+    def test_options(self):
+        self.assertEqual(buildTopic(d_service, ORDER, ["EMSX_STATUS"], "team=TKTEAM"),
+                         d_service + "/order;team=TKTEAM?fields=EMSX_SEQUENCE,EMSX_STATUS")
+        self.assertEqual(buildTopic(d_service, ORDER, ["EMSX_STATUS"], {"team": "TKTEAM"}),
+                         buildTopic(d_service, ORDER, ["EMSX_STATUS"], "team=TKTEAM"))
+
+    def test_default_topics_subscribe_to_every_field(self):
+        self.assertTrue(orderTopic(d_service).endswith("?fields=" + ",".join(ORDER_FIELDS)))
+        self.assertTrue(routeTopic(d_service).endswith("?fields=" + ",".join(ROUTE_FIELDS)))
+
+
+class FieldProjectionTest(unittest.TestCase):
+
+    def message(self, projection, record):
+        # The message the emulator publishes on the projection's topic.
+        subscription = Subscription(None, blpapi.CorrelationId(99), projection.topic, projection.kind,
+                                    TOPIC_PATTERN.match(projection.topic).group(4).split(","))
+        return blpapi.emulator.orderRouteMessage(subscription, 7, record)
+
+    def test_decodes_only_the_projected_fields(self):
+        projection = FieldProjection(d_service, ROUTE, ["EMSX_STATUS", "EMSX_FILLED"])
+        record = projection.decode(self.message(projection, ROUTE_RECORD))
+
+        self.assertEqual(record, {"EMSX_SEQUENCE": 1000001, "EMSX_ROUTE_ID": 2, "EMSX_STATUS": "WORKING", "EMSX_FILLED": 100})
+
+    def test_fields_missing_from_the_record_are_left_out(self):
+        projection = FieldProjection(d_service, ROUTE, ["EMSX_STATUS", "EMSX_LAST_PRICE"])
+        record = projection.decode(self.message(projection, ROUTE_RECORD))
+
+        self.assertEqual(record, {"EMSX_SEQUENCE": 1000001, "EMSX_ROUTE_ID": 2, "EMSX_STATUS": "WORKING"})
+
+    def test_full_projection_decodes_every_field(self):
+        projection = FieldProjection(d_service, ROUTE, ROUTE_FIELDS)
+        record = projection.decode(self.message(projection, ROUTE_RECORD))
+
+        self.assertEqual(dict((name, record[name]) for name in ROUTE_RECORD if name in record),
+                         dict((name, value) for name, value in ROUTE_RECORD.items() if name in ROUTE_FIELDS))
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""
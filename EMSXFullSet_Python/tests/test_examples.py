@@ -0,0 +1,83 @@
+# test_examples.py
+
+import contextlib
+import glob
+import io
+import os
+import runpy
+import threading
+import unittest
+
+import blpapi
+
+
+EXAMPLES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def examples():
+    # The request scripts, which wait on d_done until they are finished.
+    paths = []
+    for path in sorted(glob.glob(os.path.join(EXAMPLES_DIR, "*.py"))):
+        with open(path) as f:
+            if "d_done" in f.read():
+                paths.append(path)
+    return paths
+
+
+class ExamplesTest(unittest.TestCase):
+
+    def run_example(self, path, timeout=5):
+        # Runs the script as __main__; returns its output, or None if it is still running after timeout seconds.
+        output = io.StringIO()
+        thread = threading.Thread(target=runpy.run_path, args=(path,), kwargs={"run_name": "__main__"})
+        thread.daemon = True
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            thread.start()
+            thread.join(timeout)
+        return None if thread.is_alive() else output.getvalue()
+
+    def test_examples_finish(self):
+        self.assertTrue(examples())
+        for path in examples():
+            with self.subTest(example=os.path.basename(path)):
+                self.assertIsNotNone(self.run_example(path))
+
+    def test_examples_finish_when_the_service_fails_to_open(self):
+        blpapi.emulator.openService = lambda name: None
+        self.addCleanup(delattr, blpapi.emulator, "openService")
+
+        for path in examples():
+            with self.subTest(example=os.path.basename(path)):
+                output = self.run_example(path)
+                self.assertIsNotNone(output)
+                self.assertIn("Error: Service failed to open", output)
+
+    def test_request_runner_example(self):
+        output = self.run_example(os.path.join(EXAMPLES_DIR, "CreateOrderSync.py"))
+        self.assertIn("MESSAGE: Order created", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+__copyright__ = """
+Copyright 2017. Bloomberg Finance L.P.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to
+deal in the Software without restriction, including without limitation the
+rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+sell copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:  The above
+copyright notice and this permission notice shall be included in all copies
+or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+IN THE SOFTWARE.
+"""